@@ -0,0 +1,214 @@
+"""
+最近の更新（アクティビティ）のポーリングサービス
+
+Webhookを受け取れない環境でも、前回反映したアクティビティより新しいものだけを取得して
+Webhookと同じ方法でキャッシュとローカルミラーに反映する。変更がなければ1回の
+小さなリクエストで済むため、課題一覧を取得し直すより安く変更を検出できる
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.application.services.change_event_service import ChangeEventService
+from app.infrastructure.backlog.backlog_client_wrapper import BacklogClientWrapper
+from app.infrastructure.mirror.issue_mirror import IssueMirror, get_issue_mirror
+
+# アクティビティAPIで1回に取得できる最大件数
+PAGE_SIZE = 100
+# 1回のポーリングで取得する最大ページ数（残りは次回のポーリングで取得する）
+MAX_PAGES = 10
+
+# ミラーが無効な場合に反映済みの最新のアクティビティIDを記録する
+_cursors: Dict[Tuple[str, str], int] = {}
+# 最後にポーリングした時刻
+_last_polled: Dict[Tuple[str, str], float] = {}
+# 同じ対象のポーリングを同時に1つだけ実行するためのロック
+_poll_locks: Dict[Tuple[str, str], threading.Lock] = {}
+_state_lock = threading.Lock()
+
+
+def _poll_lock(key: Tuple[str, str]) -> threading.Lock:
+    with _state_lock:
+        return _poll_locks.setdefault(key, threading.Lock())
+
+
+class ActivityPoller:
+    """
+    最近の更新のポーリング
+    """
+
+    def __init__(
+        self,
+        backlog_client: BacklogClientWrapper,
+        project_key: Optional[str] = None,
+        mirror: Optional[IssueMirror] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        初期化
+
+        Args:
+            backlog_client: Backlogクライアント
+            project_key: プロジェクトキー（指定しない場合はスペース全体の更新を取得）
+            mirror: 課題のローカルミラー（指定しない場合は設定に従い、無効な場合はNone）
+            clock: 現在時刻を返す関数
+        """
+        self.backlog_client = backlog_client
+        self.project_key = project_key
+        self.mirror = mirror or get_issue_mirror()
+        self.change_event_service = ChangeEventService(backlog_client, mirror=self.mirror)
+        self._clock = clock
+
+    @property
+    def _key(self) -> Tuple[str, str]:
+        return (self.backlog_client.space, self.project_key or "")
+
+    def _get_cursor(self) -> Optional[int]:
+        # ミラーが有効な場合は、ミラーの内容と合わせてファイルに記録する
+        if self.mirror is not None:
+            return self.mirror.get_activity_cursor(*self._key)
+        with _state_lock:
+            return _cursors.get(self._key)
+
+    def _set_cursor(self, last_id: int) -> None:
+        if self.mirror is not None:
+            self.mirror.set_activity_cursor(*self._key, last_id)
+            return
+        with _state_lock:
+            _cursors[self._key] = last_id
+
+    def poll(self) -> Dict[str, Any]:
+        """
+        前回反映したアクティビティより新しいアクティビティを取得して反映
+
+        初回は最新のアクティビティIDを記録するだけで、反映は行わない
+
+        Returns:
+            ポーリング結果（initialized: 初回かどうか, applied: 反映したアクティビティ数,
+            last_id: 反映済みの最新のアクティビティID, has_more: 取得しきれなかったアクティビティがあるかどうか,
+            actions: 行った処理の一覧）
+
+        Raises:
+            BacklogApiError: アクティビティを取得できなかった場合
+        """
+        with _poll_lock(self._key):
+            return self._poll_locked()
+
+    def _poll_locked(self) -> Dict[str, Any]:
+        """同じ対象のポーリングのロックを取得した状態でポーリング"""
+        cursor = self._get_cursor()
+        if cursor is None:
+            latest = self.backlog_client.get_activities(
+                self.project_key, count=1, order="desc"
+            )
+            if latest:
+                cursor = latest[0]["id"]
+                self._set_cursor(cursor)
+            return {
+                "initialized": True,
+                "applied": 0,
+                "last_id": cursor,
+                "has_more": False,
+                "actions": [],
+            }
+
+        applied = 0
+        actions = []
+        has_more = True
+        for _ in range(MAX_PAGES):
+            page = self.backlog_client.get_activities(
+                self.project_key, min_id=cursor, count=PAGE_SIZE, order="asc"
+            )
+            activities = [activity for activity in page if activity["id"] > cursor]
+            if activities:
+                result = self.change_event_service.apply_all(activities)
+                applied += result["applied"]
+                actions.extend(result["actions"])
+                cursor = activities[-1]["id"]
+                self._set_cursor(cursor)
+            if len(page) < PAGE_SIZE or not activities:
+                has_more = False
+                break
+        return {
+            "initialized": False,
+            "applied": applied,
+            "last_id": cursor,
+            "has_more": has_more,
+            "actions": actions,
+        }
+
+    def _claim_if_due(self, interval: float) -> bool:
+        """
+        前回のポーリングから interval 秒を過ぎている場合に、今回のポーリングの時刻を記録
+
+        Returns:
+            ポーリングする場合はTrue
+        """
+        with _state_lock:
+            now = self._clock()
+            last = _last_polled.get(self._key)
+            if last is not None and now - last < interval:
+                return False
+            _last_polled[self._key] = now
+            return True
+
+    def _poll_logged(self) -> Optional[Dict[str, Any]]:
+        # 他のスレッドがポーリング中の場合は、終わるのを待たずに戻る
+        lock = _poll_lock(self._key)
+        if not lock.acquire(blocking=False):
+            return None
+        try:
+            return self._poll_locked()
+        except Exception as e:
+            print(f"Error polling Backlog activities: {e}")
+            return None
+        finally:
+            lock.release()
+
+    def poll_if_due(self, interval: float) -> Optional[Dict[str, Any]]:
+        """
+        前回のポーリングから interval 秒を過ぎている場合にポーリング
+
+        他のスレッドがポーリング中の場合は、終わるのを待たずにNoneを返す。
+        失敗した場合も次のポーリングは interval 秒後に行う
+
+        Args:
+            interval: ポーリングの間隔（秒）
+
+        Returns:
+            ポーリング結果。ポーリングしなかった場合や失敗した場合はNone
+        """
+        if not self._claim_if_due(interval):
+            return None
+        return self._poll_logged()
+
+    def poll_in_background_if_due(self, interval: float) -> Optional[threading.Thread]:
+        """
+        前回のポーリングから interval 秒を過ぎている場合に、別スレッドでポーリング
+
+        読み取りリクエストがアクティビティの取得や課題の再取得を待たないよう、
+        間隔の判定だけを行ってすぐに戻る。別スレッドにはリクエストの処理期限を引き継がない
+
+        Args:
+            interval: ポーリングの間隔（秒）
+
+        Returns:
+            ポーリングを開始したスレッド。ポーリングしなかった場合はNone
+        """
+        if not self._claim_if_due(interval):
+            return None
+        thread = threading.Thread(
+            target=self._poll_logged, name="backlog-activity-poller", daemon=True
+        )
+        thread.start()
+        return thread
+
+
+def reset_activity_poller_state() -> None:
+    """
+    プロセス内で記録しているポーリングの状態を破棄
+    """
+    with _state_lock:
+        _cursors.clear()
+        _last_polled.clear()
@@ -0,0 +1,257 @@
+"""
+課題の集計サービス
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.concurrency import map_concurrently
+from app.core.config import settings
+from app.infrastructure.backlog.backlog_client_wrapper import BacklogClientWrapper
+
+# 集計の軸: 軸名 -> (課題数APIの絞り込み条件, 値の一覧を取得する関数, 値を持たない課題を数えるかどうか)
+# 値の一覧を取得できない場合に空や既定の一覧で集計しないよう、取得のエラーは送出させる
+# 値を持たない課題の件数は総数から各値の件数を引いて求めるため、値を1つだけ持つ軸に限る
+_DIMENSIONS: Dict[
+    str, Tuple[str, Callable[[BacklogClientWrapper, int], List[Dict[str, Any]]], bool]
+] = {
+    "status": (
+        "status_id",
+        lambda client, project_id: client.get_statuses(project_id, raise_errors=True),
+        False,
+    ),
+    "assignee": (
+        "assignee_id",
+        lambda client, project_id: client.get_project_users(project_id, raise_errors=True),
+        True,
+    ),
+    "issue_type": (
+        "issue_type_id",
+        lambda client, project_id: client.get_issue_types(project_id, raise_errors=True),
+        False,
+    ),
+    "priority": (
+        "priority_id",
+        lambda client, project_id: client.get_priorities(raise_errors=True),
+        False,
+    ),
+    "category": (
+        "category_id",
+        lambda client, project_id: client.get_categories(project_id, raise_errors=True),
+        False,
+    ),
+    "milestone": (
+        "milestone_id",
+        lambda client, project_id: client.get_milestones(project_id, raise_errors=True),
+        False,
+    ),
+    "version": (
+        "version_id",
+        lambda client, project_id: client.get_versions(project_id, raise_errors=True),
+        False,
+    ),
+}
+
+# 1つの課題が複数の値を持てる軸（行・列が重複するため、各行・各列の件数の和は総数と一致しない）
+MULTI_VALUED_DIMENSIONS = ("category", "milestone", "version")
+
+# 値を持たない課題（担当者なし）の行・列の名前
+NONE_LABEL = "(none)"
+
+
+class AggregationService:
+    """
+    課題の集計サービス
+
+    課題一覧を取得して数えるのではなく、Backlogの課題数APIを軸の値の組み合わせごとに
+    並行して呼び出し、件数の表を返す
+    """
+
+    def __init__(
+        self,
+        backlog_client: BacklogClientWrapper,
+        max_workers: Optional[int] = None,
+        max_calls: Optional[int] = None,
+    ):
+        """
+        初期化
+
+        Args:
+            backlog_client: Backlogクライアント
+            max_workers: Backlog APIを同時に呼び出す最大数（指定しない場合は設定値）
+            max_calls: 1回の集計で呼び出す課題数APIの上限（指定しない場合は設定値）
+        """
+        self.backlog_client = backlog_client
+        self.max_workers = max(1, max_workers or settings.BULK_MAX_CONCURRENCY)
+        self.max_calls = max_calls or settings.AGGREGATION_MAX_CALLS
+
+    def _count_all(self, queries: List[Dict[str, Any]]) -> List[int]:
+        """
+        複数の条件の課題数を並行して取得
+
+        Raises:
+            Exception: いずれかの課題数を取得できなかった場合
+        """
+        results = map_concurrently(
+            lambda query: self.backlog_client.count_issues(**query),
+            queries,
+            self.max_workers,
+        )
+        counts = []
+        for ok, value in results:
+            if not ok:
+                raise Exception(f"Failed to count issues: {value}") from value
+            counts.append(value)
+        return counts
+
+    def aggregate(
+        self,
+        project_id: int,
+        group_by: Optional[List[str]] = None,
+        filters: Optional[Dict[str, List[int]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        プロジェクトの課題数を最大2つの軸で集計
+
+        1つ目の軸を行、2つ目の軸を列とする表を返す。件数が0の行と列は省略し、
+        担当者のいない課題は "(none)" に数える。
+        カテゴリー・マイルストーン・発生バージョンは1つの課題が複数の値を持てるため、
+        課題は持っている値のすべての行・列に数え、値を持たない課題の行・列は作らない
+
+        Args:
+            project_id: プロジェクトID
+            group_by: 集計の軸（status, assignee, issue_type, priority, category,
+                milestone, version から最大2つ。指定しない場合は総数のみ）
+            filters: 課題数APIの絞り込み条件（status_id, assignee_id などのIDのリスト）
+
+        Returns:
+            集計結果（group_by, columns: 列名, rows: 行ごとの [行名, 件数..., 合計],
+            total: 総数, overlapping: 行・列が重複しうる軸, api_calls: 呼び出した課題数APIの回数）
+
+        Raises:
+            ValueError: 軸の指定が不正な場合や、呼び出し回数が上限を超える場合
+            Exception: 軸の値の一覧や課題数を取得できなかった場合
+        """
+        group_by = list(group_by or [])
+        if len(group_by) > 2 or len(set(group_by)) != len(group_by):
+            raise ValueError("group_by accepts up to two distinct dimensions.")
+        unknown = [name for name in group_by if name not in _DIMENSIONS]
+        if unknown:
+            raise ValueError(
+                f"Unknown group_by dimension(s): {', '.join(unknown)}. "
+                f"Available: {', '.join(_DIMENSIONS)}"
+            )
+
+        base: Dict[str, Any] = {key: value for key, value in (filters or {}).items() if value}
+        base["project_id"] = [project_id]
+        dimensions = []
+        for name in group_by:
+            field, load_values, optional = _DIMENSIONS[name]
+            values = [
+                (value["id"], value.get("name") or str(value["id"]))
+                for value in load_values(self.backlog_client, project_id)
+                if value.get("id") is not None
+            ]
+            # 絞り込み条件と同じ項目で集計する場合は、条件に含まれる値だけを数える
+            if base.get(field):
+                values = [value for value in values if value[0] in base[field]]
+                optional = False
+            dimensions.append((name, field, values, optional))
+
+        overlapping = [name for name in group_by if name in MULTI_VALUED_DIMENSIONS]
+
+        def query(**conditions: int) -> Dict[str, Any]:
+            result = dict(base)
+            result.update({field: [value_id] for field, value_id in conditions.items()})
+            return result
+
+        if not dimensions:
+            total = self._count_all([query()])[0]
+            return {
+                "group_by": [],
+                "columns": ["total"],
+                "rows": [],
+                "total": total,
+                "overlapping": [],
+                "api_calls": 1,
+            }
+
+        if len(dimensions) == 1:
+            _, field, values, optional = dimensions[0]
+            queries = [query()] + [query(**{field: value_id}) for value_id, _ in values]
+            self._check_calls(len(queries))
+            total, *counts = self._count_all(queries)
+            rows: List[List[Any]] = [
+                [label, count] for (_, label), count in zip(values, counts) if count
+            ]
+            if optional and total - sum(counts):
+                rows.append([NONE_LABEL, total - sum(counts)])
+            return {
+                "group_by": group_by,
+                "columns": [group_by[0], "count"],
+                "rows": rows,
+                "total": total,
+                "overlapping": overlapping,
+                "api_calls": len(queries),
+            }
+
+        (_, row_field, row_values, row_optional) = dimensions[0]
+        (_, col_field, col_values, col_optional) = dimensions[1]
+        row_count, col_count = len(row_values), len(col_values)
+        queries = (
+            [query()]
+            + [query(**{row_field: row_id}) for row_id, _ in row_values]
+            + [query(**{col_field: col_id}) for col_id, _ in col_values]
+            + [
+                query(**{row_field: row_id, col_field: col_id})
+                for row_id, _ in row_values
+                for col_id, _ in col_values
+            ]
+        )
+        self._check_calls(len(queries))
+        counts = self._count_all(queries)
+        total = counts[0]
+        row_totals = counts[1 : 1 + row_count]
+        col_totals = counts[1 + row_count : 1 + row_count + col_count]
+        offset = 1 + row_count + col_count
+        cells = [
+            counts[offset + i * col_count : offset + (i + 1) * col_count]
+            for i in range(row_count)
+        ]
+
+        # 行の軸の値を持たない課題の行（行の軸は値を1つだけ持つため、列の件数から引いて求められる）
+        if row_optional:
+            row_values = row_values + [(None, NONE_LABEL)]
+            cells.append(
+                [
+                    col_totals[j] - sum(cells[i][j] for i in range(row_count))
+                    for j in range(col_count)
+                ]
+            )
+            row_totals = row_totals + [total - sum(row_totals)]
+        # 列の軸の値を持たない課題の列
+        if col_optional:
+            col_values = col_values + [(None, NONE_LABEL)]
+            for i, row in enumerate(cells):
+                row.append(row_totals[i] - sum(row))
+
+        columns = [j for j in range(len(col_values)) if any(row[j] for row in cells)]
+        rows = [
+            [row_values[i][1]] + [cells[i][j] for j in columns] + [row_totals[i]]
+            for i in range(len(row_values))
+            if row_totals[i]
+        ]
+        return {
+            "group_by": group_by,
+            "columns": [group_by[0]] + [col_values[j][1] for j in columns] + ["total"],
+            "rows": rows,
+            "total": total,
+            "overlapping": overlapping,
+            "api_calls": len(queries),
+        }
+
+    def _check_calls(self, calls: int) -> None:
+        if calls > self.max_calls:
+            raise ValueError(
+                f"Aggregation needs {calls} count requests, exceeding the limit of "
+                f"{self.max_calls}. Narrow it down with filters or fewer dimensions."
+            )
@@ -2,9 +2,28 @@
 一括操作サービス
 """
 
-from typing import Any, Dict, List, Optional
+from string import Template
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from app.core.concurrency import map_concurrently
+from app.core.config import settings
+from app.core.deadline import DeadlineExceededError, deadline_exceeded
 from app.infrastructure.backlog.backlog_client_wrapper import BacklogClientWrapper
+from app.infrastructure.backlog.circuit_breaker import CircuitOpenError
+
+# 一括作成で名前からIDへ解決するフィールド
+# (名前フィールド, IDフィールド, 名前解決表のキー, リスト値かどうか)
+_NAME_FIELDS: List[Tuple[str, str, str, bool]] = [
+    ("issue_type_name", "issue_type_id", "issue_types", False),
+    ("priority_name", "priority_id", "priorities", False),
+    ("assignee_name", "assignee_id", "users", False),
+    ("category_name", "category_id", "categories", True),
+    ("milestone_name", "milestone_id", "milestones", True),
+    ("version_name", "version_id", "versions", True),
+]
+
+# 一括作成で名前解決を経ずにそのまま渡すフィールド
+_PASSTHROUGH_FIELDS = ["summary", "description", "start_date", "due_date"]
 
 
 class BulkOperationsService:
@@ -14,14 +33,269 @@ class BulkOperationsService:
     複数のチケットに対して一括で操作を行うサービスクラス
     """
 
-    def __init__(self, backlog_client: BacklogClientWrapper):
+    def __init__(
+        self, backlog_client: BacklogClientWrapper, max_workers: Optional[int] = None
+    ):
         """
         初期化
 
         Args:
             backlog_client: Backlogクライアント
+            max_workers: Backlog APIを同時に呼び出す最大数（指定しない場合は設定値）
         """
         self.backlog_client = backlog_client
+        self.max_workers = max(1, max_workers or settings.BULK_MAX_CONCURRENCY)
+
+    def _map_concurrently(
+        self, func: Callable[[Any], Any], items: List[Any]
+    ) -> List[Tuple[bool, Any]]:
+        """
+        要素ごとの処理を同時実行数を制限して並行実行する
+
+        リクエストの処理期限が近づいた後は新しい要素の処理を開始せず、
+        その要素の結果を (False, DeadlineExceededError) とする
+
+        Args:
+            func: 各要素に適用する処理
+            items: 処理対象のリスト
+
+        Returns:
+            入力順に並んだ (成功したかどうか, 戻り値または例外) のリスト
+        """
+        return map_concurrently(func, items, self.max_workers)
+
+    def _map_sequentially(
+        self, func: Callable[[Any], Any], items: List[Any]
+    ) -> List[Tuple[bool, Any]]:
+        """
+        要素ごとの処理を入力順に1件ずつ実行する
+
+        リクエストの処理期限が近づいた後は新しい要素の処理を開始せず、
+        その要素の結果を (False, DeadlineExceededError) とする
+
+        Args:
+            func: 各要素に適用する処理
+            items: 処理対象のリスト
+
+        Returns:
+            入力順に並んだ (成功したかどうか, 戻り値または例外) のリスト
+        """
+        results: List[Tuple[bool, Any]] = []
+        for item in items:
+            if deadline_exceeded():
+                results.append((False, DeadlineExceededError()))
+                continue
+            try:
+                results.append((True, func(item)))
+            except Exception as e:
+                results.append((False, e))
+        return results
+
+    def _summarize(
+        self, keys: List[Any], results: List[Tuple[bool, Any]], action: str
+    ) -> Dict[str, Any]:
+        """
+        要素ごとの処理結果を統計情報にまとめる
+
+        Args:
+            keys: 結果に含める要素のキー（課題IDまたは課題キーなど）のリスト
+            results: 入力順に並んだ (成功したかどうか, 戻り値または例外) のリスト
+            action: エラーログに出力する処理内容
+
+        Returns:
+            処理結果の統計情報（total, success, failed, failed_issues。
+            処理期限により処理しなかった要素がある場合は deadline_exceeded と skipped_issues、
+            サーキットブレーカーにより処理しなかった要素がある場合は circuit_open と skipped_issues も含む）
+        """
+        failed_issues: List[Any] = []
+        skipped_issues: List[Any] = []
+        skipped_errors: List[Exception] = []
+        for key, (ok, value) in zip(keys, results):
+            if ok and value:
+                continue
+            failed_issues.append(key)
+            if isinstance(value, (DeadlineExceededError, CircuitOpenError)):
+                skipped_issues.append(key)
+                skipped_errors.append(value)
+            elif not ok:
+                # エラーログの出力など
+                print(f"Error {action} {key}: {value}")
+
+        summary: Dict[str, Any] = {
+            "total": len(keys),
+            "success": len(keys) - len(failed_issues),
+            "failed": len(failed_issues),
+            "failed_issues": failed_issues,
+        }
+        if skipped_issues:
+            if any(isinstance(e, DeadlineExceededError) for e in skipped_errors):
+                summary["deadline_exceeded"] = True
+            if any(isinstance(e, CircuitOpenError) for e in skipped_errors):
+                summary["circuit_open"] = True
+            summary["skipped_issues"] = skipped_issues
+        return summary
+
+    def _build_name_tables(
+        self, project_id: int, issues: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        一括作成で使われる名前をIDへ解決するための対応表を作成
+
+        対応表は行ごとではなくバッチ全体で1回だけ取得する。
+        どの行でも使われていない種類の名前については取得しない。
+
+        Args:
+            project_id: プロジェクトID
+            issues: 課題作成パラメータのリスト
+
+        Returns:
+            名前解決表のキーごとの {名前: ID} の辞書
+        """
+        loaders: Dict[str, Callable[[], List[Dict[str, Any]]]] = {
+            "issue_types": lambda: self.backlog_client.get_issue_types(str(project_id)),
+            "priorities": self.backlog_client.get_priorities,
+            "users": self.backlog_client.get_users,
+            "categories": lambda: self.backlog_client.get_categories(str(project_id)),
+            "milestones": lambda: self.backlog_client.get_milestones(str(project_id)),
+            "versions": lambda: self.backlog_client.get_versions(str(project_id)),
+        }
+        needed = [
+            table
+            for name_field, _, table, _ in _NAME_FIELDS
+            if any(issue.get(name_field) for issue in issues)
+        ]
+
+        tables: Dict[str, Dict[str, int]] = {}
+        for table, (ok, value) in zip(
+            needed, self._map_concurrently(lambda t: loaders[t](), needed)
+        ):
+            if not ok:
+                raise Exception(f"Failed to load {table}: {value}") from value
+            tables[table] = {
+                item["name"]: item["id"]
+                for item in value or []
+                if item.get("name") is not None and item.get("id") is not None
+            }
+        return tables
+
+    @staticmethod
+    def _invalid_rows(
+        total: int, validation_errors: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        検証エラーにより課題を1件も作成しなかった場合の処理結果を作成
+
+        Args:
+            total: 処理対象の総数
+            validation_errors: 検証エラーのリスト
+
+        Returns:
+            処理結果の統計情報
+        """
+        return {
+            "total": total,
+            "success": 0,
+            "failed": total,
+            "failed_issues": list(range(total)),
+            "issue_keys": [None] * total,
+            "validation_errors": validation_errors,
+        }
+
+    def bulk_create_issues(
+        self,
+        issues: List[Dict[str, Any]],
+        project_id: Optional[int] = None,
+        project_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        同じプロジェクトに複数の課題を一括作成
+
+        プロジェクト・課題種別・優先度・担当者などの名前解決はバッチ全体で1回だけ行い、
+        全行を検証してから作成を開始する。検証エラーが1件でもあれば課題は作成しない。
+
+        Args:
+            issues: 課題作成パラメータのリスト。各要素は create_issue と同じキー
+                （summary, issue_type_id, issue_type_name, priority_id, priority_name,
+                description, assignee_id, assignee_name, category_id, category_name,
+                milestone_id, milestone_name, version_id, version_name,
+                start_date, due_date）を持つ辞書
+            project_id: プロジェクトID
+            project_key: プロジェクトキー（project_idが指定されていない場合に使用）
+
+        Returns:
+            処理結果の統計情報
+            {
+                "total": 処理対象の総数,
+                "success": 成功した件数,
+                "failed": 失敗した件数,
+                "failed_issues": 失敗した行のインデックスのリスト,
+                "issue_keys": 入力順に並んだ作成された課題キーのリスト（失敗した行はNone）,
+                "validation_errors": 検証エラーのリスト（検証エラーがある場合のみ）,
+                "deadline_exceeded": 処理期限により作成しなかった行がある場合はTrue,
+                "circuit_open": サーキットブレーカーにより作成しなかった行がある場合はTrue,
+                "skipped_issues": 処理期限またはサーキットブレーカーにより作成しなかった行のインデックスのリスト
+            }
+        """
+        total = len(issues)
+
+        if project_id is None:
+            if project_key is None:
+                raise ValueError("Either project_id or project_key must be specified")
+            project = self.backlog_client.get_project(project_key)
+            project_id = project.get("id") if project else None
+        if project_id is None:
+            # プロジェクトが見つからない場合は、名前解決を行わずに全行を検証エラーとする
+            return self._invalid_rows(
+                total,
+                [
+                    {"index": index, "errors": [f"Project not found: {project_key}"]}
+                    for index in range(total)
+                ],
+            )
+
+        tables = self._build_name_tables(project_id, issues)
+
+        # 全行を検証し、作成パラメータを組み立てる
+        validation_errors: List[Dict[str, Any]] = []
+        create_params: List[Dict[str, Any]] = []
+        for index, issue in enumerate(issues):
+            errors: List[str] = []
+            params: Dict[str, Any] = {"project_id": project_id}
+            if not issue.get("summary"):
+                errors.append("summary is required")
+            for field in _PASSTHROUGH_FIELDS:
+                if issue.get(field) is not None:
+                    params[field] = issue[field]
+            for name_field, id_field, table, is_list in _NAME_FIELDS:
+                if issue.get(id_field) is not None:
+                    params[id_field] = issue[id_field]
+                    continue
+                names = issue.get(name_field)
+                if not names:
+                    continue
+                ids = []
+                for name in names if is_list else [names]:
+                    resolved = tables[table].get(name)
+                    if resolved is None:
+                        errors.append(f"Unknown {name_field}: {name}")
+                    ids.append(resolved)
+                params[id_field] = ids if is_list else ids[0]
+            if errors:
+                validation_errors.append({"index": index, "errors": errors})
+            create_params.append(params)
+
+        if validation_errors:
+            return self._invalid_rows(total, validation_errors)
+
+        results = self._map_concurrently(
+            lambda params: self.backlog_client.create_issue(**params), create_params
+        )
+
+        summary = self._summarize(list(range(total)), results, "creating issue at index")
+        summary["issue_keys"] = [
+            value.get("issueKey") if ok and value else None for ok, value in results
+        ]
+        return summary
 
     def bulk_update_status(
         self, issue_ids: List[str], status_id: int
@@ -39,33 +313,22 @@ class BulkOperationsService:
                 "total": 処理対象の総数,
                 "success": 成功した件数,
                 "failed": 失敗した件数,
-                "failed_issues": 失敗した課題IDまたは課題キーのリスト
+                "failed_issues": 失敗した課題IDまたは課題キーのリスト,
+                "deadline_exceeded": 処理期限により処理しなかった課題がある場合はTrue,
+                "circuit_open": サーキットブレーカーにより処理しなかった課題がある場合はTrue,
+                "skipped_issues": 処理期限またはサーキットブレーカーにより処理しなかった課題IDまたは課題キーのリスト
             }
         """
-        total = len(issue_ids)
-        success = 0
-        failed_issues = []
-
-        for issue_id in issue_ids:
-            try:
-                result = self.backlog_client.update_issue(
+        return self._summarize(
+            issue_ids,
+            self._map_sequentially(
+                lambda issue_id: self.backlog_client.update_issue(
                     issue_id_or_key=issue_id, status_id=status_id
-                )
-                if result:
-                    success += 1
-                else:
-                    failed_issues.append(issue_id)
-            except Exception as e:
-                # エラーログの出力など
-                print(f"Error updating status for issue {issue_id}: {e}")
-                failed_issues.append(issue_id)
-
-        return {
-            "total": total,
-            "success": success,
-            "failed": total - success,
-            "failed_issues": failed_issues,
-        }
+                ),
+                issue_ids,
+            ),
+            "updating status for issue",
+        )
 
     def bulk_update_assignee(
         self, issue_ids: List[str], assignee_id: int
@@ -83,33 +346,22 @@ class BulkOperationsService:
                 "total": 処理対象の総数,
                 "success": 成功した件数,
                 "failed": 失敗した件数,
-                "failed_issues": 失敗した課題IDまたは課題キーのリスト
+                "failed_issues": 失敗した課題IDまたは課題キーのリスト,
+                "deadline_exceeded": 処理期限により処理しなかった課題がある場合はTrue,
+                "circuit_open": サーキットブレーカーにより処理しなかった課題がある場合はTrue,
+                "skipped_issues": 処理期限またはサーキットブレーカーにより処理しなかった課題IDまたは課題キーのリスト
             }
         """
-        total = len(issue_ids)
-        success = 0
-        failed_issues = []
-
-        for issue_id in issue_ids:
-            try:
-                result = self.backlog_client.update_issue(
+        return self._summarize(
+            issue_ids,
+            self._map_sequentially(
+                lambda issue_id: self.backlog_client.update_issue(
                     issue_id_or_key=issue_id, assignee_id=assignee_id
-                )
-                if result:
-                    success += 1
-                else:
-                    failed_issues.append(issue_id)
-            except Exception as e:
-                # エラーログの出力など
-                print(f"Error updating assignee for issue {issue_id}: {e}")
-                failed_issues.append(issue_id)
-
-        return {
-            "total": total,
-            "success": success,
-            "failed": total - success,
-            "failed_issues": failed_issues,
-        }
+                ),
+                issue_ids,
+            ),
+            "updating assignee for issue",
+        )
 
     def bulk_update_priority(
         self, issue_ids: List[str], priority_id: int
@@ -127,33 +379,22 @@ class BulkOperationsService:
                 "total": 処理対象の総数,
                 "success": 成功した件数,
                 "failed": 失敗した件数,
-                "failed_issues": 失敗した課題IDまたは課題キーのリスト
+                "failed_issues": 失敗した課題IDまたは課題キーのリスト,
+                "deadline_exceeded": 処理期限により処理しなかった課題がある場合はTrue,
+                "circuit_open": サーキットブレーカーにより処理しなかった課題がある場合はTrue,
+                "skipped_issues": 処理期限またはサーキットブレーカーにより処理しなかった課題IDまたは課題キーのリスト
             }
         """
-        total = len(issue_ids)
-        success = 0
-        failed_issues = []
-
-        for issue_id in issue_ids:
-            try:
-                result = self.backlog_client.update_issue(
+        return self._summarize(
+            issue_ids,
+            self._map_sequentially(
+                lambda issue_id: self.backlog_client.update_issue(
                     issue_id_or_key=issue_id, priority_id=priority_id
-                )
-                if result:
-                    success += 1
-                else:
-                    failed_issues.append(issue_id)
-            except Exception as e:
-                # エラーログの出力など
-                print(f"Error updating priority for issue {issue_id}: {e}")
-                failed_issues.append(issue_id)
-
-        return {
-            "total": total,
-            "success": success,
-            "failed": total - success,
-            "failed_issues": failed_issues,
-        }
+                ),
+                issue_ids,
+            ),
+            "updating priority for issue",
+        )
 
     def bulk_update_milestone(
         self, issue_ids: List[str], milestone_id: int
@@ -171,34 +412,23 @@ class BulkOperationsService:
                 "total": 処理対象の総数,
                 "success": 成功した件数,
                 "failed": 失敗した件数,
-                "failed_issues": 失敗した課題IDまたは課題キーのリスト
+                "failed_issues": 失敗した課題IDまたは課題キーのリスト,
+                "deadline_exceeded": 処理期限により処理しなかった課題がある場合はTrue,
+                "circuit_open": サーキットブレーカーにより処理しなかった課題がある場合はTrue,
+                "skipped_issues": 処理期限またはサーキットブレーカーにより処理しなかった課題IDまたは課題キーのリスト
             }
         """
-        total = len(issue_ids)
-        success = 0
-        failed_issues = []
-
-        for issue_id in issue_ids:
-            try:
-                # マイルストーンIDはリストで指定する必要がある
-                result = self.backlog_client.update_issue(
+        # マイルストーンIDはリストで指定する必要がある
+        return self._summarize(
+            issue_ids,
+            self._map_sequentially(
+                lambda issue_id: self.backlog_client.update_issue(
                     issue_id_or_key=issue_id, milestone_id=[milestone_id]
-                )
-                if result:
-                    success += 1
-                else:
-                    failed_issues.append(issue_id)
-            except Exception as e:
-                # エラーログの出力など
-                print(f"Error updating milestone for issue {issue_id}: {e}")
-                failed_issues.append(issue_id)
-
-        return {
-            "total": total,
-            "success": success,
-            "failed": total - success,
-            "failed_issues": failed_issues,
-        }
+                ),
+                issue_ids,
+            ),
+            "updating milestone for issue",
+        )
 
     def bulk_update_category(
         self, issue_ids: List[str], category_id: int
@@ -216,34 +446,23 @@ class BulkOperationsService:
                 "total": 処理対象の総数,
                 "success": 成功した件数,
                 "failed": 失敗した件数,
-                "failed_issues": 失敗した課題IDまたは課題キーのリスト
+                "failed_issues": 失敗した課題IDまたは課題キーのリスト,
+                "deadline_exceeded": 処理期限により処理しなかった課題がある場合はTrue,
+                "circuit_open": サーキットブレーカーにより処理しなかった課題がある場合はTrue,
+                "skipped_issues": 処理期限またはサーキットブレーカーにより処理しなかった課題IDまたは課題キーのリスト
             }
         """
-        total = len(issue_ids)
-        success = 0
-        failed_issues = []
-
-        for issue_id in issue_ids:
-            try:
-                # カテゴリIDはリストで指定する必要がある
-                result = self.backlog_client.update_issue(
+        # カテゴリIDはリストで指定する必要がある
+        return self._summarize(
+            issue_ids,
+            self._map_sequentially(
+                lambda issue_id: self.backlog_client.update_issue(
                     issue_id_or_key=issue_id, category_id=[category_id]
-                )
-                if result:
-                    success += 1
-                else:
-                    failed_issues.append(issue_id)
-            except Exception as e:
-                # エラーログの出力など
-                print(f"Error updating category for issue {issue_id}: {e}")
-                failed_issues.append(issue_id)
-
-        return {
-            "total": total,
-            "success": success,
-            "failed": total - success,
-            "failed_issues": failed_issues,
-        }
+                ),
+                issue_ids,
+            ),
+            "updating category for issue",
+        )
 
     def bulk_delete_issues(self, issue_ids: List[str]) -> Dict[str, Any]:
         """
@@ -258,28 +477,62 @@ class BulkOperationsService:
                 "total": 処理対象の総数,
                 "success": 成功した件数,
                 "failed": 失敗した件数,
-                "failed_issues": 失敗した課題IDまたは課題キーのリスト
+                "failed_issues": 失敗した課題IDまたは課題キーのリスト,
+                "deadline_exceeded": 処理期限により処理しなかった課題がある場合はTrue,
+                "circuit_open": サーキットブレーカーにより処理しなかった課題がある場合はTrue,
+                "skipped_issues": 処理期限またはサーキットブレーカーにより処理しなかった課題IDまたは課題キーのリスト
             }
         """
-        total = len(issue_ids)
-        success = 0
-        failed_issues = []
+        return self._summarize(
+            issue_ids,
+            self._map_sequentially(
+                self.backlog_client.delete_issue,
+                issue_ids,
+            ),
+            "deleting issue",
+        )
+
+    def bulk_add_comment(
+        self,
+        issue_ids: List[str],
+        content: str,
+        variables: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        複数チケットに同じ内容のコメントを一括追加
 
-        for issue_id in issue_ids:
-            try:
-                result = self.backlog_client.delete_issue(issue_id)
-                if result:
-                    success += 1
-                else:
-                    failed_issues.append(issue_id)
-            except Exception as e:
-                # エラーログの出力など
-                print(f"Error deleting issue {issue_id}: {e}")
-                failed_issues.append(issue_id)
+        コメント内容はテンプレートとして扱い、課題ごとに ${issue_id_or_key} と
+        variables で指定した値を埋め込む。未定義のプレースホルダーはそのまま残す。
+        各API呼び出しにはクライアント側のレート制限が適用される。
 
-        return {
-            "total": total,
-            "success": success,
-            "failed": total - success,
-            "failed_issues": failed_issues,
-        }
+        Args:
+            issue_ids: 課題IDまたは課題キーのリスト
+            content: コメント内容のテンプレート
+            variables: 課題IDまたは課題キーごとのテンプレート変数
+
+        Returns:
+            処理結果の統計情報
+            {
+                "total": 処理対象の総数,
+                "success": 成功した件数,
+                "failed": 失敗した件数,
+                "failed_issues": 失敗した課題IDまたは課題キーのリスト,
+                "deadline_exceeded": 処理期限により処理しなかった課題がある場合はTrue,
+                "circuit_open": サーキットブレーカーにより処理しなかった課題がある場合はTrue,
+                "skipped_issues": 処理期限またはサーキットブレーカーにより処理しなかった課題IDまたは課題キーのリスト
+            }
+        """
+        template = Template(content)
+        variables = variables or {}
+
+        def add_comment(issue_id: str) -> Optional[Dict[str, Any]]:
+            values = {"issue_id_or_key": issue_id, **variables.get(issue_id, {})}
+            return self.backlog_client.add_comment(
+                issue_id_or_key=issue_id, content=template.safe_substitute(values)
+            )
+
+        return self._summarize(
+            issue_ids,
+            self._map_concurrently(add_comment, issue_ids),
+            "adding comment to issue",
+        )
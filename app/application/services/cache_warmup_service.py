@@ -0,0 +1,125 @@
+"""
+キャッシュの事前取得サービス
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.infrastructure.backlog.backlog_client_wrapper import BacklogClientWrapper
+
+
+def get_warmup_project_keys() -> List[str]:
+    """
+    事前取得の対象とするプロジェクトキーを取得
+
+    Returns:
+        CACHE_WARMUP_PROJECTS（指定しない場合はBACKLOG_PROJECT）のプロジェクトキー一覧
+    """
+    value = settings.CACHE_WARMUP_PROJECTS or os.getenv("BACKLOG_PROJECT") or ""
+    return [key.strip() for key in value.split(",") if key.strip()]
+
+
+class CacheWarmupService:
+    """
+    キャッシュの事前取得サービス
+
+    起動直後の最初のリクエストでメタデータを1件ずつ取得しなくて済むように、
+    プロジェクト・ステータス・課題種別・カテゴリー・マイルストーン・発生バージョン・
+    ユーザー・優先度を並行して取得し、キャッシュに保存する
+    """
+
+    def __init__(
+        self, backlog_client: BacklogClientWrapper, max_workers: Optional[int] = None
+    ):
+        """
+        初期化
+
+        Args:
+            backlog_client: Backlogクライアント
+            max_workers: Backlog APIを同時に呼び出す最大数（指定しない場合は設定値）
+        """
+        self.backlog_client = backlog_client
+        self.max_workers = max(1, max_workers or settings.BULK_MAX_CONCURRENCY)
+
+    def _run_tasks(
+        self, tasks: List[Tuple[str, Callable[[], Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        取得処理を並行実行し、処理ごとの所要時間を計測する
+
+        Args:
+            tasks: (処理名, 取得処理) のリスト
+
+        Returns:
+            入力順に並んだ処理ごとの結果（name, success, elapsed_seconds）
+        """
+
+        def run(task: Tuple[str, Callable[[], Any]]) -> Dict[str, Any]:
+            name, func = task
+            started = time.perf_counter()
+            try:
+                success = func() is not None
+            except Exception as e:
+                print(f"Error warming up {name}: {e}")
+                success = False
+            return {
+                "name": name,
+                "success": success,
+                "elapsed_seconds": round(time.perf_counter() - started, 3),
+            }
+
+        if not tasks:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as executor:
+            return list(executor.map(run, tasks))
+
+    def warm_up(self, project_keys: List[str]) -> Dict[str, Any]:
+        """
+        プロジェクトのメタデータを事前に取得
+
+        プロジェクト情報・ユーザー・優先度を先に取得し、その後で見つかったプロジェクトの
+        ステータス・課題種別・カテゴリー・マイルストーン・発生バージョンを取得する。
+        プロジェクト情報を先に取得しておくことで、プロジェクトキーとプロジェクトIDの
+        どちらで参照されてもキャッシュが使われる
+
+        Args:
+            project_keys: プロジェクトキーのリスト
+
+        Returns:
+            事前取得の結果（projects, elapsed_seconds, tasks, failed）
+        """
+        client = self.backlog_client
+        started = time.perf_counter()
+
+        first_tasks: List[Tuple[str, Callable[[], Any]]] = [
+            (f"{key}:project", partial(client.get_project, key)) for key in project_keys
+        ]
+        first_tasks += [("users", client.get_users), ("priorities", client.get_priorities)]
+        results = self._run_tasks(first_tasks)
+
+        found = [key for key, result in zip(project_keys, results) if result["success"]]
+        loaders: Dict[str, Callable[[str], Any]] = {
+            "statuses": client.get_statuses,
+            "issue_types": client.get_issue_types,
+            "categories": client.get_categories,
+            "milestones": client.get_milestones,
+            "versions": client.get_versions,
+        }
+        results += self._run_tasks(
+            [
+                (f"{key}:{kind}", partial(load, key))
+                for key in found
+                for kind, load in loaders.items()
+            ]
+        )
+
+        return {
+            "projects": found,
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+            "tasks": results,
+            "failed": [result["name"] for result in results if not result["success"]],
+        }
@@ -0,0 +1,244 @@
+"""
+Backlogの更新通知の反映サービス
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.infrastructure.backlog.backlog_client_wrapper import BacklogClientWrapper
+from app.infrastructure.backlog.comment_cache import comment_cache
+from app.infrastructure.backlog.issue_cache import issue_cache
+from app.infrastructure.backlog.metadata_cache import metadata_cache
+from app.infrastructure.backlog.negative_cache import negative_cache
+from app.infrastructure.mirror.issue_mirror import IssueMirror, get_issue_mirror
+
+# 更新の種類（WebhookのtypeとアクティビティのtypeはBacklogで共通）
+ISSUE_CREATED = 1
+ISSUE_UPDATED = 2
+ISSUE_COMMENTED = 3
+ISSUE_DELETED = 4
+ISSUE_MULTI_UPDATED = 14
+PROJECT_USER_ADDED = 15
+PROJECT_USER_REMOVED = 16
+MILESTONE_CREATED = 22
+MILESTONE_UPDATED = 23
+MILESTONE_DELETED = 24
+PROJECT_GROUP_ADDED = 25
+PROJECT_GROUP_DELETED = 26
+
+
+class ChangeEventService:
+    """
+    Backlogの更新通知の反映サービス
+
+    Webhookやアクティビティで通知された更新を、課題キャッシュ・コメントキャッシュ・
+    メタデータキャッシュ・ローカルミラーに反映する。TTLを待たずに古いデータを破棄できるため、
+    キャッシュの有効期間を長くしてもBacklogの更新が反映される
+    """
+
+    def __init__(
+        self, backlog_client: BacklogClientWrapper, mirror: Optional[IssueMirror] = None
+    ):
+        """
+        初期化
+
+        Args:
+            backlog_client: Backlogクライアント
+            mirror: 課題のローカルミラー（指定しない場合は設定に従い、無効な場合はNone）
+        """
+        self.backlog_client = backlog_client
+        self.mirror = mirror or get_issue_mirror()
+
+    @property
+    def space(self) -> str:
+        """Backlogスペース名"""
+        return self.backlog_client.space
+
+    def _invalidate_issue(self, issue_id: Optional[int], issue_key: Optional[str]) -> None:
+        """
+        課題のキャッシュを破棄
+
+        コメントの追加・編集は課題の更新としても通知されるため、コメントキャッシュも破棄する。
+        コメントキャッシュは課題IDをキーにするため、課題キーだけの場合は課題キャッシュから課題IDを引く
+        """
+        if issue_id is None and issue_key is not None:
+            cached = issue_cache.get(self.space, issue_key, allow_stale=True)
+            if cached is not None and cached.get("id") is not None:
+                issue_id = int(cached["id"])
+        if issue_id is not None:
+            comment_cache.invalidate((self.space, int(issue_id)))
+        for value in (issue_id, issue_key):
+            if value is not None:
+                issue_cache.invalidate(self.space, value)
+                negative_cache.discard(("issue", self.space, str(value)))
+
+    def _refresh_mirror_issue(
+        self,
+        project_id: Optional[int],
+        issue_id: int,
+        actions: List[str],
+        refresh_comments: bool = False,
+    ) -> None:
+        """
+        ミラーの課題をBacklogから取得し直す
+
+        通知に含まれる課題やコメントの内容は使わず、Backlogから取得した内容だけを保存する。
+        取得できなかった場合は、プロジェクトを次回の読み取り時に同期する
+        """
+        if self.mirror is None:
+            return
+        try:
+            issue = self.backlog_client.get_issue(str(issue_id))
+            if issue and refresh_comments:
+                last_id = self.mirror.get_last_comment_id(self.space, issue_id)
+                comments = list(
+                    self.backlog_client.iter_issue_comments(str(issue_id), min_id=last_id)
+                )
+            else:
+                comments = []
+        except Exception as e:
+            print(f"Error refreshing issue {issue_id} in mirror: {e}")
+            issue = None
+        if issue:
+            self.mirror.upsert_issues(self.space, [issue])
+            actions.append(f"mirror:refresh_issue:{issue_id}")
+            if comments:
+                self.mirror.upsert_comments(self.space, issue_id, comments)
+                actions.append(f"mirror:refresh_comments:{issue_id}")
+        elif project_id is not None and self.mirror.mark_stale(self.space, project_id):
+            actions.append(f"mirror:mark_stale:{project_id}")
+
+    def _confirm_deleted(self, issue_id: int) -> bool:
+        """
+        課題がBacklogで削除されていることを確認
+
+        通知だけを根拠に削除すると存在する課題が見つからなくなるため、
+        Backlogが課題を返さない（404）ことを確認する。それ以外のエラーの場合は削除しない
+        """
+        try:
+            issue = self.backlog_client.get_issue(
+                str(issue_id), use_cache=False, raise_errors=True
+            )
+        except Exception as e:
+            print(f"Error confirming deletion of issue {issue_id}: {e}")
+            return False
+        return issue is None
+
+    def _invalidate_metadata(
+        self, kinds: Sequence[str], scopes: Sequence[Optional[str]]
+    ) -> int:
+        """
+        メタデータキャッシュの値を破棄
+
+        共有キャッシュの値も破棄するため、条件ではなくキーを指定して破棄する。
+        件数はプロセス内から破棄した値の数（共有キャッシュは数えるために読み込まない）
+        """
+        keys = [(kind, self.space, scope) for kind in kinds for scope in scopes]
+        return metadata_cache.delete(*keys)
+
+    def apply(
+        self,
+        event: Dict[str, Any],
+        pending_refreshes: Optional[Dict[int, Tuple[Optional[int], bool]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        更新通知をキャッシュとミラーに反映
+
+        通知は更新があったことの手がかりとしてだけ使い、課題とコメントはBacklogから取得し直す。
+        削除の通知は、Backlogで課題が見つからないことを確認してから反映する
+
+        Args:
+            event: WebhookのペイロードまたはアクティビティAPIの1件
+                （id, type, project, content）
+            pending_refreshes: 指定した場合はミラーの課題をすぐに取得し直さず、
+                {課題ID: (プロジェクトID, コメントも取得し直すかどうか)} として記録する
+
+        Returns:
+            反映結果（id, type, actions: 行った処理の一覧）。対象外の種類の場合 actions は空
+        """
+        event_type = event.get("type")
+        project = event.get("project") or {}
+        content = event.get("content") or {}
+        project_id = project.get("id")
+        project_key = project.get("projectKey")
+        actions: List[str] = []
+
+        if event_type in (ISSUE_CREATED, ISSUE_UPDATED, ISSUE_COMMENTED, ISSUE_DELETED):
+            issue_id = content.get("id")
+            key_id = content.get("key_id")
+            issue_key = f"{project_key}-{key_id}" if project_key and key_id else None
+            self._invalidate_issue(issue_id, issue_key)
+            actions.append(f"issue_cache:invalidate:{issue_key or issue_id}")
+            if (
+                issue_id is not None
+                and event_type == ISSUE_DELETED
+                and self._confirm_deleted(issue_id)
+            ):
+                # 否定キャッシュには確認に使った課題IDだけが登録される（課題キーは通知の内容のため登録しない）
+                if self.mirror is not None and self.mirror.delete_issue(self.space, issue_id):
+                    actions.append(f"mirror:delete_issue:{issue_id}")
+                if pending_refreshes is not None:
+                    pending_refreshes.pop(issue_id, None)
+            elif issue_id is not None:
+                refresh_comments = event_type == ISSUE_COMMENTED
+                if pending_refreshes is None:
+                    self._refresh_mirror_issue(project_id, issue_id, actions, refresh_comments)
+                elif self.mirror is not None:
+                    _, pending_comments = pending_refreshes.get(issue_id, (None, False))
+                    pending_refreshes[issue_id] = (
+                        project_id,
+                        pending_comments or refresh_comments,
+                    )
+
+        elif event_type == ISSUE_MULTI_UPDATED:
+            # 一括更新は課題ごとに取得し直さず、次回の読み取り時に差分を同期する
+            for link in content.get("link") or []:
+                key_id = link.get("key_id")
+                self._invalidate_issue(
+                    link.get("id"), f"{project_key}-{key_id}" if project_key and key_id else None
+                )
+                actions.append(f"issue_cache:invalidate:{link.get('id')}")
+            if (
+                self.mirror is not None
+                and project_id is not None
+                and self.mirror.mark_stale(self.space, project_id)
+            ):
+                actions.append(f"mirror:mark_stale:{project_id}")
+
+        elif event_type in (MILESTONE_CREATED, MILESTONE_UPDATED, MILESTONE_DELETED):
+            # マイルストーンと発生バージョンはBacklogでは同じバージョンとして管理される
+            scopes = [str(value) for value in (project_id, project_key) if value is not None]
+            count = self._invalidate_metadata(["milestones", "versions"], scopes)
+            actions.append(f"metadata_cache:invalidate:versions:{count}")
+
+        elif event_type in (
+            PROJECT_USER_ADDED,
+            PROJECT_USER_REMOVED,
+            PROJECT_GROUP_ADDED,
+            PROJECT_GROUP_DELETED,
+        ):
+            count = self._invalidate_metadata(["users"], [None])
+            scopes = [str(value) for value in (project_id, project_key) if value is not None]
+            count += self._invalidate_metadata(["project_users"], scopes)
+            actions.append(f"metadata_cache:invalidate:users:{count}")
+
+        return {"id": event.get("id"), "type": event_type, "actions": actions}
+
+    def apply_all(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        複数の更新通知を順に反映
+
+        同じ課題が何度も更新されている場合でも、ミラーの課題は最後に1回だけ取得し直す
+
+        Args:
+            events: 更新通知のリスト（古い順）
+
+        Returns:
+            反映結果（applied: 反映した更新通知の数, actions: 行った処理の一覧）
+        """
+        pending_refreshes: Dict[int, Tuple[Optional[int], bool]] = {}
+        actions: List[str] = []
+        for event in events:
+            actions.extend(self.apply(event, pending_refreshes)["actions"])
+        for issue_id, (project_id, refresh_comments) in pending_refreshes.items():
+            self._refresh_mirror_issue(project_id, issue_id, actions, refresh_comments)
+        return {"applied": len(events), "actions": actions}
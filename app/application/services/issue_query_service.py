@@ -0,0 +1,543 @@
+"""
+課題の検索クエリの解析と実行計画
+
+「type:バグ priority:高 milestone:"v2.0" assignee:tanaka is:overdue」のようなクエリを解析し、
+名前をメタデータキャッシュ経由でIDへ解決して、Backlog APIで絞り込める条件はすべて
+課題一覧APIに渡す。APIで絞り込めない条件（担当者なし・件名の部分一致など）だけを
+取得した課題に対して適用し、実行計画（渡した条件・API呼び出し回数・ページ数）を返す
+
+クエリの構文:
+    項目:値                 値はカンマ区切りでいずれか（例: status:未対応,処理中）
+    -項目:値                否定（例: -status:完了）
+    日付項目<値 / <= / > / >=  日付の範囲（created, updated, start, due。値は yyyy-MM-dd, today, today-7 など）
+    is:open / closed / overdue / parent / child / standalone
+    sort:項目 order:asc|desc limit:件数
+    その他の語               キーワード検索（Backlogの課題一覧APIの keyword）
+"""
+
+import re
+import unicodedata
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from app.core.concurrency import map_concurrently
+from app.core.config import settings
+from app.infrastructure.backlog.backlog_client_wrapper import BacklogClientWrapper
+
+# 名前からIDへ解決する項目: クエリの項目名 -> (課題一覧APIの条件, 名前解決表のキー, 課題の属性)
+_NAME_FIELDS: Dict[str, Tuple[str, str, str]] = {
+    "status": ("status_id", "statuses", "status"),
+    "assignee": ("assignee_id", "users", "assignee"),
+    "type": ("issue_type_id", "issue_types", "issueType"),
+    "category": ("category_id", "categories", "category"),
+    "milestone": ("milestone_id", "milestones", "milestone"),
+    "version": ("version_id", "versions", "versions"),
+    "priority": ("priority_id", "priorities", "priority"),
+    "created_by": ("created_user_id", "users", "createdUser"),
+}
+
+# 項目名の別名
+_FIELD_ALIASES = {
+    "issue_type": "type",
+    "issuetype": "type",
+    "creator": "created_by",
+    "createduser": "created_by",
+}
+
+# 値を持たない課題を "none" で指定できる項目
+_OPTIONAL_FIELDS = {"assignee", "category", "milestone", "version"}
+
+# 否定を「一覧の他のすべての値」として課題一覧APIに渡せる項目
+# （すべての課題が一覧のいずれか1つの値を持つ項目。担当者・作成者は参加していないユーザーのこともあり、
+# マイルストーンなどは値なしやアーカイブ済みの値があるため、否定は取得後に適用する）
+_CLOSED_FIELDS = {"status", "type", "priority"}
+
+# 日付の項目: クエリの項目名 -> 課題一覧APIの条件の接頭辞
+_DATE_FIELDS = {
+    "created": "created",
+    "updated": "updated",
+    "start": "start_date",
+    "due": "due_date",
+}
+
+# 並び替えの項目: クエリの値 -> 課題一覧APIの sort
+_SORT_KEYS = {
+    "type": "issueType",
+    "issue_type": "issueType",
+    "category": "category",
+    "version": "version",
+    "milestone": "milestone",
+    "summary": "summary",
+    "status": "status",
+    "priority": "priority",
+    "created": "created",
+    "created_by": "createdUser",
+    "updated": "updated",
+    "updated_by": "updatedUser",
+    "assignee": "assignee",
+    "start": "startDate",
+    "due": "dueDate",
+}
+
+# 完了ステータスのID（Backlogのすべてのプロジェクトで共通）
+CLOSED_STATUS_ID = 4
+
+# 親子課題の条件: is:の値 -> 課題一覧APIの parentChild
+_PARENT_CHILD = {"child": 2, "standalone": 3, "parent": 4}
+
+_TERM_PATTERN = re.compile(
+    r"""
+    (?P<negate>-)?
+    (?:
+        (?P<field>[A-Za-z_]+)(?P<op><=|>=|<|>|:)
+        (?P<value>(?:"[^"]*"|[^\s,"]+)(?:,(?:"[^"]*"|[^\s,"]+))*)
+      | "(?P<phrase>[^"]*)"
+      | (?P<word>\S+)
+    )
+    """,
+    re.VERBOSE,
+)
+_VALUE_PATTERN = re.compile(r'"([^"]*)"|([^\s,"]+)')
+_RELATIVE_DATE_PATTERN = re.compile(r"^today(?:([+-])(\d+))?$")
+
+PAGE_SIZE = 100
+
+
+def parse_query(text: str) -> List[Dict[str, Any]]:
+    """
+    クエリを条件のリストに解析
+
+    Args:
+        text: クエリ
+
+    Returns:
+        条件のリスト（field, op, values, negate）。項目のない語は field が "keyword"
+
+    Raises:
+        ValueError: 否定した語など、解析できない場合
+    """
+    terms: List[Dict[str, Any]] = []
+    for match in _TERM_PATTERN.finditer(text):
+        negate = bool(match.group("negate"))
+        if match.group("field"):
+            field = match.group("field").lower()
+            terms.append(
+                {
+                    "field": _FIELD_ALIASES.get(field, field),
+                    "op": match.group("op"),
+                    "values": [
+                        quoted or plain
+                        for quoted, plain in _VALUE_PATTERN.findall(match.group("value"))
+                    ],
+                    "negate": negate,
+                }
+            )
+            continue
+        word = match.group("phrase") if match.group("phrase") is not None else match.group("word")
+        if negate:
+            raise ValueError(f"Negation is only supported for field conditions: -{word}")
+        if word:
+            terms.append({"field": "keyword", "op": ":", "values": [word], "negate": False})
+    return terms
+
+
+def _fold(name: str) -> str:
+    return unicodedata.normalize("NFKC", name).casefold()
+
+
+def _parse_date(value: str, today: date) -> date:
+    """
+    日付の値（yyyy-MM-dd、today、today-7 など）を解析
+
+    Raises:
+        ValueError: 日付として解析できない場合
+    """
+    relative = _RELATIVE_DATE_PATTERN.match(value.lower())
+    if relative:
+        sign, days = relative.groups()
+        offset = int(days or 0) * (-1 if sign == "-" else 1)
+        return today + timedelta(days=offset)
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid date: {value}. Use yyyy-MM-dd, today or today-N.")
+
+
+def _issue_ids(issue: Dict[str, Any], attribute: str) -> List[int]:
+    """課題の属性（単一またはリスト）のIDの一覧"""
+    value = issue.get(attribute)
+    if isinstance(value, list):
+        return [item["id"] for item in value if isinstance(item, dict) and "id" in item]
+    if isinstance(value, dict) and "id" in value:
+        return [value["id"]]
+    return []
+
+
+class IssueQueryService:
+    """
+    課題の検索クエリを解析・計画・実行するサービス
+    """
+
+    def __init__(
+        self,
+        backlog_client: BacklogClientWrapper,
+        today: Callable[[], date] = date.today,
+        max_pages: Optional[int] = None,
+    ):
+        """
+        初期化
+
+        Args:
+            backlog_client: Backlogクライアント
+            today: 今日の日付を返す関数（today・is:overdue の解釈に使う）
+            max_pages: APIで絞り込めない条件がある場合に取得する最大ページ数（指定しない場合は設定値）
+        """
+        self.backlog_client = backlog_client
+        self.today = today
+        self.max_pages = max(1, max_pages or settings.QUERY_MAX_PAGES)
+
+    def _resolve_project(self, terms: List[Dict[str, Any]], project_id: Optional[int]) -> int:
+        """
+        クエリの project: または引数からプロジェクトIDを取得
+
+        Raises:
+            ValueError: プロジェクトを指定しなかった場合や、存在しない場合
+        """
+        for term in terms:
+            if term["field"] == "project":
+                value = term["values"][0]
+                if value.isdigit():
+                    return int(value)
+                project = self.backlog_client.get_project(value)
+                if not project:
+                    raise ValueError(f"Project not found: {value}")
+                return int(project["id"])
+        if project_id is None:
+            raise ValueError("Specify a project with project_id or project:KEY.")
+        return project_id
+
+    def _load_tables(
+        self, project_id: int, tables: List[str]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        名前の解決に使う一覧をメタデータキャッシュ経由で並行して取得
+
+        Raises:
+            Exception: 一覧を取得できなかった場合
+        """
+        loaders: Dict[str, Callable[[], List[Dict[str, Any]]]] = {
+            "statuses": lambda: self.backlog_client.get_statuses(project_id, raise_errors=True),
+            "users": lambda: self.backlog_client.get_project_users(
+                project_id, raise_errors=True
+            ),
+            "issue_types": lambda: self.backlog_client.get_issue_types(
+                project_id, raise_errors=True
+            ),
+            "categories": lambda: self.backlog_client.get_categories(
+                project_id, raise_errors=True
+            ),
+            "milestones": lambda: self.backlog_client.get_milestones(
+                project_id, raise_errors=True
+            ),
+            "versions": lambda: self.backlog_client.get_versions(project_id, raise_errors=True),
+            "priorities": lambda: self.backlog_client.get_priorities(raise_errors=True),
+        }
+        loaded: Dict[str, List[Dict[str, Any]]] = {}
+        results = map_concurrently(
+            lambda table: loaders[table](), tables, settings.BULK_MAX_CONCURRENCY
+        )
+        for table, (ok, value) in zip(tables, results):
+            if not ok:
+                raise Exception(f"Failed to load {table}: {value}") from value
+            loaded[table] = value or []
+        return loaded
+
+    @staticmethod
+    def _resolve_names(
+        field: str, names: List[str], items: List[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """
+        名前（ユーザーはログインIDも可、大文字・小文字と全角・半角を区別しない）をIDへ解決
+
+        Raises:
+            ValueError: 存在しない名前がある場合
+        """
+        index: Dict[str, int] = {}
+        for item in items:
+            for key in ("name", "userId"):
+                if item.get(key) and item.get("id") is not None:
+                    index.setdefault(_fold(str(item[key])), item["id"])
+        resolved = {}
+        for name in names:
+            if name.isdigit() and int(name) in index.values():
+                resolved[name] = int(name)
+            elif _fold(name) in index:
+                resolved[name] = index[_fold(name)]
+            else:
+                candidates = ", ".join(str(item.get("name")) for item in items[:20])
+                raise ValueError(f"Unknown {field}: {name}. Available: {candidates}")
+        return resolved
+
+    def plan(self, text: str, project_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        クエリの実行計画を作成
+
+        Args:
+            text: クエリ
+            project_id: プロジェクトID（クエリで project: を指定しない場合は必須）
+
+        Returns:
+            実行計画（project_id, pushdown: 課題一覧APIに渡す条件, local: 取得後に適用する条件,
+            resolved: 解決した名前とID, limit, empty: 条件に一致する課題がないことが確定したかどうか,
+            lookups: 計画のために行ったプロジェクト・親課題・名前解決用の一覧の取得回数
+            （キャッシュから返した取得も数える））
+
+        Raises:
+            ValueError: クエリが不正な場合や、名前を解決できない場合
+        """
+        terms = parse_query(text)
+        lookups = sum(
+            1 for term in terms if term["field"] == "project" and not term["values"][0].isdigit()
+        )
+        project_id = self._resolve_project(terms, project_id)
+        today = self.today()
+
+        tables = sorted(
+            {
+                _NAME_FIELDS[term["field"]][1]
+                for term in terms
+                if term["field"] in _NAME_FIELDS
+                and any(_fold(value) != "none" for value in term["values"])
+            }
+            | (
+                {"statuses"}
+                if any(
+                    term["field"] == "is" and set(term["values"]) & {"open", "overdue"}
+                    for term in terms
+                )
+                else set()
+            )
+        )
+        loaded = self._load_tables(project_id, tables)
+        lookups += len(tables)
+
+        id_filters: Dict[str, Set[int]] = {}
+        pushdown: Dict[str, Any] = {}
+        local: List[Dict[str, Any]] = []
+        resolved: Dict[str, Dict[str, int]] = {}
+        keywords: List[str] = []
+        limit: Optional[int] = None
+
+        def restrict(kwarg: str, ids: Set[int]) -> None:
+            id_filters[kwarg] = id_filters[kwarg] & ids if kwarg in id_filters else set(ids)
+
+        def bound(prefix: str, since: Optional[date], until: Optional[date]) -> None:
+            if since is not None:
+                current = pushdown.get(f"{prefix}_since")
+                value = since.isoformat()
+                pushdown[f"{prefix}_since"] = max(current, value) if current else value
+            if until is not None:
+                current = pushdown.get(f"{prefix}_until")
+                value = until.isoformat()
+                pushdown[f"{prefix}_until"] = min(current, value) if current else value
+
+        for term in terms:
+            field, op, values, negate = term["field"], term["op"], term["values"], term["negate"]
+            if field == "project":
+                continue
+            if field == "keyword":
+                keywords.extend(values)
+            elif field in _NAME_FIELDS:
+                if op != ":":
+                    raise ValueError(f"{field} only supports ':'")
+                kwarg, table, attribute = _NAME_FIELDS[field]
+                names = [value for value in values if _fold(value) != "none"]
+                include_none = len(names) != len(values)
+                if include_none and field not in _OPTIONAL_FIELDS:
+                    raise ValueError(f"{field}:none is not supported")
+                ids = self._resolve_names(field, names, loaded.get(table, []))
+                resolved.setdefault(field, {}).update(ids)
+                if include_none or (negate and field not in _CLOSED_FIELDS):
+                    # Backlog APIは「値なし」や否定で絞り込めないため、取得後に適用する
+                    local.append(
+                        {
+                            "field": field,
+                            "attribute": attribute,
+                            "ids": sorted(set(ids.values())),
+                            "include_none": include_none,
+                            "negate": negate,
+                        }
+                    )
+                elif negate:
+                    all_ids = {item["id"] for item in loaded.get(table, []) if "id" in item}
+                    restrict(kwarg, all_ids - set(ids.values()))
+                else:
+                    restrict(kwarg, set(ids.values()))
+            elif field in _DATE_FIELDS:
+                if negate or len(values) != 1:
+                    raise ValueError(f"{field} takes a single date and cannot be negated")
+                day = _parse_date(values[0], today)
+                prefix = _DATE_FIELDS[field]
+                if op == ":":
+                    bound(prefix, day, day)
+                elif op == ">=":
+                    bound(prefix, day, None)
+                elif op == ">":
+                    bound(prefix, day + timedelta(days=1), None)
+                elif op == "<=":
+                    bound(prefix, None, day)
+                else:
+                    bound(prefix, None, day - timedelta(days=1))
+            elif field == "is":
+                if negate:
+                    raise ValueError("is: cannot be negated")
+                statuses = {item["id"] for item in loaded.get("statuses", [])}
+                for value in values:
+                    value = value.lower()
+                    if value == "open" or value == "overdue":
+                        restrict("status_id", statuses - {CLOSED_STATUS_ID})
+                        if value == "overdue":
+                            bound("due_date", None, today - timedelta(days=1))
+                    elif value == "closed":
+                        restrict("status_id", {CLOSED_STATUS_ID})
+                    elif value in _PARENT_CHILD:
+                        pushdown["parent_child"] = _PARENT_CHILD[value]
+                    else:
+                        raise ValueError(f"Unknown is: value: {value}")
+            elif field == "parent":
+                parent_ids = []
+                for value in values:
+                    if value.isdigit():
+                        parent_ids.append(int(value))
+                        continue
+                    parent = self.backlog_client.get_issue(value, raise_errors=True)
+                    lookups += 1
+                    if not parent:
+                        raise ValueError(f"Parent issue not found: {value}")
+                    parent_ids.append(int(parent["id"]))
+                pushdown["parent_issue_id"] = parent_ids
+            elif field == "summary":
+                local.append({"field": "summary", "contains": values, "negate": negate})
+            elif field == "sort":
+                if values[0] not in _SORT_KEYS:
+                    raise ValueError(
+                        f"Unknown sort key: {values[0]}. Available: {', '.join(_SORT_KEYS)}"
+                    )
+                pushdown["sort"] = _SORT_KEYS[values[0]]
+            elif field == "order":
+                if values[0] not in ("asc", "desc"):
+                    raise ValueError("order must be asc or desc")
+                pushdown["order"] = values[0]
+            elif field == "limit":
+                if not values[0].isdigit() or int(values[0]) < 1:
+                    raise ValueError("limit must be a positive integer")
+                limit = int(values[0])
+            else:
+                raise ValueError(f"Unknown field: {field}")
+
+        if keywords:
+            pushdown["keyword"] = " ".join(keywords)
+        for kwarg, id_set in id_filters.items():
+            pushdown[kwarg] = sorted(id_set)
+        empty = any(not id_set for id_set in id_filters.values()) or any(
+            pushdown.get(f"{prefix}_since", "") > pushdown.get(f"{prefix}_until", "9999")
+            for prefix in _DATE_FIELDS.values()
+        )
+        return {
+            "project_id": project_id,
+            "pushdown": pushdown,
+            "local": local,
+            "resolved": resolved,
+            "limit": limit,
+            "empty": empty,
+            "lookups": lookups,
+        }
+
+    @staticmethod
+    def _matches(issue: Dict[str, Any], condition: Dict[str, Any]) -> bool:
+        """取得後に適用する条件に課題が一致するかどうか"""
+        result: bool
+        if condition["field"] == "summary":
+            summary = _fold(issue.get("summary") or "")
+            result = all(_fold(text) in summary for text in condition["contains"])
+        else:
+            ids = _issue_ids(issue, condition["attribute"])
+            result = bool(condition["include_none"] and not ids) or any(
+                value in condition["ids"] for value in ids
+            )
+        return result != bool(condition["negate"])
+
+    def query(
+        self,
+        text: str,
+        project_id: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        クエリで課題を検索
+
+        Args:
+            text: クエリ
+            project_id: プロジェクトID（クエリで project: を指定しない場合は必須）
+            limit: 取得件数（クエリの limit: を優先。指定しない場合は20件）
+            offset: 課題一覧APIの取得開始位置（前回の結果の plan.next_offset）
+
+        Returns:
+            検索結果（issues: 課題一覧, plan: 実行計画と api_calls（lookups と pages の合計）・
+            pages: 課題一覧APIの呼び出し回数・scanned・truncated、
+            続きがある場合に次の取得開始位置とする next_offset）
+
+        Raises:
+            ValueError: クエリが不正な場合や、名前を解決できない場合
+            Exception: 名前解決用の一覧や課題一覧を取得できなかった場合
+        """
+        plan = self.plan(text, project_id)
+        limit = plan["limit"] or limit or 20
+        plan["limit"] = limit
+        # APIで絞り込めない条件がない場合は必要な件数だけを取得する
+        page_size = PAGE_SIZE if plan["local"] else min(PAGE_SIZE, limit)
+        max_pages = self.max_pages if plan["local"] else -(-limit // PAGE_SIZE)
+
+        issues: List[Dict[str, Any]] = []
+        pages = scanned = 0
+        truncated = False
+        # 続きがある場合に次の取得開始位置とする、最後に返した課題の次の位置
+        next_offset: Optional[int] = None
+        while not plan["empty"] and len(issues) < limit:
+            if pages >= max_pages:
+                truncated = bool(plan["local"])
+                next_offset = offset
+                break
+            page = self.backlog_client.get_issues(
+                project_id=plan["project_id"],
+                count=page_size,
+                offset=offset or None,
+                raise_errors=True,
+                **plan["pushdown"],
+            )
+            pages += 1
+            scanned += len(page)
+            for position, issue in enumerate(page, start=offset + 1):
+                if all(self._matches(issue, condition) for condition in plan["local"]):
+                    issues.append(issue)
+                    if len(issues) == limit:
+                        next_offset = position
+                        break
+            if len(page) < page_size:
+                # 最後のページの途中で件数に達した場合だけ続きがある
+                if next_offset is not None and next_offset >= offset + len(page):
+                    next_offset = None
+                break
+            offset += page_size
+
+        plan.update(
+            {
+                "api_calls": plan["lookups"] + pages,
+                "pages": pages,
+                "scanned": scanned,
+                "truncated": truncated,
+                "next_offset": next_offset,
+            }
+        )
+        return {"issues": issues, "plan": plan}
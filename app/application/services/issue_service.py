@@ -2,13 +2,37 @@
 課題管理サービス
 """
 
-from typing import Any, Dict, List, Optional, Union
+import heapq
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 import logging # logging をインポート
 
+from app.core.concurrency import map_concurrently
+from app.core.config import settings
+
 from app.infrastructure.backlog.backlog_client_wrapper import BacklogClientWrapper, BacklogApiError # BacklogApiError をインポート
+from app.infrastructure.mirror.issue_mirror import IssueMirror, get_issue_mirror
+from app.infrastructure.mirror.mirror_sync import IssueMirrorSync
 
 logger = logging.getLogger(__name__) # ロガーを取得
 
+# 課題一覧の並び替えに使える項目（カスタム属性は customField_{ID}）
+ISSUE_SORT_PATTERN = (
+    r"^(issueType|category|version|milestone|summary|status|priority|attachment|sharedFile"
+    r"|created|createdUser|updated|updatedUser|assignee|startDate|dueDate|estimatedHours"
+    r"|actualHours|childIssue|customField_\d+)$"
+)
+# 日付の絞り込み条件の形式（yyyy-MM-dd）
+DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+
+# 課題の取得時に合わせて取得できる関連情報
+ISSUE_EXPANSIONS = ("comments", "children", "parent")
+# 関連情報として取得するコメント数（新しい順）
+EXPANDED_COMMENT_COUNT = 20
+
+# 複数プロジェクトの検索で結果を併合できる並び替えの項目（値はISO 8601の日時・日付）
+MULTI_PROJECT_SORT_KEYS = ("updated", "created", "dueDate", "startDate")
+
 class IssueService:
     """
     課題管理サービス
@@ -16,14 +40,61 @@ class IssueService:
     課題関連の業務ロジックを実装するサービスクラス
     """
 
-    def __init__(self, backlog_client: BacklogClientWrapper):
+    def __init__(
+        self, backlog_client: BacklogClientWrapper, mirror: Optional[IssueMirror] = None
+    ):
         """
         初期化
 
         Args:
             backlog_client: Backlogクライアント
+            mirror: 課題のローカルミラー（指定しない場合は設定に従い、無効な場合はNone）
         """
         self.backlog_client = backlog_client
+        self.mirror = mirror or get_issue_mirror()
+
+    def _get_issues_from_mirror(
+        self,
+        project_id: int,
+        status_id: Optional[List[int]],
+        assignee_id: Optional[int],
+        count: int,
+        max_staleness: float,
+        offset: int = 0,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        ローカルミラーから課題一覧を取得
+
+        最後の同期から max_staleness 秒を過ぎている場合は、先に差分を同期する
+
+        Args:
+            project_id: プロジェクトID
+            status_id: ステータスID
+            assignee_id: 担当者ID
+            count: 取得件数
+            max_staleness: 許容する最後の同期からの経過秒数
+            offset: 取得開始位置
+
+        Returns:
+            課題一覧。同期に失敗した場合はNone
+        """
+        if self.mirror is None:
+            return None
+        try:
+            IssueMirrorSync(self.backlog_client, self.mirror).sync_project(
+                project_id, max_staleness=max_staleness
+            )
+        except Exception as e:
+            print(f"Error syncing issue mirror for project {project_id}: {e}")
+            return None
+        return self.mirror.query_issues(
+            self.backlog_client.space,
+            project_id=project_id,
+            status_id=status_id,
+            assignee_id=assignee_id,
+            count=count,
+            offset=offset,
+        )
 
     def get_issues(
         self,
@@ -32,16 +103,25 @@ class IssueService:
         assignee_id: Optional[int] = None,
         keyword: Optional[str] = None,
         count: int = 20,
+        max_staleness: Optional[float] = None,
+        **filters: Any,
     ) -> List[Dict[str, Any]]:
         """
         課題一覧を取得
 
+        max_staleness を指定し、ローカルミラーが有効でプロジェクトを指定した場合
+        （キーワード検索とその他の絞り込み条件を除く）はミラーから取得する。
+        この場合は同期に失敗してBacklogから取得する場合も、ミラーと同じ更新日時の降順で返す
+
         Args:
             project_id: プロジェクトID（指定しない場合は全プロジェクト）
             status_id: ステータスID（指定しない場合は全ステータス）
             assignee_id: 担当者ID（指定しない場合は全担当者）
             keyword: 検索キーワード
             count: 取得件数（デフォルト20件）
+            max_staleness: ミラーから取得する場合に許容する最後の同期からの経過秒数
+            filters: その他の絞り込み・並び替えの条件（issue_type_id, milestone_id,
+                due_date_until, sort, offset など。BacklogClientWrapper.get_issues を参照）
 
         Returns:
             課題一覧
@@ -49,6 +129,23 @@ class IssueService:
         Raises:
             Exception: API呼び出しに失敗した場合
         """
+        # 値を指定しなかった条件は送信しない
+        filters = {key: value for key, value in filters.items() if value not in (None, [])}
+        # 取得開始位置はミラーでも指定できるため、ミラーから取得するかの判定に含めない
+        offset = filters.get("offset") or 0
+        if (
+            max_staleness is not None
+            and project_id is not None
+            and not keyword
+            and not {key for key in filters if key != "offset"}
+        ):
+            issues = self._get_issues_from_mirror(
+                project_id, status_id, assignee_id, count, max_staleness, offset
+            )
+            if issues is not None:
+                return issues
+            # 同期に失敗した場合も、前後のページとつながるようにミラーと同じ並び順で取得する
+            filters.update(sort="updated", order="desc")
         try:
             issues = self.backlog_client.get_issues(
                 project_id=project_id,
@@ -56,6 +153,7 @@ class IssueService:
                 assignee_id=assignee_id,
                 keyword=keyword,
                 count=count,
+                **filters,
             )
             return issues
         except Exception as e:
@@ -64,19 +162,201 @@ class IssueService:
             # 呼び出し元でハンドリングできるように例外を再スロー
             raise Exception(f"Failed to get issues: {e}") from e
 
-    def get_issue(self, issue_id_or_key: str) -> Optional[Dict[str, Any]]:
+    def search_issues(
+        self,
+        query: str,
+        project_id: Optional[int] = None,
+        count: int = 20,
+        max_staleness: Optional[float] = None,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        ローカルミラーの全文検索索引で課題を検索
+
+        Args:
+            query: 検索語（空白で区切った場合はすべてを含む課題）
+            project_id: プロジェクトID（指定しない場合はミラー内の全プロジェクト）
+            count: 取得件数（デフォルト20件）
+            max_staleness: プロジェクトを指定した場合に許容する最後の同期からの経過秒数
+                （過ぎている場合は先に差分を同期する。指定しない場合は同期しない）
+            offset: 取得開始位置
+
+        Returns:
+            関連度の高い順の検索結果（issue, score, matched_field, snippet）
+
+        Raises:
+            ValueError: ローカルミラーが無効な場合
+        """
+        if self.mirror is None:
+            raise ValueError("Full-text search requires the local issue mirror (MIRROR_ENABLED).")
+        if project_id is not None and max_staleness is not None:
+            try:
+                IssueMirrorSync(self.backlog_client, self.mirror).sync_project(
+                    project_id, max_staleness=max_staleness
+                )
+            except Exception as e:
+                # 同期に失敗した場合は同期済みの範囲で検索する
+                print(f"Error syncing issue mirror for project {project_id}: {e}")
+        return self.mirror.search_issues(
+            self.backlog_client.space, query, project_id=project_id, count=count, offset=offset
+        )
+
+    def _resolve_project_ids(self, projects: List[Union[int, str]]) -> List[int]:
+        """
+        プロジェクトIDまたはプロジェクトキーのリストをプロジェクトIDのリストに変換
+
+        Raises:
+            ValueError: 存在しないプロジェクトキーがある場合
+        """
+        project_ids: List[int] = []
+        for project in projects:
+            if isinstance(project, int) or str(project).isdigit():
+                project_id = int(project)
+            else:
+                found = self.backlog_client.get_project(str(project))
+                if not found:
+                    raise ValueError(f"Project not found: {project}")
+                project_id = int(found["id"])
+            if project_id not in project_ids:
+                project_ids.append(project_id)
+        return project_ids
+
+    def get_issues_across_projects(
+        self,
+        projects: List[Union[int, str]],
+        limit: int = 100,
+        sort: str = "updated",
+        order: str = "desc",
+        offsets: Optional[List[int]] = None,
+        **filters: Any,
+    ) -> Dict[str, Any]:
+        """
+        複数のプロジェクトの課題を1つの並び順で取得
+
+        プロジェクトIDを MULTI_PROJECT_CHUNK_SIZE 件ずつ1つのリクエストにまとめ、
+        まとめたリクエストを並行して送信する。各リクエストの結果はBacklog側で並び替え済みのため、
+        先頭から順に併合し、limit 件に達した時点で残りのページは取得しない
+
+        Args:
+            projects: プロジェクトIDまたはプロジェクトキーのリスト（空の場合は全プロジェクト）
+            limit: 取得件数
+            sort: 並び替えの項目（updated, created, dueDate, startDate）
+            order: 並び順（"asc"または"desc"）
+            offsets: まとめたリクエストごとの取得開始位置（前回の結果の offsets。指定しない場合は先頭から）
+            filters: その他の絞り込み条件（BacklogClientWrapper.get_issues を参照）
+
+        Returns:
+            検索結果（issues: 課題一覧, project_ids: 対象のプロジェクトID, api_calls: 課題一覧APIの呼び出し回数,
+            offsets: 続きを取得する場合のまとめたリクエストごとの取得開始位置）
+
+        Raises:
+            ValueError: 並び替えの項目が不正な場合や、存在しないプロジェクトがある場合
+            Exception: 課題一覧を取得できなかった場合
+        """
+        if sort not in MULTI_PROJECT_SORT_KEYS:
+            raise ValueError(
+                f"sort must be one of {', '.join(MULTI_PROJECT_SORT_KEYS)} to merge projects."
+            )
+        if order not in ("asc", "desc"):
+            raise ValueError("order must be asc or desc")
+        filters = {key: value for key, value in filters.items() if value not in (None, [])}
+        project_ids = self._resolve_project_ids(projects)
+        chunk_size = max(1, settings.MULTI_PROJECT_CHUNK_SIZE)
+        chunks: List[Optional[List[int]]] = [
+            project_ids[i : i + chunk_size] for i in range(0, len(project_ids), chunk_size)
+        ] or [None]
+        offsets = list(offsets or [0] * len(chunks))
+        if len(offsets) != len(chunks):
+            raise ValueError("offsets must have one position for each chunk of projects")
+        page_size = min(100, limit)
+        api_calls = len(chunks)
+
+        def fetch(chunk: Optional[List[int]], offset: int) -> List[Dict[str, Any]]:
+            return self.backlog_client.get_issues(
+                project_id=chunk,
+                count=page_size,
+                offset=offset or None,
+                sort=sort,
+                order=order,
+                raise_errors=True,
+                **filters,
+            )
+
+        # 各リクエストの1ページ目は並行して取得し、2ページ目以降は併合で必要になった時点で取得する
+        first_pages = map_concurrently(
+            lambda position: fetch(*position),
+            list(zip(chunks, offsets)),
+            settings.BULK_MAX_CONCURRENCY,
+        )
+
+        def stream(
+            index: int, chunk: Optional[List[int]], page: List[Dict[str, Any]]
+        ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+            nonlocal api_calls
+            start = offset = offsets[index]
+            while True:
+                yield from ((index, issue) for issue in page)
+                offset += page_size
+                if len(page) < page_size or offset - start >= limit:
+                    return
+                api_calls += 1
+                try:
+                    page = fetch(chunk, offset)
+                except Exception as e:
+                    raise Exception(f"Failed to get issues of projects {chunk}: {e}") from e
+
+        streams = []
+        for index, (chunk, (ok, value)) in enumerate(zip(chunks, first_pages)):
+            if not ok:
+                raise Exception(f"Failed to get issues of projects {chunk}: {value}") from value
+            streams.append(stream(index, chunk, value))
+
+        def sort_key(item: Tuple[int, Dict[str, Any]]) -> Any:
+            value = item[1].get(sort)
+            # 値のない課題は並び順によらず最後にする
+            return (value is not None, value or "") if order == "desc" else (value is None, value or "")
+
+        merged = list(islice(heapq.merge(*streams, key=sort_key, reverse=order == "desc"), limit))
+        # 併合した結果に含めた件数だけ、まとめたリクエストごとの取得開始位置を進める
+        for index, _ in merged:
+            offsets[index] += 1
+        return {
+            "issues": [issue for _, issue in merged],
+            "project_ids": project_ids,
+            "api_calls": api_calls,
+            "offsets": offsets,
+        }
+
+    def get_issue(
+        self, issue_id_or_key: str, expand: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         課題情報を取得
 
+        expand を指定した場合は、関連情報（comments: コメント, children: 子課題, parent: 親課題）を
+        並行して取得し、課題情報の同名のキーに含めて返す。取得できなかった関連情報は
+        expand_errors に理由を含める
+
         Args:
             issue_id_or_key: 課題IDまたは課題キー
+            expand: 合わせて取得する関連情報のリスト
 
         Returns:
             課題情報。課題が存在しない場合はNone
 
         Raises:
+            ValueError: expand に不明な関連情報を指定した場合
             Exception: API呼び出しに失敗した場合
         """
+        expand = list(dict.fromkeys(expand or []))
+        unknown = [name for name in expand if name not in ISSUE_EXPANSIONS]
+        if unknown:
+            raise ValueError(
+                f"Unknown expand value(s): {', '.join(unknown)}. "
+                f"Available: {', '.join(ISSUE_EXPANSIONS)}"
+            )
+        if expand:
+            return self._get_expanded_issue(issue_id_or_key, expand)
         try:
             issue = self.backlog_client.get_issue(issue_id_or_key)
             return issue
@@ -86,6 +366,77 @@ class IssueService:
             # 呼び出し元でハンドリングできるように例外を再スロー
             raise Exception(f"Failed to get issue {issue_id_or_key}: {e}") from e
 
+    def _get_expanded_issue(
+        self, issue_id_or_key: str, expand: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        課題情報と関連情報を並行して取得
+
+        コメントと（課題IDで指定した場合の）子課題は課題情報と同時に取得し、
+        課題情報が必要な親課題などは課題情報の取得後に取得する
+
+        Args:
+            issue_id_or_key: 課題IDまたは課題キー
+            expand: 合わせて取得する関連情報のリスト
+
+        Returns:
+            関連情報を含む課題情報。課題が存在しない場合はNone
+
+        Raises:
+            Exception: 課題情報を取得できなかった場合
+        """
+        issue: Dict[str, Any] = {}
+
+        def load(name: str) -> Any:
+            if name == "issue":
+                return self.backlog_client.get_issue(issue_id_or_key)
+            if name == "comments":
+                return self.backlog_client.get_issue_comments(
+                    issue_id_or_key=issue_id_or_key, count=EXPANDED_COMMENT_COUNT
+                )
+            if name == "children":
+                return self.backlog_client.get_issues(
+                    parent_issue_id=[int(issue.get("id") or issue_id_or_key)],
+                    count=100,
+                    sort="created",
+                    order="asc",
+                    raise_errors=True,
+                )
+            parent_id = issue.get("parentIssueId")
+            return self.backlog_client.get_issue(str(parent_id)) if parent_id else None
+
+        first = ["issue"] + [
+            name
+            for name in expand
+            if name == "comments" or (name == "children" and issue_id_or_key.isdigit())
+        ]
+        results = dict(
+            zip(first, map_concurrently(load, first, settings.BULK_MAX_CONCURRENCY))
+        )
+        ok, found = results.pop("issue")
+        if not ok:
+            print(f"Error getting issue {issue_id_or_key}: {found}")
+            raise Exception(f"Failed to get issue {issue_id_or_key}: {found}") from found
+        if found is None:
+            return None
+        # キャッシュされた課題情報を変更しないように複製する
+        issue.update(found)
+
+        second = [name for name in expand if name not in results]
+        results.update(zip(second, map_concurrently(load, second, settings.BULK_MAX_CONCURRENCY)))
+
+        errors = {}
+        for name in expand:
+            ok, value = results[name]
+            if ok:
+                issue[name] = value
+            else:
+                issue[name] = None
+                errors[name] = str(value)
+        if errors:
+            issue["expand_errors"] = errors
+        return issue
+
     def create_issue(
         self,
         project_id: Optional[int] = None,
@@ -297,14 +648,26 @@ class IssueService:
             ) from e
 
     def get_issue_comments(
-        self, issue_id_or_key: str, count: int = 20
+        self,
+        issue_id_or_key: str,
+        count: int = 20,
+        since_comment_id: Optional[int] = None,
+        before_comment_id: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         課題のコメント一覧を取得
 
+        since_comment_idを指定した場合は、そのIDより新しいコメントをID昇順で返す。
+        返された最後のコメントIDを次のsince_comment_idに指定することで、
+        件数の上限を超えるコメントも順に取得できる。
+        それ以外の場合は新しい順で返し、返された最後のコメントIDを次のbefore_comment_idに指定すると
+        それより古いコメントを取得できる
+
         Args:
             issue_id_or_key: 課題IDまたは課題キー
             count: 取得件数（デフォルト20件）
+            since_comment_id: このIDより新しいコメントを取得（0の場合は最初から）
+            before_comment_id: このIDより古いコメントを新しい順で取得
 
         Returns:
             コメント一覧
@@ -313,6 +676,20 @@ class IssueService:
             Exception: API呼び出しに失敗した場合
         """
         try:
+            if since_comment_id is not None:
+                return self.backlog_client.get_issue_comments_since(
+                    issue_id_or_key=issue_id_or_key,
+                    since_comment_id=since_comment_id,
+                    count=count,
+                )
+            if before_comment_id is not None:
+                comments = self.backlog_client.get_issue_comments(
+                    issue_id_or_key=issue_id_or_key,
+                    count=count,
+                    max_id=before_comment_id - 1,
+                    order="desc",
+                )
+                return [comment for comment in comments if comment["id"] < before_comment_id]
             comments = self.backlog_client.get_issue_comments(
                 issue_id_or_key=issue_id_or_key, count=count
             )
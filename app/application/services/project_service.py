@@ -2,10 +2,46 @@
 プロジェクト管理サービス
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from app.core.concurrency import map_concurrently
+from app.core.config import settings
 from app.infrastructure.backlog.backlog_client_wrapper import BacklogClientWrapper
 
+# プロジェクトのコンテキストの項目: 項目名 -> (一覧を取得する関数, 返す属性)
+_CONTEXT_SECTIONS: Dict[
+    str, Tuple[Callable[[BacklogClientWrapper, str], List[Dict[str, Any]]], Tuple[str, ...]]
+] = {
+    "statuses": (
+        lambda client, key: client.get_statuses(key, raise_errors=True),
+        ("id", "name"),
+    ),
+    "issue_types": (
+        lambda client, key: client.get_issue_types(key, raise_errors=True),
+        ("id", "name"),
+    ),
+    "categories": (
+        lambda client, key: client.get_categories(key, raise_errors=True),
+        ("id", "name"),
+    ),
+    "milestones": (
+        lambda client, key: client.get_milestones(key, raise_errors=True),
+        ("id", "name", "startDate", "releaseDueDate", "archived"),
+    ),
+    "versions": (
+        lambda client, key: client.get_versions(key, raise_errors=True),
+        ("id", "name", "startDate", "releaseDueDate", "archived"),
+    ),
+    "users": (
+        lambda client, key: client.get_project_users(key, raise_errors=True),
+        ("id", "userId", "name"),
+    ),
+    "priorities": (
+        lambda client, key: client.get_priorities(raise_errors=True),
+        ("id", "name"),
+    ),
+}
+
 
 class ProjectService:
     """
@@ -192,3 +228,66 @@ class ProjectService:
             raise Exception(
                 f"Failed to get versions for project {project_key}: {e}"
             ) from e
+
+    def get_project_context(
+        self,
+        project_key: str,
+        sections: Optional[List[str]] = None,
+        include_archived: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        課題の作成・検索に必要なプロジェクトの情報をまとめて取得
+
+        ステータス・種別・カテゴリー・マイルストーン・発生バージョン・参加ユーザー・優先度を
+        メタデータキャッシュ経由で並行して取得し、ID・名前などの必要な属性だけに絞って返す。
+        取得できなかった項目は errors に理由を含める
+
+        Args:
+            project_key: プロジェクトキー
+            sections: 取得する項目（指定しない場合はすべて）
+            include_archived: アーカイブ済みのマイルストーン・発生バージョンを含めるかどうか
+
+        Returns:
+            プロジェクトのコンテキスト（project と各項目の一覧）。プロジェクトが存在しない場合はNone
+
+        Raises:
+            ValueError: 不明な項目を指定した場合
+        """
+        sections = list(dict.fromkeys(sections or _CONTEXT_SECTIONS))
+        unknown = [name for name in sections if name not in _CONTEXT_SECTIONS]
+        if unknown:
+            raise ValueError(
+                f"Unknown section(s): {', '.join(unknown)}. "
+                f"Available: {', '.join(_CONTEXT_SECTIONS)}"
+            )
+
+        # 先にプロジェクト情報を取得し、キーで取得した一覧をIDで取得した一覧とキャッシュで共有する
+        project = self.backlog_client.get_project(project_key)
+        if project is None:
+            return None
+
+        results = map_concurrently(
+            lambda name: _CONTEXT_SECTIONS[name][0](self.backlog_client, project_key),
+            sections,
+            settings.BULK_MAX_CONCURRENCY,
+        )
+        context: Dict[str, Any] = {
+            "project": {
+                key: project.get(key) for key in ("id", "projectKey", "name") if key in project
+            }
+        }
+        errors = {}
+        for name, (ok, items) in zip(sections, results):
+            if not ok:
+                context[name] = None
+                errors[name] = str(items)
+                continue
+            fields = _CONTEXT_SECTIONS[name][1]
+            context[name] = [
+                {key: item[key] for key in fields if item.get(key) is not None}
+                for item in items or []
+                if include_archived or not item.get("archived")
+            ]
+        if errors:
+            context["errors"] = errors
+        return context
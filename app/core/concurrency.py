@@ -0,0 +1,46 @@
+"""
+Backlog API呼び出しの並行実行
+
+同時実行数を制限したスレッドプールで要素ごとの処理を実行する。
+リクエストの処理期限をワーカースレッドに引き継ぐため、要素ごとに呼び出し元のコンテキストで実行する
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Any, Callable, List, Tuple
+
+from app.core.deadline import DeadlineExceededError, deadline_exceeded
+
+
+def map_concurrently(
+    func: Callable[[Any], Any], items: List[Any], max_workers: int
+) -> List[Tuple[bool, Any]]:
+    """
+    要素ごとの処理を同時実行数を制限して並行実行する
+
+    リクエストの処理期限が近づいた後は新しい要素の処理を開始せず、
+    その要素の結果を (False, DeadlineExceededError) とする
+
+    Args:
+        func: 各要素に適用する処理
+        items: 処理対象のリスト
+        max_workers: 同時実行数の上限
+
+    Returns:
+        入力順に並んだ (成功したかどうか, 戻り値または例外) のリスト
+    """
+
+    def run(item: Any) -> Tuple[bool, Any]:
+        if deadline_exceeded():
+            return False, DeadlineExceededError()
+        try:
+            return True, func(item)
+        except Exception as e:
+            return False, e
+
+    if len(items) <= 1 or max_workers <= 1:
+        return [run(item) for item in items]
+
+    contexts = [copy_context() for _ in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(lambda c, item: c.run(run, item), contexts, items))
@@ -1,11 +1,102 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
     READ_ONLY_MODE: bool = False
+    # 一括操作でBacklog APIを同時に呼び出す最大数
+    BULK_MAX_CONCURRENCY: int = 5
+    # 集計1回あたりに呼び出す課題数APIの上限
+    AGGREGATION_MAX_CALLS: int = 200
+    # 課題の検索クエリでAPIで絞り込めない条件がある場合に取得する最大ページ数（1ページ100件）
+    QUERY_MAX_PAGES: int = 5
+    # 複数プロジェクトの課題検索で1つのリクエストにまとめるプロジェクト数
+    MULTI_PROJECT_CHUNK_SIZE: int = 10
+    # Backlog APIのクライアント側レート制限（1秒あたりのリクエスト数、0以下で無効）
+    BACKLOG_RATE_LIMIT_PER_SECOND: float = 10.0
+    # レート制限で連続して許可するリクエスト数（指定しない場合は1秒分）
+    BACKLOG_RATE_LIMIT_BURST: Optional[int] = None
+    # コメントをキャッシュする課題数の上限
+    COMMENT_CACHE_MAX_ISSUES: int = 256
+    # 課題キャッシュに保持する課題数の上限
+    ISSUE_CACHE_MAX_ENTRIES: int = 1000
+    # 課題キャッシュの有効期間（秒、0以下で無効）
+    ISSUE_CACHE_TTL_SECONDS: float = 60.0
+    # 予算に収まらなかったレスポンスの続きを保持する秒数（0以下で無効）
+    RESULT_CACHE_TTL_SECONDS: float = 300.0
+    # 続きを保持するレスポンスの数の上限
+    RESULT_CACHE_MAX_ENTRIES: int = 100
+    # 存在しない課題・プロジェクト・名前を記録しておく秒数（0以下で無効）
+    NEGATIVE_CACHE_TTL_SECONDS: float = 30.0
+    # 存在しない課題・プロジェクト・名前を記録しておく件数の上限
+    NEGATIVE_CACHE_MAX_ENTRIES: int = 1000
+    # メタデータ（ステータス・カテゴリー・ユーザーなど）を再取得せずに使う秒数
+    METADATA_CACHE_TTL_SECONDS: float = 300.0
+    # 再取得中に古いメタデータを返してよい秒数の上限
+    METADATA_CACHE_MAX_STALENESS_SECONDS: float = 3600.0
+    # 起動時にプロジェクトのメタデータを事前に取得するかどうか
+    CACHE_WARMUP_ENABLED: bool = False
+    # 事前に取得するプロジェクトキー（カンマ区切り、指定しない場合はBACKLOG_PROJECT）
+    CACHE_WARMUP_PROJECTS: Optional[str] = None
+    # Backlog API呼び出しのサーキットブレーカーを有効にするかどうか
+    CIRCUIT_BREAKER_ENABLED: bool = True
+    # サーキットブレーカーを開く失敗率（0〜1）
+    CIRCUIT_BREAKER_FAILURE_RATE_THRESHOLD: float = 0.5
+    # 遅い呼び出しとみなす秒数
+    CIRCUIT_BREAKER_SLOW_CALL_SECONDS: float = 10.0
+    # サーキットブレーカーを開く遅い呼び出しの割合（0〜1）
+    CIRCUIT_BREAKER_SLOW_CALL_RATE_THRESHOLD: float = 0.8
+    # 失敗率を判定するのに必要な呼び出し回数
+    CIRCUIT_BREAKER_MINIMUM_CALLS: int = 10
+    # 失敗率の計算に使う直近の呼び出し回数
+    CIRCUIT_BREAKER_WINDOW_SIZE: int = 20
+    # サーキットブレーカーを開いてから試験的な呼び出しを許可するまでの秒数
+    CIRCUIT_BREAKER_OPEN_SECONDS: float = 30.0
+    # Backlog APIへの接続タイムアウト（秒）
+    BACKLOG_CONNECT_TIMEOUT_SECONDS: float = 3.05
+    # Backlog APIの読み取り系（GET）リクエストのレスポンス待ちタイムアウト（秒）
+    BACKLOG_READ_TIMEOUT_SECONDS: float = 10.0
+    # Backlog APIの更新系（POST・PUT・PATCH・DELETE）リクエストのレスポンス待ちタイムアウト（秒）
+    BACKLOG_WRITE_TIMEOUT_SECONDS: float = 30.0
+    # リクエストごとの処理期限（秒、指定しない場合はヘッダーやLambdaの残り時間のみを使う）
+    REQUEST_TIMEOUT_SECONDS: Optional[float] = None
+    # 処理期限の何秒前から新しいBacklog API呼び出しを行わないか
+    DEADLINE_SAFETY_MARGIN_SECONDS: float = 1.0
+    # 課題の取得が遅い場合に同じリクエストを重ねて送る（ヘッジ）かどうか
+    HEDGED_READS_ENABLED: bool = False
+    # ヘッジとして重ねて送るリクエストの割合の上限（0〜1）
+    HEDGED_READS_BUDGET_RATIO: float = 0.05
+    # ヘッジするまでの待ち時間に使う応答時間のパーセンタイル（0〜1）
+    HEDGED_READS_PERCENTILE: float = 0.95
+    # ヘッジするまでの最小の待ち時間（秒）
+    HEDGED_READS_MIN_DELAY_SECONDS: float = 0.05
+    # ヘッジを始めるのに必要な応答時間の記録数
+    HEDGED_READS_MIN_SAMPLES: int = 20
+    # 課題をローカルのSQLiteにミラーするかどうか
+    MIRROR_ENABLED: bool = False
+    # ローカルミラーのSQLiteファイルのパス（Lambdaでは/tmp以下を指定すること）
+    MIRROR_DB_PATH: str = "/tmp/backlog_mirror.sqlite3"
+    # ミラーの同期時に更新された課題のコメントも取得して全文検索の対象にするかどうか
+    MIRROR_INDEX_COMMENTS: bool = False
+    # BacklogのWebhookのURLに付けるトークン（?token=...、指定しない場合はWebhookを受け付けない）
+    BACKLOG_WEBHOOK_TOKEN: Optional[str] = None
+    # Webhookを受け取れない環境で、最近の更新（アクティビティ）を取得して変更を検出するかどうか
+    ACTIVITY_POLL_ENABLED: bool = False
+    # 最近の更新を取得する間隔（秒）。読み取りリクエストの際に間隔を過ぎていれば別スレッドで取得する
+    ACTIVITY_POLL_INTERVAL_SECONDS: float = 30.0
+    # 最近の更新を取得するプロジェクトキー（指定しない場合はスペース全体）
+    ACTIVITY_POLL_PROJECT: Optional[str] = None
+    # プロセス間で共有するメタデータキャッシュの接続先
+    # （redis://host:6379/0、rediss://...、sqlite:///path/to/file。指定しない場合はプロセス内のみ）
+    SHARED_CACHE_URL: Optional[str] = None
+    # 共有キャッシュのキーの先頭に付ける名前空間
+    SHARED_CACHE_NAMESPACE: str = "backlog-mcp"
+    # 一覧のカーソルの署名の鍵（指定しない場合はBacklogのAPIキー。複数のインスタンスで同じ値にすること）
+    CURSOR_SECRET: Optional[str] = None
 
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         extra = "ignore"
 
-settings = Settings()
\ No newline at end of file
+settings = Settings()
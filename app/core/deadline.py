@@ -0,0 +1,84 @@
+"""
+リクエスト単位の処理期限
+
+受け付けたリクエストごとに処理期限を設定し、サービス層やBacklog API呼び出しで参照する。
+期限はcontextvarsで保持するため、スレッドプールで実行する処理に引き継ぐ場合は
+contextvars.copy_context() で取得したコンテキストで実行すること
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from app.core.config import settings
+
+_deadline: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+
+class DeadlineExceededError(Exception):
+    """処理期限が近いため処理を行わなかったことを示すエラー"""
+
+    def __init__(self, message: str = "Request deadline exceeded"):
+        """
+        初期化
+
+        Args:
+            message: エラーメッセージ
+        """
+        super().__init__(message)
+
+
+def remaining() -> Optional[float]:
+    """
+    処理期限までの残り秒数を取得
+
+    Returns:
+        残り秒数。期限が設定されていない場合はNone
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def deadline_exceeded(margin: Optional[float] = None) -> bool:
+    """
+    処理期限が近いかどうか
+
+    Args:
+        margin: 期限の何秒前から期限切れとみなすか（指定しない場合は設定値）
+
+    Returns:
+        期限までの残り秒数が margin 以下の場合はTrue。期限が設定されていない場合はFalse
+    """
+    left = remaining()
+    if left is None:
+        return False
+    if margin is None:
+        margin = settings.DEADLINE_SAFETY_MARGIN_SECONDS
+    return left <= margin
+
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]) -> Iterator[None]:
+    """
+    処理期限を設定する
+
+    すでに期限が設定されている場合は、より早い方の期限を使う
+
+    Args:
+        seconds: 現在からの秒数（Noneの場合は期限を変更しない）
+    """
+    if seconds is None:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(current, deadline)
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
@@ -6,7 +6,7 @@ PyBacklogPyのBacklogClientをラップして、テスト環境でのSSL検証
 
 import json
 import os
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 import logging # logging をインポート
 
 import requests
@@ -82,10 +82,34 @@ from pybacklogpy.Status import Status
 from pybacklogpy.User import User
 from pybacklogpy.Version import Version
 
+from app.core.deadline import DeadlineExceededError
+from app.infrastructure.backlog.circuit_breaker import CircuitOpenError
+from app.infrastructure.backlog.comment_cache import CommentCacheEntry, comment_cache
+from app.infrastructure.backlog.hedging import get_hedger
+from app.infrastructure.backlog.issue_cache import issue_cache
+from app.infrastructure.backlog.metadata_cache import metadata_cache
+from app.infrastructure.backlog.negative_cache import negative_cache
+from app.infrastructure.backlog.request_sender import ManagedRequestSender
+
 logger = logging.getLogger(__name__) # ロガーを取得
 class BacklogApiError(Exception):
     """Backlog APIに関するカスタムエラー"""
-    pass
+
+    def __init__(
+        self, message: str, status_code: Optional[int] = None, details: Any = None
+    ):
+        """
+        初期化
+
+        Args:
+            message: エラーメッセージ
+            status_code: 呼び出し元に返すHTTPステータスコード
+            details: Backlog APIのレスポンスなどの詳細情報
+        """
+        super().__init__(message)
+        self.message = message
+        self.status_code = status_code
+        self.details = details
 
 class BacklogClientWrapper:
     """
@@ -104,6 +128,7 @@ class BacklogClientWrapper:
             read_only_mode: 読み取り専用モードフラグ
         """
         self.config = BacklogComConfigure(space, api_key)
+        self.space = space
         self.read_only_mode = read_only_mode
         self.project_api = Project(self.config)
         self.issue_api = Issue(self.config)
@@ -116,9 +141,138 @@ class BacklogClientWrapper:
         self.milestone_api = Version(self.config)
         self.version_api = Version(self.config)
 
-        # キャッシュ
-        self._users_cache: Optional[List[Dict[str, Any]]] = None
-        self._priorities_cache: Optional[List[Dict[str, Any]]] = None
+        # すべてのAPI呼び出しにレート制限などを適用する
+        self.request_sender = ManagedRequestSender(self.config)
+        for api in (
+            self.project_api,
+            self.issue_api,
+            self.issue_comment_api,
+            self.issue_type_api,
+            self.user_api,
+            self.status_api,
+            self.priority_api,
+            self.category_api,
+            self.milestone_api,
+            self.version_api,
+        ):
+            api.rs = self.request_sender
+
+    def _cache_issue(self, issue: Optional[Dict[str, Any]]) -> None:
+        """
+        課題を課題キャッシュに保存し、存在しないという記録を破棄する
+
+        Args:
+            issue: 課題情報
+        """
+        if not issue or issue.get("id") is None:
+            return
+        issue_cache.put(self.space, issue)
+        negative_cache.discard(("issue", self.space, str(issue["id"])))
+        if issue.get("issueKey"):
+            negative_cache.discard(("issue", self.space, issue["issueKey"]))
+
+    def _metadata_scope(
+        self, project_id_or_key: Optional[Union[str, int]]
+    ) -> Optional[str]:
+        """
+        メタデータキャッシュのプロジェクト単位のスコープを取得
+
+        プロジェクトキーで呼び出された場合でも、プロジェクト情報がキャッシュ済みであれば
+        プロジェクトIDに揃え、IDで呼び出された場合とキャッシュを共有する
+
+        Args:
+            project_id_or_key: プロジェクトIDまたはプロジェクトキー
+
+        Returns:
+            スコープ。スペース全体のメタデータの場合はNone
+        """
+        if project_id_or_key is None:
+            return None
+        scope = str(project_id_or_key)
+        if not scope.isdigit():
+            project = metadata_cache.get(("project", self.space, scope))
+            if project and project.get("id") is not None:
+                return str(project["id"])
+        return scope
+
+    def _get_metadata(
+        self,
+        kind: str,
+        fetch: Callable[[], requests.Response],
+        project_id_or_key: Optional[Union[str, int]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        メタデータの一覧をメタデータキャッシュ経由で取得
+
+        Args:
+            kind: メタデータの種類（"users"、"statuses"など）
+            fetch: Backlog APIから一覧を取得する関数
+            project_id_or_key: プロジェクトIDまたはプロジェクトキー（プロジェクトごとの一覧の場合）
+
+        Returns:
+            メタデータの一覧
+
+        Raises:
+            BacklogApiError: 一覧を取得できなかった場合
+        """
+        scope = self._metadata_scope(project_id_or_key)
+
+        def load() -> List[Dict[str, Any]]:
+            response = fetch()
+            result = json.loads(response.text)
+            # エラーレスポンスはキャッシュしない
+            if not isinstance(result, list):
+                raise BacklogApiError(
+                    message=f"Unexpected response for {kind}: {result}",
+                    status_code=getattr(response, "status_code", None),
+                    details=result,
+                )
+            return result
+
+        key = (kind, self.space, scope)
+        try:
+            values: List[Dict[str, Any]] = metadata_cache.get_or_load(key, load)
+            return values
+        except CircuitOpenError:
+            # Backlogに接続できない間は、最大許容期間を過ぎた値でも返す
+            stale: Optional[List[Dict[str, Any]]] = metadata_cache.get(key, max_age=float("inf"))
+            if stale is None:
+                raise
+            return stale
+
+    def _find_id_by_name(
+        self,
+        kind: str,
+        name: str,
+        load_items: Callable[[], List[Dict[str, Any]]],
+        project_id_or_key: Optional[Union[str, int]] = None,
+    ) -> Optional[int]:
+        """
+        名前からIDを取得
+
+        見つからなかった名前は一定時間記録し、同じ名前での検索では一覧を取得しない
+
+        Args:
+            kind: 名前の種類（"user"、"status"など）
+            name: 名前
+            load_items: 一覧を取得する関数
+            project_id_or_key: プロジェクトIDまたはプロジェクトキー（プロジェクトごとの一覧の場合）
+
+        Returns:
+            ID。存在しない場合はNone
+        """
+        scope = self._metadata_scope(project_id_or_key)
+        negative_key = (f"{kind}_name", self.space, scope, name)
+        if negative_cache.contains(negative_key):
+            return None
+        items = load_items()
+        for item in items:
+            if item.get("name") == name:
+                return item.get("id")
+        # 一覧を取得できなかった場合は記録しない
+        if items:
+            negative_cache.add(negative_key)
+        return None
 
     def get_projects(self) -> List[Dict[str, Any]]:
         """
@@ -141,10 +295,37 @@ class BacklogClientWrapper:
         Returns:
             プロジェクト情報。プロジェクトが存在しない場合はNone
         """
-        try:
+        negative_key = ("project", self.space, str(project_key))
+        if negative_cache.contains(negative_key):
+            return None
+
+        def load() -> Dict[str, Any]:
             response = self.project_api.get_project(project_key)
+            if not response.ok:
+                raise BacklogApiError(
+                    message=response.text, status_code=response.status_code
+                )
             result: Dict[str, Any] = json.loads(response.text)
             return result
+
+        cache_key = ("project", self.space, str(project_key))
+        try:
+            # プロジェクト情報はメタデータと同様にめったに変わらないため、メタデータキャッシュで保持する
+            project: Dict[str, Any] = metadata_cache.get_or_load(cache_key, load)
+            return project
+        except CircuitOpenError as e:
+            # Backlogに接続できない間は、最大許容期間を過ぎた値でも返す
+            stale: Optional[Dict[str, Any]] = metadata_cache.get(cache_key, max_age=float("inf"))
+            if stale is None:
+                print(f"Error getting project {project_key}: {e}")
+            return stale
+        except BacklogApiError as e:
+            if e.status_code == 404:
+                # 存在しないプロジェクトは記録しておき、エラーとしては出力しない
+                negative_cache.add(negative_key)
+            else:
+                print(f"Error getting project {project_key}: {e}")
+            return None
         except Exception as e:
             # プロジェクトが存在しない場合などのエラー処理
             print(f"Error getting project {project_key}: {e}")
@@ -152,59 +333,293 @@ class BacklogClientWrapper:
 
     def get_issues(
         self,
-        project_id: Optional[int] = None,
+        project_id: Optional[Union[int, List[int]]] = None,
         status_id: Optional[List[int]] = None,
-        assignee_id: Optional[int] = None,
+        assignee_id: Optional[Union[int, List[int]]] = None,
         keyword: Optional[str] = None,
         count: int = 20,
+        issue_type_id: Optional[List[int]] = None,
+        category_id: Optional[List[int]] = None,
+        milestone_id: Optional[List[int]] = None,
+        version_id: Optional[List[int]] = None,
+        priority_id: Optional[List[int]] = None,
+        created_user_id: Optional[List[int]] = None,
+        parent_child: Optional[int] = None,
+        parent_issue_id: Optional[List[int]] = None,
+        created_since: Optional[str] = None,
+        created_until: Optional[str] = None,
+        updated_since: Optional[str] = None,
+        updated_until: Optional[str] = None,
+        start_date_since: Optional[str] = None,
+        start_date_until: Optional[str] = None,
+        due_date_since: Optional[str] = None,
+        due_date_until: Optional[str] = None,
+        sort: Optional[str] = None,
+        order: Optional[str] = None,
+        offset: Optional[int] = None,
+        raise_errors: bool = False,
     ) -> List[Dict[str, Any]]:
         """
         課題一覧を取得
 
+        絞り込み・並び替えはすべてBacklog APIに渡し、サーバー側で処理する
+
         Args:
-            project_id: プロジェクトID（指定しない場合は全プロジェクト）
+            project_id: プロジェクトID、またはいずれかに一致するプロジェクトIDのリスト（指定しない場合は全プロジェクト）
             status_id: ステータスID（指定しない場合は全ステータス）
-            assignee_id: 担当者ID（指定しない場合は全担当者）
+            assignee_id: 担当者ID、またはいずれかに一致する担当者IDのリスト（指定しない場合は全担当者）
             keyword: 検索キーワード
             count: 取得件数（デフォルト20件）
+            issue_type_id: 種別ID
+            category_id: カテゴリーID
+            milestone_id: マイルストーンID
+            version_id: 発生バージョンID
+            priority_id: 優先度ID
+            created_user_id: 登録者ID
+            parent_child: 親子課題の条件（0: すべて, 1: 子課題以外, 2: 子課題, 3: 親課題でも子課題でもない, 4: 親課題）
+            parent_issue_id: 親課題ID
+            created_since: 登録日の開始（yyyy-MM-dd）
+            created_until: 登録日の終了（yyyy-MM-dd）
+            updated_since: 更新日の開始（yyyy-MM-dd）
+            updated_until: 更新日の終了（yyyy-MM-dd）
+            start_date_since: 開始日の開始（yyyy-MM-dd）
+            start_date_until: 開始日の終了（yyyy-MM-dd）
+            due_date_since: 期限日の開始（yyyy-MM-dd）
+            due_date_until: 期限日の終了（yyyy-MM-dd）
+            sort: 並び替えの項目（updated, created, dueDate, priority など）
+            order: 並び順（"asc"または"desc"、指定しない場合は降順）
+            offset: 取得開始位置
+            raise_errors: 取得できなかった場合に空の一覧を返さず例外を送出するかどうか
 
         Returns:
             課題一覧
+
+        Raises:
+            Exception: raise_errors がTrueで、課題一覧を取得できなかった場合
         """
         try:
-            project_id_list = [project_id] if project_id else None
+            if isinstance(project_id, list):
+                project_id_list = project_id or None
+            else:
+                project_id_list = [project_id] if project_id else None
             status_id_list = status_id if status_id else None
-            assignee_id_list = [assignee_id] if assignee_id else None
-
-            response = self.issue_api.get_issue_list(
-                project_id=project_id_list,
-                status_id=status_id_list,
-                assignee_id=assignee_id_list,
-                keyword=keyword,
-                count=count,
+            if isinstance(assignee_id, list):
+                assignee_id_list = assignee_id or None
+            else:
+                assignee_id_list = [assignee_id] if assignee_id else None
+
+            response = get_hedger().call(
+                "get_issues",
+                lambda: self.issue_api.get_issue_list(
+                    project_id=project_id_list,
+                    status_id=status_id_list,
+                    assignee_id=assignee_id_list,
+                    keyword=keyword,
+                    count=count,
+                    issue_type_id=issue_type_id or None,
+                    category_id=category_id or None,
+                    milestone_id=milestone_id or None,
+                    version_id=version_id or None,
+                    priority_id=priority_id or None,
+                    created_user_id=created_user_id or None,
+                    parent_child=parent_child,
+                    parent_issue_id=parent_issue_id or None,
+                    created_since=created_since,
+                    created_until=created_until,
+                    updated_since=updated_since,
+                    updated_until=updated_until,
+                    start_date_since=start_date_since,
+                    start_date_until=start_date_until,
+                    due_date_since=due_date_since,
+                    due_date_until=due_date_until,
+                    sort=sort,
+                    order=order,
+                    offset=offset,
+                ),
             )
 
             result: List[Dict[str, Any]] = json.loads(response.text)
+            if isinstance(result, list):
+                for issue in result:
+                    self._cache_issue(issue)
+            elif raise_errors:
+                raise BacklogApiError(
+                    message=f"Error getting issues: {response.text}",
+                    status_code=response.status_code,
+                    details=result,
+                )
             return result
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error getting issues: {e}")
             return []
 
-    def get_issue(self, issue_id_or_key: str) -> Optional[Dict[str, Any]]:
+    def get_issues_page(
+        self,
+        project_id: int,
+        updated_since: Optional[str] = None,
+        offset: int = 0,
+        count: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """
+        プロジェクトの課題を更新日時の昇順で1ページ分取得
+
+        ローカルミラーの同期に使うため、get_issues と異なりエラー時は例外を送出する
+
+        Args:
+            project_id: プロジェクトID
+            updated_since: この日付（yyyy-MM-dd）以降に更新された課題のみ取得
+            offset: 取得開始位置
+            count: 取得件数（1-100）
+
+        Returns:
+            課題一覧
+
+        Raises:
+            BacklogApiError: 課題一覧を取得できなかった場合
+        """
+        response = self.issue_api.get_issue_list(
+            project_id=[project_id],
+            sort="updated",
+            order="asc",
+            offset=offset,
+            count=count,
+            updated_since=updated_since,
+        )
+        result = json.loads(response.text)
+        if not response.ok or not isinstance(result, list):
+            raise BacklogApiError(
+                message=f"Error getting issues of project {project_id}: {result}",
+                status_code=response.status_code,
+                details=result,
+            )
+        for issue in result:
+            self._cache_issue(issue)
+        return result
+
+    def get_activities(
+        self,
+        project_id_or_key: Optional[Union[str, int]] = None,
+        min_id: Optional[int] = None,
+        count: int = 100,
+        order: str = "asc",
+    ) -> List[Dict[str, Any]]:
+        """
+        スペースまたはプロジェクトの最近の更新（アクティビティ）を取得
+
+        PyBacklogPyのプロジェクトの最近の更新の取得はパスが誤っているため、
+        RequestSenderで直接リクエストを送信する
+
+        Args:
+            project_id_or_key: プロジェクトIDまたはプロジェクトキー（指定しない場合はスペース全体）
+            min_id: このIDより新しいアクティビティを取得
+            count: 取得件数（1-100）
+            order: 並び順（"asc"または"desc"）
+
+        Returns:
+            アクティビティ一覧
+
+        Raises:
+            BacklogApiError: アクティビティを取得できなかった場合
+        """
+        params: Dict[str, Any] = {"count": count, "order": order}
+        if min_id is not None:
+            params["minId"] = min_id
+        path = (
+            f"projects/{project_id_or_key}/activities"
+            if project_id_or_key is not None
+            else "space/activities"
+        )
+        response = self.request_sender.send_get_request(path=path, url_param=params)
+        result = json.loads(response.text)
+        if not response.ok or not isinstance(result, list):
+            raise BacklogApiError(
+                message=f"Error getting activities: {result}",
+                status_code=response.status_code,
+                details=result,
+            )
+        return result
+
+    def count_issues(self, **filters: Any) -> int:
+        """
+        条件に一致する課題数を取得
+
+        Args:
+            filters: PyBacklogPyの Issue.count_issue の絞り込み条件
+                （project_id, status_id, assignee_id, category_id などのIDのリスト、日付の範囲など）
+
+        Returns:
+            課題数
+
+        Raises:
+            BacklogApiError: 課題数を取得できなかった場合
+        """
+        # 件数の取得では件数・並び順の指定は不要なため送信しない
+        filters.setdefault("count", None)
+        filters.setdefault("order", None)
+        response = get_hedger().call(
+            "count_issues", lambda: self.issue_api.count_issue(**filters)
+        )
+        result = json.loads(response.text)
+        if not response.ok or not isinstance(result, dict) or "count" not in result:
+            raise BacklogApiError(
+                message=f"Error counting issues: {result}",
+                status_code=response.status_code,
+                details=result,
+            )
+        return int(result["count"])
+
+    def get_issue(
+        self, issue_id_or_key: str, use_cache: bool = True, raise_errors: bool = False
+    ) -> Optional[Dict[str, Any]]:
         """
         課題情報を取得
 
         Args:
             issue_id_or_key: 課題IDまたは課題キー
+            use_cache: 課題キャッシュを使用するかどうか
+            raise_errors: 課題が存在しない場合以外のエラーをNoneにせず送出するかどうか
 
         Returns:
             課題情報。課題が存在しない場合はNone
         """
+        negative_key = ("issue", self.space, str(issue_id_or_key))
+        if use_cache:
+            cached = issue_cache.get(self.space, issue_id_or_key)
+            if cached is not None:
+                return cached
+            if negative_cache.contains(negative_key):
+                return None
         try:
-            response = self.issue_api.get_issue(issue_id_or_key)
+            response = get_hedger().call(
+                "get_issue", lambda: self.issue_api.get_issue(issue_id_or_key)
+            )
+            if response.status_code == 404:
+                negative_cache.add(negative_key)
+                return None
+            if not response.ok:
+                if raise_errors:
+                    raise BacklogApiError(
+                        message=f"Error getting issue {issue_id_or_key}: {response.text}",
+                        status_code=response.status_code,
+                    )
+                print(f"Error getting issue {issue_id_or_key}: {response.text}")
+                return None
             result: Dict[str, Any] = json.loads(response.text)
+            self._cache_issue(result)
             return result
+        except CircuitOpenError as e:
+            # Backlogに接続できない間は、有効期間を過ぎた課題でも返す
+            stale = issue_cache.get(self.space, issue_id_or_key, allow_stale=True)
+            if stale is None:
+                if raise_errors:
+                    raise
+                print(f"Error getting issue {issue_id_or_key}: {e}")
+            return stale
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error getting issue {issue_id_or_key}: {e}")
             return None
 
@@ -215,14 +630,39 @@ class BacklogClientWrapper:
         Returns:
             ユーザー一覧
         """
-        if self._users_cache is None:
-            try:
-                response = self.user_api.get_user_list()
-                self._users_cache = json.loads(response.text)
-            except Exception as e:
-                print(f"Error getting users: {e}")
-                self._users_cache = []
-        return self._users_cache
+        try:
+            return self._get_metadata("users", self.user_api.get_user_list)
+        except Exception as e:
+            print(f"Error getting users: {e}")
+            return []
+
+    def get_project_users(
+        self, project_id_or_key: Union[str, int], raise_errors: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        プロジェクトの参加ユーザー一覧を取得
+
+        Args:
+            project_id_or_key: プロジェクトIDまたはプロジェクトキー
+            raise_errors: 取得できなかった場合に空の一覧を返さず例外を送出するかどうか
+
+        Returns:
+            ユーザー一覧
+
+        Raises:
+            Exception: raise_errors がTrueで、一覧を取得できなかった場合
+        """
+        try:
+            return self._get_metadata(
+                "project_users",
+                lambda: self.project_api.get_project_user_list(str(project_id_or_key)),
+                project_id_or_key,
+            )
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(f"Error getting users for project {project_id_or_key}: {e}")
+            return []
 
     def get_user_id_by_name(self, user_name: str) -> Optional[int]:
         """
@@ -234,27 +674,28 @@ class BacklogClientWrapper:
         Returns:
             ユーザーID。ユーザーが存在しない場合はNone
         """
-        users = self.get_users()
-        for user in users:
-            if user.get("name") == user_name:
-                return user.get("id")
-        return None
+        return self._find_id_by_name("user", user_name, self.get_users)
 
-    def get_priorities(self) -> List[Dict[str, Any]]:
+    def get_priorities(self, raise_errors: bool = False) -> List[Dict[str, Any]]:
         """
         優先度一覧を取得
 
+        Args:
+            raise_errors: 取得できなかった場合に空の一覧を返さず例外を送出するかどうか
+
         Returns:
             優先度一覧
+
+        Raises:
+            Exception: raise_errors がTrueで、一覧を取得できなかった場合
         """
-        if self._priorities_cache is None:
-            try:
-                response = self.priority_api.get_priority_list()
-                self._priorities_cache = json.loads(response.text)
-            except Exception as e:
-                print(f"Error getting priorities: {e}")
-                self._priorities_cache = []
-        return self._priorities_cache
+        try:
+            return self._get_metadata("priorities", self.priority_api.get_priority_list)
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(f"Error getting priorities: {e}")
+            return []
 
     def get_priority_id_by_name(self, priority_name: str) -> Optional[int]:
         """
@@ -266,50 +707,48 @@ class BacklogClientWrapper:
         Returns:
             優先度ID。優先度が存在しない場合はNone
         """
-        priorities = self.get_priorities()
-        for priority in priorities:
-            if priority.get("name") == priority_name:
-                return priority.get("id")
-        return None
+        return self._find_id_by_name("priority", priority_name, self.get_priorities)
 
-    def get_statuses(self, project_id_or_key: Union[str, int]) -> List[Dict[str, Any]]:
+    def get_statuses(
+        self, project_id_or_key: Union[str, int], raise_errors: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         ステータス一覧を取得
 
         Args:
             project_id_or_key: プロジェクトIDまたはプロジェクトキー
+            raise_errors: 取得できなかった場合に既定のステータス一覧を返さず例外を送出するかどうか
 
         Returns:
             ステータス一覧
+
+        Raises:
+            Exception: raise_errors がTrueで、一覧を取得できなかった場合
         """
+        default_statuses = [
+            {"id": 1, "name": "未対応"},
+            {"id": 2, "name": "処理中"},
+            {"id": 3, "name": "処理済み"},
+            {"id": 4, "name": "完了"},
+        ]
         try:
             # PyBacklogPyのバージョンによっては、get_status_listメソッドがない場合があるため、
             # 代わりにget_status_list_of_projectメソッドを使用
-            response = None
             if hasattr(self.status_api, "get_status_list"):
-                response = self.status_api.get_status_list(project_id_or_key)
+                fetch = lambda: self.status_api.get_status_list(project_id_or_key)
             elif hasattr(self.status_api, "get_status_list_of_project"):
-                response = self.status_api.get_status_list_of_project(project_id_or_key)
+                fetch = lambda: self.status_api.get_status_list_of_project(project_id_or_key)
             else:
                 # どちらのメソッドも存在しない場合はデフォルト値を返す
-                return [
-                    {"id": 1, "name": "未対応"},
-                    {"id": 2, "name": "処理中"},
-                    {"id": 3, "name": "処理済み"},
-                    {"id": 4, "name": "完了"},
-                ]
-            
-            result: List[Dict[str, Any]] = json.loads(response.text)
-            return result
+                return default_statuses
+
+            return self._get_metadata("statuses", fetch, project_id_or_key)
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error getting statuses for project {project_id_or_key}: {e}")
             # エラーが発生した場合は、デフォルトのステータス一覧を返す
-            return [
-                {"id": 1, "name": "未対応"},
-                {"id": 2, "name": "処理中"},
-                {"id": 3, "name": "処理済み"},
-                {"id": 4, "name": "完了"},
-            ]
+            return default_statuses
 
     def get_status_id_by_name(
         self, project_id_or_key: Union[str, int], status_name: str
@@ -324,31 +763,40 @@ class BacklogClientWrapper:
         Returns:
             ステータスID。ステータスが存在しない場合はNone
         """
-        statuses = self.get_statuses(project_id_or_key)
-        for status in statuses:
-            if status.get("name") == status_name:
-                return status.get("id")
-        return None
+        return self._find_id_by_name(
+            "status",
+            status_name,
+            lambda: self.get_statuses(project_id_or_key),
+            project_id_or_key=project_id_or_key,
+        )
 
     def get_categories(
-        self, project_id_or_key: Union[str, int]
+        self, project_id_or_key: Union[str, int], raise_errors: bool = False
     ) -> List[Dict[str, Any]]:
         """
         カテゴリー一覧を取得
 
         Args:
             project_id_or_key: プロジェクトIDまたはプロジェクトキー
+            raise_errors: 取得できなかった場合に空の一覧を返さず例外を送出するかどうか
 
         Returns:
             カテゴリー一覧
+
+        Raises:
+            Exception: raise_errors がTrueで、一覧を取得できなかった場合
         """
         try:
             # project_id_or_keyの型をstrに変換
             project_key = str(project_id_or_key)
-            response = self.category_api.get_category_list(project_key)
-            result: List[Dict[str, Any]] = json.loads(response.text)
-            return result
+            return self._get_metadata(
+                "categories",
+                lambda: self.category_api.get_category_list(project_key),
+                project_key,
+            )
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error getting categories for project {project_id_or_key}: {e}")
             return []
 
@@ -365,38 +813,43 @@ class BacklogClientWrapper:
         Returns:
             カテゴリーID。カテゴリーが存在しない場合はNone
         """
-        categories = self.get_categories(project_id_or_key)
-        for category in categories:
-            if category.get("name") == category_name:
-                return category.get("id")
-        return None
+        return self._find_id_by_name(
+            "category",
+            category_name,
+            lambda: self.get_categories(project_id_or_key),
+            project_id_or_key=project_id_or_key,
+        )
 
     def get_milestones(
-        self, project_id_or_key: Union[str, int]
+        self, project_id_or_key: Union[str, int], raise_errors: bool = False
     ) -> List[Dict[str, Any]]:
         """
         マイルストーン一覧を取得
 
         Args:
             project_id_or_key: プロジェクトIDまたはプロジェクトキー
+            raise_errors: 取得できなかった場合に空の一覧を返さず例外を送出するかどうか
 
         Returns:
             マイルストーン一覧
+
+        Raises:
+            Exception: raise_errors がTrueで、一覧を取得できなかった場合
         """
         try:
             # PyBacklogPyのバージョンによっては、get_milestone_listメソッドがない場合があるため、
             # 代わりにget_version_milestone_listメソッドを使用
-            response = None
             if hasattr(self.milestone_api, "get_milestone_list"):
-                response = self.milestone_api.get_milestone_list(project_id_or_key)
+                fetch = lambda: self.milestone_api.get_milestone_list(project_id_or_key)
             elif hasattr(self.milestone_api, "get_version_milestone_list"):
-                response = self.milestone_api.get_version_milestone_list(project_id_or_key)  # type: ignore
+                fetch = lambda: self.milestone_api.get_version_milestone_list(project_id_or_key)  # type: ignore
             else:
                 return []
-            
-            result: List[Dict[str, Any]] = json.loads(response.text)
-            return result
+
+            return self._get_metadata("milestones", fetch, project_id_or_key)
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error getting milestones for project {project_id_or_key}: {e}")
             return []
 
@@ -413,33 +866,43 @@ class BacklogClientWrapper:
         Returns:
             マイルストーンID。マイルストーンが存在しない場合はNone
         """
-        milestones = self.get_milestones(project_id_or_key)
-        for milestone in milestones:
-            if milestone.get("name") == milestone_name:
-                return milestone.get("id")
-        return None
-
-    def get_versions(self, project_id_or_key: Union[str, int]) -> List[Dict[str, Any]]:
+        return self._find_id_by_name(
+            "milestone",
+            milestone_name,
+            lambda: self.get_milestones(project_id_or_key),
+            project_id_or_key=project_id_or_key,
+        )
+
+    def get_versions(
+        self, project_id_or_key: Union[str, int], raise_errors: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         バージョン一覧を取得
 
         Args:
             project_id_or_key: プロジェクトIDまたはプロジェクトキー
+            raise_errors: 取得できなかった場合に空の一覧を返さず例外を送出するかどうか
 
         Returns:
             バージョン一覧
+
+        Raises:
+            Exception: raise_errors がTrueで、一覧を取得できなかった場合
         """
         try:
             # project_id_or_keyの型をstrに変換
             project_key = str(project_id_or_key)
             # get_version_milestone_listはstr | Noneを期待するため、Noneの可能性を排除
             if project_key:
-                response = self.version_api.get_version_milestone_list(project_key)
-                if response and hasattr(response, 'text'):
-                    result: List[Dict[str, Any]] = json.loads(response.text)
-                    return result
+                return self._get_metadata(
+                    "versions",
+                    lambda: self.version_api.get_version_milestone_list(project_key),
+                    project_key,
+                )
             return []
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error getting versions for project {project_id_or_key}: {e}")
             return []
 
@@ -456,11 +919,12 @@ class BacklogClientWrapper:
         Returns:
             バージョンID。バージョンが存在しない場合はNone
         """
-        versions = self.get_versions(project_id_or_key)
-        for version in versions:
-            if version.get("name") == version_name:
-                return version.get("id")
-        return None
+        return self._find_id_by_name(
+            "version",
+            version_name,
+            lambda: self.get_versions(project_id_or_key),
+            project_id_or_key=project_id_or_key,
+        )
 
     def create_issue(
         self,
@@ -500,6 +964,10 @@ class BacklogClientWrapper:
 
         Returns:
             作成された課題情報。作成に失敗した場合はNone。
+
+        Raises:
+            DeadlineExceededError: 処理期限が近い場合
+            CircuitOpenError: サーキットブレーカーが開いている場合
         """
         if self.read_only_mode:
             raise PermissionError("Cannot create issue in read-only mode.")
@@ -588,8 +1056,12 @@ class BacklogClientWrapper:
             response = self.issue_api.add_issue(**params)
             if response and hasattr(response, 'text'):
                 result: Dict[str, Any] = json.loads(response.text)
+                self._cache_issue(result)
                 return result
             return None
+        except (DeadlineExceededError, CircuitOpenError):
+            # 一括作成で未作成の行として扱えるよう、処理期限切れと接続断は送出する
+            raise
         except Exception as e:
             print(f"Error creating issue: {e}")
             return None
@@ -637,10 +1109,14 @@ class BacklogClientWrapper:
 
         Returns:
             更新された課題情報。更新に失敗した場合はNone
+
+        Raises:
+            DeadlineExceededError: 処理期限が近い場合
+            CircuitOpenError: サーキットブレーカーが開いている場合
         """
         try:
             # 課題情報の取得（プロジェクトIDを取得するため）
-            issue = self.get_issue(issue_id_or_key)
+            issue = self.get_issue(issue_id_or_key, raise_errors=True)
             if not issue:
                 raise ValueError(f"Issue with ID or key {issue_id_or_key} not found")
 
@@ -718,8 +1194,12 @@ class BacklogClientWrapper:
             response = self.issue_api.update_issue(**params)
             if response and hasattr(response, 'text'):
                 result: Dict[str, Any] = json.loads(response.text)
+                self._cache_issue(result)
                 return result
             return None
+        except (DeadlineExceededError, CircuitOpenError):
+            # 一括更新で未更新の課題として扱えるよう、処理期限切れと接続断は送出する
+            raise
         except Exception as e:
             print(f"Error updating issue {issue_id_or_key}: {e}")
             return None
@@ -738,28 +1218,40 @@ class BacklogClientWrapper:
             raise PermissionError("Cannot delete issue in read-only mode.")
         try:
             response = self.issue_api.delete_issue(issue_id_or_key)
+            if response.ok:
+                issue_cache.invalidate(self.space, issue_id_or_key)
+                negative_cache.add(("issue", self.space, str(issue_id_or_key)))
             return bool(response.ok)
         except Exception as e:
             print(f"Error deleting issue {issue_id_or_key}: {e}")
             return False
+
     def get_issue_types(
-        self, project_id_or_key: Union[str, int]
+        self, project_id_or_key: Union[str, int], raise_errors: bool = False
     ) -> List[Dict[str, Any]]:
         """
         課題種別一覧を取得
 
         Args:
             project_id_or_key: プロジェクトIDまたはプロジェクトキー
+            raise_errors: 取得できなかった場合に空の一覧を返さず例外を送出するかどうか
 
         Returns:
             課題種別一覧
+
+        Raises:
+            Exception: raise_errors がTrueで、一覧を取得できなかった場合
         """
         try:
             project_key = str(project_id_or_key)
-            response = self.issue_type_api.get_issue_type_list(project_key)
-            result: List[Dict[str, Any]] = json.loads(response.text)
-            return result
+            return self._get_metadata(
+                "issue_types",
+                lambda: self.issue_type_api.get_issue_type_list(project_key),
+                project_key,
+            )
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Error getting issue types for project {project_id_or_key}: {e}")
             return []
 
@@ -775,33 +1267,75 @@ class BacklogClientWrapper:
 
         Returns:
             追加されたコメント情報。失敗した場合はNone
+
+        Raises:
+            DeadlineExceededError: 処理期限が近い場合
+            CircuitOpenError: サーキットブレーカーが開いている場合
         """
         if self.read_only_mode:
             raise PermissionError("Cannot add comment in read-only mode.")
         try:
-            response = self.issue_comment_api.add_issue_comment(
-                issue_id_or_key=issue_id_or_key, content=content
-            )
+            # PyBacklogPyのバージョンによっては、add_issue_commentメソッドがない場合があるため、
+            # 代わりにadd_commentメソッドを使用
+            if hasattr(self.issue_comment_api, "add_issue_comment"):
+                response = self.issue_comment_api.add_issue_comment(
+                    issue_id_or_key=issue_id_or_key, content=content
+                )
+            else:
+                response = self.issue_comment_api.add_comment(
+                    issue_id_or_key=issue_id_or_key, content=content
+                )
+            if not response.ok:
+                # エラーの本文（{"errors": [...]}）を追加したコメントとして返さない
+                print(
+                    f"Error adding comment to issue {issue_id_or_key}: "
+                    f"{response.status_code} {response.text}"
+                )
+                return None
             result: Dict[str, Any] = json.loads(response.text)
             return result
+        except (DeadlineExceededError, CircuitOpenError):
+            # 一括追加で未追加の課題として扱えるよう、処理期限切れと接続断は送出する
+            raise
         except Exception as e:
             print(f"Error adding comment to issue {issue_id_or_key}: {e}")
             return None
 
-    def get_issue_comments(self, issue_id_or_key: str, count: Optional[int] = 100) -> List[Dict[str, Any]]:
+    def get_issue_comments(
+        self,
+        issue_id_or_key: str,
+        count: Optional[int] = 100,
+        min_id: Optional[int] = None,
+        max_id: Optional[int] = None,
+        order: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
         """
         課題のコメント一覧を取得
 
         Args:
             issue_id_or_key: 課題IDまたは課題キー
             count: 取得件数 (デフォルト100)
+            min_id: 取得するコメントIDの下限
+            max_id: 取得するコメントIDの上限
+            order: 並び順（"asc"または"desc"。指定しない場合は"desc"）
 
         Returns:
             コメント一覧
         """
         try:
-            response = self.issue_comment_api.get_comment_list(
-                issue_id_or_key=issue_id_or_key, count=count
+            # PyBacklogPyのget_comment_listはcountをリクエストに含めないため、
+            # RequestSenderで直接リクエストを送信する
+            params: Dict[str, Any] = {}
+            if count is not None:
+                params["count"] = count
+            if min_id is not None:
+                params["minId"] = min_id
+            if max_id is not None:
+                params["maxId"] = max_id
+            if order is not None:
+                params["order"] = order
+            response = self.request_sender.send_get_request(
+                path=f"issues/{issue_id_or_key}/comments", url_param=params
             )
             if not response or not response.text:
                 logger.error(f"Empty response from Backlog API for get_issue_comments ({issue_id_or_key})")
@@ -830,8 +1364,158 @@ class BacklogClientWrapper:
                 logger.error(f"Unexpected response format for get_issue_comments ({issue_id_or_key}): {response_json}")
                 raise BacklogApiError(message=f"Unexpected response format for issue comments for {issue_id_or_key}", status_code=500, details=response_json)
             return response_json
-        except BacklogApiError:
+        except (BacklogApiError, CircuitOpenError):
             raise
         except Exception as e:
             logger.error(f"Failed to get issue comments for {issue_id_or_key}: {e}", exc_info=True)
             raise BacklogApiError(message=f"An unexpected error occurred while getting issue comments for {issue_id_or_key}: {str(e)}", status_code=500) from e
+
+    def iter_issue_comments(
+        self,
+        issue_id_or_key: str,
+        min_id: Optional[int] = None,
+        max_id: Optional[int] = None,
+        order: str = "asc",
+        page_size: int = 100,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        課題のコメントをページングしながら順に取得
+
+        昇順の場合はminId、降順の場合はmaxIdを最後に取得したコメントIDに進めながら、
+        件数制限なしにすべてのコメントを取得する
+
+        Args:
+            issue_id_or_key: 課題IDまたは課題キー
+            min_id: このIDより新しいコメントを取得
+            max_id: このIDより古いコメントを取得
+            order: 並び順（"asc"または"desc"）
+            page_size: 1回のリクエストで取得する件数（1-100）
+
+        Yields:
+            コメント
+        """
+        ascending = order == "asc"
+        cursor = min_id if ascending else max_id
+        while True:
+            page = self.get_issue_comments(
+                issue_id_or_key,
+                count=page_size,
+                min_id=cursor if ascending else min_id,
+                max_id=max_id if ascending else cursor,
+                order=order,
+            )
+            # minId/maxIdに一致するコメント自体は読み飛ばす
+            if cursor is not None:
+                comments = [
+                    c for c in page if (c["id"] > cursor if ascending else c["id"] < cursor)
+                ]
+            else:
+                comments = page
+            yield from comments
+            if len(page) < page_size or not comments:
+                return
+            cursor = comments[-1]["id"]
+
+    def _extend_comment_cache(
+        self,
+        issue_id_or_key: str,
+        entry: CommentCacheEntry,
+        since: int,
+        needed: Optional[int],
+    ) -> CommentCacheEntry:
+        """
+        コメントキャッシュの範囲を、キャッシュ済みの最新のコメントより新しい方向へ広げる
+
+        Args:
+            issue_id_or_key: 課題IDまたは課題キー
+            entry: コメントキャッシュ
+            since: このIDより新しいコメントを数える
+            needed: sinceより新しいコメントをあと何件取得すればよいか（Noneの場合は最新まで）
+
+        Returns:
+            範囲を広げたコメントキャッシュ
+        """
+        last_id = entry.last_id
+        comments = list(entry.comments)
+        for comment in self.iter_issue_comments(issue_id_or_key, min_id=last_id or None):
+            if int(comment["id"]) <= last_id:
+                continue
+            comments.append(comment)
+            if needed is not None and int(comment["id"]) > since:
+                needed -= 1
+                if needed == 0:
+                    return CommentCacheEntry(entry.floor_id, comments, complete=False)
+        return CommentCacheEntry(entry.floor_id, comments, complete=True)
+
+    def _comment_cache_key(self, issue_id_or_key: str) -> Optional[Tuple[str, int]]:
+        """
+        コメントキャッシュのキーを取得
+
+        課題キーで指定された場合も課題IDをキーにして、課題IDによる破棄で
+        課題キーで取得したコメントも破棄されるようにする
+
+        Args:
+            issue_id_or_key: 課題IDまたは課題キー
+
+        Returns:
+            (スペース, 課題ID)。課題が見つからない場合はNone
+        """
+        value = str(issue_id_or_key)
+        if value.isdigit():
+            return (self.space, int(value))
+        issue = self.get_issue(value)
+        if issue is None or issue.get("id") is None:
+            return None
+        return (self.space, int(issue["id"]))
+
+    def get_issue_comments_since(
+        self,
+        issue_id_or_key: str,
+        since_comment_id: Optional[int] = None,
+        count: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        指定したIDより新しいコメントをID昇順で取得
+
+        取得済みのコメントはプロセス内でキャッシュし、2回目以降は
+        最後に取得したコメントより新しいコメントだけをBacklogから取得する。
+        キャッシュは課題IDごとに保持し、課題キーで指定した場合は課題IDに解決する。
+        countを指定した場合はcount件が揃った時点で取得をやめ、取得した範囲だけをキャッシュする。
+        コメントの編集・削除はキャッシュに反映されない
+
+        Args:
+            issue_id_or_key: 課題IDまたは課題キー
+            since_comment_id: このIDより新しいコメントを取得（指定しない場合はすべて）
+            count: 取得件数の上限（指定しない場合はすべて）
+
+        Returns:
+            コメント一覧
+        """
+        since = since_comment_id or 0
+        key = self._comment_cache_key(issue_id_or_key)
+        cached = comment_cache.get(key) if key is not None else None
+        # キャッシュの範囲と連続しない場合は、sinceから取得し直す
+        cold = (
+            cached is None
+            or since < cached.floor_id
+            or (not cached.complete and since > cached.last_id)
+        )
+        entry: CommentCacheEntry
+        if cached is None or cold:
+            entry = CommentCacheEntry(floor_id=since, comments=[], complete=False)
+        else:
+            entry = cached
+        needed = count - len(entry.since(since)) if count else None
+        if needed is None or needed > 0:
+            try:
+                entry = self._extend_comment_cache(issue_id_or_key, entry, since, needed)
+            except CircuitOpenError as e:
+                if cold:
+                    raise
+                # Backlogに接続できない間は、取得済みのコメントだけを返す
+                print(f"Error getting new comments for issue {issue_id_or_key}: {e}")
+            if key is not None:
+                comment_cache.put(key, entry)
+
+        comments = entry.since(since)
+        return comments[:count] if count else comments
@@ -0,0 +1,245 @@
+"""
+Backlog API呼び出しのサーキットブレーカー
+
+Backlogの障害時に、タイムアウトまで待つリクエストを繰り返さずにすぐ失敗させる。
+ルーターやMCPツールはリクエストごとにBacklogClientWrapperを生成するため、
+サーキットブレーカーの状態はプロセス内で共有する
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """サーキットブレーカーが開いているため呼び出しを行わなかったことを示すエラー"""
+
+    def __init__(self, retry_after: float):
+        """
+        初期化
+
+        Args:
+            retry_after: 呼び出しを再開するまでの秒数
+        """
+        super().__init__(
+            f"Backlog API circuit breaker is open. Retry after {retry_after:.1f} seconds."
+        )
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    閉・開・半開の3状態を持つサーキットブレーカー
+
+    - 閉: 直近 window_size 回の呼び出しのうち、失敗または遅い呼び出しの割合が
+      しきい値以上になったら開く（minimum_calls 回に満たない間は判定しない）
+    - 開: open_seconds 秒の間、呼び出しをすぐに失敗させる
+    - 半開: half_open_max_calls 回だけ試験的に呼び出し、すべて成功したら閉じ、
+      1回でも失敗または遅い呼び出しがあれば再び開く
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_seconds: float = 10.0,
+        slow_call_rate_threshold: float = 0.8,
+        minimum_calls: int = 10,
+        window_size: int = 20,
+        open_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        初期化
+
+        Args:
+            failure_rate_threshold: 開く失敗率（0〜1）
+            slow_call_seconds: 遅い呼び出しとみなす秒数
+            slow_call_rate_threshold: 開く遅い呼び出しの割合（0〜1）
+            minimum_calls: 割合を判定するのに必要な呼び出し回数
+            window_size: 割合の計算に使う直近の呼び出し回数
+            open_seconds: 開いてから半開にするまでの秒数
+            half_open_max_calls: 半開で試験的に許可する呼び出し回数
+            enabled: サーキットブレーカーを有効にするかどうか
+            clock: 現在時刻を返す関数
+        """
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_size = max(1, window_size)
+        self.minimum_calls = min(max(1, minimum_calls), self.window_size)
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self.enabled = enabled
+        self._clock = clock
+        self._state = CLOSED
+        # 直近の呼び出し結果 (失敗したかどうか, 遅かったかどうか)
+        self._window: Deque[Tuple[bool, bool]] = deque(maxlen=self.window_size)
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._half_open_successes = 0
+        self._rejected_calls = 0
+        self._opened_count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """
+        現在の状態
+
+        Returns:
+            "closed"、"open"、"half_open" のいずれか
+        """
+        with self._lock:
+            self._update_state()
+            return self._state
+
+    def _update_state(self) -> None:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.open_seconds:
+            self._state = HALF_OPEN
+            self._half_open_in_flight = 0
+            self._half_open_successes = 0
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self._opened_count += 1
+        self._window.clear()
+
+    def before_call(self) -> None:
+        """
+        呼び出しの前に呼び出してよいか確認する
+
+        Raises:
+            CircuitOpenError: 開いている場合や、半開で試験的な呼び出しが上限に達している場合
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._update_state()
+            if self._state == CLOSED:
+                return
+            if (
+                self._state == HALF_OPEN
+                and self._half_open_in_flight + self._half_open_successes
+                < self.half_open_max_calls
+            ):
+                self._half_open_in_flight += 1
+                return
+            self._rejected_calls += 1
+            retry_after = max(0.0, self._opened_at + self.open_seconds - self._clock())
+        raise CircuitOpenError(retry_after)
+
+    def cancel(self) -> None:
+        """
+        before_call で許可された呼び出しを行わなかった場合に呼び出す
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+
+    def record(self, success: bool, elapsed: float) -> None:
+        """
+        呼び出しの結果を記録する
+
+        Args:
+            success: 呼び出しが成功したかどうか
+            elapsed: 呼び出しにかかった秒数
+        """
+        if not self.enabled:
+            return
+        slow = elapsed >= self.slow_call_seconds
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                if not success or slow:
+                    self._open()
+                    return
+                self._half_open_successes += 1
+                if self._half_open_successes >= self.half_open_max_calls:
+                    self._state = CLOSED
+                    self._window.clear()
+                return
+            if self._state == OPEN:
+                # 開く前に始まった呼び出しの結果は判定に使わない
+                return
+
+            self._window.append((not success, slow))
+            if len(self._window) < self.minimum_calls:
+                return
+            failure_rate, slow_call_rate = self._rates()
+            if (
+                failure_rate >= self.failure_rate_threshold
+                or slow_call_rate >= self.slow_call_rate_threshold
+            ):
+                self._open()
+
+    def _rates(self) -> Tuple[float, float]:
+        if not self._window:
+            return 0.0, 0.0
+        failures = sum(1 for failed, _ in self._window if failed)
+        slow_calls = sum(1 for _, slow in self._window if slow)
+        return failures / len(self._window), slow_calls / len(self._window)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        ヘルスチェックやメトリクス用に現在の状態を取得
+
+        Returns:
+            状態・直近の失敗率・遅い呼び出しの割合・拒否した呼び出し回数などの辞書
+        """
+        with self._lock:
+            self._update_state()
+            failure_rate, slow_call_rate = self._rates()
+            retry_after = (
+                max(0.0, self._opened_at + self.open_seconds - self._clock())
+                if self._state == OPEN
+                else 0.0
+            )
+            return {
+                "enabled": self.enabled,
+                "state": self._state,
+                "failure_rate": round(failure_rate, 3),
+                "slow_call_rate": round(slow_call_rate, 3),
+                "calls_in_window": len(self._window),
+                "rejected_calls": self._rejected_calls,
+                "opened_count": self._opened_count,
+                "retry_after_seconds": round(retry_after, 3),
+            }
+
+
+_circuit_breaker: Optional[CircuitBreaker] = None
+_circuit_breaker_lock = threading.Lock()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """
+    プロセス内で共有するサーキットブレーカーを取得
+
+    Returns:
+        CircuitBreaker: 設定値 CIRCUIT_BREAKER_* に基づくサーキットブレーカー
+    """
+    global _circuit_breaker
+    if _circuit_breaker is None:
+        with _circuit_breaker_lock:
+            if _circuit_breaker is None:
+                _circuit_breaker = CircuitBreaker(
+                    failure_rate_threshold=settings.CIRCUIT_BREAKER_FAILURE_RATE_THRESHOLD,
+                    slow_call_seconds=settings.CIRCUIT_BREAKER_SLOW_CALL_SECONDS,
+                    slow_call_rate_threshold=settings.CIRCUIT_BREAKER_SLOW_CALL_RATE_THRESHOLD,
+                    minimum_calls=settings.CIRCUIT_BREAKER_MINIMUM_CALLS,
+                    window_size=settings.CIRCUIT_BREAKER_WINDOW_SIZE,
+                    open_seconds=settings.CIRCUIT_BREAKER_OPEN_SECONDS,
+                    enabled=settings.CIRCUIT_BREAKER_ENABLED,
+                )
+    return _circuit_breaker
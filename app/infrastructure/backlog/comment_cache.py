@@ -0,0 +1,135 @@
+"""
+課題コメントのキャッシュ
+
+課題ごとに取得済みのコメントを保持し、2回目以降は最後に取得したコメントより
+新しいコメントだけをBacklogから取得できるようにする。
+キャッシュキーは (スペース, 課題ID) とし、課題キーで取得した場合も課題IDで破棄できるようにする。
+ルーターやMCPツールはリクエストごとにBacklogClientWrapperを生成するため、
+キャッシュはプロセス内で共有する
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+from app.core.config import settings
+
+
+class CommentCacheEntry:
+    """
+    1課題分のコメントキャッシュ
+
+    floor_id より大きいIDを持つコメントを、取得済みの範囲で漏れなくID昇順に保持する。
+    件数を指定して取得した場合は、floor_id から last_id までの途中の範囲だけを保持する。
+    複数スレッドから参照されるため、更新時は新しいインスタンスを作成して置き換える
+    """
+
+    def __init__(
+        self, floor_id: int, comments: List[Dict[str, Any]], complete: bool = True
+    ):
+        """
+        初期化
+
+        Args:
+            floor_id: キャッシュが網羅する範囲の下限（このIDより大きいコメントを保持）
+            comments: ID昇順のコメント一覧
+            complete: 取得時点の最新のコメントまで保持しているかどうか
+                （Falseの場合は last_id より新しいコメントが残っている可能性がある）
+        """
+        self.floor_id = floor_id
+        self.comments = comments
+        self.complete = complete
+
+    @property
+    def last_id(self) -> int:
+        """
+        取得済みの最新のコメントID
+
+        Returns:
+            最新のコメントID。コメントがない場合はfloor_id
+        """
+        if self.comments:
+            return int(self.comments[-1]["id"])
+        return self.floor_id
+
+    def since(self, comment_id: int) -> List[Dict[str, Any]]:
+        """
+        指定したIDより新しいコメントを取得
+
+        Args:
+            comment_id: コメントID
+
+        Returns:
+            ID昇順のコメント一覧
+        """
+        return [c for c in self.comments if int(c["id"]) > comment_id]
+
+
+class CommentCache:
+    """
+    課題ごとのコメントキャッシュ
+
+    保持する課題数が上限を超えた場合は、最も長く使われていない課題から破棄する
+    """
+
+    def __init__(self, max_issues: int = 256):
+        """
+        初期化
+
+        Args:
+            max_issues: キャッシュする課題数の上限
+        """
+        self.max_issues = max_issues
+        self._entries: "OrderedDict[Hashable, CommentCacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[CommentCacheEntry]:
+        """
+        キャッシュを取得
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            キャッシュ。存在しない場合はNone
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, entry: CommentCacheEntry) -> None:
+        """
+        キャッシュを保存
+
+        Args:
+            key: キャッシュキー
+            entry: キャッシュ
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_issues:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        キャッシュを破棄
+
+        Args:
+            key: キャッシュキー
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        すべてのキャッシュを破棄
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+# プロセス内で共有するコメントキャッシュ
+comment_cache = CommentCache(max_issues=settings.COMMENT_CACHE_MAX_ISSUES)
@@ -0,0 +1,218 @@
+"""
+Backlog APIの読み取りリクエストのヘッジ
+
+応答が遅いリクエストに引きずられないように、直近の応答時間のパーセンタイル値を
+過ぎても応答がない場合に同じリクエストをもう1つ送り、先に成功した方の結果を使う。
+重複して送るリクエストの割合は予算で制限する。
+ルーターやMCPツールはリクエストごとにBacklogClientWrapperを生成するため、
+応答時間の統計と予算はプロセス内で共有する
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from typing import Any, Callable, Deque, Dict, Optional, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+
+def _succeeded(result: Any) -> bool:
+    """
+    呼び出しが成功したかどうかを判定
+
+    requests.Response のように ok 属性を持つ結果は、エラーのステータスコードを失敗とみなす
+
+    Args:
+        result: 呼び出しの結果
+
+    Returns:
+        成功した場合はTrue
+    """
+    return bool(getattr(result, "ok", True))
+
+
+class Hedger:
+    """
+    冪等な読み取りリクエストのヘッジ
+
+    - 操作ごとに直近 window_size 回の成功した呼び出しの応答時間を記録する
+      （例外やエラーのレスポンスは、速くても記録しない）
+    - 記録が min_samples 回に満たない操作はヘッジしない
+    - 応答時間の percentile 値（min_delay 秒以上）を過ぎても応答がない場合、
+      予算が残っていれば同じ呼び出しをもう1回行い、先に成功した結果を返す
+    - 予算は呼び出しごとに budget_ratio ずつ貯まり、ヘッジ1回で1消費する
+      （重複して送る呼び出しは全体の約 budget_ratio の割合に抑えられる）
+    """
+
+    def __init__(
+        self,
+        budget_ratio: float = 0.05,
+        percentile: float = 0.95,
+        min_delay: float = 0.05,
+        min_samples: int = 20,
+        window_size: int = 200,
+        max_budget: float = 10.0,
+        max_workers: int = 32,
+        enabled: bool = True,
+    ):
+        """
+        初期化
+
+        Args:
+            budget_ratio: 呼び出し1回あたりに貯まるヘッジの予算
+            percentile: ヘッジするまでの待ち時間に使う応答時間のパーセンタイル（0〜1）
+            min_delay: ヘッジするまでの最小の待ち時間（秒）
+            min_samples: ヘッジを始めるのに必要な応答時間の記録数
+            window_size: 操作ごとに記録する直近の応答時間の数
+            max_budget: 貯められる予算の上限
+            max_workers: 呼び出しを実行するスレッド数の上限
+            enabled: ヘッジを有効にするかどうか
+        """
+        self.budget_ratio = budget_ratio
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = max(1, min_samples)
+        self.window_size = max(self.min_samples, window_size)
+        self.max_budget = max_budget
+        self.enabled = enabled
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="backlog-hedge"
+        )
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._budget = 0.0
+        self._calls = 0
+        self._hedged_calls = 0
+        self._hedge_wins = 0
+        self._lock = threading.Lock()
+
+    def delay(self, name: str) -> Optional[float]:
+        """
+        ヘッジするまでの待ち時間を取得
+
+        Args:
+            name: 操作名
+
+        Returns:
+            待ち時間（秒）。応答時間の記録が足りない場合はNone
+        """
+        with self._lock:
+            latencies = sorted(self._latencies.get(name, ()))
+        if len(latencies) < self.min_samples:
+            return None
+        index = max(0, math.ceil(self.percentile * len(latencies)) - 1)
+        return max(self.min_delay, latencies[index])
+
+    def _record(self, name: str, elapsed: float) -> None:
+        with self._lock:
+            latencies = self._latencies.setdefault(name, deque(maxlen=self.window_size))
+            latencies.append(elapsed)
+
+    def _timed(self, name: str, func: Callable[[], T]) -> T:
+        started = time.perf_counter()
+        result = func()
+        if _succeeded(result):
+            self._record(name, time.perf_counter() - started)
+        return result
+
+    def _spend(self) -> bool:
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            self._hedged_calls += 1
+            return True
+
+    def _submit(self, name: str, func: Callable[[], T]) -> "Future[T]":
+        # 処理期限などを引き継ぐため、呼び出し元のコンテキストで実行する
+        return self._executor.submit(copy_context().run, self._timed, name, func)
+
+    def call(self, name: str, func: Callable[[], T]) -> T:
+        """
+        ヘッジを適用して呼び出す
+
+        func は冪等な読み取り処理であること
+
+        Args:
+            name: 操作名（応答時間は操作ごとに記録する）
+            func: 呼び出す処理
+
+        Returns:
+            先に成功した呼び出しの結果。どちらも失敗した場合は最初の呼び出しの結果
+        """
+        if not self.enabled:
+            return func()
+        with self._lock:
+            self._calls += 1
+            self._budget = min(self.max_budget, self._budget + self.budget_ratio)
+
+        delay = self.delay(name)
+        if delay is None:
+            return self._timed(name, func)
+
+        primary = self._submit(name, func)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._spend():
+            return primary.result()
+
+        hedge = self._submit(name, func)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                # エラーのレスポンスは、もう一方の呼び出しの成功を待つ
+                if future.exception() is None and _succeeded(future.result()):
+                    if future is hedge:
+                        with self._lock:
+                            self._hedge_wins += 1
+                    return future.result()
+        # どちらも失敗した場合は最初の呼び出しの結果を返すか、例外を送出する
+        return primary.result()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        メトリクス用に現在の状態を取得
+
+        Returns:
+            呼び出し回数・ヘッジした回数・ヘッジが先に成功した回数・操作ごとの待ち時間などの辞書
+        """
+        with self._lock:
+            names = list(self._latencies)
+            stats: Dict[str, Any] = {
+                "enabled": self.enabled,
+                "calls": self._calls,
+                "hedged_calls": self._hedged_calls,
+                "hedge_wins": self._hedge_wins,
+                "budget": round(self._budget, 3),
+            }
+        stats["delays"] = {name: self.delay(name) for name in names}
+        return stats
+
+
+_hedger: Optional[Hedger] = None
+_hedger_lock = threading.Lock()
+
+
+def get_hedger() -> Hedger:
+    """
+    プロセス内で共有するヘッジを取得
+
+    Returns:
+        Hedger: 設定値 HEDGED_READS_* に基づくヘッジ
+    """
+    global _hedger
+    if _hedger is None:
+        with _hedger_lock:
+            if _hedger is None:
+                _hedger = Hedger(
+                    budget_ratio=settings.HEDGED_READS_BUDGET_RATIO,
+                    percentile=settings.HEDGED_READS_PERCENTILE,
+                    min_delay=settings.HEDGED_READS_MIN_DELAY_SECONDS,
+                    min_samples=settings.HEDGED_READS_MIN_SAMPLES,
+                    enabled=settings.HEDGED_READS_ENABLED,
+                )
+    return _hedger
@@ -0,0 +1,145 @@
+"""
+課題のキャッシュ
+
+get_issue・get_issues・create_issue・update_issue の結果を保持し、
+delete_issue で破棄するライトスルーキャッシュ。
+ルーターやMCPツールはリクエストごとにBacklogClientWrapperを生成するため、
+キャッシュはプロセス内で共有する
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from app.core.config import settings
+
+
+class IssueCache:
+    """
+    課題IDと課題キーの両方で参照できる課題キャッシュ
+
+    - 課題IDを正規のキーとして保持し、課題キーは別名として課題IDに対応付ける
+    - 保存から ttl 秒を過ぎた課題は返さない（Backlogに接続できない場合に限り、
+      破棄されるまで古い課題を返せるように保持しておく）
+    - 保存済みの課題より updated が古い課題では上書きしない
+    - 保持する課題数が上限を超えた場合は、最も長く使われていない課題から破棄する
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        初期化
+
+        Args:
+            max_entries: キャッシュする課題数の上限
+            ttl: 課題を保持する秒数（0以下の場合はキャッシュしない）
+            clock: 現在時刻を返す関数
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        # (スペース, 課題ID) -> (保存時刻, 課題)
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        # (スペース, 課題キー) -> 課題ID
+        self._aliases: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def _resolve(self, space: str, issue_id_or_key: Hashable) -> Optional[Tuple[str, int]]:
+        key = str(issue_id_or_key)
+        if key.isdigit():
+            return (space, int(key))
+        issue_id = self._aliases.get((space, key))
+        return (space, issue_id) if issue_id is not None else None
+
+    def _remove(self, entry_key: Tuple[str, int]) -> None:
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            issue_key = entry[1].get("issueKey")
+            if issue_key:
+                self._aliases.pop((entry_key[0], issue_key), None)
+
+    def get(
+        self, space: str, issue_id_or_key: Hashable, allow_stale: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """
+        課題を取得
+
+        Args:
+            space: Backlogスペース名
+            issue_id_or_key: 課題IDまたは課題キー
+            allow_stale: 有効期間を過ぎた課題も返すかどうか
+
+        Returns:
+            課題情報のコピー。キャッシュにない場合や期限切れの場合はNone
+        """
+        with self._lock:
+            entry_key = self._resolve(space, issue_id_or_key)
+            if entry_key is None or entry_key not in self._entries:
+                return None
+            stored_at, issue = self._entries[entry_key]
+            if not allow_stale and self._clock() - stored_at > self.ttl:
+                return None
+            self._entries.move_to_end(entry_key)
+            return copy.deepcopy(issue)
+
+    def put(self, space: str, issue: Optional[Dict[str, Any]]) -> None:
+        """
+        課題を保存
+
+        Args:
+            space: Backlogスペース名
+            issue: 課題情報（idを持たない場合は保存しない）
+        """
+        if self.ttl <= 0 or not issue or issue.get("id") is None:
+            return
+        entry_key = (space, int(issue["id"]))
+        with self._lock:
+            current = self._entries.get(entry_key)
+            if current is not None:
+                current_updated = current[1].get("updated")
+                updated = issue.get("updated")
+                if current_updated and updated and updated < current_updated:
+                    return
+                self._remove(entry_key)
+            self._entries[entry_key] = (self._clock(), copy.deepcopy(issue))
+            if issue.get("issueKey"):
+                self._aliases[(space, issue["issueKey"])] = entry_key[1]
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, space: str, issue_id_or_key: Hashable) -> None:
+        """
+        課題を破棄
+
+        Args:
+            space: Backlogスペース名
+            issue_id_or_key: 課題IDまたは課題キー
+        """
+        with self._lock:
+            entry_key = self._resolve(space, issue_id_or_key)
+            if entry_key is not None:
+                self._remove(entry_key)
+            else:
+                self._aliases.pop((space, str(issue_id_or_key)), None)
+
+    def clear(self) -> None:
+        """
+        すべてのキャッシュを破棄
+        """
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+
+
+# プロセス内で共有する課題キャッシュ
+issue_cache = IssueCache(
+    max_entries=settings.ISSUE_CACHE_MAX_ENTRIES, ttl=settings.ISSUE_CACHE_TTL_SECONDS
+)
@@ -0,0 +1,254 @@
+"""
+メタデータ（ステータス・カテゴリー・マイルストーン・発生バージョン・優先度・ユーザーなど）のキャッシュ
+
+メタデータはめったに変わらないため、有効期間を過ぎても最大許容期間までは
+古い値をすぐに返し、裏で再取得する（stale-while-revalidate）。
+ルーターやMCPツールはリクエストごとにBacklogClientWrapperを生成するため、
+キャッシュはプロセス内で共有する。共有キャッシュ（L2）を設定した場合は、
+プロセス内にない値を共有キャッシュから読み込み、取得した値を共有キャッシュにも保存する
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.infrastructure.backlog.shared_cache import SharedCache, get_shared_cache
+
+
+def _start_daemon_thread(func: Callable[[], None]) -> None:
+    """
+    処理をデーモンスレッドで実行する
+
+    Args:
+        func: 実行する処理
+    """
+    threading.Thread(target=func, daemon=True).start()
+
+
+class MetadataCache:
+    """
+    stale-while-revalidate方式のメタデータキャッシュ
+
+    - 取得から ttl 秒以内の値はそのまま返す
+    - ttl 秒を過ぎ max_staleness 秒以内の値はそのまま返し、裏で1回だけ再取得する
+    - max_staleness 秒を過ぎた値やキャッシュにない値は、取得が終わるまで待つ
+      （同じキーの取得は1回にまとめる）
+    - 取得に失敗した場合は値を保存しない
+    - 共有キャッシュを指定した場合、プロセス内にない値は共有キャッシュから読み込み、
+      取得するときは共有キャッシュに有効期間内の値がないか先に確認する
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        max_staleness: float = 3600.0,
+        clock: Callable[[], float] = time.monotonic,
+        run_in_background: Callable[[Callable[[], None]], None] = _start_daemon_thread,
+        shared: Optional[SharedCache] = None,
+        wall_clock: Callable[[], float] = time.time,
+    ):
+        """
+        初期化
+
+        Args:
+            ttl: 値を再取得せずに返す秒数
+            max_staleness: 再取得中に古い値を返してよい秒数の上限
+            clock: 現在時刻を返す関数
+            run_in_background: 再取得処理を裏で実行する関数
+            shared: 共有キャッシュ（L2）
+            wall_clock: 共有キャッシュの取得時刻に使う現在時刻（UNIX時間）を返す関数
+        """
+        self.ttl = ttl
+        self.max_staleness = max(ttl, max_staleness)
+        self._clock = clock
+        self._run_in_background = run_in_background
+        self.shared = shared
+        self._wall_clock = wall_clock
+        # キー -> (取得時刻, 値)
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._refreshing: Set[Hashable] = set()
+        self._lock = threading.Lock()
+
+    def _key_lock(self, key: Hashable) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _entry(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """
+        プロセス内の値を取得し、ない場合は共有キャッシュから読み込む
+
+        Returns:
+            (取得時刻, 値)。どちらにもない場合はNone
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None or self.shared is None:
+            return entry
+        shared_entry = self.shared.get(key)
+        if shared_entry is None:
+            return None
+        stored_at, value = shared_entry
+        # 共有キャッシュの取得時刻（UNIX時間）をプロセス内の時計に換算する
+        age = max(0.0, self._wall_clock() - stored_at)
+        entry = (self._clock() - age, value)
+        with self._lock:
+            self._entries.setdefault(key, entry)
+        return entry
+
+    def get(self, key: Hashable, max_age: Optional[float] = None) -> Optional[Any]:
+        """
+        再取得せずにキャッシュの値を取得
+
+        Args:
+            key: キャッシュキー
+            max_age: 許容する経過秒数（指定しない場合はmax_staleness）
+
+        Returns:
+            キャッシュの値。ない場合や古すぎる場合はNone
+        """
+        entry = self._entry(key)
+        if entry is None:
+            return None
+        limit = self.max_staleness if max_age is None else max_age
+        if self._clock() - entry[0] > limit:
+            return None
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        値を保存
+
+        Args:
+            key: キャッシュキー
+            value: 値
+        """
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+        if self.shared is not None:
+            self.shared.set(
+                key, value, ttl=self.max_staleness, stored_at=self._wall_clock()
+            )
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        キャッシュの値を取得し、必要に応じて再取得する
+
+        Args:
+            key: キャッシュキー
+            loader: 値を取得する関数（失敗時は例外を送出すること）
+
+        Returns:
+            値
+        """
+        entry = self._entry(key)
+        if entry is not None:
+            age = self._clock() - entry[0]
+            if age <= self.ttl:
+                return entry[1]
+            if age <= self.max_staleness:
+                self._refresh_in_background(key, loader)
+                return entry[1]
+        return self._load(key, loader)
+
+    def _load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        with self._key_lock(key):
+            # 待っている間に他のスレッドが取得した場合はその値を使う
+            cached = self.get(key, max_age=self.ttl)
+            if cached is not None:
+                return cached
+            fresh = self._fresh_shared_value(key)
+            if fresh is not None:
+                return fresh
+            value = loader()
+            self.set(key, value)
+            return value
+
+    def _fresh_shared_value(self, key: Hashable) -> Optional[Any]:
+        """
+        共有キャッシュに有効期間内の値があれば、プロセス内に保存して返す
+        """
+        if self.shared is None:
+            return None
+        shared_entry = self.shared.get(key)
+        if shared_entry is None:
+            return None
+        stored_at, value = shared_entry
+        age = max(0.0, self._wall_clock() - stored_at)
+        if age > self.ttl:
+            return None
+        with self._lock:
+            self._entries[key] = (self._clock() - age, value)
+        return value
+
+    def _refresh_in_background(self, key: Hashable, loader: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh() -> None:
+            try:
+                with self._key_lock(key):
+                    # 他のプロセスが再取得済みであればその値を使う
+                    if self._fresh_shared_value(key) is None:
+                        self.set(key, loader())
+            except Exception as e:
+                # 古い値を使い続け、次回のアクセスで再度取得を試みる
+                print(f"Error refreshing metadata {key}: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        self._run_in_background(refresh)
+
+    def delete(self, *keys: Hashable) -> int:
+        """
+        値をプロセス内と共有キャッシュの両方から破棄
+
+        Args:
+            keys: キャッシュキー
+
+        Returns:
+            プロセス内から破棄した件数
+        """
+        with self._lock:
+            count = sum(1 for key in keys if self._entries.pop(key, None) is not None)
+        if self.shared is not None:
+            for key in keys:
+                self.shared.delete(key)
+        return count
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        条件に一致するキーの値をプロセス内から破棄
+
+        共有キャッシュの値は破棄しないため、共有キャッシュを使う場合は delete を使うこと
+
+        Args:
+            predicate: 破棄するキーならTrueを返す関数
+
+        Returns:
+            破棄した件数
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        """
+        プロセス内のすべての値を破棄
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+# プロセス内で共有するメタデータキャッシュ
+metadata_cache = MetadataCache(
+    ttl=settings.METADATA_CACHE_TTL_SECONDS,
+    max_staleness=settings.METADATA_CACHE_MAX_STALENESS_SECONDS,
+    shared=get_shared_cache(),
+)
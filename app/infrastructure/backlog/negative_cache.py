@@ -0,0 +1,98 @@
+"""
+存在しないことが確認された課題・プロジェクト・名前のキャッシュ
+
+存在しない課題キーや誤った名前での検索が繰り返された場合に、
+Backlogへの問い合わせを省略するための短期間のキャッシュ。
+見つかった結果を保持するキャッシュとは分けて管理する
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from app.core.config import settings
+
+
+class NegativeCache:
+    """
+    存在しないことが確認されたキーを一定時間保持するキャッシュ
+    """
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        max_entries: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        初期化
+
+        Args:
+            ttl: キーを保持する秒数（0以下の場合はキャッシュしない）
+            max_entries: 保持するキー数の上限
+            clock: 現在時刻を返す関数
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._expires: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def contains(self, key: Hashable) -> bool:
+        """
+        キーが存在しないと記録されているかどうか
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            有効期間内に存在しないと記録されている場合はTrue
+        """
+        with self._lock:
+            expires = self._expires.get(key)
+            if expires is None:
+                return False
+            if self._clock() >= expires:
+                del self._expires[key]
+                return False
+            return True
+
+    def add(self, key: Hashable) -> None:
+        """
+        キーが存在しないことを記録
+
+        Args:
+            key: キャッシュキー
+        """
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._expires[key] = self._clock() + self.ttl
+            self._expires.move_to_end(key)
+            while len(self._expires) > self.max_entries:
+                self._expires.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """
+        記録を破棄
+
+        Args:
+            key: キャッシュキー
+        """
+        with self._lock:
+            self._expires.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        すべての記録を破棄
+        """
+        with self._lock:
+            self._expires.clear()
+
+
+# プロセス内で共有するネガティブキャッシュ
+negative_cache = NegativeCache(
+    ttl=settings.NEGATIVE_CACHE_TTL_SECONDS,
+    max_entries=settings.NEGATIVE_CACHE_MAX_ENTRIES,
+)
@@ -0,0 +1,91 @@
+"""
+Backlog APIのクライアント側レート制限
+
+ルーターやMCPツールはリクエストごとにBacklogClientWrapperを生成するため、
+レート制限の状態はプロセス内で共有する
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+from app.core.config import settings
+
+
+class RateLimiter:
+    """
+    トークンバケット方式のレート制限
+
+    毎秒 rate 個のトークンを補充し、最大 burst 個まで貯める。
+    トークンがない場合は補充されるまで待機する。
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        初期化
+
+        Args:
+            rate: 1秒あたりに許可するリクエスト数（0以下の場合は制限しない）
+            burst: 連続して許可するリクエスト数の上限（指定しない場合はrateの切り上げ）
+            clock: 現在時刻を返す関数
+            sleep: 待機する関数
+        """
+        self.rate = rate
+        self.burst = max(1, burst if burst is not None else int(rate + 0.999))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        リクエスト1回分のトークンを取得する
+
+        Returns:
+            待機した秒数
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                float(self.burst), self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        # ロックの外で待機し、他スレッドの予約を妨げない
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    プロセス内で共有するレート制限を取得
+
+    Returns:
+        RateLimiter: 設定値 BACKLOG_RATE_LIMIT_PER_SECOND に基づくレート制限
+    """
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = RateLimiter(
+                    rate=settings.BACKLOG_RATE_LIMIT_PER_SECOND,
+                    burst=settings.BACKLOG_RATE_LIMIT_BURST,
+                )
+    return _rate_limiter
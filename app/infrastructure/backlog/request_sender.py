@@ -0,0 +1,168 @@
+"""
+PyBacklogPyのリクエスト送信処理の差し替え
+
+PyBacklogPyの各APIクラスは RequestSender を通してHTTPリクエストを送信する。
+BacklogClientWrapperはこのクラスを各APIクラスに設定し、
+タイムアウト・処理期限・サーキットブレーカー・レート制限などの横断的な処理を
+すべてのBacklog API呼び出しに適用する
+"""
+
+import time
+from typing import Any, Callable, Optional, Tuple
+
+import requests
+from pybacklogpy.BacklogConfigure import BacklogConfigure
+from pybacklogpy.modules import RequestSender, convert_bool_to_str
+from requests import Response
+
+from app.core import deadline
+from app.core.config import settings
+from app.core.deadline import DeadlineExceededError
+from app.infrastructure.backlog.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from app.infrastructure.backlog.rate_limiter import RateLimiter, get_rate_limiter
+
+
+def _is_server_failure(response: Response) -> bool:
+    """
+    Backlog側の障害とみなすレスポンスかどうか
+
+    Args:
+        response: レスポンス
+
+    Returns:
+        5xxまたは429の場合はTrue（課題が存在しないなどの4xxは障害とみなさない）
+    """
+    return response.status_code >= 500 or response.status_code == 429
+
+
+class ManagedRequestSender(RequestSender):
+    """
+    タイムアウト・処理期限・サーキットブレーカー・レート制限を適用するRequestSender
+
+    PyBacklogPyのRequestSenderはタイムアウトを指定せずにリクエストを送信するため、
+    送信処理は同じ内容でタイムアウトを指定して実装し直している
+    """
+
+    def __init__(
+        self,
+        config: BacklogConfigure,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        """
+        初期化
+
+        Args:
+            config: Backlogの接続設定
+            rate_limiter: レート制限（指定しない場合はプロセス内で共有するもの）
+            circuit_breaker: サーキットブレーカー（指定しない場合はプロセス内で共有するもの）
+        """
+        super().__init__(config)
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker()
+        self.connect_timeout = settings.BACKLOG_CONNECT_TIMEOUT_SECONDS
+        self.read_timeout = settings.BACKLOG_READ_TIMEOUT_SECONDS
+        self.write_timeout = settings.BACKLOG_WRITE_TIMEOUT_SECONDS
+
+    def _timeout(self, read_timeout: float) -> Tuple[float, float]:
+        """
+        処理期限を考慮したタイムアウトを取得
+
+        Args:
+            read_timeout: レスポンス待ちタイムアウト（秒）
+
+        Returns:
+            (接続タイムアウト, レスポンス待ちタイムアウト)
+
+        Raises:
+            DeadlineExceededError: 処理期限が近い場合
+        """
+        if deadline.deadline_exceeded():
+            raise DeadlineExceededError()
+        left = deadline.remaining()
+        if left is None:
+            return self.connect_timeout, read_timeout
+        return min(self.connect_timeout, left), min(read_timeout, left)
+
+    def _send(
+        self, send: Callable[..., Response], read_timeout: float, **kwargs: Any
+    ) -> Response:
+        """
+        タイムアウト・処理期限・サーキットブレーカー・レート制限を適用してリクエストを送信
+
+        Args:
+            send: 送信処理（requests.getなど）
+            read_timeout: レスポンス待ちタイムアウト（秒）
+            **kwargs: 送信処理の引数
+
+        Returns:
+            レスポンス
+
+        Raises:
+            DeadlineExceededError: 処理期限が近い場合
+            CircuitOpenError: サーキットブレーカーが開いている場合
+        """
+        # レート制限で待つ前に判定し、期限切れや障害時はすぐに失敗させる
+        self._timeout(read_timeout)
+        self.circuit_breaker.before_call()
+        self.rate_limiter.acquire()
+        started = time.perf_counter()
+        try:
+            response = send(timeout=self._timeout(read_timeout), **kwargs)
+        except DeadlineExceededError:
+            # レート制限で待つ間に期限が近づいた場合は、呼び出しの結果として記録しない
+            self.circuit_breaker.cancel()
+            raise
+        except Exception:
+            self.circuit_breaker.record(False, time.perf_counter() - started)
+            raise
+        self.circuit_breaker.record(
+            not _is_server_failure(response), time.perf_counter() - started
+        )
+        return response
+
+    def send_delete_request(
+        self, path: str, request_param: Optional[dict] = None
+    ) -> Response:
+        return self._send(
+            requests.delete,
+            self.write_timeout,
+            url=self.api_url + path,
+            data=convert_bool_to_str(request_param or {}),
+            params=self.payload,
+        )
+
+    def send_get_request(self, path: str, url_param: Optional[dict] = None) -> Response:
+        params = self.payload.copy()
+        if url_param:
+            params.update(convert_bool_to_str(url_param))
+        return self._send(
+            requests.get, self.read_timeout, url=self.api_url + path, params=params
+        )
+
+    def send_patch_request(self, path: str, request_param: dict) -> Response:
+        return self._send(
+            requests.patch,
+            self.write_timeout,
+            url=self.api_url + path,
+            data=convert_bool_to_str(request_param),
+            params=self.payload,
+        )
+
+    def send_post_request(self, path: str, request_param: dict) -> Response:
+        return self._send(
+            requests.post,
+            self.write_timeout,
+            url=self.api_url + path,
+            data=convert_bool_to_str(request_param),
+            params=self.payload,
+        )
+
+    def send_put_request(self, path: str, request_param: dict) -> Response:
+        return self._send(
+            requests.put,
+            self.write_timeout,
+            url=self.api_url + path,
+            data=convert_bool_to_str(request_param),
+            params=self.payload,
+        )
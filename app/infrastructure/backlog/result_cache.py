@@ -0,0 +1,98 @@
+"""
+分割して返すレスポンスの結果のキャッシュ
+
+予算に収まらなかった課題やコメント一覧の続きを、Backlogに再度問い合わせずに
+返すための短期間のキャッシュ。続きを読み出すカーソルには推測できないキーを使う
+"""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+from app.core.config import settings
+
+
+class ResultCache:
+    """
+    結果を一定時間保持するキャッシュ
+
+    - 保存した結果はランダムなキーで参照する
+    - 保存から ttl 秒を過ぎた結果は返さない
+    - 保持する結果の数が上限を超えた場合は、最も長く使われていない結果から破棄する
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        max_entries: int = 100,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        初期化
+
+        Args:
+            ttl: 結果を保持する秒数（0以下の場合は保持しない）
+            max_entries: 保持する結果の数の上限
+            clock: 現在時刻を返す関数
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        # キー -> (有効期限, 結果)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, value: Any) -> str:
+        """
+        結果を保存
+
+        Args:
+            value: 結果（保存後に変更しないこと）
+
+        Returns:
+            結果を参照するキー
+        """
+        key = secrets.token_urlsafe(12)
+        if self.ttl <= 0:
+            return key
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return key
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        結果を取得
+
+        Args:
+            key: 結果を参照するキー
+
+        Returns:
+            結果。保存されていない場合や期限切れの場合はNone
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._clock() >= entry[0]:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def clear(self) -> None:
+        """
+        すべての結果を破棄
+        """
+        with self._lock:
+            self._entries.clear()
+
+
+# プロセス内で共有する結果のキャッシュ
+result_cache = ResultCache(
+    ttl=settings.RESULT_CACHE_TTL_SECONDS,
+    max_entries=settings.RESULT_CACHE_MAX_ENTRIES,
+)
@@ -0,0 +1,450 @@
+"""
+プロセス間で共有するキャッシュ（L2）
+
+プロセス内のキャッシュ（L1）はLambdaのコンテナやuvicorn/gunicornのワーカーごとに
+空の状態から始まるため、その下に共有のキャッシュを置き、他のプロセスが取得した値を使えるようにする。
+値は取得時刻（UNIX時間）と合わせてJSONで保存し、キーにはスペース名を含めて名前空間を分ける。
+共有キャッシュの障害でリクエストを失敗させないため、エラーはキャッシュにない場合として扱う
+"""
+
+import json
+import socket
+import sqlite3
+import ssl
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, BinaryIO, Callable, Hashable, List, Optional, Tuple
+from urllib.parse import quote, unquote, urlparse
+
+from app.core.config import settings
+
+
+class CacheBackend(ABC):
+    """
+    共有キャッシュの保存先
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        値を取得
+
+        Args:
+            key: キー
+
+        Returns:
+            値。ない場合や有効期限を過ぎた場合はNone
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """
+        値を保存
+
+        Args:
+            key: キー
+            value: 値
+            ttl: 有効期間（秒）
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        値を削除
+
+        Args:
+            key: キー
+        """
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    SQLiteファイルに保存する共有キャッシュ
+
+    同じホストのワーカー間での共有やテストに使う
+    """
+
+    def __init__(self, path: str = ":memory:", clock: Any = time.time):
+        """
+        初期化
+
+        Args:
+            path: SQLiteファイルのパス
+            clock: 現在時刻（UNIX時間）を返す関数
+        """
+        self.path = path
+        self._clock = clock
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=1.0)
+        self._lock = threading.Lock()
+        with self._lock:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS shared_cache (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM shared_cache WHERE key = ? AND expires_at > ?",
+                (key, self._clock()),
+            ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            now = self._clock()
+            self._conn.execute(
+                """
+                INSERT INTO shared_cache (key, value, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    value = excluded.value,
+                    expires_at = excluded.expires_at
+                """,
+                (key, value, now + ttl),
+            )
+            # 有効期限を過ぎた値はここでまとめて削除する
+            self._conn.execute("DELETE FROM shared_cache WHERE expires_at <= ?", (now,))
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM shared_cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+
+class SharedCacheUnavailableError(ConnectionError):
+    """共有キャッシュへの接続に失敗した直後で、接続を試みずに失敗させる場合のエラー"""
+
+
+class _RedisConnection:
+    """
+    Redisへの1本の接続
+    """
+
+    def __init__(self, sock: Optional[socket.socket], reader: BinaryIO):
+        self.sock = sock
+        self.reader = reader
+
+    def send(self, args: List[Any]) -> Any:
+        assert self.sock is not None
+        parts = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode()
+            parts.append(f"${len(data)}\r\n".encode() + data + b"\r\n")
+        self.sock.sendall(b"".join(parts))
+        return self.read_reply()
+
+    def read_reply(self) -> Any:
+        line = self.reader.readline()
+        if not line.endswith(b"\r\n"):
+            raise ConnectionError("Connection closed by Redis server")
+        prefix, payload = line[:1], line[1:-2]
+        if prefix == b"+":
+            return payload.decode()
+        if prefix == b"-":
+            raise RuntimeError(f"Redis error: {payload.decode()}")
+        if prefix == b":":
+            return int(payload)
+        if prefix == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self.reader.read(length + 2)
+            return data[:-2]
+        if prefix == b"*":
+            length = int(payload)
+            return None if length < 0 else [self.read_reply() for _ in range(length)]
+        raise ConnectionError(f"Unexpected Redis reply: {line!r}")
+
+    def close(self) -> None:
+        for resource in (self.reader, self.sock):
+            try:
+                if resource is not None:
+                    resource.close()
+            except OSError:
+                pass
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Redisプロトコル（RESP）で保存する共有キャッシュ
+
+    Redis・Valkey・ElastiCacheなどに接続する。使うコマンドはGET・SET・DELだけのため、
+    クライアントライブラリに依存せずにソケットで直接通信する。
+    接続は小さなプールで使い回し、通信中はロックを持たないため、同時に呼び出しても互いを待たない。
+    接続に失敗した後の retry_interval 秒間は接続を試みずに失敗させ、L1とBacklogから取得させる
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_ssl: bool = False,
+        timeout: float = 1.0,
+        pool_size: int = 4,
+        retry_interval: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        初期化（接続は最初のコマンドの送信時に行う）
+
+        Args:
+            host: ホスト名
+            port: ポート番号
+            db: データベース番号
+            username: ユーザー名（ACLを使う場合）
+            password: パスワード
+            use_ssl: TLSで接続するかどうか
+            timeout: 接続・応答待ちのタイムアウト（秒）
+            pool_size: 使い回すために保持する接続数の上限
+            retry_interval: 接続に失敗した後、接続を試みずに失敗させる秒数
+            clock: 現在時刻を返す関数
+        """
+        self.host = host
+        self.port = port
+        self.db = db
+        self.username = username
+        self.password = password
+        self.use_ssl = use_ssl
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.retry_interval = retry_interval
+        self._clock = clock
+        self._idle: List[_RedisConnection] = []
+        self._retry_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_url(cls, url: str, timeout: float = 1.0) -> "RedisCacheBackend":
+        """
+        URL（redis://[[user]:password@]host[:port][/db]、TLSの場合はrediss://）から生成
+
+        Args:
+            url: 接続先のURL
+            timeout: 接続・応答待ちのタイムアウト（秒）
+
+        Returns:
+            RedisCacheBackend
+        """
+        parsed = urlparse(url)
+        path = parsed.path.lstrip("/")
+        return cls(
+            host=parsed.hostname or "localhost",
+            port=parsed.port or 6379,
+            db=int(path) if path else 0,
+            username=unquote(parsed.username) if parsed.username else None,
+            password=unquote(parsed.password) if parsed.password else None,
+            use_ssl=parsed.scheme == "rediss",
+            timeout=timeout,
+        )
+
+    def _connect(self) -> _RedisConnection:
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        if self.use_ssl:
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=self.host)
+        conn = _RedisConnection(sock, sock.makefile("rb"))
+        try:
+            if self.password:
+                if self.username:
+                    conn.send(["AUTH", self.username, self.password])
+                else:
+                    conn.send(["AUTH", self.password])
+            if self.db:
+                conn.send(["SELECT", str(self.db)])
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    def _acquire(self) -> Optional[_RedisConnection]:
+        with self._lock:
+            if self._retry_at is not None and self._clock() < self._retry_at:
+                raise SharedCacheUnavailableError(
+                    f"Redis {self.host}:{self.port} is unavailable; retrying later"
+                )
+            return self._idle.pop() if self._idle else None
+
+    def _release(self, conn: _RedisConnection) -> None:
+        with self._lock:
+            self._retry_at = None
+            if len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def _command(self, *args: Any) -> Any:
+        conn = self._acquire()
+        # プールの接続が切断されていた場合に備え、1回だけ新しい接続でやり直す
+        for reused in ((True, False) if conn is not None else (False,)):
+            try:
+                if conn is None:
+                    conn = self._connect()
+                result = conn.send(list(args))
+            except (OSError, ConnectionError):
+                if conn is not None:
+                    conn.close()
+                conn = None
+                if reused:
+                    continue
+                with self._lock:
+                    self._retry_at = self._clock() + self.retry_interval
+                raise
+            except Exception:
+                # 応答の途中で失敗した場合は接続を再利用しない
+                if conn is not None:
+                    conn.close()
+                raise
+            self._release(conn)
+            return result
+
+    def get(self, key: str) -> Optional[bytes]:
+        result = self._command("GET", key)
+        return result if isinstance(result, bytes) else None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._command("SET", key, value, "PX", max(1, int(ttl * 1000)))
+
+    def delete(self, key: str) -> None:
+        self._command("DEL", key)
+
+
+def create_cache_backend(url: str) -> CacheBackend:
+    """
+    URLから共有キャッシュの保存先を生成
+
+    Args:
+        url: redis://...、rediss://...、sqlite:///path/to/file のいずれか
+
+    Returns:
+        CacheBackend
+
+    Raises:
+        ValueError: 対応していないURLの場合
+    """
+    scheme = urlparse(url).scheme
+    if scheme in ("redis", "rediss"):
+        return RedisCacheBackend.from_url(url)
+    if scheme == "sqlite":
+        return SQLiteCacheBackend(url[len("sqlite://") :] or ":memory:")
+    raise ValueError(f"Unsupported shared cache URL: {url}")
+
+
+class SharedCache:
+    """
+    名前空間・シリアライズ・有効期間を扱う共有キャッシュ
+    """
+
+    def __init__(self, backend: CacheBackend, namespace: str = "backlog-mcp"):
+        """
+        初期化
+
+        Args:
+            backend: 保存先
+            namespace: キーの先頭に付ける名前空間
+        """
+        self.backend = backend
+        self.namespace = namespace
+
+    def make_key(self, key: Hashable) -> str:
+        """
+        キャッシュキーを共有キャッシュのキーに変換
+
+        (種類, スペース名, ...) のタプルは「名前空間:スペース名:種類:...」にする
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            共有キャッシュのキー
+        """
+        parts = list(key) if isinstance(key, tuple) else [key]
+        if len(parts) >= 2:
+            parts[0], parts[1] = parts[1], parts[0]
+        return ":".join(
+            [self.namespace] + [quote("" if part is None else str(part), safe="") for part in parts]
+        )
+
+    def get(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """
+        値を取得
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            (取得時刻（UNIX時間）, 値)。ない場合や共有キャッシュに接続できない場合はNone
+        """
+        try:
+            data = self.backend.get(self.make_key(key))
+            if data is None:
+                return None
+            entry = json.loads(data)
+            return entry["stored_at"], entry["value"]
+        except Exception as e:
+            print(f"Error reading shared cache {key}: {e}")
+            return None
+
+    def set(
+        self, key: Hashable, value: Any, ttl: float, stored_at: Optional[float] = None
+    ) -> None:
+        """
+        値を保存
+
+        Args:
+            key: キャッシュキー
+            value: JSONに変換できる値
+            ttl: 有効期間（秒）
+            stored_at: 取得時刻（UNIX時間、指定しない場合は現在時刻）
+        """
+        try:
+            data = json.dumps(
+                {"stored_at": time.time() if stored_at is None else stored_at, "value": value},
+                ensure_ascii=False,
+            ).encode()
+            self.backend.set(self.make_key(key), data, ttl)
+        except Exception as e:
+            print(f"Error writing shared cache {key}: {e}")
+
+    def delete(self, key: Hashable) -> None:
+        """
+        値を削除
+
+        Args:
+            key: キャッシュキー
+        """
+        try:
+            self.backend.delete(self.make_key(key))
+        except Exception as e:
+            print(f"Error deleting shared cache {key}: {e}")
+
+
+def get_shared_cache() -> Optional[SharedCache]:
+    """
+    設定値 SHARED_CACHE_URL の共有キャッシュを生成
+
+    モジュールの読み込み時に呼ばれるため、設定値が不正な場合も例外を送出せず、
+    エラーを出力して共有キャッシュなしで動作させる（Redisへの接続は最初のコマンドの送信時に行う）
+
+    Returns:
+        SharedCache。SHARED_CACHE_URL を指定しない場合や生成できない場合はNone
+    """
+    if not settings.SHARED_CACHE_URL:
+        return None
+    try:
+        backend = create_cache_backend(settings.SHARED_CACHE_URL)
+    except Exception as e:
+        print(f"Error creating shared cache, continuing without it: {e}")
+        return None
+    return SharedCache(backend, namespace=settings.SHARED_CACHE_NAMESPACE)
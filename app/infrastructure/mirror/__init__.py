@@ -0,0 +1,3 @@
+"""
+Backlogの課題をローカルのSQLiteにミラーするモジュール
+"""
@@ -0,0 +1,550 @@
+"""
+課題のローカルミラー
+
+Backlogから取得した課題をSQLiteに保存し、集計や一覧の取得をローカルで行えるようにする。
+課題の内容はJSONで保存し、絞り込みに使う項目は別の列にも保存する。
+件名・詳細・コメントはbi-gramに分割してFTS5の全文検索索引にも登録する
+"""
+
+import json
+import sqlite3
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from app.core.config import settings
+from app.infrastructure.mirror.ngram import make_snippet, to_index_text, to_match_query
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    space TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    project_id INTEGER,
+    issue_key TEXT,
+    status_id INTEGER,
+    assignee_id INTEGER,
+    issue_type_id INTEGER,
+    priority_id INTEGER,
+    created TEXT,
+    updated TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (space, id)
+);
+CREATE INDEX IF NOT EXISTS idx_issues_project_updated ON issues (space, project_id, updated);
+CREATE INDEX IF NOT EXISTS idx_issues_key ON issues (space, issue_key);
+CREATE TABLE IF NOT EXISTS sync_state (
+    space TEXT NOT NULL,
+    project_id INTEGER NOT NULL,
+    last_updated TEXT,
+    synced_at REAL,
+    PRIMARY KEY (space, project_id)
+);
+CREATE TABLE IF NOT EXISTS issue_comments (
+    space TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    issue_id INTEGER NOT NULL,
+    content TEXT,
+    created TEXT,
+    PRIMARY KEY (space, id)
+);
+CREATE INDEX IF NOT EXISTS idx_issue_comments_issue ON issue_comments (space, issue_id, id);
+CREATE TABLE IF NOT EXISTS activity_cursors (
+    space TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    last_id INTEGER NOT NULL,
+    PRIMARY KEY (space, scope)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS issue_fts USING fts5(
+    summary, description, comments, tokenize = 'unicode61 remove_diacritics 0'
+);
+"""
+
+# 全文検索の順位付け（BM25）での件名・詳細・コメントの重み
+_FTS_WEIGHTS = (10.0, 3.0, 1.0)
+
+
+def _nested_id(issue: Dict[str, Any], field: str) -> Optional[int]:
+    value = issue.get(field)
+    if isinstance(value, dict):
+        return value.get("id")
+    return None
+
+
+class IssueMirror:
+    """
+    SQLiteに保存する課題のミラー
+
+    1つの接続を複数スレッドで共有するため、操作はロックで直列化する
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        初期化
+
+        Args:
+            path: SQLiteファイルのパス
+        """
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            # 全文検索索引を追加する前に保存した課題を索引に登録する
+            indexed = self._conn.execute("SELECT COUNT(*) FROM issue_fts").fetchone()[0]
+            if not indexed:
+                rows = self._conn.execute("SELECT space, id FROM issues").fetchall()
+                for row in rows:
+                    self._reindex(row["space"], row["id"])
+            self._conn.commit()
+
+    def _where_issue(self, issue_id_or_key: Hashable) -> Tuple[str, Any]:
+        key = str(issue_id_or_key)
+        if key.isdigit():
+            return "id = ?", int(key)
+        return "issue_key = ?", key
+
+    def _reindex(self, space: str, issue_id: int) -> None:
+        # ロックを取得した状態で呼び出すこと
+        row = self._conn.execute(
+            "SELECT rowid, data FROM issues WHERE space = ? AND id = ?", (space, issue_id)
+        ).fetchone()
+        if row is None:
+            return
+        self._conn.execute("DELETE FROM issue_fts WHERE rowid = ?", (row["rowid"],))
+        issue = json.loads(row["data"])
+        comments = self._conn.execute(
+            "SELECT content FROM issue_comments WHERE space = ? AND issue_id = ? ORDER BY id",
+            (space, issue_id),
+        ).fetchall()
+        self._conn.execute(
+            "INSERT INTO issue_fts (rowid, summary, description, comments) VALUES (?, ?, ?, ?)",
+            (
+                row["rowid"],
+                to_index_text(issue.get("summary")),
+                to_index_text(issue.get("description")),
+                "\n".join(to_index_text(comment["content"]) for comment in comments),
+            ),
+        )
+
+    def upsert_issues(self, space: str, issues: List[Dict[str, Any]]) -> int:
+        """
+        課題を保存
+
+        保存済みの課題より updated が古い課題では上書きしない
+
+        Args:
+            space: Backlogスペース名
+            issues: 課題のリスト
+
+        Returns:
+            保存した課題数
+        """
+        rows = [
+            (
+                space,
+                issue["id"],
+                issue.get("projectId"),
+                issue.get("issueKey"),
+                _nested_id(issue, "status"),
+                _nested_id(issue, "assignee"),
+                _nested_id(issue, "issueType"),
+                _nested_id(issue, "priority"),
+                issue.get("created"),
+                issue.get("updated"),
+                json.dumps(issue, ensure_ascii=False),
+            )
+            for issue in issues
+            if issue.get("id") is not None
+        ]
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO issues (
+                    space, id, project_id, issue_key, status_id, assignee_id,
+                    issue_type_id, priority_id, created, updated, data
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (space, id) DO UPDATE SET
+                    project_id = excluded.project_id,
+                    issue_key = excluded.issue_key,
+                    status_id = excluded.status_id,
+                    assignee_id = excluded.assignee_id,
+                    issue_type_id = excluded.issue_type_id,
+                    priority_id = excluded.priority_id,
+                    created = excluded.created,
+                    updated = excluded.updated,
+                    data = excluded.data
+                WHERE issues.updated IS NULL
+                    OR excluded.updated IS NULL
+                    OR excluded.updated >= issues.updated
+                """,
+                rows,
+            )
+            for row in rows:
+                self._reindex(space, row[1])
+            self._conn.commit()
+        return len(rows)
+
+    def get_issue(self, space: str, issue_id_or_key: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        課題を取得
+
+        Args:
+            space: Backlogスペース名
+            issue_id_or_key: 課題IDまたは課題キー
+
+        Returns:
+            課題情報。ミラーにない場合はNone
+        """
+        condition, value = self._where_issue(issue_id_or_key)
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT data FROM issues WHERE space = ? AND {condition}", (space, value)
+            ).fetchone()
+        return json.loads(row["data"]) if row else None
+
+    def delete_issue(self, space: str, issue_id_or_key: Hashable) -> bool:
+        """
+        課題を削除
+
+        Args:
+            space: Backlogスペース名
+            issue_id_or_key: 課題IDまたは課題キー
+
+        Returns:
+            削除した場合はTrue
+        """
+        condition, value = self._where_issue(issue_id_or_key)
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT rowid, id FROM issues WHERE space = ? AND {condition}", (space, value)
+            ).fetchone()
+            if row is None:
+                return False
+            self._conn.execute("DELETE FROM issue_fts WHERE rowid = ?", (row["rowid"],))
+            self._conn.execute(
+                "DELETE FROM issue_comments WHERE space = ? AND issue_id = ?", (space, row["id"])
+            )
+            self._conn.execute("DELETE FROM issues WHERE rowid = ?", (row["rowid"],))
+            self._conn.commit()
+        return True
+
+    def upsert_comments(
+        self, space: str, issue_id: int, comments: List[Dict[str, Any]]
+    ) -> int:
+        """
+        課題のコメントを保存し、全文検索索引を更新
+
+        Args:
+            space: Backlogスペース名
+            issue_id: 課題ID
+            comments: コメントのリスト
+
+        Returns:
+            保存したコメント数
+        """
+        rows = [
+            (space, comment["id"], issue_id, comment.get("content"), comment.get("created"))
+            for comment in comments
+            if comment.get("id") is not None
+        ]
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO issue_comments (space, id, issue_id, content, created)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (space, id) DO UPDATE SET
+                    content = excluded.content,
+                    created = excluded.created
+                """,
+                rows,
+            )
+            self._reindex(space, issue_id)
+            self._conn.commit()
+        return len(rows)
+
+    def get_last_comment_id(self, space: str, issue_id: int) -> Optional[int]:
+        """
+        保存済みの最新のコメントIDを取得
+
+        Args:
+            space: Backlogスペース名
+            issue_id: 課題ID
+
+        Returns:
+            コメントID。コメントを保存していない場合はNone
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(id) FROM issue_comments WHERE space = ? AND issue_id = ?",
+                (space, issue_id),
+            ).fetchone()
+        return None if row[0] is None else int(row[0])
+
+    def search_issues(
+        self,
+        space: str,
+        query: str,
+        project_id: Optional[int] = None,
+        count: int = 20,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        課題を全文検索
+
+        件名・詳細・コメントから検索語をすべて含む課題を、BM25の順位（件名を重視）で取得する
+
+        Args:
+            space: Backlogスペース名
+            query: 検索語（空白で区切った場合はすべてを含む課題）
+            project_id: プロジェクトID（指定しない場合は全プロジェクト）
+            count: 取得件数
+            offset: 取得開始位置
+
+        Returns:
+            検索結果のリスト（issue: 課題情報, score: 関連度（大きいほど関連が強い）,
+            matched_field: 抜粋を取得した項目, snippet: 検索語を含む抜粋）
+        """
+        match = to_match_query(query)
+        if match is None:
+            return []
+        conditions = ["issue_fts MATCH ?", "issues.space = ?"]
+        params: List[Any] = [match, space]
+        if project_id is not None:
+            conditions.append("issues.project_id = ?")
+            params.append(project_id)
+        params.extend([count, offset])
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT issues.id, issues.data,
+                    bm25(issue_fts, {', '.join(str(w) for w in _FTS_WEIGHTS)}) AS rank
+                FROM issue_fts JOIN issues ON issues.rowid = issue_fts.rowid
+                WHERE {' AND '.join(conditions)}
+                ORDER BY rank
+                LIMIT ? OFFSET ?
+                """,
+                params,
+            ).fetchall()
+            comments = {
+                row["id"]: [
+                    comment["content"]
+                    for comment in self._conn.execute(
+                        "SELECT content FROM issue_comments"
+                        " WHERE space = ? AND issue_id = ? ORDER BY id DESC",
+                        (space, row["id"]),
+                    )
+                ]
+                for row in rows
+            }
+
+        results = []
+        for row in rows:
+            issue = json.loads(row["data"])
+            candidates = [
+                ("summary", issue.get("summary")),
+                ("description", issue.get("description")),
+            ] + [("comments", content) for content in comments[row["id"]]]
+            matched_field, snippet = None, None
+            for field, text in candidates:
+                snippet = make_snippet(text, query)
+                if snippet is not None:
+                    matched_field = field
+                    break
+            results.append(
+                {
+                    "issue": issue,
+                    # bm25() は関連が強いほど小さい負の値を返す
+                    "score": -row["rank"],
+                    "matched_field": matched_field,
+                    "snippet": snippet,
+                }
+            )
+        return results
+
+    def query_issues(
+        self,
+        space: str,
+        project_id: Optional[int] = None,
+        status_id: Optional[List[int]] = None,
+        assignee_id: Optional[int] = None,
+        count: int = 20,
+        offset: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """
+        課題一覧を更新日時の降順で取得
+
+        Args:
+            space: Backlogスペース名
+            project_id: プロジェクトID（指定しない場合は全プロジェクト）
+            status_id: ステータスID（指定しない場合は全ステータス）
+            assignee_id: 担当者ID（指定しない場合は全担当者）
+            count: 取得件数
+            offset: 取得開始位置
+
+        Returns:
+            課題一覧
+        """
+        conditions = ["space = ?"]
+        params: List[Any] = [space]
+        if project_id is not None:
+            conditions.append("project_id = ?")
+            params.append(project_id)
+        if status_id:
+            conditions.append(f"status_id IN ({', '.join('?' for _ in status_id)})")
+            params.extend(status_id)
+        if assignee_id is not None:
+            conditions.append("assignee_id = ?")
+            params.append(assignee_id)
+        params.extend([count, offset])
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT data FROM issues
+                WHERE {' AND '.join(conditions)}
+                ORDER BY updated DESC, id DESC
+                LIMIT ? OFFSET ?
+                """,
+                params,
+            ).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    def get_sync_state(self, space: str, project_id: int) -> Optional[Dict[str, Any]]:
+        """
+        プロジェクトの同期状態を取得
+
+        Args:
+            space: Backlogスペース名
+            project_id: プロジェクトID
+
+        Returns:
+            同期状態（last_updated: 同期済みの最新の更新日時, synced_at: 最後に同期を完了した時刻）。
+            同期したことがない場合はNone
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_updated, synced_at FROM sync_state WHERE space = ? AND project_id = ?",
+                (space, project_id),
+            ).fetchone()
+        return dict(row) if row else None
+
+    def set_sync_state(
+        self,
+        space: str,
+        project_id: int,
+        last_updated: Optional[str],
+        synced_at: Optional[float],
+    ) -> None:
+        """
+        プロジェクトの同期状態を保存
+
+        Args:
+            space: Backlogスペース名
+            project_id: プロジェクトID
+            last_updated: 同期済みの最新の更新日時
+            synced_at: 最後に同期を完了した時刻（UNIX時間）
+        """
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO sync_state (space, project_id, last_updated, synced_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (space, project_id) DO UPDATE SET
+                    last_updated = excluded.last_updated,
+                    synced_at = excluded.synced_at
+                """,
+                (space, project_id, last_updated, synced_at),
+            )
+            self._conn.commit()
+
+    def get_activity_cursor(self, space: str, scope: str) -> Optional[int]:
+        """
+        反映済みの最新のアクティビティIDを取得
+
+        Args:
+            space: Backlogスペース名
+            scope: アクティビティの取得対象（スペース全体の場合は空文字列、プロジェクトの場合はプロジェクトキー）
+
+        Returns:
+            アクティビティID。記録していない場合はNone
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_id FROM activity_cursors WHERE space = ? AND scope = ?",
+                (space, scope),
+            ).fetchone()
+        return row["last_id"] if row else None
+
+    def set_activity_cursor(self, space: str, scope: str, last_id: int) -> None:
+        """
+        反映済みの最新のアクティビティIDを保存
+
+        Args:
+            space: Backlogスペース名
+            scope: アクティビティの取得対象（スペース全体の場合は空文字列、プロジェクトの場合はプロジェクトキー）
+            last_id: アクティビティID
+        """
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO activity_cursors (space, scope, last_id) VALUES (?, ?, ?)
+                ON CONFLICT (space, scope) DO UPDATE SET last_id = excluded.last_id
+                """,
+                (space, scope, last_id),
+            )
+            self._conn.commit()
+
+    def mark_stale(self, space: str, project_id: int) -> bool:
+        """
+        プロジェクトを次回の読み取り時に同期が必要な状態にする
+
+        同期済みの最新の更新日時は残すため、次回の同期は差分だけを取得する
+
+        Args:
+            space: Backlogスペース名
+            project_id: プロジェクトID
+
+        Returns:
+            同期したことがあるプロジェクトの場合はTrue
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE sync_state SET synced_at = NULL WHERE space = ? AND project_id = ?",
+                (space, project_id),
+            )
+            self._conn.commit()
+        return cursor.rowcount > 0
+
+    def clear(self) -> None:
+        """
+        すべての課題・コメント・同期状態を削除
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM issues")
+            self._conn.execute("DELETE FROM sync_state")
+            self._conn.execute("DELETE FROM issue_comments")
+            self._conn.execute("DELETE FROM issue_fts")
+            self._conn.execute("DELETE FROM activity_cursors")
+            self._conn.commit()
+
+
+_issue_mirror: Optional[IssueMirror] = None
+_issue_mirror_lock = threading.Lock()
+
+
+def get_issue_mirror() -> Optional[IssueMirror]:
+    """
+    プロセス内で共有する課題のミラーを取得
+
+    Returns:
+        IssueMirror: 設定値 MIRROR_DB_PATH のミラー。MIRROR_ENABLED が無効な場合はNone
+    """
+    global _issue_mirror
+    if not settings.MIRROR_ENABLED:
+        return None
+    if _issue_mirror is None:
+        with _issue_mirror_lock:
+            if _issue_mirror is None:
+                _issue_mirror = IssueMirror(settings.MIRROR_DB_PATH)
+    return _issue_mirror
@@ -0,0 +1,186 @@
+"""
+課題のローカルミラーの同期
+
+初回はプロジェクトの課題をすべてページ単位で取得し、2回目以降は前回同期した
+最新の更新日時以降に更新された課題だけを取得する（updatedSince・sort=updated）。
+同期中に課題が更新されると末尾へ移動してページの境界がずれ、他の課題を読み飛ばすことがある。
+同じ課題を2回取得した場合はずれが起きたとみなし、読み飛ばした可能性がある範囲を取得し直す。
+課題の削除は一覧からは検出できないため、Webhookなどの通知で反映する。
+コメントを全文検索の対象にする場合は、取得した課題ごとに保存済みのコメントより新しいコメントを取得する
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.deadline import DeadlineExceededError, deadline_exceeded
+from app.infrastructure.backlog.backlog_client_wrapper import BacklogClientWrapper
+from app.infrastructure.mirror.issue_mirror import IssueMirror
+
+# 課題一覧APIで1回に取得できる最大件数
+PAGE_SIZE = 100
+
+# 同期中の更新で読み飛ばした範囲を取得し直す場合を含めた、1回の同期で課題一覧を巡回する回数の上限
+MAX_SYNC_PASSES = 3
+
+# 同じプロジェクトの同期を同時に1つだけ実行するためのロック
+_sync_locks: Dict[Tuple[str, int], threading.Lock] = {}
+_sync_locks_lock = threading.Lock()
+
+
+def _sync_lock(space: str, project_id: int) -> threading.Lock:
+    with _sync_locks_lock:
+        return _sync_locks.setdefault((space, project_id), threading.Lock())
+
+
+def _earliest(*values: Optional[str]) -> Optional[str]:
+    present = [value for value in values if value]
+    return min(present) if present else None
+
+
+class IssueMirrorSync:
+    """
+    課題のローカルミラーをBacklogと同期する
+    """
+
+    def __init__(
+        self,
+        backlog_client: BacklogClientWrapper,
+        mirror: IssueMirror,
+        clock: Callable[[], float] = time.time,
+        index_comments: Optional[bool] = None,
+    ):
+        """
+        初期化
+
+        Args:
+            backlog_client: Backlogクライアント
+            mirror: 課題のローカルミラー
+            clock: 現在時刻（UNIX時間）を返す関数
+            index_comments: コメントも同期するかどうか（指定しない場合は設定値 MIRROR_INDEX_COMMENTS）
+        """
+        self.backlog_client = backlog_client
+        self.mirror = mirror
+        self._clock = clock
+        self.index_comments = (
+            settings.MIRROR_INDEX_COMMENTS if index_comments is None else index_comments
+        )
+
+    def age(self, project_id: int) -> Optional[float]:
+        """
+        プロジェクトを最後に同期してからの経過秒数を取得
+
+        Args:
+            project_id: プロジェクトID
+
+        Returns:
+            経過秒数。同期を完了したことがない場合はNone
+        """
+        state = self.mirror.get_sync_state(self.backlog_client.space, project_id)
+        if not state or state.get("synced_at") is None:
+            return None
+        return self._clock() - float(state["synced_at"])
+
+    def _sync_comments(self, issue_id: int) -> None:
+        space = self.backlog_client.space
+        last_id = self.mirror.get_last_comment_id(space, issue_id)
+        comments = list(self.backlog_client.iter_issue_comments(str(issue_id), min_id=last_id))
+        if comments:
+            self.mirror.upsert_comments(space, issue_id, comments)
+
+    def sync_project(
+        self, project_id: int, max_staleness: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        プロジェクトの課題をミラーに同期
+
+        Args:
+            project_id: プロジェクトID
+            max_staleness: 最後の同期からこの秒数以内であれば同期しない（指定しない場合は常に同期）
+
+        Returns:
+            同期結果（project_id, synced: 同期したかどうか, fetched: 取得した課題数,
+            age_seconds: 同期結果を返す時点での最後の同期からの経過秒数）
+
+        Raises:
+            BacklogApiError: 課題一覧を取得できなかった場合
+            DeadlineExceededError: 処理期限が近いため同期を中断した場合
+        """
+        space = self.backlog_client.space
+        with _sync_lock(space, project_id):
+            # 待っている間に他のスレッドが同期した場合は同期しない
+            age = self.age(project_id)
+            if max_staleness is not None and age is not None and age <= max_staleness:
+                return {
+                    "project_id": project_id,
+                    "synced": False,
+                    "fetched": 0,
+                    "age_seconds": age,
+                }
+
+            state = self.mirror.get_sync_state(space, project_id) or {}
+            last_updated: Optional[str] = state.get("last_updated")
+            # updatedSinceは日付単位のため、同じ日に更新された課題は再取得して上書きする
+            updated_since = last_updated[:10] if last_updated else None
+            started = self._clock()
+            fetched = 0
+            # 読み飛ばした可能性がある範囲の始まり（Noneの場合は読み飛ばしていない）
+            unverified_from: Optional[str] = None
+            for passes in range(1, MAX_SYNC_PASSES + 1):
+                # 課題ID -> 最初に取得したページの最後の課題の更新日時
+                boundaries: Dict[int, str] = {}
+                resume_from: Optional[str] = None
+                offset = 0
+                while True:
+                    if deadline_exceeded():
+                        # 取得済みの範囲は次回の同期で再取得しないように記録する
+                        self.mirror.set_sync_state(
+                            space,
+                            project_id,
+                            _earliest(last_updated, unverified_from, resume_from),
+                            state.get("synced_at"),
+                        )
+                        raise DeadlineExceededError(
+                            f"Deadline exceeded while syncing issues of project {project_id}"
+                        )
+                    page = self.backlog_client.get_issues_page(
+                        project_id, updated_since=updated_since, offset=offset, count=PAGE_SIZE
+                    )
+                    self.mirror.upsert_issues(space, page)
+                    if self.index_comments:
+                        for issue in page:
+                            self._sync_comments(issue["id"])
+                    fetched += len(page)
+                    boundary = page[-1].get("updated") if page else None
+                    for issue in page:
+                        updated = issue.get("updated")
+                        if updated and (last_updated is None or updated > last_updated):
+                            last_updated = updated
+                        first_boundary = boundaries.get(issue["id"])
+                        if first_boundary is not None:
+                            # 同期中に更新されて末尾へ移動した課題。最初に取得したページより後の
+                            # ページの境界で、他の課題を読み飛ばした可能性がある
+                            resume_from = _earliest(resume_from, first_boundary)
+                        elif boundary:
+                            boundaries[issue["id"]] = boundary
+                    if len(page) < PAGE_SIZE:
+                        break
+                    offset += len(page)
+
+                unverified_from = resume_from
+                if resume_from is None or passes == MAX_SYNC_PASSES:
+                    break
+                # 読み飛ばした可能性がある範囲だけを取得し直す
+                updated_since = resume_from[:10]
+
+            # 取得し直しても落ち着かなかった場合は、次回の同期で読み飛ばした可能性がある範囲から取得する
+            self.mirror.set_sync_state(
+                space, project_id, _earliest(last_updated, unverified_from), started
+            )
+            return {
+                "project_id": project_id,
+                "synced": True,
+                "fetched": fetched,
+                "age_seconds": self._clock() - started,
+            }
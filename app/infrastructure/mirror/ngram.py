@@ -0,0 +1,123 @@
+"""
+全文検索用のn-gram（bi-gram）分割
+
+日本語は単語の区切りがないため、文字・数字の連続を2文字ずつ区切った語として
+FTS5に登録し、検索語も同じ方法で分割してフレーズ検索する。
+記号や空白は区切りとして扱う
+"""
+
+import unicodedata
+from typing import List, Optional
+
+
+def normalize(text: str) -> str:
+    """
+    検索用に文字列を正規化
+
+    Args:
+        text: 文字列
+
+    Returns:
+        NFKC正規化して小文字にした文字列
+    """
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def _runs(text: str) -> List[str]:
+    runs: List[str] = []
+    current: List[str] = []
+    for char in normalize(text):
+        if char.isalnum():
+            current.append(char)
+        elif current:
+            runs.append("".join(current))
+            current = []
+    if current:
+        runs.append("".join(current))
+    return runs
+
+
+def _bigrams(run: str) -> List[str]:
+    if len(run) == 1:
+        return [run]
+    return [run[i : i + 2] for i in range(len(run) - 1)]
+
+
+def to_index_text(text: Optional[str]) -> str:
+    """
+    FTS5に登録する文字列に変換
+
+    Args:
+        text: 文字列
+
+    Returns:
+        2文字ずつ区切った語を空白で連結した文字列
+    """
+    if not text:
+        return ""
+    return " ".join(" ".join(_bigrams(run)) for run in _runs(text))
+
+
+def to_match_query(query: str) -> Optional[str]:
+    """
+    検索語をFTS5のMATCH式に変換
+
+    空白で区切った検索語はすべてを含む課題（AND）を検索する
+
+    Args:
+        query: 検索語
+
+    Returns:
+        MATCH式。検索できる文字を含まない場合はNone
+    """
+    phrases = []
+    for run in _runs(query):
+        if len(run) == 1:
+            # 1文字の場合はその文字で始まる語を前方一致で検索する
+            phrases.append(f'"{run}" *')
+        else:
+            phrases.append('"' + " ".join(_bigrams(run)) + '"')
+    return " AND ".join(phrases) if phrases else None
+
+
+def make_snippet(
+    text: Optional[str],
+    query: str,
+    width: int = 40,
+    start_mark: str = "**",
+    end_mark: str = "**",
+) -> Optional[str]:
+    """
+    検索語を含む前後の文字列を抜き出す
+
+    Args:
+        text: 抜き出し元の文字列
+        query: 検索語
+        width: 検索語の前後に含める文字数
+        start_mark: 検索語の前に付ける文字列
+        end_mark: 検索語の後に付ける文字列
+
+    Returns:
+        抜き出した文字列。検索語を含まない場合はNone
+    """
+    if not text:
+        return None
+    haystack = normalize(text)
+    # 正規化で文字数が変わる場合は元の文字列の位置と対応しないため、正規化後の文字列から抜き出す
+    source = text if len(haystack) == len(text) else haystack
+    for term in sorted(_runs(query), key=len, reverse=True):
+        index = haystack.find(term)
+        if index < 0:
+            continue
+        start = max(0, index - width)
+        end = min(len(source), index + len(term) + width)
+        return (
+            ("…" if start > 0 else "")
+            + source[start:index]
+            + start_mark
+            + source[index : index + len(term)]
+            + end_mark
+            + source[index + len(term) : end]
+            + ("…" if end < len(source) else "")
+        ).replace("\n", " ")
+    return None
@@ -13,16 +13,30 @@ except ImportError:
     print("[DEBUG] python-dotenv がインストールされていないため、.env ファイルを読み込めません")
     # Lambda環境では.envファイルは使用しないので、エラーを無視する
 
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
 from fastapi import FastAPI, Request, HTTPException, Response
-from typing import Callable
+from starlette.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from starlette.status import HTTP_403_FORBIDDEN
 from fastapi_mcp import FastApiMCP  # type: ignore
 
 from app.core.config import settings
+from app.core.deadline import deadline_scope
 from mangum import Mangum
 
+from app.application.services.activity_poller import ActivityPoller
+from app.application.services.cache_warmup_service import (
+    CacheWarmupService,
+    get_warmup_project_keys,
+)
+from app.infrastructure.backlog.backlog_client_wrapper import BacklogClientWrapper
+from app.infrastructure.backlog.circuit_breaker import CLOSED, get_circuit_breaker
+from app.infrastructure.backlog.hedging import get_hedger
+
 from app.presentation.api.bulk_operations_router import router as bulk_operations_router
 from app.presentation.api.issue_router import router as issue_router
 from app.presentation.api.priority_router import router as priority_router
@@ -30,6 +44,55 @@ from app.presentation.api.priority_router import router as priority_router
 # APIルーターのインポート
 from app.presentation.api.project_router import router as project_router
 from app.presentation.api.user_router import router as user_router
+from app.presentation.api.webhook_router import router as webhook_router
+
+_warmup_lock = threading.Lock()
+_warmup_report: Optional[Dict[str, Any]] = None
+
+
+def warm_up_caches() -> Optional[Dict[str, Any]]:
+    """
+    設定されたプロジェクトのメタデータを事前に取得する
+
+    Mangumはライフスパンの開始処理を呼び出しごとに実行するため、
+    事前取得はプロセスごとに1回だけ行う
+
+    Returns:
+        事前取得の結果。事前取得が無効な場合や対象がない場合はNone
+    """
+    global _warmup_report
+    with _warmup_lock:
+        if _warmup_report is not None:
+            return _warmup_report
+        api_key = os.getenv("BACKLOG_API_KEY")
+        space = os.getenv("BACKLOG_SPACE")
+        project_keys = get_warmup_project_keys()
+        if not settings.CACHE_WARMUP_ENABLED or not api_key or not space or not project_keys:
+            return None
+        backlog_client = BacklogClientWrapper(api_key=api_key, space=space)
+        _warmup_report = CacheWarmupService(backlog_client).warm_up(project_keys)
+        print(
+            f"[INFO] キャッシュの事前取得が完了しました: {_warmup_report['elapsed_seconds']}秒 "
+            f"(プロジェクト: {_warmup_report['projects']}, 失敗: {_warmup_report['failed']})"
+        )
+        return _warmup_report
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    アプリケーションのライフスパン
+
+    Args:
+        app: FastAPIアプリケーション
+    """
+    try:
+        app.state.cache_warmup = await run_in_threadpool(warm_up_caches)
+    except Exception as e:
+        # 事前取得に失敗しても起動は継続する
+        print(f"[ERROR] キャッシュの事前取得に失敗しました: {str(e)}")
+    yield
+
 
 # FastAPIアプリケーションの作成
 app = FastAPI(
@@ -37,6 +100,7 @@ app = FastAPI(
     description="Backlog SaaSをModel Context Protocol (MCP)経由で操作するためのAPI",
     version="0.1.0",
     openapi_version="3.0.3",
+    lifespan=lifespan,
 )
 from fastapi.openapi.utils import get_openapi
 
@@ -67,7 +131,12 @@ app.add_middleware(
 # Read-only mode middleware
 @app.middleware("http")
 async def read_only_middleware(request: Request, call_next: Callable) -> Response:
-    if settings.READ_ONLY_MODE and request.method in ("POST", "PUT", "DELETE", "PATCH"):
+    # Webhookはキャッシュに反映するだけでBacklogを更新しないため、読み取り専用モードでも受け付ける
+    if (
+        settings.READ_ONLY_MODE
+        and request.method in ("POST", "PUT", "DELETE", "PATCH")
+        and not request.url.path.startswith("/api/webhooks/")
+    ):
         raise HTTPException(
             status_code=HTTP_403_FORBIDDEN,
             detail="Application is in read-only mode. Write operations are disabled.",
@@ -75,12 +144,76 @@ async def read_only_middleware(request: Request, call_next: Callable) -> Respons
     response: Response = await call_next(request)
     return response
 
+def get_request_timeout(request: Request) -> Optional[float]:
+    """
+    リクエストの処理期限までの秒数を取得
+
+    X-Request-Timeout ヘッダー（秒）、Lambdaの残り実行時間、設定値 REQUEST_TIMEOUT_SECONDS の
+    うち最も短いものを使う
+
+    Args:
+        request: リクエスト
+
+    Returns:
+        処理期限までの秒数。いずれも指定されていない場合はNone
+    """
+    candidates = []
+    header = request.headers.get("X-Request-Timeout")
+    if header:
+        try:
+            candidates.append(float(header))
+        except ValueError:
+            print(f"[WARN] X-Request-Timeout ヘッダーの値が不正です: {header}")
+    lambda_context = request.scope.get("aws.context")
+    if lambda_context is not None and hasattr(lambda_context, "get_remaining_time_in_millis"):
+        candidates.append(lambda_context.get_remaining_time_in_millis() / 1000)
+    if settings.REQUEST_TIMEOUT_SECONDS is not None:
+        candidates.append(settings.REQUEST_TIMEOUT_SECONDS)
+    return min(candidates) if candidates else None
+
+
+def poll_activities_if_due() -> None:
+    """
+    最近の更新の取得間隔を過ぎていれば、別スレッドで更新を取得してキャッシュとミラーに反映
+    """
+    api_key = os.getenv("BACKLOG_API_KEY")
+    space = os.getenv("BACKLOG_SPACE")
+    if not api_key or not space:
+        return
+    backlog_client = BacklogClientWrapper(api_key=api_key, space=space, read_only_mode=settings.READ_ONLY_MODE)
+    ActivityPoller(
+        backlog_client, project_key=settings.ACTIVITY_POLL_PROJECT
+    ).poll_in_background_if_due(settings.ACTIVITY_POLL_INTERVAL_SECONDS)
+
+
+# 読み取りリクエストのたびに最近の更新の取得を開始するミドルウェア
+# （取得は別スレッドで行い、リクエストの処理期限や応答時間には含めない）
+@app.middleware("http")
+async def activity_poll_middleware(request: Request, call_next: Callable) -> Response:
+    if (
+        settings.ACTIVITY_POLL_ENABLED
+        and request.method == "GET"
+        and request.url.path.startswith("/api/")
+    ):
+        poll_activities_if_due()
+    response: Response = await call_next(request)
+    return response
+
+
+# リクエストごとの処理期限を設定するミドルウェア
+@app.middleware("http")
+async def deadline_middleware(request: Request, call_next: Callable) -> Response:
+    with deadline_scope(get_request_timeout(request)):
+        response: Response = await call_next(request)
+    return response
+
 # APIルーターの登録
 app.include_router(project_router)
 app.include_router(issue_router)
 app.include_router(bulk_operations_router)
 app.include_router(user_router)
 app.include_router(priority_router)
+app.include_router(webhook_router)
 
 # MCPサーバーの作成
 print("[DEBUG] MCPサーバー作成開始")
@@ -184,6 +317,41 @@ async def root() -> dict:
     return {"message": "Welcome to BacklogMCP API", "docs": "/docs", "mcp": "/mcp"}
 
 
+# ヘルスチェックエンドポイント
+@app.get("/health")
+async def health() -> dict:
+    """
+    ヘルスチェックエンドポイント
+
+    サーキットブレーカーが開いている間もキャッシュ済みのデータは返せるため、
+    ステータスコードは200のまま status を "degraded" にする
+
+    Returns:
+        dict: アプリケーションとBacklog API呼び出しの状態
+    """
+    circuit_breaker = get_circuit_breaker().snapshot()
+    return {
+        "status": "ok" if circuit_breaker["state"] == CLOSED else "degraded",
+        "circuit_breaker": circuit_breaker,
+        "cache_warmup": getattr(app.state, "cache_warmup", None),
+    }
+
+
+# メトリクスエンドポイント
+@app.get("/metrics")
+async def metrics() -> dict:
+    """
+    メトリクスエンドポイント
+
+    Returns:
+        dict: サーキットブレーカーの状態やヘッジした回数などのメトリクス
+    """
+    return {
+        "circuit_breaker": get_circuit_breaker().snapshot(),
+        "hedged_reads": get_hedger().snapshot(),
+    }
+
+
 # AWS Lambda用ハンドラー
 handler = Mangum(app)
 
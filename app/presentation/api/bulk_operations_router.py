@@ -3,7 +3,7 @@
 """
 
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from dotenv import load_dotenv
 from fastapi import APIRouter, Depends, HTTPException
@@ -62,6 +62,42 @@ class BulkCategoryUpdateRequest(BulkUpdateRequest):
     category_id: int
 
 
+class BulkCommentRequest(BulkUpdateRequest):
+    """コメント一括追加リクエスト"""
+
+    content: str
+    variables: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+class BulkIssueCreateItem(BaseModel):
+    """一括作成する課題1件分のパラメータ"""
+
+    summary: str
+    issue_type_id: Optional[int] = None
+    issue_type_name: Optional[str] = None
+    priority_id: Optional[int] = None
+    priority_name: Optional[str] = None
+    description: Optional[str] = None
+    assignee_id: Optional[int] = None
+    assignee_name: Optional[str] = None
+    category_id: Optional[List[int]] = None
+    category_name: Optional[List[str]] = None
+    milestone_id: Optional[List[int]] = None
+    milestone_name: Optional[List[str]] = None
+    version_id: Optional[List[int]] = None
+    version_name: Optional[List[str]] = None
+    start_date: Optional[str] = None
+    due_date: Optional[str] = None
+
+
+class BulkIssueCreateRequest(BaseModel):
+    """課題一括作成リクエスト"""
+
+    project_id: Optional[int] = None
+    project_key: Optional[str] = None
+    issues: List[BulkIssueCreateItem]
+
+
 def get_bulk_operations_service() -> BulkOperationsService:
     """
     一括操作サービスの依存性注入
@@ -246,3 +282,67 @@ async def bulk_delete_issues(
         raise HTTPException(
             status_code=500, detail=f"Failed to bulk delete issues: {str(e)}"
         )
+
+
+@router.post(
+    "/issues", response_model=Dict[str, Any], operation_id="bulk_create_issues"
+)
+async def bulk_create_issues(
+    request: BulkIssueCreateRequest,
+    bulk_service: BulkOperationsService = Depends(get_bulk_operations_service),
+) -> Dict[str, Any]:
+    """
+    同じプロジェクトに複数の課題を一括作成するエンドポイント
+
+    Args:
+        request: 課題一括作成リクエスト
+        bulk_service: 一括操作サービス（依存性注入）
+
+    Returns:
+        処理結果の統計情報（作成された課題キーは入力順）
+    """
+    if request.project_id is None and not request.project_key:
+        raise HTTPException(
+            status_code=400, detail="Either project_id or project_key must be specified"
+        )
+    try:
+        result = bulk_service.bulk_create_issues(
+            issues=[issue.model_dump(exclude_none=True) for issue in request.issues],
+            project_id=request.project_id,
+            project_key=request.project_key,
+        )
+        return result
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to bulk create issues: {str(e)}"
+        )
+
+
+@router.post(
+    "/comments", response_model=Dict[str, Any], operation_id="bulk_add_comment"
+)
+async def bulk_add_comment(
+    request: BulkCommentRequest,
+    bulk_service: BulkOperationsService = Depends(get_bulk_operations_service),
+) -> Dict[str, Any]:
+    """
+    複数チケットにコメントを一括追加するエンドポイント
+
+    Args:
+        request: コメント一括追加リクエスト
+        bulk_service: 一括操作サービス（依存性注入）
+
+    Returns:
+        処理結果の統計情報
+    """
+    try:
+        result = bulk_service.bulk_add_comment(
+            issue_ids=request.issue_ids,
+            content=request.content,
+            variables=request.variables,
+        )
+        return result
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to bulk add comment: {str(e)}"
+        )
@@ -3,20 +3,52 @@
 """
 
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union, overload
 
 from dotenv import load_dotenv
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from app.infrastructure.backlog.backlog_client_wrapper import BacklogClientWrapper, BacklogApiError
 from pydantic import BaseModel
 
-from app.application.services.issue_service import IssueService
+from app.application.services.aggregation_service import AggregationService
+from app.application.services.issue_query_service import IssueQueryService
+from app.application.services.issue_service import (
+    DATE_PATTERN,
+    ISSUE_SORT_PATTERN,
+    MULTI_PROJECT_SORT_KEYS,
+    IssueService,
+)
 from app.infrastructure.backlog.backlog_client import BacklogClient # 正しくは backlog_client_wrapper を使うべきだが、既存コードに合わせる
 from app.core.config import settings # settings をインポート
+from app.presentation.response_format import (
+    COMMENT_COLUMNS,
+    ISSUE_COLUMNS,
+    MIN_BUDGET_BYTES,
+    SEARCH_COLUMNS,
+    TABLE_FORMATS,
+    budget_bytes,
+    budget_comments,
+    budget_issue,
+    continue_result,
+    format_items,
+    format_table,
+    is_continuation_cursor,
+    normalize_entities,
+    page_cursor,
+    parse_columns,
+    read_page_cursor,
+    table_media_type,
+    with_next_cursor,
+)
 
 # 環境変数の読み込み
 load_dotenv()
 
+# 表形式の形式の指定
+TABLE_FORMAT_PATTERN = f"^({'|'.join(TABLE_FORMATS)})$"
+# 一覧の次のページのカーソルを返すヘッダー
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 # ルーターの作成
 router = APIRouter(
     prefix="/api/issues",
@@ -90,60 +122,586 @@ def get_issue_service() -> IssueService:
     return IssueService(backlog_client=backlog_client)
 
 
-@router.get("/", response_model=List[Dict[str, Any]], operation_id="get_issues")
+def get_aggregation_service() -> AggregationService:
+    """
+    課題集計サービスの依存性注入
+
+    Returns:
+        AggregationService: 課題集計サービス
+    """
+    api_key = os.getenv("BACKLOG_API_KEY")
+    space = os.getenv("BACKLOG_SPACE")
+
+    if not api_key or not space:
+        raise HTTPException(
+            status_code=500,
+            detail="Backlog API configuration is missing. Please set BACKLOG_API_KEY and BACKLOG_SPACE environment variables.",
+        )
+
+    backlog_client = BacklogClientWrapper(api_key=api_key, space=space, read_only_mode=settings.READ_ONLY_MODE)
+    return AggregationService(backlog_client=backlog_client)
+
+
+def get_issue_query_service() -> IssueQueryService:
+    """
+    課題検索クエリサービスの依存性注入
+
+    Returns:
+        IssueQueryService: 課題検索クエリサービス
+    """
+    api_key = os.getenv("BACKLOG_API_KEY")
+    space = os.getenv("BACKLOG_SPACE")
+
+    if not api_key or not space:
+        raise HTTPException(
+            status_code=500,
+            detail="Backlog API configuration is missing. Please set BACKLOG_API_KEY and BACKLOG_SPACE environment variables.",
+        )
+
+    backlog_client = BacklogClientWrapper(api_key=api_key, space=space, read_only_mode=settings.READ_ONLY_MODE)
+    return IssueQueryService(backlog_client=backlog_client)
+
+
+def table_response(
+    items: List[Dict[str, Any]], table_format: str, columns: List[str], default_columns: List[str]
+) -> Response:
+    """
+    一覧を表形式のレスポンスに変換
+
+    Args:
+        items: 課題またはコメントの一覧
+        table_format: 形式（csv, tsv, markdown）
+        columns: 列（指定しない場合は default_columns）
+        default_columns: 既定の列
+
+    Returns:
+        表形式のレスポンス
+    """
+    content = format_table(items, parse_columns(columns) or default_columns, table_format)
+    return Response(content=content, media_type=table_media_type(table_format))
+
+
+@overload
+def paged_response(
+    response: Response,
+    items: List[Dict[str, Any]],
+    next_cursor: Optional[str],
+    table_format: Optional[str],
+    columns: List[str],
+    default_columns: List[str],
+    result: Dict[str, Any],
+    wrap: bool = False,
+) -> Union[Dict[str, Any], Response]: ...
+
+
+@overload
+def paged_response(
+    response: Response,
+    items: List[Dict[str, Any]],
+    next_cursor: Optional[str],
+    table_format: Optional[str],
+    columns: List[str],
+    default_columns: List[str],
+    result: None = None,
+    wrap: bool = False,
+) -> Union[List[Dict[str, Any]], Dict[str, Any], Response]: ...
+
+
+def paged_response(
+    response: Response,
+    items: List[Dict[str, Any]],
+    next_cursor: Optional[str],
+    table_format: Optional[str],
+    columns: List[str],
+    default_columns: List[str],
+    result: Optional[Dict[str, Any]] = None,
+    wrap: bool = False,
+) -> Union[List[Dict[str, Any]], Dict[str, Any], Response]:
+    """
+    一覧のレスポンスに次のページのカーソルを付ける
+
+    カーソルは X-Next-Cursor ヘッダーで返し、JSONの辞書のレスポンスでは next_cursor にも含める
+
+    Args:
+        response: レスポンス（ヘッダーの設定に使う）
+        items: 課題またはコメントの一覧
+        next_cursor: 次のページのカーソル（最後のページの場合はNone）
+        table_format: 表形式で返す場合の形式
+        columns: 表形式の列
+        default_columns: 表形式の既定の列
+        result: JSONで返す内容（指定しない場合は items）
+        wrap: リストを items と next_cursor の辞書にするかどうか
+
+    Returns:
+        レスポンス
+    """
+    if table_format:
+        response = table_response(items, table_format, columns, default_columns)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if table_format:
+        return response
+    return with_next_cursor(items if result is None else result, next_cursor, wrap)
+
+
+@router.get(
+    "/",
+    response_model=Union[List[Dict[str, Any]], Dict[str, Any]],
+    operation_id="get_issues",
+)
 async def get_issues(
+    response: Response,
     project_id: Optional[int] = None,
     keyword: Optional[str] = None,
     count: int = Query(20, ge=1, le=100),
+    max_staleness: Optional[float] = Query(None, ge=0),
+    status_id: List[int] = Query([]),
+    assignee_id: Optional[int] = None,
+    issue_type_id: List[int] = Query([]),
+    category_id: List[int] = Query([]),
+    milestone_id: List[int] = Query([]),
+    version_id: List[int] = Query([]),
+    priority_id: List[int] = Query([]),
+    created_user_id: List[int] = Query([]),
+    parent_child: Optional[int] = Query(None, ge=0, le=4),
+    parent_issue_id: List[int] = Query([]),
+    created_since: Optional[str] = Query(None, pattern=DATE_PATTERN),
+    created_until: Optional[str] = Query(None, pattern=DATE_PATTERN),
+    updated_since: Optional[str] = Query(None, pattern=DATE_PATTERN),
+    updated_until: Optional[str] = Query(None, pattern=DATE_PATTERN),
+    start_date_since: Optional[str] = Query(None, pattern=DATE_PATTERN),
+    start_date_until: Optional[str] = Query(None, pattern=DATE_PATTERN),
+    due_date_since: Optional[str] = Query(None, pattern=DATE_PATTERN),
+    due_date_until: Optional[str] = Query(None, pattern=DATE_PATTERN),
+    sort: Optional[str] = Query(None, pattern=ISSUE_SORT_PATTERN),
+    order: Optional[str] = Query(None, pattern="^(asc|desc)$"),
+    offset: Optional[int] = Query(None, ge=0),
+    compact: bool = False,
+    table_format: Optional[str] = Query(None, alias="format", pattern=TABLE_FORMAT_PATTERN),
+    columns: List[str] = Query([]),
+    paginate: bool = False,
+    cursor: Optional[str] = None,
     issue_service: IssueService = Depends(get_issue_service),
-) -> List[Dict[str, Any]]:
+) -> Union[List[Dict[str, Any]], Dict[str, Any], Response]:
     """
     課題一覧を取得するエンドポイント
 
+    絞り込み・並び替えの条件はすべてBacklog APIに渡し、条件に合う課題だけを取得する。
+    次のページのカーソルは X-Next-Cursor ヘッダーで返す
+
     Args:
         project_id: プロジェクトID（指定しない場合は全プロジェクト）
         keyword: 検索キーワード
         count: 取得件数（1-100）
+        max_staleness: ローカルミラーから取得する場合に許容する最後の同期からの経過秒数
+        status_id: ステータスID
+        assignee_id: 担当者ID
+        issue_type_id: 種別ID
+        category_id: カテゴリーID
+        milestone_id: マイルストーンID
+        version_id: 発生バージョンID
+        priority_id: 優先度ID
+        created_user_id: 登録者ID
+        parent_child: 親子課題の条件（0: すべて, 1: 子課題以外, 2: 子課題, 3: 親課題でも子課題でもない, 4: 親課題）
+        parent_issue_id: 親課題ID
+        created_since: 登録日の開始（yyyy-MM-dd）
+        created_until: 登録日の終了（yyyy-MM-dd）
+        updated_since: 更新日の開始（yyyy-MM-dd）
+        updated_until: 更新日の終了（yyyy-MM-dd）
+        start_date_since: 開始日の開始（yyyy-MM-dd）
+        start_date_until: 開始日の終了（yyyy-MM-dd）
+        due_date_since: 期限日の開始（yyyy-MM-dd）
+        due_date_until: 期限日の終了（yyyy-MM-dd）
+        sort: 並び替えの項目（updated, created, dueDate, priority など）
+        order: 並び順（asc または desc）
+        offset: 取得開始位置
+        compact: ユーザー・ステータスなどを entities にまとめ、行ではIDで参照するコンパクト形式で返すかどうか
+        table_format: 表形式で返す場合の形式（csv, tsv, markdown）
+        columns: 表形式の列（"status.name" のようにドット区切り、カンマ区切りで複数指定可）
+        paginate: 一覧を items と next_cursor（次のページのカーソル）の辞書で返すかどうか
+        cursor: 前のページの next_cursor（指定した場合は絞り込み・並び替えの条件もカーソルのものを使う）
+        issue_service: 課題管理サービス（依存性注入）
+
+    Returns:
+        課題一覧（compact の場合は items と entities、format を指定した場合は表。
+        paginate・cursor を指定した場合とコンパクト形式では next_cursor を含む）
+    """
+    try:
+        if cursor:
+            query = read_page_cursor("issues", cursor)
+        else:
+            query = {
+                key: value
+                for key, value in {
+                    "project_id": project_id,
+                    "status_id": status_id,
+                    "assignee_id": assignee_id,
+                    "keyword": keyword,
+                    "count": count,
+                    "max_staleness": max_staleness,
+                    "issue_type_id": issue_type_id,
+                    "category_id": category_id,
+                    "milestone_id": milestone_id,
+                    "version_id": version_id,
+                    "priority_id": priority_id,
+                    "created_user_id": created_user_id,
+                    "parent_child": parent_child,
+                    "parent_issue_id": parent_issue_id,
+                    "created_since": created_since,
+                    "created_until": created_until,
+                    "updated_since": updated_since,
+                    "updated_until": updated_until,
+                    "start_date_since": start_date_since,
+                    "start_date_until": start_date_until,
+                    "due_date_since": due_date_since,
+                    "due_date_until": due_date_until,
+                    "sort": sort,
+                    "order": order,
+                    "offset": offset,
+                }.items()
+                if value not in (None, [])
+            }
+        issues = issue_service.get_issues(**query)
+        next_cursor = None
+        if issues and len(issues) >= query.get("count", 20):
+            next_offset = (query.get("offset") or 0) + len(issues)
+            next_cursor = page_cursor("issues", **{**query, "offset": next_offset})
+        return paged_response(
+            response,
+            issues,
+            next_cursor,
+            table_format,
+            columns,
+            ISSUE_COLUMNS,
+            normalize_entities(issues) if compact else None,
+            wrap=paginate or bool(cursor),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get issues: {str(e)}")
+
+
+@router.get(
+    "/search",
+    response_model=Union[List[Dict[str, Any]], Dict[str, Any]],
+    operation_id="search_issues",
+)
+async def search_issues(
+    response: Response,
+    query: Optional[str] = Query(None, min_length=1),
+    project_id: Optional[int] = None,
+    count: int = Query(20, ge=1, le=100),
+    max_staleness: Optional[float] = Query(None, ge=0),
+    table_format: Optional[str] = Query(None, alias="format", pattern=TABLE_FORMAT_PATTERN),
+    columns: List[str] = Query([]),
+    paginate: bool = False,
+    cursor: Optional[str] = None,
+    issue_service: IssueService = Depends(get_issue_service),
+) -> Union[List[Dict[str, Any]], Dict[str, Any], Response]:
+    """
+    ローカルミラーの全文検索索引で課題を検索するエンドポイント
+
+    Args:
+        query: 検索語（空白で区切った場合はすべてを含む課題。cursor を指定しない場合は必須）
+        project_id: プロジェクトID（指定しない場合はミラー内の全プロジェクト）
+        count: 取得件数（1-100）
+        max_staleness: プロジェクトを指定した場合に許容する最後の同期からの経過秒数
+        table_format: 表形式で返す場合の形式（csv, tsv, markdown）
+        columns: 表形式の列（"status.name" のようにドット区切り、カンマ区切りで複数指定可）
+        paginate: 一覧を items と next_cursor（次のページのカーソル）の辞書で返すかどうか
+        cursor: 前のページの next_cursor（指定した場合は検索語・プロジェクトもカーソルのものを使う）
         issue_service: 課題管理サービス（依存性注入）
 
     Returns:
-        課題一覧
+        関連度の高い順の検索結果（format を指定した場合は表。paginate・cursor を指定した場合は
+        items と next_cursor）
     """
     try:
-        issues = issue_service.get_issues(
-            project_id=project_id, keyword=keyword, count=count
+        if cursor:
+            search = read_page_cursor("search", cursor)
+        elif query:
+            search = {"query": query, "count": count}
+            if project_id is not None:
+                search["project_id"] = project_id
+            if max_staleness is not None:
+                search["max_staleness"] = max_staleness
+        else:
+            raise ValueError("query or cursor is required")
+        issues = issue_service.search_issues(**search)
+        next_cursor = None
+        if issues and len(issues) >= search["count"]:
+            next_offset = search.get("offset", 0) + len(issues)
+            next_cursor = page_cursor("search", **{**search, "offset": next_offset})
+        return paged_response(
+            response,
+            issues,
+            next_cursor,
+            table_format,
+            columns,
+            SEARCH_COLUMNS,
+            wrap=paginate or bool(cursor),
         )
-        return issues
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to search issues: {str(e)}")
+
+
+@router.get(
+    "/across-projects", response_model=Dict[str, Any], operation_id="get_issues_across_projects"
+)
+async def get_issues_across_projects(
+    response: Response,
+    project: List[str] = Query([]),
+    limit: int = Query(100, ge=1, le=1000),
+    sort: str = Query("updated", pattern=f"^({'|'.join(MULTI_PROJECT_SORT_KEYS)})$"),
+    order: str = Query("desc", pattern="^(asc|desc)$"),
+    keyword: Optional[str] = None,
+    status_id: List[int] = Query([]),
+    assignee_id: List[int] = Query([]),
+    priority_id: List[int] = Query([]),
+    parent_child: Optional[int] = Query(None, ge=0, le=4),
+    created_since: Optional[str] = Query(None, pattern=DATE_PATTERN),
+    created_until: Optional[str] = Query(None, pattern=DATE_PATTERN),
+    updated_since: Optional[str] = Query(None, pattern=DATE_PATTERN),
+    updated_until: Optional[str] = Query(None, pattern=DATE_PATTERN),
+    due_date_since: Optional[str] = Query(None, pattern=DATE_PATTERN),
+    due_date_until: Optional[str] = Query(None, pattern=DATE_PATTERN),
+    table_format: Optional[str] = Query(None, alias="format", pattern=TABLE_FORMAT_PATTERN),
+    columns: List[str] = Query([]),
+    cursor: Optional[str] = None,
+    issue_service: IssueService = Depends(get_issue_service),
+) -> Union[Dict[str, Any], Response]:
+    """
+    複数のプロジェクトの課題を1つの並び順で取得するエンドポイント
+
+    Args:
+        project: プロジェクトIDまたはプロジェクトキー（複数指定可、指定しない場合は全プロジェクト）
+        limit: 取得件数（1-1000）
+        sort: 並び替えの項目（updated, created, dueDate, startDate）
+        order: 並び順（asc または desc）
+        keyword: 検索キーワード
+        status_id: ステータスID
+        assignee_id: 担当者ID
+        priority_id: 優先度ID
+        parent_child: 親子課題の条件（0: すべて, 1: 子課題以外, 2: 子課題, 3: 親課題でも子課題でもない, 4: 親課題）
+        created_since: 登録日の開始（yyyy-MM-dd）
+        created_until: 登録日の終了（yyyy-MM-dd）
+        updated_since: 更新日の開始（yyyy-MM-dd）
+        updated_until: 更新日の終了（yyyy-MM-dd）
+        due_date_since: 期限日の開始（yyyy-MM-dd）
+        due_date_until: 期限日の終了（yyyy-MM-dd）
+        table_format: 表形式で返す場合の形式（csv, tsv, markdown）
+        columns: 表形式の列（"status.name" のようにドット区切り、カンマ区切りで複数指定可）
+        cursor: 前のページの next_cursor（指定した場合はプロジェクト・絞り込み・並び替えの条件もカーソルのものを使う）
+        issue_service: 課題管理サービス（依存性注入）
+
+    Returns:
+        検索結果（issues: 課題一覧, project_ids: 対象のプロジェクトID, api_calls: 課題一覧APIの呼び出し回数,
+        next_cursor: 次のページのカーソル）。format を指定した場合は課題一覧の表
+    """
+    try:
+        if cursor:
+            state = read_page_cursor("across_projects", cursor)
+        else:
+            filters = {
+                "keyword": keyword,
+                "status_id": status_id,
+                "assignee_id": assignee_id,
+                "priority_id": priority_id,
+                "parent_child": parent_child,
+                "created_since": created_since,
+                "created_until": created_until,
+                "updated_since": updated_since,
+                "updated_until": updated_until,
+                "due_date_since": due_date_since,
+                "due_date_until": due_date_until,
+            }
+            state = {
+                "projects": list(project),
+                "limit": limit,
+                "sort": sort,
+                "order": order,
+                "filters": {key: value for key, value in filters.items() if value not in (None, [])},
+            }
+        result = issue_service.get_issues_across_projects(
+            state["projects"],
+            limit=state["limit"],
+            sort=state["sort"],
+            order=state["order"],
+            offsets=state.get("offsets"),
+            **state["filters"],
+        )
+        next_cursor = None
+        if len(result["issues"]) >= state["limit"]:
+            next_cursor = page_cursor(
+                "across_projects",
+                **{**state, "projects": result["project_ids"], "offsets": result["offsets"]},
+            )
+        return paged_response(
+            response, result["issues"], next_cursor, table_format, columns, ISSUE_COLUMNS, result
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get issues: {str(e)}")
 
 
+@router.get("/query", response_model=Dict[str, Any], operation_id="query_issues")
+async def query_issues(
+    response: Response,
+    q: Optional[str] = Query(None, min_length=1),
+    project_id: Optional[int] = None,
+    limit: int = Query(20, ge=1, le=500),
+    table_format: Optional[str] = Query(None, alias="format", pattern=TABLE_FORMAT_PATTERN),
+    columns: List[str] = Query([]),
+    cursor: Optional[str] = None,
+    query_service: IssueQueryService = Depends(get_issue_query_service),
+) -> Union[Dict[str, Any], Response]:
+    """
+    検索クエリで課題を検索するエンドポイント
+
+    例: type:バグ priority:高 milestone:"2.0" assignee:tanaka is:overdue
+
+    Args:
+        q: 検索クエリ（項目:値, -項目:値, due<today, is:open/overdue, sort:due order:asc, キーワード。
+            cursor を指定しない場合は必須）
+        project_id: プロジェクトID（クエリで project:KEY を指定しない場合は必須）
+        limit: 取得件数（クエリの limit: を優先）
+        table_format: 表形式で返す場合の形式（csv, tsv, markdown）
+        columns: 表形式の列（"status.name" のようにドット区切り、カンマ区切りで複数指定可）
+        cursor: 前のページの next_cursor（指定した場合はクエリもカーソルのものを使う）
+        query_service: 課題検索クエリサービス（依存性注入）
+
+    Returns:
+        検索結果（issues: 課題一覧, plan: Backlog APIに渡した条件・取得後に適用した条件・API呼び出し回数,
+        next_cursor: 次のページのカーソル）。format を指定した場合は課題一覧の表
+    """
+    try:
+        if cursor:
+            state = read_page_cursor("query", cursor)
+        elif q:
+            state = {"q": q, "project_id": project_id, "limit": limit}
+        else:
+            raise ValueError("q or cursor is required")
+        result = query_service.query(
+            state["q"],
+            project_id=state["project_id"],
+            limit=state["limit"],
+            offset=state.get("offset", 0),
+        )
+        next_cursor = None
+        if result["plan"]["next_offset"] is not None:
+            next_cursor = page_cursor(
+                "query",
+                **{**state, "limit": result["plan"]["limit"], "offset": result["plan"]["next_offset"]},
+            )
+        return paged_response(
+            response, result["issues"], next_cursor, table_format, columns, ISSUE_COLUMNS, result
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to query issues: {str(e)}")
+
+
+@router.get("/aggregate", response_model=Dict[str, Any], operation_id="aggregate_issues")
+async def aggregate_issues(
+    project_id: int,
+    group_by: List[str] = Query([]),
+    status_id: List[int] = Query([]),
+    assignee_id: List[int] = Query([]),
+    issue_type_id: List[int] = Query([]),
+    priority_id: List[int] = Query([]),
+    category_id: List[int] = Query([]),
+    milestone_id: List[int] = Query([]),
+    version_id: List[int] = Query([]),
+    aggregation_service: AggregationService = Depends(get_aggregation_service),
+) -> Dict[str, Any]:
+    """
+    課題数をステータス・担当者などの軸で集計するエンドポイント
+
+    課題一覧を取得せず、Backlogの課題数APIで件数の表を返す
+
+    Args:
+        project_id: プロジェクトID
+        group_by: 集計の軸（status, assignee, issue_type, priority, category, milestone, version から最大2つ）
+        status_id: 絞り込むステータスID
+        assignee_id: 絞り込む担当者ID
+        issue_type_id: 絞り込む種別ID
+        priority_id: 絞り込む優先度ID
+        category_id: 絞り込むカテゴリーID
+        milestone_id: 絞り込むマイルストーンID
+        version_id: 絞り込む発生バージョンID
+        aggregation_service: 課題集計サービス（依存性注入）
+
+    Returns:
+        集計結果（columns: 列名, rows: 行ごとの件数, total: 総数, overlapping: 行・列が重複しうる軸）
+    """
+    try:
+        return aggregation_service.aggregate(
+            project_id,
+            group_by=group_by,
+            filters={
+                "status_id": status_id,
+                "assignee_id": assignee_id,
+                "issue_type_id": issue_type_id,
+                "priority_id": priority_id,
+                "category_id": category_id,
+                "milestone_id": milestone_id,
+                "version_id": version_id,
+            },
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to aggregate issues: {str(e)}")
+
+
 @router.get(
     "/{issue_id_or_key}", response_model=Dict[str, Any], operation_id="get_issue"
 )
 async def get_issue(
-    issue_id_or_key: str, issue_service: IssueService = Depends(get_issue_service)
+    issue_id_or_key: str,
+    expand: List[str] = Query([]),
+    max_bytes: Optional[int] = Query(None, ge=MIN_BUDGET_BYTES),
+    max_tokens: Optional[int] = Query(None, ge=1),
+    cursor: Optional[str] = None,
+    issue_service: IssueService = Depends(get_issue_service),
 ) -> Dict[str, Any]:
     """
     課題情報を取得するエンドポイント
 
     Args:
         issue_id_or_key: 課題IDまたは課題キー
+        expand: 合わせて取得する関連情報（comments, children, parent。カンマ区切りまたは複数指定）
+        max_bytes: レスポンスの大きさの上限（バイト）
+        max_tokens: レスポンスの大きさの上限（トークン、1トークン3バイトとして換算）
+        cursor: 前のレスポンスの continuation.cursor（指定した場合はBacklogに問い合わせずに続きを返す）
         issue_service: 課題管理サービス（依存性注入）
 
     Returns:
-        課題情報
+        課題情報（expand を指定した場合は関連情報を含む）。
+        上限を超える場合は詳細・コメント・子課題を区切り、continuation に続きのカーソルを含める
     """
     try:
-        issue = issue_service.get_issue(issue_id_or_key)
+        budget = budget_bytes(max_bytes, max_tokens)
+        if cursor:
+            return continue_result("issue", cursor, budget)[0]
+
+        names = [name.strip() for value in expand for name in value.split(",") if name.strip()]
+        issue = issue_service.get_issue(issue_id_or_key, expand=names or None)
         if issue is None:
             raise HTTPException(
                 status_code=404,
                 detail=f"Issue with ID or key {issue_id_or_key} not found",
             )
-        return issue
+        return budget_issue(issue, budget) if budget else issue
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500, detail=f"Failed to get issue {issue_id_or_key}: {str(e)}"
@@ -291,30 +849,99 @@ async def add_comment(
 
 @router.get(
     "/{issue_id_or_key}/comments",
-    response_model=List[Dict[str, Any]],
+    response_model=Union[List[Dict[str, Any]], Dict[str, Any]],
     operation_id="get_issue_comments",
 )
 async def get_issue_comments(
     issue_id_or_key: str,
+    response: Response,
     count: int = Query(20, ge=1, le=100),
+    since_comment_id: Optional[int] = Query(None, ge=0),
+    compact: bool = False,
+    table_format: Optional[str] = Query(None, alias="format", pattern=TABLE_FORMAT_PATTERN),
+    columns: List[str] = Query([]),
+    max_bytes: Optional[int] = Query(None, ge=MIN_BUDGET_BYTES),
+    max_tokens: Optional[int] = Query(None, ge=1),
+    paginate: bool = False,
+    cursor: Optional[str] = None,
     issue_service: IssueService = Depends(get_issue_service),
-) -> List[Dict[str, Any]]:
+) -> Union[List[Dict[str, Any]], Dict[str, Any], Response]:
     """
     課題のコメント一覧を取得するエンドポイント
 
+    次のページ（since_comment_id を指定した場合はより新しいコメント、それ以外はより古いコメント）の
+    カーソルは X-Next-Cursor ヘッダーで返す
+
     Args:
         issue_id_or_key: 課題IDまたは課題キー
         count: 取得件数（1-100）
+        since_comment_id: このIDより新しいコメントをID昇順で取得（0の場合は最初から）
+        compact: 投稿者を entities にまとめ、行ではIDで参照するコンパクト形式で返すかどうか
+        table_format: 表形式で返す場合の形式（csv, tsv, markdown）
+        columns: 表形式の列（"status.name" のようにドット区切り、カンマ区切りで複数指定可）
+        max_bytes: レスポンスの大きさの上限（バイト）
+        max_tokens: レスポンスの大きさの上限（トークン、1トークン3バイトとして換算）
+        paginate: 一覧を items と next_cursor（次のページのカーソル）の辞書で返すかどうか
+        cursor: 前のレスポンスの continuation.cursor（Backlogに問い合わせずに続きを返す）
+            または next_cursor（次のページを返す）
         issue_service: 課題管理サービス（依存性注入）
 
     Returns:
-        コメント一覧
+        コメント一覧（compact の場合は items と entities、format を指定した場合は表。
+        paginate・cursor を指定した場合とコンパクト形式では next_cursor を含む）。
+        上限を指定した場合は comments と next_cursor、続きがあれば continuation
     """
     try:
-        comments = issue_service.get_issue_comments(
-            issue_id_or_key=issue_id_or_key, count=count
+        budget = budget_bytes(max_bytes, max_tokens)
+        options: Dict[str, Any] = {"compact": compact, "format": table_format, "columns": columns}
+        if cursor and is_continuation_cursor(cursor):
+            page, options = continue_result("comments", cursor, budget)
+        else:
+            if cursor:
+                state = read_page_cursor("comments", cursor, issue=issue_id_or_key)
+            else:
+                state = {"issue": issue_id_or_key, "count": count}
+                if since_comment_id is not None:
+                    state["min_id"] = since_comment_id
+            comments = issue_service.get_issue_comments(
+                issue_id_or_key=state["issue"],
+                count=state["count"],
+                since_comment_id=state.get("min_id"),
+                before_comment_id=state.get("max_id"),
+            )
+            next_cursor = None
+            if comments and len(comments) >= state["count"]:
+                # 昇順の場合はより新しいコメント、降順の場合はより古いコメントを次のページにする
+                bound = "min_id" if "min_id" in state else "max_id"
+                next_cursor = page_cursor("comments", **{**state, bound: comments[-1]["id"]})
+            if not budget:
+                return paged_response(
+                    response,
+                    comments,
+                    next_cursor,
+                    table_format,
+                    columns,
+                    COMMENT_COLUMNS,
+                    normalize_entities(comments) if compact else None,
+                    wrap=paginate or bool(cursor),
+                )
+            options["next_cursor"] = next_cursor
+            page = budget_comments(comments, budget, options)
+
+        if options.get("next_cursor"):
+            response.headers[NEXT_CURSOR_HEADER] = options["next_cursor"]
+
+        page["comments"] = format_items(
+            page.get("comments", []),
+            COMMENT_COLUMNS,
+            bool(options.get("compact")),
+            options.get("format"),
+            options.get("columns"),
         )
-        return comments
+        page["next_cursor"] = options.get("next_cursor")
+        return page
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except BacklogApiError as e:
         status_code = e.status_code if e.status_code else 500
         detail = str(e)
@@ -6,7 +6,7 @@ import os
 from typing import Any, Dict, List
 
 from dotenv import load_dotenv
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from app.infrastructure.backlog.backlog_client_wrapper import BacklogClientWrapper
 
 from app.application.services.project_service import ProjectService
@@ -118,6 +118,49 @@ async def get_project(
         )
 
 
+@router.get(
+    "/{project_key}/context",
+    response_model=Dict[str, Any],
+    operation_id="get_project_context",
+)
+async def get_project_context(
+    project_key: str,
+    section: List[str] = Query([]),
+    include_archived: bool = False,
+    project_service: ProjectService = Depends(get_project_service),
+) -> Dict[str, Any]:
+    """
+    プロジェクトのステータス・種別・カテゴリー・マイルストーン・発生バージョン・
+    参加ユーザー・優先度をまとめて取得するエンドポイント
+
+    Args:
+        project_key: プロジェクトキー
+        section: 取得する項目（statuses, issue_types, categories, milestones, versions,
+            users, priorities。指定しない場合はすべて）
+        include_archived: アーカイブ済みのマイルストーン・発生バージョンを含めるかどうか
+        project_service: プロジェクト管理サービス（依存性注入）
+
+    Returns:
+        プロジェクトのコンテキスト
+    """
+    try:
+        context = project_service.get_project_context(
+            project_key, sections=section or None, include_archived=include_archived
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get context for project {project_key}: {str(e)}",
+        )
+    if context is None:
+        raise HTTPException(
+            status_code=404, detail=f"Project with key {project_key} not found"
+        )
+    return context
+
+
 @router.get(
     "/{project_key}/statuses",
     response_model=List[Dict[str, Any]],
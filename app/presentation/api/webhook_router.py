@@ -0,0 +1,112 @@
+"""
+Webhook関連のAPIエンドポイント
+"""
+
+import hmac
+import os
+from typing import Any, Dict, Optional
+
+from dotenv import load_dotenv
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, ConfigDict
+
+from app.application.services.change_event_service import ChangeEventService
+from app.core.config import settings
+from app.infrastructure.backlog.backlog_client_wrapper import BacklogClientWrapper
+
+# 環境変数の読み込み
+load_dotenv()
+
+# ルーターの作成
+# WebhookはBacklogから呼び出すものであり、MCPツールとして公開しないためスキーマに含めない
+router = APIRouter(
+    prefix="/api/webhooks",
+    tags=["webhooks"],
+    include_in_schema=False,
+)
+
+
+class WebhookProject(BaseModel):
+    """Webhookのプロジェクト"""
+
+    model_config = ConfigDict(extra="allow")
+
+    id: int
+    projectKey: str
+
+
+class BacklogWebhook(BaseModel):
+    """BacklogのWebhookのペイロード"""
+
+    model_config = ConfigDict(extra="allow")
+
+    id: Optional[int] = None
+    type: int
+    project: WebhookProject
+    content: Dict[str, Any] = {}
+    created: Optional[str] = None
+
+
+def get_change_event_service() -> ChangeEventService:
+    """
+    更新通知の反映サービスの依存性注入
+
+    Returns:
+        ChangeEventService: 更新通知の反映サービス
+    """
+    api_key = os.getenv("BACKLOG_API_KEY")
+    space = os.getenv("BACKLOG_SPACE")
+
+    if not api_key or not space:
+        raise HTTPException(
+            status_code=500,
+            detail="Backlog API configuration is missing. Please set BACKLOG_API_KEY and BACKLOG_SPACE environment variables.",
+        )
+
+    backlog_client = BacklogClientWrapper(api_key=api_key, space=space, read_only_mode=settings.READ_ONLY_MODE)
+    return ChangeEventService(backlog_client=backlog_client)
+
+
+def verify_webhook_token(token: Optional[str] = None) -> None:
+    """
+    WebhookのURLに付けたトークンを検証
+
+    BacklogのWebhookは署名を付けないため、設定値 BACKLOG_WEBHOOK_TOKEN を
+    WebhookのURLのクエリ文字列（?token=...）に含めて送信元を確認する。
+    トークンを設定していない場合は、誰からでもキャッシュを破棄できてしまうため受け付けない
+
+    Args:
+        token: クエリ文字列のトークン
+
+    Raises:
+        HTTPException: トークンが設定されていない場合（503）、一致しない場合（401）
+    """
+    expected = settings.BACKLOG_WEBHOOK_TOKEN
+    if not expected:
+        raise HTTPException(
+            status_code=503,
+            detail="Webhook receiver is not configured. Please set BACKLOG_WEBHOOK_TOKEN.",
+        )
+    if not hmac.compare_digest(token or "", expected):
+        raise HTTPException(status_code=401, detail="Invalid webhook token")
+
+
+@router.post("/backlog", dependencies=[Depends(verify_webhook_token)])
+async def receive_backlog_webhook(
+    payload: BacklogWebhook,
+    change_event_service: ChangeEventService = Depends(get_change_event_service),
+) -> Dict[str, Any]:
+    """
+    BacklogのWebhookを受け取り、キャッシュとローカルミラーに反映するエンドポイント
+
+    Args:
+        payload: Webhookのペイロード
+        change_event_service: 更新通知の反映サービス（依存性注入）
+
+    Returns:
+        反映結果（id, type, actions）
+    """
+    try:
+        return change_event_service.apply(payload.model_dump())
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to apply webhook: {str(e)}")
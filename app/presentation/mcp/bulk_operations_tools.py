@@ -303,3 +303,175 @@ async def bulk_delete_issues_handler(params: Dict[str, Any]) -> Dict[str, Any]:
 
     bulk_service = get_bulk_operations_service()
     return bulk_service.bulk_delete_issues(issue_ids=issue_ids)
+
+
+# 複数の課題を一括作成するMCPツール
+bulk_create_issues_tool = Tool(
+    name="bulk_create_issues",
+    description="同じBacklogプロジェクトに複数の課題を一括作成します",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "project_id": {"type": "integer", "description": "プロジェクトID"},
+            "project_key": {
+                "type": "string",
+                "description": "プロジェクトキー（project_idが指定されていない場合に使用）",
+            },
+            "issues": {
+                "type": "array",
+                "description": "作成する課題のリスト",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "summary": {"type": "string", "description": "課題の件名"},
+                        "issue_type_id": {
+                            "type": "integer",
+                            "description": "課題の種別ID",
+                        },
+                        "issue_type_name": {
+                            "type": "string",
+                            "description": "課題の種別名（issue_type_idが指定されていない場合に使用）",
+                        },
+                        "priority_id": {"type": "integer", "description": "優先度ID"},
+                        "priority_name": {
+                            "type": "string",
+                            "description": "優先度名（priority_idが指定されていない場合に使用）",
+                        },
+                        "description": {"type": "string", "description": "課題の詳細"},
+                        "assignee_id": {"type": "integer", "description": "担当者ID"},
+                        "assignee_name": {
+                            "type": "string",
+                            "description": "担当者名（assignee_idが指定されていない場合に使用）",
+                        },
+                        "category_id": {
+                            "type": "array",
+                            "items": {"type": "integer"},
+                            "description": "カテゴリーIDのリスト",
+                        },
+                        "category_name": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "カテゴリー名のリスト（category_idが指定されていない場合に使用）",
+                        },
+                        "milestone_id": {
+                            "type": "array",
+                            "items": {"type": "integer"},
+                            "description": "マイルストーンIDのリスト",
+                        },
+                        "milestone_name": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "マイルストーン名のリスト（milestone_idが指定されていない場合に使用）",
+                        },
+                        "version_id": {
+                            "type": "array",
+                            "items": {"type": "integer"},
+                            "description": "発生バージョンIDのリスト",
+                        },
+                        "version_name": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "発生バージョン名のリスト（version_idが指定されていない場合に使用）",
+                        },
+                        "start_date": {
+                            "type": "string",
+                            "description": "開始日（yyyy-MM-dd形式）",
+                        },
+                        "due_date": {
+                            "type": "string",
+                            "description": "期限日（yyyy-MM-dd形式）",
+                        },
+                    },
+                    "required": ["summary"],
+                },
+            },
+        },
+        "required": ["issues"],
+    },
+)
+
+
+# @bulk_create_issues_tool.handler
+async def bulk_create_issues_handler(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    複数の課題を一括作成するMCPツールのハンドラー
+
+    Args:
+        params: パラメータ
+            - project_id: プロジェクトID
+            - project_key: プロジェクトキー（project_idが指定されていない場合に使用）
+            - issues: 作成する課題のリスト
+
+    Returns:
+        処理結果の統計情報（作成された課題キーは入力順）
+    """
+    project_id = params.get("project_id")
+    project_key = params.get("project_key")
+    issues = params.get("issues", [])
+
+    if not issues:
+        raise ValueError("issues is required")
+    if not project_id and not project_key:
+        raise ValueError("either project_id or project_key is required")
+
+    bulk_service = get_bulk_operations_service()
+    return bulk_service.bulk_create_issues(
+        issues=issues, project_id=project_id, project_key=project_key
+    )
+
+
+# 複数チケットにコメントを一括追加するMCPツール
+bulk_add_comment_tool = Tool(
+    name="bulk_add_comment",
+    description="複数のBacklogチケットにコメントを一括追加します。"
+    "コメント内容の ${issue_id_or_key} やvariablesで指定した変数は課題ごとに置換されます",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "issue_ids": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "課題IDまたは課題キーのリスト",
+            },
+            "content": {
+                "type": "string",
+                "description": "コメント内容（${変数名} 形式のテンプレート）",
+            },
+            "variables": {
+                "type": "object",
+                "description": "課題IDまたは課題キーごとのテンプレート変数",
+                "additionalProperties": {"type": "object"},
+            },
+        },
+        "required": ["issue_ids", "content"],
+    },
+)
+
+
+# @bulk_add_comment_tool.handler
+async def bulk_add_comment_handler(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    複数チケットにコメントを一括追加するMCPツールのハンドラー
+
+    Args:
+        params: パラメータ
+            - issue_ids: 課題IDまたは課題キーのリスト
+            - content: コメント内容（${変数名} 形式のテンプレート）
+            - variables: 課題IDまたは課題キーごとのテンプレート変数
+
+    Returns:
+        処理結果の統計情報
+    """
+    issue_ids = params.get("issue_ids", [])
+    content = params.get("content")
+    variables = params.get("variables")
+
+    if not issue_ids:
+        raise ValueError("issue_ids is required")
+    if not content:
+        raise ValueError("content is required")
+
+    bulk_service = get_bulk_operations_service()
+    return bulk_service.bulk_add_comment(
+        issue_ids=issue_ids, content=content, variables=variables
+    )
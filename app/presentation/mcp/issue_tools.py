@@ -8,9 +8,35 @@ from typing import Any, Dict, List, Optional, Union
 from dotenv import load_dotenv
 from mcp.types import Tool
 
-from app.application.services.issue_service import IssueService
+from app.application.services.aggregation_service import AggregationService
+from app.application.services.issue_query_service import IssueQueryService
+from app.application.services.issue_service import (
+    DATE_PATTERN,
+    ISSUE_SORT_PATTERN,
+    ISSUE_EXPANSIONS,
+    MULTI_PROJECT_SORT_KEYS,
+    IssueService,
+)
 from app.infrastructure.backlog.backlog_client_wrapper import BacklogClientWrapper
 from app.core.config import settings
+from app.presentation.response_format import (
+    COMMENT_COLUMNS,
+    ISSUE_COLUMNS,
+    MIN_BUDGET_BYTES,
+    SEARCH_COLUMNS,
+    TABLE_FORMATS,
+    budget_bytes,
+    budget_comments,
+    budget_issue,
+    continue_result,
+    format_items,
+    format_table,
+    is_continuation_cursor,
+    page_cursor,
+    parse_columns,
+    read_page_cursor,
+    with_next_cursor,
+)
 
 # 環境変数の読み込み
 load_dotenv()
@@ -35,10 +61,97 @@ def get_issue_service() -> IssueService:
     return IssueService(backlog_client=backlog_client)
 
 
+def get_aggregation_service() -> AggregationService:
+    """
+    課題集計サービスのインスタンスを取得
+
+    Returns:
+        AggregationService: 課題集計サービス
+    """
+    api_key = os.getenv("BACKLOG_API_KEY")
+    space = os.getenv("BACKLOG_SPACE")
+
+    if not api_key or not space:
+        raise ValueError(
+            "Backlog API configuration is missing. Please set BACKLOG_API_KEY and BACKLOG_SPACE environment variables."
+        )
+
+    backlog_client = BacklogClientWrapper(api_key=api_key, space=space, read_only_mode=settings.READ_ONLY_MODE)
+    return AggregationService(backlog_client=backlog_client)
+
+
+def get_issue_query_service() -> IssueQueryService:
+    """
+    課題検索クエリサービスのインスタンスを取得
+
+    Returns:
+        IssueQueryService: 課題検索クエリサービス
+    """
+    api_key = os.getenv("BACKLOG_API_KEY")
+    space = os.getenv("BACKLOG_SPACE")
+
+    if not api_key or not space:
+        raise ValueError(
+            "Backlog API configuration is missing. Please set BACKLOG_API_KEY and BACKLOG_SPACE environment variables."
+        )
+
+    backlog_client = BacklogClientWrapper(api_key=api_key, space=space, read_only_mode=settings.READ_ONLY_MODE)
+    return IssueQueryService(backlog_client=backlog_client)
+
+
+# 一覧を表形式で返す場合のパラメータ
+TABLE_PROPERTIES: Dict[str, Any] = {
+    "format": {
+        "type": "string",
+        "enum": list(TABLE_FORMATS),
+        "description": "表形式（csv, tsv, markdown）で返す場合の形式。指定しない場合はJSON",
+    },
+    "columns": {
+        "type": "array",
+        "items": {"type": "string"},
+        "description": "表形式の列（\"status.name\" のようにドット区切りで属性をたどる）",
+    },
+}
+
+
+# 一覧を次のページのカーソルと合わせて返す場合のパラメータ
+PAGE_PROPERTIES: Dict[str, Any] = {
+    "paginate": {
+        "type": "boolean",
+        "description": "一覧を items と next_cursor（次のページのカーソル、最後のページではnull）で返す",
+        "default": False,
+    },
+    "cursor": {
+        "type": "string",
+        "description": "前のレスポンスの next_cursor。指定すると同じ条件で次のページを返す",
+    },
+}
+
+
+# レスポンスの大きさを予算に収める場合のパラメータ
+BUDGET_PROPERTIES: Dict[str, Any] = {
+    "max_bytes": {
+        "type": "integer",
+        "description": "レスポンスの大きさの上限（バイト）。超える部分は区切り、続きは cursor で取得する",
+        "minimum": MIN_BUDGET_BYTES,
+    },
+    "max_tokens": {
+        "type": "integer",
+        "description": "レスポンスの大きさの上限（トークン、1トークン3バイトとして換算）",
+        "minimum": 1,
+    },
+    "cursor": {
+        "type": "string",
+        "description": "前のレスポンスの continuation.cursor。指定するとBacklogに問い合わせずに続きを返す",
+    },
+}
+
+
 # 課題一覧を取得するMCPツール
 get_issues_tool = Tool(
     name="get_issues",
-    description="Backlogの課題一覧を取得します",
+    description="Backlogの課題一覧を取得します（種別・カテゴリー・マイルストーン・期限日などの"
+    "絞り込みと並び替えはBacklog側で行います）",
     inputSchema={
         "type": "object",
         "properties": {
@@ -54,13 +167,123 @@ get_issues_tool = Tool(
                 "minimum": 1,
                 "maximum": 100,
             },
+            "max_staleness": {
+                "type": "number",
+                "description": "ローカルミラーから取得する場合に許容する最後の同期からの経過秒数"
+                "（project_idの指定が必要。指定しない場合はBacklogから直接取得）",
+                "minimum": 0,
+            },
+            "assignee_id": {"type": "integer", "description": "担当者ID"},
+            "status_id": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "ステータスID",
+            },
+            "issue_type_id": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "種別ID",
+            },
+            "category_id": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "カテゴリーID",
+            },
+            "milestone_id": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "マイルストーンID",
+            },
+            "version_id": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "発生バージョンID",
+            },
+            "priority_id": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "優先度ID",
+            },
+            "created_user_id": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "登録者ID",
+            },
+            "parent_issue_id": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "親課題ID",
+            },
+            "parent_child": {
+                "type": "integer",
+                "description": "親子課題の条件（0: すべて, 1: 子課題以外, 2: 子課題, "
+                "3: 親課題でも子課題でもない, 4: 親課題）",
+                "minimum": 0,
+                "maximum": 4,
+            },
+            "created_since": {
+                "type": "string",
+                "pattern": DATE_PATTERN,
+                "description": "登録日の開始（yyyy-MM-dd）",
+            },
+            "created_until": {
+                "type": "string",
+                "pattern": DATE_PATTERN,
+                "description": "登録日の終了（yyyy-MM-dd）",
+            },
+            "updated_since": {
+                "type": "string",
+                "pattern": DATE_PATTERN,
+                "description": "更新日の開始（yyyy-MM-dd）",
+            },
+            "updated_until": {
+                "type": "string",
+                "pattern": DATE_PATTERN,
+                "description": "更新日の終了（yyyy-MM-dd）",
+            },
+            "start_date_since": {
+                "type": "string",
+                "pattern": DATE_PATTERN,
+                "description": "開始日の開始（yyyy-MM-dd）",
+            },
+            "start_date_until": {
+                "type": "string",
+                "pattern": DATE_PATTERN,
+                "description": "開始日の終了（yyyy-MM-dd）",
+            },
+            "due_date_since": {
+                "type": "string",
+                "pattern": DATE_PATTERN,
+                "description": "期限日の開始（yyyy-MM-dd）",
+            },
+            "due_date_until": {
+                "type": "string",
+                "pattern": DATE_PATTERN,
+                "description": "期限日の終了（yyyy-MM-dd）",
+            },
+            "sort": {
+                "type": "string",
+                "pattern": ISSUE_SORT_PATTERN,
+                "description": "並び替えの項目（updated, created, dueDate, priority など）",
+            },
+            "order": {"type": "string", "enum": ["asc", "desc"], "description": "並び順"},
+            "offset": {"type": "integer", "description": "取得開始位置", "minimum": 0},
+            "compact": {
+                "type": "boolean",
+                "description": "ユーザー・ステータスなどを entities にまとめ、行ではIDで参照するコンパクト形式で返す",
+                "default": False,
+            },
+            **TABLE_PROPERTIES,
+            **PAGE_PROPERTIES,
         },
     },
 )
 
 
 # @get_issues_tool.handler
-async def get_issues_handler(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+async def get_issues_handler(
+    params: Dict[str, Any]
+) -> Union[List[Dict[str, Any]], Dict[str, Any], str]:
     """
     課題一覧を取得するMCPツールのハンドラー
 
@@ -69,26 +292,498 @@ async def get_issues_handler(params: Dict[str, Any]) -> List[Dict[str, Any]]:
             - project_id: プロジェクトID（指定しない場合は全プロジェクト）
             - keyword: 検索キーワード
             - count: 取得件数（1-100）
+            - max_staleness: ローカルミラーから取得する場合に許容する最後の同期からの経過秒数
+            - その他の絞り込み・並び替えの条件（status_id, issue_type_id, due_date_until, sort など）
+            - compact: コンパクト形式で返すかどうか
+            - format: 表形式で返す場合の形式（csv, tsv, markdown）
+            - columns: 表形式の列
+            - paginate: items と next_cursor で返すかどうか
+            - cursor: 前のレスポンスの next_cursor
 
     Returns:
-        課題一覧
+        課題一覧（compact の場合は items と entities、format を指定した場合は表。
+        paginate・cursor を指定した場合とコンパクト形式では next_cursor を含む）
     """
-    project_id = params.get("project_id")
-    keyword = params.get("keyword")
-    count = params.get("count", 20)
+    if params.get("cursor"):
+        query = read_page_cursor("issues", params["cursor"])
+    else:
+        query = {
+            key: value
+            for key, value in params.items()
+            if key in get_issues_tool.inputSchema["properties"]
+            and key not in ("compact", *TABLE_PROPERTIES, *PAGE_PROPERTIES)
+            and value not in (None, [])
+        }
+        query.setdefault("count", 20)
 
     issue_service = get_issue_service()
-    return issue_service.get_issues(project_id=project_id, keyword=keyword, count=count)
+    issues = issue_service.get_issues(**query)
+    next_cursor = None
+    if issues and len(issues) >= query["count"]:
+        next_offset = (query.get("offset") or 0) + len(issues)
+        next_cursor = page_cursor("issues", **{**query, "offset": next_offset})
+    return with_next_cursor(
+        format_items(
+            issues,
+            ISSUE_COLUMNS,
+            bool(params.get("compact")),
+            params.get("format"),
+            params.get("columns"),
+        ),
+        next_cursor,
+        wrap=bool(params.get("paginate") or params.get("cursor")),
+    )
+
+
+# 複数のプロジェクトの課題を取得するMCPツール
+get_issues_across_projects_tool = Tool(
+    name="get_issues_across_projects",
+    description="複数のBacklogプロジェクトの課題を1回の呼び出しで取得し、1つの並び順で返します",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "projects": {
+                "type": "array",
+                "items": {"type": ["integer", "string"]},
+                "description": "プロジェクトIDまたはプロジェクトキーのリスト（指定しない場合は全プロジェクト）",
+            },
+            "limit": {
+                "type": "integer",
+                "description": "取得件数（1-1000）",
+                "default": 100,
+                "minimum": 1,
+                "maximum": 1000,
+            },
+            "sort": {
+                "type": "string",
+                "enum": list(MULTI_PROJECT_SORT_KEYS),
+                "default": "updated",
+                "description": "並び替えの項目",
+            },
+            "order": {
+                "type": "string",
+                "enum": ["asc", "desc"],
+                "default": "desc",
+                "description": "並び順",
+            },
+            "keyword": {"type": "string", "description": "検索キーワード"},
+            "status_id": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "ステータスID",
+            },
+            "assignee_id": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "担当者ID",
+            },
+            "priority_id": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "優先度ID",
+            },
+            "parent_child": {
+                "type": "integer",
+                "description": "親子課題の条件（0: すべて, 1: 子課題以外, 2: 子課題, "
+                "3: 親課題でも子課題でもない, 4: 親課題）",
+                "minimum": 0,
+                "maximum": 4,
+            },
+            "created_since": {
+                "type": "string",
+                "pattern": DATE_PATTERN,
+                "description": "登録日の開始（yyyy-MM-dd）",
+            },
+            "created_until": {
+                "type": "string",
+                "pattern": DATE_PATTERN,
+                "description": "登録日の終了（yyyy-MM-dd）",
+            },
+            "updated_since": {
+                "type": "string",
+                "pattern": DATE_PATTERN,
+                "description": "更新日の開始（yyyy-MM-dd）",
+            },
+            "updated_until": {
+                "type": "string",
+                "pattern": DATE_PATTERN,
+                "description": "更新日の終了（yyyy-MM-dd）",
+            },
+            "due_date_since": {
+                "type": "string",
+                "pattern": DATE_PATTERN,
+                "description": "期限日の開始（yyyy-MM-dd）",
+            },
+            "due_date_until": {
+                "type": "string",
+                "pattern": DATE_PATTERN,
+                "description": "期限日の終了（yyyy-MM-dd）",
+            },
+            **TABLE_PROPERTIES,
+            **PAGE_PROPERTIES,
+        },
+    },
+)
+
+
+# @get_issues_across_projects_tool.handler
+async def get_issues_across_projects_handler(
+    params: Dict[str, Any]
+) -> Union[Dict[str, Any], str]:
+    """
+    複数のプロジェクトの課題を取得するMCPツールのハンドラー
+
+    Args:
+        params: パラメータ
+            - projects: プロジェクトIDまたはプロジェクトキーのリスト
+            - limit: 取得件数
+            - sort: 並び替えの項目
+            - order: 並び順
+            - その他の絞り込み条件（keyword, status_id, due_date_until など）
+            - format: 表形式で返す場合の形式（csv, tsv, markdown）
+            - columns: 表形式の列
+            - paginate: 表を items と next_cursor で返すかどうか
+            - cursor: 前のレスポンスの next_cursor
+
+    Returns:
+        検索結果（issues: 課題一覧, project_ids: 対象のプロジェクトID, api_calls: 課題一覧APIの呼び出し回数,
+        next_cursor: 次のページのカーソル）。format を指定した場合は課題一覧の表
+    """
+    if params.get("cursor"):
+        state = read_page_cursor("across_projects", params["cursor"])
+    else:
+        state = {
+            "projects": params.get("projects") or [],
+            "limit": params.get("limit", 100),
+            "sort": params.get("sort", "updated"),
+            "order": params.get("order", "desc"),
+            "filters": {
+                key: value
+                for key, value in params.items()
+                if key in get_issues_across_projects_tool.inputSchema["properties"]
+                and key
+                not in ("projects", "limit", "sort", "order", *TABLE_PROPERTIES, *PAGE_PROPERTIES)
+                and value not in (None, [])
+            },
+        }
+
+    issue_service = get_issue_service()
+    result = issue_service.get_issues_across_projects(
+        state["projects"],
+        limit=state["limit"],
+        sort=state["sort"],
+        order=state["order"],
+        offsets=state.get("offsets"),
+        **state["filters"],
+    )
+    next_cursor = None
+    if len(result["issues"]) >= state["limit"]:
+        next_cursor = page_cursor(
+            "across_projects",
+            **{**state, "projects": result["project_ids"], "offsets": result["offsets"]},
+        )
+    body: Union[Dict[str, Any], str] = result
+    if params.get("format"):
+        body = format_table(
+            result["issues"], parse_columns(params.get("columns")) or ISSUE_COLUMNS, params["format"]
+        )
+    return with_next_cursor(
+        body, next_cursor, wrap=bool(params.get("paginate") or params.get("cursor"))
+    )
+
+
+# 課題を全文検索するMCPツール
+search_issues_tool = Tool(
+    name="search_issues",
+    description="ローカルミラーの全文検索索引でBacklogの課題を件名・詳細・コメントから検索します"
+    "（関連度順、検索語を含む抜粋付き）",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "検索語（空白で区切った場合はすべてを含む課題。cursor を指定しない場合は必須）",
+            },
+            "project_id": {
+                "type": "integer",
+                "description": "プロジェクトID（指定しない場合はミラー内の全プロジェクト）",
+            },
+            "count": {
+                "type": "integer",
+                "description": "取得件数（1-100）",
+                "default": 20,
+                "minimum": 1,
+                "maximum": 100,
+            },
+            "max_staleness": {
+                "type": "number",
+                "description": "project_idを指定した場合に許容する最後の同期からの経過秒数"
+                "（過ぎている場合は先に同期する）",
+                "minimum": 0,
+            },
+            **TABLE_PROPERTIES,
+            **PAGE_PROPERTIES,
+        },
+    },
+)
+
+
+# @search_issues_tool.handler
+async def search_issues_handler(
+    params: Dict[str, Any]
+) -> Union[List[Dict[str, Any]], Dict[str, Any], str]:
+    """
+    課題を全文検索するMCPツールのハンドラー
+
+    Args:
+        params: パラメータ
+            - query: 検索語
+            - project_id: プロジェクトID（指定しない場合はミラー内の全プロジェクト）
+            - count: 取得件数（1-100）
+            - max_staleness: project_idを指定した場合に許容する最後の同期からの経過秒数
+            - format: 表形式で返す場合の形式（csv, tsv, markdown）
+            - columns: 表形式の列
+            - paginate: items と next_cursor で返すかどうか
+            - cursor: 前のレスポンスの next_cursor
+
+    Returns:
+        関連度の高い順の検索結果（format を指定した場合は表。paginate・cursor を指定した場合は
+        items と next_cursor）
+    """
+    if params.get("cursor"):
+        search = read_page_cursor("search", params["cursor"])
+    elif params.get("query"):
+        search = {
+            key: params[key]
+            for key in ("query", "project_id", "max_staleness")
+            if params.get(key) is not None
+        }
+        search["count"] = params.get("count", 20)
+    else:
+        raise ValueError("query or cursor is required")
+
+    issue_service = get_issue_service()
+    issues = issue_service.search_issues(**search)
+    next_cursor = None
+    if issues and len(issues) >= search["count"]:
+        next_offset = search.get("offset", 0) + len(issues)
+        next_cursor = page_cursor("search", **{**search, "offset": next_offset})
+    return with_next_cursor(
+        format_items(issues, SEARCH_COLUMNS, False, params.get("format"), params.get("columns")),
+        next_cursor,
+        wrap=bool(params.get("paginate") or params.get("cursor")),
+    )
+
+
+# 検索クエリで課題を検索するMCPツール
+query_issues_tool = Tool(
+    name="query_issues",
+    description="検索クエリでBacklogの課題を検索します。名前はIDに解決され、絞り込みはBacklog側で行われます。"
+    "例: type:バグ priority:高 milestone:\"2.0\" assignee:tanaka is:overdue",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "q": {
+                "type": "string",
+                "description": "検索クエリ。項目:値（status, assignee, type, category, milestone, version, "
+                "priority, created_by, parent, summary。カンマ区切りでいずれか、先頭に-で否定、"
+                "assignee:none で担当者なし）、日付の範囲（created, updated, start, due に <, <=, >, >=, : と "
+                "yyyy-MM-dd・today・today-7）、is:open/closed/overdue/parent/child/standalone、"
+                "sort:due order:asc limit:50、その他の語はキーワード検索。cursor を指定しない場合は必須",
+            },
+            "project_id": {
+                "type": "integer",
+                "description": "プロジェクトID（クエリで project:KEY を指定しない場合は必須）",
+            },
+            "limit": {
+                "type": "integer",
+                "description": "取得件数（クエリの limit: を優先）",
+                "default": 20,
+                "minimum": 1,
+                "maximum": 500,
+            },
+            **TABLE_PROPERTIES,
+            **PAGE_PROPERTIES,
+        },
+    },
+)
+
+
+# @query_issues_tool.handler
+async def query_issues_handler(params: Dict[str, Any]) -> Union[Dict[str, Any], str]:
+    """
+    検索クエリで課題を検索するMCPツールのハンドラー
+
+    Args:
+        params: パラメータ
+            - q: 検索クエリ
+            - project_id: プロジェクトID
+            - limit: 取得件数
+            - format: 表形式で返す場合の形式（csv, tsv, markdown）
+            - columns: 表形式の列
+            - paginate: 表を items と next_cursor で返すかどうか
+            - cursor: 前のレスポンスの next_cursor
+
+    Returns:
+        検索結果（issues: 課題一覧, plan: 実行計画, next_cursor: 次のページのカーソル）、
+        format を指定した場合は課題一覧の表
+    """
+    if params.get("cursor"):
+        state = read_page_cursor("query", params["cursor"])
+    elif params.get("q"):
+        state = {
+            "q": params["q"],
+            "project_id": params.get("project_id"),
+            "limit": params.get("limit", 20),
+        }
+    else:
+        raise ValueError("q or cursor is required")
+
+    query_service = get_issue_query_service()
+    result = query_service.query(
+        state["q"],
+        project_id=state["project_id"],
+        limit=state["limit"],
+        offset=state.get("offset", 0),
+    )
+    next_cursor = None
+    if result["plan"]["next_offset"] is not None:
+        next_cursor = page_cursor(
+            "query",
+            **{**state, "limit": result["plan"]["limit"], "offset": result["plan"]["next_offset"]},
+        )
+    body: Union[Dict[str, Any], str] = result
+    if params.get("format"):
+        body = format_table(
+            result["issues"], parse_columns(params.get("columns")) or ISSUE_COLUMNS, params["format"]
+        )
+    return with_next_cursor(
+        body, next_cursor, wrap=bool(params.get("paginate") or params.get("cursor"))
+    )
+
+
+# 課題数を集計するMCPツール
+aggregate_issues_tool = Tool(
+    name="aggregate_issues",
+    description="Backlogの課題数をステータス・担当者・カテゴリー・マイルストーンなどの軸で集計し、"
+    "件数の表を返します（課題一覧は取得しません）",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "project_id": {"type": "integer", "description": "プロジェクトID"},
+            "group_by": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": [
+                        "status",
+                        "assignee",
+                        "issue_type",
+                        "priority",
+                        "category",
+                        "milestone",
+                        "version",
+                    ],
+                },
+                "maxItems": 2,
+                "description": "集計の軸（1つ目が行、2つ目が列。指定しない場合は総数のみ）。"
+                "category・milestone・version は1つの課題が複数の値を持てるため、行・列が重複します",
+            },
+            "status_id": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "絞り込むステータスID",
+            },
+            "assignee_id": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "絞り込む担当者ID",
+            },
+            "issue_type_id": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "絞り込む種別ID",
+            },
+            "priority_id": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "絞り込む優先度ID",
+            },
+            "category_id": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "絞り込むカテゴリーID",
+            },
+            "milestone_id": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "絞り込むマイルストーンID",
+            },
+            "version_id": {
+                "type": "array",
+                "items": {"type": "integer"},
+                "description": "絞り込む発生バージョンID",
+            },
+        },
+        "required": ["project_id"],
+    },
+)
+
+
+# @aggregate_issues_tool.handler
+async def aggregate_issues_handler(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    課題数を集計するMCPツールのハンドラー
+
+    Args:
+        params: パラメータ
+            - project_id: プロジェクトID
+            - group_by: 集計の軸（最大2つ）
+            - status_id, assignee_id, issue_type_id, priority_id, category_id,
+              milestone_id, version_id: 絞り込むIDのリスト
+
+    Returns:
+        集計結果（columns: 列名, rows: 行ごとの件数, total: 総数）
+    """
+    project_id = params.get("project_id")
+    if not project_id:
+        raise ValueError("project_id is required")
+
+    aggregation_service = get_aggregation_service()
+    return aggregation_service.aggregate(
+        project_id,
+        group_by=params.get("group_by"),
+        filters={
+            field: params[field]
+            for field in (
+                "status_id",
+                "assignee_id",
+                "issue_type_id",
+                "priority_id",
+                "category_id",
+                "milestone_id",
+                "version_id",
+            )
+            if params.get(field)
+        },
+    )
 
 
 # 課題情報を取得するMCPツール
 get_issue_tool = Tool(
     name="get_issue",
-    description="指定された課題の情報を取得します",
+    description="指定された課題の情報を取得します（expand でコメント・子課題・親課題も1回で取得できます）",
     inputSchema={
         "type": "object",
         "properties": {
-            "issue_id_or_key": {"type": "string", "description": "課題IDまたは課題キー"}
+            "issue_id_or_key": {"type": "string", "description": "課題IDまたは課題キー"},
+            "expand": {
+                "type": "array",
+                "items": {"type": "string", "enum": list(ISSUE_EXPANSIONS)},
+                "description": "合わせて取得する関連情報（comments: 新しいコメント20件, "
+                "children: 子課題, parent: 親課題）",
+            },
+            **BUDGET_PROPERTIES,
         },
         "required": ["issue_id_or_key"],
     },
@@ -103,21 +798,29 @@ async def get_issue_handler(params: Dict[str, Any]) -> Dict[str, Any]:
     Args:
         params: パラメータ
             - issue_id_or_key: 課題IDまたは課題キー
+            - expand: 合わせて取得する関連情報のリスト
+            - max_bytes, max_tokens: レスポンスの大きさの上限
+            - cursor: 前のレスポンスの continuation.cursor
 
     Returns:
-        課題情報
+        課題情報（expand を指定した場合は関連情報を含む）。
+        上限を超える場合は詳細・コメント・子課題を区切り、continuation に続きのカーソルを含める
     """
     issue_id_or_key = params.get("issue_id_or_key")
     if not issue_id_or_key:
         raise ValueError("issue_id_or_key is required")
 
+    budget = budget_bytes(params.get("max_bytes"), params.get("max_tokens"))
+    if params.get("cursor"):
+        return continue_result("issue", params["cursor"], budget)[0]
+
     issue_service = get_issue_service()
-    issue = issue_service.get_issue(issue_id_or_key)
+    issue = issue_service.get_issue(issue_id_or_key, expand=params.get("expand"))
 
     if issue is None:
         raise ValueError(f"Issue with ID or key {issue_id_or_key} not found")
 
-    return issue
+    return budget_issue(issue, budget) if budget else issue
 
 
 # 課題を作成するMCPツール
@@ -443,6 +1146,25 @@ get_issue_comments_tool = Tool(
                 "minimum": 1,
                 "maximum": 100,
             },
+            "since_comment_id": {
+                "type": "integer",
+                "description": "このIDより新しいコメントをID昇順で取得（0の場合は最初から）。"
+                "前回取得した最後のコメントIDを指定すると続きを取得できる",
+                "minimum": 0,
+            },
+            "compact": {
+                "type": "boolean",
+                "description": "投稿者を entities にまとめ、行ではIDで参照するコンパクト形式で返す",
+                "default": False,
+            },
+            **TABLE_PROPERTIES,
+            **PAGE_PROPERTIES,
+            **BUDGET_PROPERTIES,
+            "cursor": {
+                "type": "string",
+                "description": "前のレスポンスの continuation.cursor（Backlogに問い合わせずに続きを返す）"
+                "または next_cursor（次のページを返す）",
+            },
         },
         "required": ["issue_id_or_key"],
     },
@@ -450,7 +1172,9 @@ get_issue_comments_tool = Tool(
 
 
 # @get_issue_comments_tool.handler
-async def get_issue_comments_handler(params: Dict[str, Any]) -> List[Dict[str, Any]]:
+async def get_issue_comments_handler(
+    params: Dict[str, Any]
+) -> Union[List[Dict[str, Any]], Dict[str, Any], str]:
     """
     課題のコメント一覧を取得するMCPツールのハンドラー
 
@@ -458,20 +1182,74 @@ async def get_issue_comments_handler(params: Dict[str, Any]) -> List[Dict[str, A
         params: パラメータ
             - issue_id_or_key: 課題IDまたは課題キー
             - count: 取得件数（1-100）
+            - since_comment_id: このIDより新しいコメントをID昇順で取得
+            - compact: コンパクト形式で返すかどうか
+            - format: 表形式で返す場合の形式（csv, tsv, markdown）
+            - columns: 表形式の列
+            - max_bytes, max_tokens: レスポンスの大きさの上限
+            - paginate: items と next_cursor で返すかどうか
+            - cursor: 前のレスポンスの continuation.cursor または next_cursor
 
     Returns:
-        コメント一覧
+        コメント一覧（compact の場合は items と entities、format を指定した場合は表。
+        paginate・cursor を指定した場合とコンパクト形式では next_cursor を含む）。
+        上限を指定した場合は comments と next_cursor、続きがあれば continuation
     """
     issue_id_or_key = params.get("issue_id_or_key")
     count = params.get("count", 20)
+    since_comment_id = params.get("since_comment_id")
+    cursor = params.get("cursor")
 
     if not issue_id_or_key:
         raise ValueError("issue_id_or_key is required")
 
-    issue_service = get_issue_service()
-    return issue_service.get_issue_comments(
-        issue_id_or_key=issue_id_or_key, count=count
+    budget = budget_bytes(params.get("max_bytes"), params.get("max_tokens"))
+    options: Dict[str, Any] = {key: params.get(key) for key in ("compact", "format", "columns")}
+    if cursor and is_continuation_cursor(cursor):
+        page, options = continue_result("comments", cursor, budget)
+    else:
+        if cursor:
+            state = read_page_cursor("comments", cursor, issue=issue_id_or_key)
+        else:
+            state = {"issue": issue_id_or_key, "count": count}
+            if since_comment_id is not None:
+                state["min_id"] = since_comment_id
+        issue_service = get_issue_service()
+        comments = issue_service.get_issue_comments(
+            issue_id_or_key=state["issue"],
+            count=state["count"],
+            since_comment_id=state.get("min_id"),
+            before_comment_id=state.get("max_id"),
+        )
+        next_cursor = None
+        if comments and len(comments) >= state["count"]:
+            # 昇順の場合はより新しいコメント、降順の場合はより古いコメントを次のページにする
+            bound = "min_id" if "min_id" in state else "max_id"
+            next_cursor = page_cursor("comments", **{**state, bound: comments[-1]["id"]})
+        if not budget:
+            return with_next_cursor(
+                format_items(
+                    comments,
+                    COMMENT_COLUMNS,
+                    bool(options.get("compact")),
+                    options.get("format"),
+                    options.get("columns"),
+                ),
+                next_cursor,
+                wrap=bool(params.get("paginate") or cursor),
+            )
+        options["next_cursor"] = next_cursor
+        page = budget_comments(comments, budget, options)
+
+    page["comments"] = format_items(
+        page.get("comments", []),
+        COMMENT_COLUMNS,
+        bool(options.get("compact")),
+        options.get("format"),
+        options.get("columns"),
     )
+    page["next_cursor"] = options.get("next_cursor")
+    return page
 
 
 # 課題種別一覧を取得するMCPツール
@@ -97,6 +97,73 @@ async def get_project_handler(params: Dict[str, Any]) -> Optional[Dict[str, Any]
     return project
 
 
+# プロジェクトのコンテキストを取得するMCPツール
+get_project_context_tool = Tool(
+    name="get_project_context",
+    description="課題の作成・検索に必要なプロジェクトのステータス・種別・カテゴリー・マイルストーン・"
+    "発生バージョン・参加ユーザー・優先度を1回でまとめて取得します",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "project_key": {"type": "string", "description": "プロジェクトキー"},
+            "sections": {
+                "type": "array",
+                "items": {
+                    "type": "string",
+                    "enum": [
+                        "statuses",
+                        "issue_types",
+                        "categories",
+                        "milestones",
+                        "versions",
+                        "users",
+                        "priorities",
+                    ],
+                },
+                "description": "取得する項目（指定しない場合はすべて）",
+            },
+            "include_archived": {
+                "type": "boolean",
+                "description": "アーカイブ済みのマイルストーン・発生バージョンを含めるかどうか",
+                "default": False,
+            },
+        },
+        "required": ["project_key"],
+    },
+)
+
+
+# @get_project_context_tool.handler
+async def get_project_context_handler(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    プロジェクトのコンテキストを取得するMCPツールのハンドラー
+
+    Args:
+        params: パラメータ
+            - project_key: プロジェクトキー
+            - sections: 取得する項目
+            - include_archived: アーカイブ済みのマイルストーン・発生バージョンを含めるかどうか
+
+    Returns:
+        プロジェクトのコンテキスト
+    """
+    project_key = params.get("project_key")
+    if not project_key:
+        raise ValueError("project_key is required")
+
+    project_service = get_project_service()
+    context = project_service.get_project_context(
+        project_key,
+        sections=params.get("sections"),
+        include_archived=params.get("include_archived", False),
+    )
+
+    if context is None:
+        raise ValueError(f"Project with key {project_key} not found")
+
+    return context
+
+
 # プロジェクト一覧リソース
 projects_resource = {
     "uri": "projects",
@@ -0,0 +1,795 @@
+"""
+APIエンドポイントとMCPツールで共通のレスポンスの整形
+"""
+
+import base64
+import binascii
+import csv
+import hashlib
+import hmac
+import io
+import json
+import os
+import re
+import secrets
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, overload
+
+from app.application.services.issue_service import (
+    DATE_PATTERN,
+    ISSUE_SORT_PATTERN,
+    MULTI_PROJECT_SORT_KEYS,
+)
+from app.core.config import settings
+from app.infrastructure.backlog.result_cache import result_cache
+
+# 一覧の各行で参照される項目: 課題・コメントの属性 -> 参照先の表
+_ENTITY_FIELDS = {
+    "createdUser": "users",
+    "updatedUser": "users",
+    "assignee": "users",
+    "status": "statuses",
+    "priority": "priorities",
+    "issueType": "issue_types",
+    "resolution": "resolutions",
+    "category": "categories",
+    "milestone": "milestones",
+    "versions": "versions",
+}
+
+
+def _compact_value(value: Any) -> bool:
+    """コンパクト形式で省略しない値かどうか"""
+    return value is not None and value != [] and value != ""
+
+
+def normalize_entities(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    一覧をコンパクト形式に変換
+
+    各行に繰り返し含まれるユーザー・ステータス・優先度・種別などは entities の表に1回だけ含め、
+    行ではIDで参照する。値のない項目（None・空のリスト・空文字列）は行から省略する
+
+    Args:
+        items: 課題またはコメントの一覧
+
+    Returns:
+        コンパクト形式の一覧（items: IDで参照する行, entities: 表の名前ごとの {ID: 内容}）
+    """
+    entities: Dict[str, Dict[str, Any]] = {}
+
+    def reference(table: str, entity: Any) -> Any:
+        if not isinstance(entity, dict) or entity.get("id") is None:
+            return entity
+        entities.setdefault(table, {}).setdefault(
+            str(entity["id"]),
+            {key: value for key, value in entity.items() if key != "id" and _compact_value(value)},
+        )
+        return entity["id"]
+
+    rows = []
+    for item in items:
+        row = {}
+        for key, value in item.items():
+            if not _compact_value(value):
+                continue
+            table = _ENTITY_FIELDS.get(key)
+            if table is None:
+                row[key] = value
+            elif isinstance(value, list):
+                row[key] = [reference(table, entity) for entity in value]
+            else:
+                row[key] = reference(table, value)
+        rows.append(row)
+    return {"items": rows, "entities": entities}
+
+
+# 表形式で返す場合の形式
+TABLE_FORMATS = ("csv", "tsv", "markdown")
+
+# 表形式の既定の列（"status.name" のようにドットで属性をたどる）
+ISSUE_COLUMNS = [
+    "issueKey",
+    "summary",
+    "status.name",
+    "priority.name",
+    "assignee.name",
+    "dueDate",
+    "updated",
+]
+COMMENT_COLUMNS = ["id", "createdUser.name", "created", "content"]
+SEARCH_COLUMNS = [
+    "issue.issueKey",
+    "issue.summary",
+    "issue.status.name",
+    "issue.assignee.name",
+    "score",
+    "snippet",
+]
+
+_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "tsv": "text/tab-separated-values; charset=utf-8",
+    "markdown": "text/markdown; charset=utf-8",
+}
+
+
+def parse_columns(values: Optional[Union[str, List[str]]]) -> List[str]:
+    """
+    列の指定（複数指定またはカンマ区切り）を列のリストに変換
+
+    Args:
+        values: 列の指定
+
+    Returns:
+        列のリスト
+    """
+    if isinstance(values, str):
+        values = [values]
+    return [
+        column.strip() for value in values or [] for column in value.split(",") if column.strip()
+    ]
+
+
+def _cell(item: Dict[str, Any], path: str) -> str:
+    """属性をドット区切りでたどった値を文字列にする（リストはカンマ区切り）"""
+    values: List[Any] = [item]
+    for key in path.split("."):
+        next_values: List[Any] = []
+        for value in values:
+            value = value.get(key) if isinstance(value, dict) else None
+            if isinstance(value, list):
+                next_values.extend(value)
+            elif value is not None:
+                next_values.append(value)
+        values = next_values
+    return ", ".join(
+        str(value).lower() if isinstance(value, bool) else str(value)
+        for value in values
+        if not isinstance(value, (dict, list))
+    )
+
+
+def format_table(items: List[Dict[str, Any]], columns: List[str], table_format: str) -> str:
+    """
+    一覧を表形式の文字列に変換
+
+    Args:
+        items: 課題またはコメントの一覧
+        columns: 列（ドット区切りの属性のパス）
+        table_format: 形式（csv, tsv, markdown）
+
+    Returns:
+        見出し行付きの表
+
+    Raises:
+        ValueError: 形式が不正な場合や、列を指定しなかった場合
+    """
+    if table_format not in TABLE_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(TABLE_FORMATS)}")
+    if not columns:
+        raise ValueError("At least one column is required")
+    rows = [[_cell(item, column) for column in columns] for item in items]
+
+    if table_format == "markdown":
+
+        def escape(text: str) -> str:
+            text = text.replace("\\", "\\\\").replace("|", "\\|")
+            return text.replace("\r\n", "<br>").replace("\n", "<br>")
+
+        lines = [
+            "| " + " | ".join(escape(column) for column in columns) + " |",
+            "|" + "|".join("---" for _ in columns) + "|",
+        ]
+        lines.extend("| " + " | ".join(escape(cell) for cell in row) + " |" for row in rows)
+        return "\n".join(lines) + "\n"
+
+    output = io.StringIO()
+    writer = csv.writer(
+        output, delimiter="\t" if table_format == "tsv" else ",", lineterminator="\n"
+    )
+    writer.writerow(columns)
+    writer.writerows(rows)
+    return output.getvalue()
+
+
+def format_items(
+    items: List[Dict[str, Any]],
+    default_columns: List[str],
+    compact: bool = False,
+    table_format: Optional[str] = None,
+    columns: Optional[Union[str, List[str]]] = None,
+) -> Union[List[Dict[str, Any]], Dict[str, Any], str]:
+    """
+    一覧を指定された形式に変換
+
+    Args:
+        items: 課題またはコメントの一覧
+        default_columns: 表形式の既定の列
+        compact: コンパクト形式にするかどうか
+        table_format: 表形式の形式（csv, tsv, markdown、指定した場合は compact より優先）
+        columns: 表形式の列
+
+    Returns:
+        一覧（compact の場合は items と entities、table_format を指定した場合は表）
+    """
+    if table_format:
+        return format_table(items, parse_columns(columns) or default_columns, table_format)
+    return normalize_entities(items) if compact else items
+
+
+def table_media_type(table_format: str) -> str:
+    """
+    表形式のContent-Type
+
+    Args:
+        table_format: 形式（csv, tsv, markdown）
+
+    Returns:
+        Content-Type
+    """
+    return _MEDIA_TYPES[table_format]
+
+
+# トークン数からバイト数への換算（日本語の1文字は3バイトで、おおむね1トークン以上になる）
+BYTES_PER_TOKEN = 3
+# レスポンスの予算の下限（バイト）
+MIN_BUDGET_BYTES = 512
+
+# 続きを読み出すカーソルのために残しておくバイト数
+_CONTINUATION_BYTES = 200
+# 予算に合わせて途中で区切る本文の属性
+_TEXT_FIELDS = ("content", "description")
+# 続きのページで項目を識別するために含める属性
+_IDENTITY_FIELDS = ("id", "issueKey")
+# 課題のうち予算に合わせて区切る属性（この順に詰める）
+_ISSUE_SECTIONS = ("description", "comments", "children")
+
+# ページの位置: (セクションの番号, リストの項目の番号, 本文の文字の位置)
+Position = Tuple[int, int, int]
+
+
+def budget_bytes(
+    max_bytes: Optional[int] = None, max_tokens: Optional[int] = None
+) -> Optional[int]:
+    """
+    レスポンスの予算をバイト数で求める
+
+    Args:
+        max_bytes: 予算（バイト）
+        max_tokens: 予算（トークン、BYTES_PER_TOKEN バイトとして換算）
+
+    Returns:
+        予算（両方指定した場合は小さい方）。指定しない場合はNone
+
+    Raises:
+        ValueError: 予算が MIN_BUDGET_BYTES より小さい場合
+    """
+    budgets = []
+    if max_bytes is not None:
+        budgets.append(max_bytes)
+    if max_tokens is not None:
+        budgets.append(max_tokens * BYTES_PER_TOKEN)
+    if not budgets:
+        return None
+    budget = min(budgets)
+    if budget < MIN_BUDGET_BYTES:
+        raise ValueError(f"The response budget must be at least {MIN_BUDGET_BYTES} bytes")
+    return budget
+
+
+# カーソルの署名の鍵（CURSOR_SECRET、BacklogのAPIキーの順に使い、どちらもない場合はプロセスごとに作成）
+_CURSOR_KEY = (
+    settings.CURSOR_SECRET or os.getenv("BACKLOG_API_KEY") or secrets.token_hex(32)
+).encode()
+# カーソルの署名の長さ（バイト）
+_CURSOR_SIGNATURE_BYTES = 16
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _cursor_signature(payload: str) -> str:
+    digest = hmac.new(_CURSOR_KEY, payload.encode(), hashlib.sha256).digest()
+    return _b64encode(digest[:_CURSOR_SIGNATURE_BYTES])
+
+
+def encode_cursor(data: Dict[str, Any]) -> str:
+    """
+    カーソルの内容を署名付きの不透明な文字列に変換
+
+    Args:
+        data: カーソルの内容
+
+    Returns:
+        URLにそのまま含められるカーソル
+    """
+    raw = json.dumps(data, separators=(",", ":"), sort_keys=True).encode()
+    payload = _b64encode(raw)
+    return f"{payload}.{_cursor_signature(payload)}"
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    カーソルの署名を検証して内容を取り出す
+
+    Args:
+        cursor: encode_cursor で作成したカーソル
+
+    Returns:
+        カーソルの内容
+
+    Raises:
+        ValueError: カーソルが不正な場合や、署名が一致しない場合
+    """
+    payload, _, signature = cursor.partition(".")
+    if not hmac.compare_digest(signature.encode(), _cursor_signature(payload).encode()):
+        raise ValueError("Invalid cursor")
+    try:
+        data = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(data, dict):
+        raise ValueError("Invalid cursor")
+    return data
+
+
+def _is_int(
+    minimum: Optional[int] = None, maximum: Optional[int] = None
+) -> Callable[[Any], bool]:
+    return lambda value: (
+        isinstance(value, int)
+        and not isinstance(value, bool)
+        and (minimum is None or value >= minimum)
+        and (maximum is None or value <= maximum)
+    )
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0
+
+
+def _is_text(value: Any) -> bool:
+    return isinstance(value, str) and bool(value)
+
+
+def _matches(pattern: str) -> Callable[[Any], bool]:
+    return lambda value: isinstance(value, str) and re.match(pattern, value) is not None
+
+
+def _is_one_of(*choices: str) -> Callable[[Any], bool]:
+    return lambda value: value in choices
+
+
+def _is_list(is_item: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    return lambda value: isinstance(value, list) and all(is_item(item) for item in value)
+
+
+def _is_optional(is_value: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    return lambda value: value is None or is_value(value)
+
+
+_is_id = _is_int(0)
+_is_date = _matches(DATE_PATTERN)
+_is_order = _is_one_of("asc", "desc")
+
+# 複数プロジェクトの検索の絞り込み条件: 属性 -> 値の検証
+_ACROSS_PROJECTS_FILTERS: Dict[str, Callable[[Any], bool]] = {
+    "keyword": _is_text,
+    "status_id": _is_list(_is_id),
+    "assignee_id": _is_list(_is_id),
+    "priority_id": _is_list(_is_id),
+    "parent_child": _is_int(0, 4),
+    **{
+        f"{name}_{bound}": _is_date
+        for name in ("created", "updated", "due_date")
+        for bound in ("since", "until")
+    },
+}
+
+
+def _is_filters(value: Any) -> bool:
+    return isinstance(value, dict) and all(
+        key in _ACROSS_PROJECTS_FILTERS and _ACROSS_PROJECTS_FILTERS[key](item)
+        for key, item in value.items()
+    )
+
+
+# 一覧の種類ごとのカーソルの属性: 属性 -> (必須かどうか, 値の検証)。クエリパラメータと同じ制約で検証する
+_PAGE_CURSOR_FIELDS: Dict[str, Dict[str, Tuple[bool, Callable[[Any], bool]]]] = {
+    "issues": {
+        "project_id": (False, _is_id),
+        "keyword": (False, _is_text),
+        "count": (True, _is_int(1, 100)),
+        "max_staleness": (False, _is_number),
+        "assignee_id": (False, _is_id),
+        **{
+            name: (False, _is_list(_is_id))
+            for name in (
+                "status_id",
+                "issue_type_id",
+                "category_id",
+                "milestone_id",
+                "version_id",
+                "priority_id",
+                "created_user_id",
+                "parent_issue_id",
+            )
+        },
+        "parent_child": (False, _is_int(0, 4)),
+        **{
+            f"{name}_{bound}": (False, _is_date)
+            for name in ("created", "updated", "start_date", "due_date")
+            for bound in ("since", "until")
+        },
+        "sort": (False, _matches(ISSUE_SORT_PATTERN)),
+        "order": (False, _is_order),
+        "offset": (True, _is_id),
+    },
+    "search": {
+        "query": (True, _is_text),
+        "project_id": (False, _is_id),
+        "count": (True, _is_int(1, 100)),
+        "max_staleness": (False, _is_number),
+        "offset": (True, _is_id),
+    },
+    "across_projects": {
+        "projects": (True, _is_list(lambda value: _is_id(value) or _is_text(value))),
+        "limit": (True, _is_int(1, 1000)),
+        "sort": (True, _is_one_of(*MULTI_PROJECT_SORT_KEYS)),
+        "order": (True, _is_order),
+        "filters": (True, _is_filters),
+        "offsets": (True, _is_list(_is_id)),
+    },
+    "query": {
+        "q": (True, _is_text),
+        "project_id": (True, _is_optional(_is_id)),
+        "limit": (True, _is_int(1, 500)),
+        "offset": (True, _is_id),
+    },
+    "comments": {
+        "issue": (True, _is_text),
+        "count": (True, _is_int(1, 100)),
+        "min_id": (False, _is_id),
+        "max_id": (False, _is_id),
+    },
+}
+
+
+def page_cursor(kind: str, **state: Any) -> str:
+    """
+    一覧の次のページを取得するカーソルを作成
+
+    Args:
+        kind: 一覧の種類（issues, comments, search, across_projects, query）
+        state: 次のページを取得する条件（絞り込み・並び替えの条件と取得開始位置）
+
+    Returns:
+        カーソル
+    """
+    return encode_cursor({"kind": kind, **state})
+
+
+def read_page_cursor(kind: str, cursor: str, **expected: Any) -> Dict[str, Any]:
+    """
+    一覧の次のページを取得する条件をカーソルから取り出す
+
+    条件はクエリパラメータと同じ制約で検証し、一覧の種類にない属性を含むカーソルは受け付けない
+
+    Args:
+        kind: 一覧の種類
+        cursor: page_cursor で作成したカーソル
+        expected: カーソルの条件と一致する必要がある値（コメント一覧の issue など）
+
+    Returns:
+        次のページを取得する条件
+
+    Raises:
+        ValueError: カーソルが不正な場合や、種類の異なる一覧のカーソルの場合、
+            expected と条件が一致しない場合
+    """
+    state = decode_cursor(cursor)
+    if state.pop("kind", None) != kind:
+        raise ValueError(f"The cursor is not for {kind}")
+    fields = _PAGE_CURSOR_FIELDS[kind]
+    for name, (required, is_valid) in fields.items():
+        if name in state:
+            if not is_valid(state[name]):
+                raise ValueError(f"Invalid cursor: {name}")
+        elif required:
+            raise ValueError(f"Invalid cursor: {name} is missing")
+    unknown = sorted(set(state) - set(fields))
+    if unknown:
+        raise ValueError(f"Invalid cursor: {', '.join(unknown)}")
+    for name, value in expected.items():
+        if state[name] != value:
+            raise ValueError(f"The cursor is not for this {name}")
+    return state
+
+
+def is_continuation_cursor(cursor: str) -> bool:
+    """
+    予算に収まらなかったレスポンスの続きを取得するカーソルかどうか
+
+    Args:
+        cursor: カーソル
+
+    Returns:
+        continuation のカーソルの場合はTrue（一覧の次のページのカーソルの場合はFalse）
+
+    Raises:
+        ValueError: カーソルが不正な場合
+    """
+    return "key" in decode_cursor(cursor)
+
+
+@overload
+def with_next_cursor(
+    result: Dict[str, Any], next_cursor: Optional[str], wrap: bool = False
+) -> Dict[str, Any]: ...
+
+
+@overload
+def with_next_cursor(
+    result: List[Dict[str, Any]], next_cursor: Optional[str], wrap: bool = False
+) -> Union[List[Dict[str, Any]], Dict[str, Any]]: ...
+
+
+@overload
+def with_next_cursor(
+    result: str, next_cursor: Optional[str], wrap: bool = False
+) -> Union[str, Dict[str, Any]]: ...
+
+
+def with_next_cursor(
+    result: Union[List[Dict[str, Any]], Dict[str, Any], str],
+    next_cursor: Optional[str],
+    wrap: bool = False,
+) -> Union[List[Dict[str, Any]], Dict[str, Any], str]:
+    """
+    一覧に次のページのカーソルを付ける
+
+    Args:
+        result: 一覧（コンパクト形式などの辞書には next_cursor を追加する）
+        next_cursor: 次のページのカーソル（最後のページの場合はNone）
+        wrap: リストや表を items と next_cursor の辞書にするかどうか
+
+    Returns:
+        カーソルを付けた一覧
+    """
+    if isinstance(result, dict):
+        return {**result, "next_cursor": next_cursor}
+    if wrap:
+        return {"items": result, "next_cursor": next_cursor}
+    return result
+
+
+def _json_size(value: Any) -> int:
+    """JSONにした場合のバイト数"""
+    return len(json.dumps(value, ensure_ascii=False).encode())
+
+
+def _text_field(item: Dict[str, Any]) -> Optional[str]:
+    """項目の本文の属性（本文が空の場合はNone）"""
+    return next(
+        (field for field in _TEXT_FIELDS if isinstance(item.get(field), str) and item[field]), None
+    )
+
+
+def _identity(item: Dict[str, Any]) -> Dict[str, Any]:
+    """続きのページで項目を識別する属性"""
+    return {field: item[field] for field in _IDENTITY_FIELDS if field in item}
+
+
+def _fit_text(text: str, fits: Callable[[str], bool]) -> int:
+    """fits(text[:n]) を満たす最大の n"""
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if fits(text[:middle]):
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def paginate_to_budget(
+    head: Dict[str, Any],
+    sections: List[Tuple[str, Any]],
+    budget: int,
+    position: Position = (0, 0, 0),
+) -> Tuple[Dict[str, Any], Optional[Position], List[str]]:
+    """
+    予算に収まる範囲のページを作成
+
+    head のあとに sections（名前と、本文またはリスト）を順に詰める。予算を超える本文は文字の境界で、
+    リストは項目の境界で区切り、1件も収まらない項目は本文の途中で区切る。
+    予算を超える場合でも1ページに1文字または1件は含め、ページごとに必ず先へ進める
+
+    Args:
+        head: ページの先頭に含める属性
+        sections: 予算に合わせて区切る (名前, 本文またはリスト) のリスト
+        budget: JSONにした場合のページのバイト数の上限
+        position: ページを始める位置
+
+    Returns:
+        (ページ, 続きの位置（最後まで収まった場合はNone）, 続きがあるセクションの名前)
+    """
+    page = dict(head)
+    used = _json_size(page)
+    section, index, offset = position
+    empty = True
+
+    while section < len(sections):
+        name, value = sections[section]
+        # "name": の分
+        base = used + (2 if page else 0) + _json_size(name) + 2
+
+        if isinstance(value, str):
+            text = value[offset:]
+            if base + _json_size(text) <= budget:
+                page[name] = text
+                used = base + _json_size(text)
+                empty = empty and not text
+                section, index, offset = section + 1, 0, 0
+                continue
+            length = _fit_text(text, lambda part: base + _json_size(part) <= budget)
+            if length or empty:
+                page[name] = text[: max(length, 1)]
+                offset += max(length, 1)
+            break
+
+        items: List[Dict[str, Any]] = []
+        # [] の分
+        list_used = base + 2
+        complete = True
+        while index < len(value):
+            original = value[index]
+            field = _text_field(original)
+            item = original
+            if offset and field:
+                item = {**_identity(original), field: original[field][offset:]}
+            separator = 2 if items else 0
+            size = _json_size(item)
+            if list_used + separator + size <= budget:
+                items.append(item)
+                list_used += separator + size
+                index, offset, empty = index + 1, 0, False
+                continue
+
+            complete = False
+            if field:
+                text = item[field]
+                # 本文を除いた項目の分（空文字列の "" を除く）
+                rest = list_used + separator + _json_size({**item, field: ""}) - 2
+                length = _fit_text(text, lambda part: rest + _json_size(part) <= budget)
+                if length or empty:
+                    length = max(length, 1)
+                    items.append({**item, field: text[:length]})
+                    offset, empty = offset + length, False
+            elif empty:
+                items.append(item)
+                index, offset, empty = index + 1, 0, False
+            break
+
+        if items or complete:
+            page[name] = items
+            used = list_used
+        if not complete:
+            break
+        section, index, offset = section + 1, 0, 0
+
+    if section >= len(sections):
+        return page, None, []
+    return page, (section, index, offset), [name for name, _ in sections[section:]]
+
+
+def _page_result(
+    kind: str,
+    head: Dict[str, Any],
+    sections: List[Tuple[str, Any]],
+    budget: int,
+    options: Dict[str, Any],
+    position: Position = (0, 0, 0),
+    key: Optional[str] = None,
+) -> Dict[str, Any]:
+    """ページを作成し、続きがある場合は結果をキャッシュしてカーソルを付ける"""
+    page, next_position, truncated = paginate_to_budget(
+        head, sections, budget - _CONTINUATION_BYTES, position
+    )
+    if next_position is not None:
+        if key is None:
+            key = result_cache.put(
+                {
+                    "kind": kind,
+                    "head": _identity(head),
+                    "sections": sections,
+                    "budget": budget,
+                    "options": options,
+                }
+            )
+        page["continuation"] = {
+            "cursor": encode_cursor({"key": key, "position": list(next_position)}),
+            "truncated": truncated,
+        }
+    return page
+
+
+def budget_issue(issue: Dict[str, Any], budget: int) -> Dict[str, Any]:
+    """
+    課題を予算に収まるように区切る
+
+    詳細・コメント・子課題の順に詰め、収まらなかった続きは continuation のカーソルで取得する
+
+    Args:
+        issue: 課題情報（expand で取得したコメント・子課題を含む）
+        budget: 予算（バイト）
+
+    Returns:
+        予算に収まる課題情報（続きがある場合は continuation に cursor と区切った属性）
+    """
+    sections = [
+        (name, issue[name]) for name in _ISSUE_SECTIONS if isinstance(issue.get(name), (str, list))
+    ]
+    head = {key: value for key, value in issue.items() if key not in dict(sections)}
+    return _page_result("issue", head, sections, budget, {})
+
+
+def budget_comments(
+    comments: List[Dict[str, Any]], budget: int, options: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    コメント一覧を予算に収まるように区切る
+
+    Args:
+        comments: コメント一覧
+        budget: 予算（バイト）
+        options: 続きのページにも引き継ぐ形式の指定（compact, format, columns）
+
+    Returns:
+        予算に収まるコメント一覧（comments、続きがある場合は continuation）
+    """
+    return _page_result("comments", {}, [("comments", comments)], budget, options or {})
+
+
+def continue_result(
+    kind: str, cursor: str, budget: Optional[int] = None
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    カーソルが指す続きのページを、キャッシュした結果から作成
+
+    Args:
+        kind: 結果の種類（issue または comments）
+        cursor: 前のページの continuation のカーソル
+        budget: 予算（バイト、指定しない場合は最初のページと同じ）
+
+    Returns:
+        (続きのページ, 最初のページで指定した形式の指定)
+
+    Raises:
+        ValueError: カーソルが不正な場合や、結果の保持期間を過ぎた場合
+    """
+    data = decode_cursor(cursor)
+    position = data.get("position")
+    if not (
+        isinstance(data.get("key"), str)
+        and isinstance(position, list)
+        and len(position) == 3
+        and all(isinstance(value, int) and value >= 0 for value in position)
+    ):
+        raise ValueError("Invalid cursor")
+    state = result_cache.get(data["key"])
+    if state is None:
+        raise ValueError("The cursor has expired. Please fetch the result again")
+    if state["kind"] != kind:
+        raise ValueError(f"The cursor is not for {kind}")
+    page = _page_result(
+        kind,
+        state["head"],
+        state["sections"],
+        budget or state["budget"],
+        state["options"],
+        (position[0], position[1], position[2]),
+        key=data["key"],
+    )
+    return page, state["options"]
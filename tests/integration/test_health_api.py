@@ -0,0 +1,25 @@
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.infrastructure.backlog.circuit_breaker import CircuitBreaker
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_health_reports_circuit_breaker_state():
+    """サーキットブレーカーが開いている場合、ヘルスチェックが degraded を返すことをテストします。"""
+    breaker = CircuitBreaker(minimum_calls=1, window_size=1)
+    with patch("app.main.get_circuit_breaker", return_value=breaker):
+        response = client.get("/health")
+        assert response.status_code == 200
+        assert response.json()["status"] == "ok"
+
+        breaker.record(False, 0.1)
+        response = client.get("/health")
+        assert response.json()["status"] == "degraded"
+        assert response.json()["circuit_breaker"]["state"] == "open"
+
+        response = client.get("/metrics")
+        assert response.json()["circuit_breaker"]["opened_count"] == 1
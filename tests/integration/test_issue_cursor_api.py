@@ -0,0 +1,64 @@
+"""
+課題一覧のカーソルによるページングの結合テスト
+"""
+
+from typing import Any, Dict, Generator, List
+from unittest.mock import Mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.application.services.issue_service import IssueService
+from app.infrastructure.mirror.issue_mirror import IssueMirror
+from app.main import app
+from app.presentation.api.issue_router import NEXT_CURSOR_HEADER, get_issue_service
+from tests.mock_data import make_issue
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def backlog_client() -> Generator[Mock, None, None]:
+    """ミラーに同期する課題を返すBacklogクライアント"""
+    backlog_client = Mock()
+    backlog_client.space = "dummy_space"
+    backlog_client.get_issues_page.return_value = [
+        make_issue(i, updated=f"2024-01-{i:02d}T00:00:00Z") for i in range(1, 6)
+    ]
+    issue_service = IssueService(backlog_client=backlog_client, mirror=IssueMirror())
+    app.dependency_overrides[get_issue_service] = lambda: issue_service
+    yield backlog_client
+    app.dependency_overrides.pop(get_issue_service, None)
+
+
+def fetch_all(params: Dict[str, Any]) -> List[int]:
+    """X-Next-Cursor をたどって最後のページまで取得した課題ID"""
+    response = client.get("/api/issues/", params=params)
+    ids: List[int] = []
+    while True:
+        assert response.status_code == 200
+        body = response.json()
+        # カーソルを指定したページは items と next_cursor の辞書で返る
+        ids.extend(issue["id"] for issue in (body["items"] if isinstance(body, dict) else body))
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            return ids
+        response = client.get("/api/issues/", params={"cursor": cursor})
+
+
+def test_cursor_pages_come_from_mirror(backlog_client: Mock) -> None:
+    """max_staleness を指定した場合は次のページもミラーから取得し、重複も欠落もないことをテストします。"""
+    ids = fetch_all({"project_id": 1, "count": 2, "max_staleness": 600})
+
+    assert ids == [5, 4, 3, 2, 1]
+    backlog_client.get_issues.assert_not_called()
+
+
+def test_cursor_pages_keep_order_when_sync_fails(backlog_client: Mock) -> None:
+    """同期に失敗してBacklogから取得する場合も、ミラーと同じ並び順で取得することをテストします。"""
+    backlog_client.get_issues_page.side_effect = Exception("API Error")
+    backlog_client.get_issues.return_value = []
+
+    assert fetch_all({"project_id": 1, "count": 2, "max_staleness": 600}) == []
+    assert backlog_client.get_issues.call_args.kwargs["sort"] == "updated"
+    assert backlog_client.get_issues.call_args.kwargs["order"] == "desc"
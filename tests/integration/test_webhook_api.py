@@ -0,0 +1,72 @@
+from unittest.mock import Mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+from app.presentation.api.webhook_router import get_change_event_service
+
+client = TestClient(app)
+
+PAYLOAD = {
+    "id": 100,
+    "type": 2,
+    "project": {"id": 1, "projectKey": "TEST", "name": "テスト"},
+    "content": {"id": 5, "key_id": 5, "summary": "件名"},
+    "createdUser": {"id": 1},
+}
+
+
+@pytest.fixture
+def change_event_service(monkeypatch):
+    monkeypatch.setattr(settings, "BACKLOG_WEBHOOK_TOKEN", "secret")
+    service = Mock()
+    service.apply.return_value = {"id": 100, "type": 2, "actions": []}
+    app.dependency_overrides[get_change_event_service] = lambda: service
+    yield service
+    app.dependency_overrides.pop(get_change_event_service, None)
+
+
+def test_webhook_applies_payload(change_event_service):
+    """Webhookのペイロードを更新通知として反映することをテストします。"""
+    response = client.post("/api/webhooks/backlog?token=secret", json=PAYLOAD)
+    assert response.status_code == 200
+    event = change_event_service.apply.call_args.args[0]
+    assert event["type"] == 2
+    assert event["project"]["projectKey"] == "TEST"
+    assert event["content"]["id"] == 5
+
+
+def test_webhook_rejects_invalid_payload(change_event_service):
+    """必須項目のないペイロードを拒否することをテストします。"""
+    response = client.post("/api/webhooks/backlog?token=secret", json={"type": 2})
+    assert response.status_code == 422
+    change_event_service.apply.assert_not_called()
+
+
+def test_webhook_verifies_token(change_event_service):
+    """トークンが一致しないリクエストを拒否することをテストします。"""
+    assert client.post("/api/webhooks/backlog", json=PAYLOAD).status_code == 401
+    assert client.post("/api/webhooks/backlog?token=wrong", json=PAYLOAD).status_code == 401
+    assert client.post("/api/webhooks/backlog?token=secret", json=PAYLOAD).status_code == 200
+
+
+def test_webhook_rejected_without_configured_token(change_event_service, monkeypatch):
+    """トークンを設定していない場合、Webhookを受け付けないことをテストします。"""
+    monkeypatch.setattr(settings, "BACKLOG_WEBHOOK_TOKEN", None)
+    response = client.post("/api/webhooks/backlog", json=PAYLOAD)
+    assert response.status_code == 503
+    change_event_service.apply.assert_not_called()
+
+
+def test_webhook_allowed_in_read_only_mode(change_event_service, monkeypatch):
+    """読み取り専用モードでもWebhookを受け付けることをテストします。"""
+    monkeypatch.setattr(settings, "READ_ONLY_MODE", True)
+    response = client.post("/api/webhooks/backlog?token=secret", json=PAYLOAD)
+    assert response.status_code == 200
+
+
+def test_webhook_not_exposed_in_schema():
+    """WebhookがOpenAPIスキーマ（MCPツール）に含まれないことをテストします。"""
+    assert "/api/webhooks/backlog" not in app.openapi()["paths"]
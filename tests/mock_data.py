@@ -2,7 +2,9 @@
 モックデータ
 """
 
-from typing import Any, Dict, List
+import json
+from typing import Any, Dict, List, Optional
+from unittest.mock import Mock
 
 # プロジェクト一覧のモックデータ
 MOCK_PROJECTS = [
@@ -156,3 +158,69 @@ MOCK_COMMENTS = [
         "notifications": [],
     }
 ]
+
+
+def make_issue(
+    issue_id: int,
+    summary: Optional[str] = None,
+    updated: str = "2024-01-01T00:00:00Z",
+    project_id: int = 1,
+    **fields: Any,
+) -> Dict[str, Any]:
+    """
+    テスト用の課題を作成
+
+    Args:
+        issue_id: 課題ID（課題キーは TEST-{課題ID}）
+        summary: 件名（指定しない場合は「課題{課題ID}」）
+        updated: 更新日時
+        project_id: プロジェクトID
+        **fields: 追加・上書きする項目
+
+    Returns:
+        課題
+    """
+    issue: Dict[str, Any] = {
+        "id": issue_id,
+        "projectId": project_id,
+        "issueKey": f"TEST-{issue_id}",
+        "summary": summary if summary is not None else f"課題{issue_id}",
+        "updated": updated,
+    }
+    issue.update(fields)
+    return issue
+
+
+class FakeClock:
+    """
+    テスト用の時計
+
+    呼び出すと now を返し、sleep で now を進める
+    """
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def make_response(body: Any, status_code: int = 200) -> Mock:
+    """
+    requests.Responseのモックを作成
+
+    Args:
+        body: JSONに変換するレスポンスの本文
+        status_code: HTTPステータスコード
+
+    Returns:
+        レスポンスのモック
+    """
+    response = Mock()
+    response.status_code = status_code
+    response.ok = status_code < 400
+    response.text = json.dumps(body)
+    return response
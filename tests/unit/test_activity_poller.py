@@ -0,0 +1,193 @@
+"""
+最近の更新のポーリングのテスト
+"""
+
+import json
+from typing import Any, Dict, Generator, List, Optional
+from unittest.mock import Mock
+
+import pytest
+
+from app.application.services.activity_poller import (
+    PAGE_SIZE,
+    ActivityPoller,
+    _poll_lock,
+    reset_activity_poller_state,
+)
+from app.application.services.change_event_service import ISSUE_DELETED, ISSUE_UPDATED
+from app.infrastructure.backlog.backlog_client_wrapper import BacklogClientWrapper
+from app.infrastructure.backlog.issue_cache import issue_cache
+from app.infrastructure.mirror.issue_mirror import IssueMirror
+from tests.mock_data import FakeClock
+
+PROJECT = {"id": 1, "projectKey": "TEST"}
+
+
+def make_activity(activity_id: int, issue_id: int, activity_type: int = ISSUE_UPDATED) -> Dict[str, Any]:
+    return {
+        "id": activity_id,
+        "type": activity_type,
+        "project": PROJECT,
+        "content": {"id": issue_id, "key_id": issue_id},
+    }
+
+
+class FakeActivityApi:
+    """minId/count/orderを解釈するアクティビティAPIの代わり"""
+
+    def __init__(self, activities: List[Dict[str, Any]]) -> None:
+        self.activities = activities
+        self.requests: List[Dict[str, Any]] = []
+
+    def __call__(
+        self,
+        project_id_or_key: Optional[str] = None,
+        min_id: Optional[int] = None,
+        count: int = 100,
+        order: str = "asc",
+    ) -> List[Dict[str, Any]]:
+        self.requests.append({"project": project_id_or_key, "min_id": min_id, "order": order})
+        activities = sorted(self.activities, key=lambda a: a["id"], reverse=order == "desc")
+        if min_id is not None:
+            activities = [a for a in activities if a["id"] >= min_id]
+        return activities[:count]
+
+
+class TestActivityPoller:
+    """最近の更新のポーリングのテストクラス"""
+
+    @pytest.fixture(autouse=True)
+    def reset_state(self) -> Generator[None, None, None]:
+        reset_activity_poller_state()
+        issue_cache.clear()
+        yield
+        reset_activity_poller_state()
+        issue_cache.clear()
+
+    def setup_method(self) -> None:
+        self.client = Mock()
+        self.client.space = "space"
+        self.api = FakeActivityApi([make_activity(10, 1)])
+        self.client.get_activities.side_effect = self.api
+        self.mirror = IssueMirror()
+        self.clock = FakeClock(1000.0)
+        self.poller = ActivityPoller(self.client, mirror=self.mirror, clock=self.clock)
+
+    def test_first_poll_records_latest_id(self) -> None:
+        """初回は最新のアクティビティIDを記録するだけで反映しないことを確認するテスト"""
+        result = self.poller.poll()
+
+        assert result["initialized"] is True
+        assert result["last_id"] == 10
+        assert self.mirror.get_activity_cursor("space", "") == 10
+        self.client.get_issue.assert_not_called()
+
+    def test_applies_new_activities(self) -> None:
+        """前回より新しいアクティビティだけを反映することを確認するテスト"""
+        self.poller.poll()
+        issue_cache.put("space", {"id": 2, "issueKey": "TEST-2", "summary": "古い件名"})
+        self.api.activities += [make_activity(11, 2), make_activity(12, 3)]
+        self.client.get_issue.side_effect = lambda key: {"id": int(key), "projectId": 1}
+
+        result = self.poller.poll()
+
+        assert result["applied"] == 2
+        assert result["last_id"] == 12
+        assert self.api.requests[-1]["min_id"] == 10
+        assert issue_cache.get("space", "TEST-2") is None
+        assert self.mirror.get_issue("space", 3) is not None
+
+    def test_refreshes_each_issue_once(self) -> None:
+        """同じ課題の複数の更新は1回だけ取得し直し、削除された課題は取得しないことを確認するテスト"""
+        self.poller.poll()
+        self.api.activities += [
+            make_activity(11, 2),
+            make_activity(12, 2),
+            make_activity(13, 3),
+            make_activity(14, 3, ISSUE_DELETED),
+        ]
+        # 削除された課題は、Backlogで見つからないことを確認するためだけに取得する
+        self.client.get_issue.side_effect = lambda key, **kwargs: (
+            None if key == "3" else {"id": int(key), "projectId": 1}
+        )
+
+        self.poller.poll()
+
+        calls = self.client.get_issue.call_args_list
+        assert [call.args for call in calls if not call.kwargs] == [("2",)]
+        assert [call.args for call in calls if call.kwargs] == [("3",)]
+
+    def test_pages_through_many_activities(self) -> None:
+        """1ページに収まらない場合はページングして取得することを確認するテスト"""
+        self.poller.poll()
+        self.api.activities += [
+            {"id": i, "type": 5, "project": PROJECT, "content": {}}
+            for i in range(11, 11 + PAGE_SIZE + 5)
+        ]
+
+        result = self.poller.poll()
+
+        assert result["applied"] == PAGE_SIZE + 5
+        assert result["has_more"] is False
+        assert result["last_id"] == 10 + PAGE_SIZE + 5
+
+    def test_uses_in_process_cursor_without_mirror(self) -> None:
+        """ミラーが無効な場合はプロセス内で反映済みのIDを共有することを確認するテスト"""
+        poller = ActivityPoller(self.client, project_key="TEST", clock=self.clock)
+        assert poller.mirror is None
+        poller.poll()
+        self.api.activities.append(make_activity(11, 2))
+
+        other = ActivityPoller(self.client, project_key="TEST", clock=self.clock)
+        assert other.poll()["applied"] == 1
+        assert self.api.requests[-1]["project"] == "TEST"
+
+    def test_poll_if_due_respects_interval(self) -> None:
+        """取得間隔を過ぎるまではポーリングしないことを確認するテスト"""
+        assert self.poller.poll_if_due(30) is not None
+        self.clock.now += 10
+        assert self.poller.poll_if_due(30) is None
+        self.clock.now += 30
+        assert self.poller.poll_if_due(30) is not None
+        assert len(self.api.requests) == 2
+
+    def test_poll_if_due_does_not_wait_for_running_poll(self) -> None:
+        """他のスレッドがポーリング中の場合は待たずにNoneを返すことを確認するテスト"""
+        lock = _poll_lock(self.poller._key)
+        with lock:
+            assert self.poller.poll_if_due(30) is None
+        assert self.api.requests == []
+        assert not lock.locked()
+
+    def test_poll_in_background_if_due(self) -> None:
+        """間隔を過ぎている場合だけ別スレッドでポーリングすることを確認するテスト"""
+        thread = self.poller.poll_in_background_if_due(30)
+        assert thread is not None
+        thread.join(timeout=5)
+
+        assert self.mirror.get_activity_cursor("space", "") == 10
+        assert self.poller.poll_in_background_if_due(30) is None
+
+    def test_poll_if_due_swallows_errors(self) -> None:
+        """取得に失敗しても例外を送出しないことを確認するテスト"""
+        self.client.get_activities.side_effect = Exception("API Error")
+        assert self.poller.poll_if_due(30) is None
+
+
+class TestGetActivities:
+    """アクティビティ取得のテストクラス"""
+
+    def test_requests_project_activities_path(self) -> None:
+        """プロジェクトの最近の更新を正しいパスで取得することを確認するテスト"""
+        client = BacklogClientWrapper(api_key="dummy_api_key", space="dummy_space")
+        response = Mock(ok=True, status_code=200, text=json.dumps([{"id": 1}]))
+        client.request_sender.send_get_request = Mock(return_value=response)
+
+        assert client.get_activities("TEST", min_id=5) == [{"id": 1}]
+        client.request_sender.send_get_request.assert_called_once_with(
+            path="projects/TEST/activities",
+            url_param={"count": 100, "order": "asc", "minId": 5},
+        )
+
+        client.get_activities()
+        assert client.request_sender.send_get_request.call_args.kwargs["path"] == "space/activities"
@@ -0,0 +1,199 @@
+"""
+課題の集計サービスのテスト
+"""
+
+import json
+from typing import Any, Dict, List
+from unittest.mock import Mock
+
+import pytest
+
+from app.application.services.aggregation_service import NONE_LABEL, AggregationService
+from app.infrastructure.backlog.backlog_client_wrapper import BacklogClientWrapper
+
+# (ステータスID, 担当者ID) ごとの課題
+ISSUES: List[Dict[str, Any]] = [
+    {"status_id": 1, "assignee_id": 10},
+    {"status_id": 1, "assignee_id": 10},
+    {"status_id": 1, "assignee_id": None},
+    {"status_id": 2, "assignee_id": 11},
+    {"status_id": 4, "assignee_id": 11},
+]
+
+
+def fake_count_issues(issues: List[Dict[str, Any]] = ISSUES, **filters: Any) -> int:
+    """絞り込み条件に一致する issues の件数を返す課題数APIの代わり"""
+
+    def matches(value: Any, values: List[int]) -> bool:
+        if isinstance(value, list):
+            return any(item in values for item in value)
+        return value in values
+
+    return sum(
+        1
+        for issue in issues
+        if all(
+            matches(issue[field], values)
+            for field, values in filters.items()
+            if field in issue and values
+        )
+    )
+
+
+class TestAggregationService:
+    """課題の集計サービスのテストクラス"""
+
+    def setup_method(self) -> None:
+        self.client = Mock()
+        self.client.count_issues.side_effect = fake_count_issues
+        self.client.get_statuses.return_value = [
+            {"id": 1, "name": "未対応"},
+            {"id": 2, "name": "処理中"},
+            {"id": 3, "name": "処理済み"},
+            {"id": 4, "name": "完了"},
+        ]
+        self.client.get_project_users.return_value = [
+            {"id": 10, "name": "田中"},
+            {"id": 11, "name": "鈴木"},
+            {"id": 12, "name": "佐藤"},
+        ]
+        self.service = AggregationService(self.client, max_workers=4)
+
+    def test_total_only(self) -> None:
+        """軸を指定しない場合は総数だけを取得することを確認するテスト"""
+        result = self.service.aggregate(1)
+
+        assert result["total"] == 5
+        assert result["api_calls"] == 1
+        self.client.count_issues.assert_called_once_with(project_id=[1])
+
+    def test_single_dimension(self) -> None:
+        """1つの軸で集計し、件数が0の行を省略することを確認するテスト"""
+        result = self.service.aggregate(1, group_by=["status"])
+
+        assert result["columns"] == ["status", "count"]
+        assert result["rows"] == [["未対応", 3], ["処理中", 1], ["完了", 1]]
+        assert result["total"] == 5
+        assert result["api_calls"] == 5
+
+    def test_optional_dimension_counts_missing_values(self) -> None:
+        """担当者のいない課題を "(none)" に数えることを確認するテスト"""
+        result = self.service.aggregate(1, group_by=["assignee"])
+
+        assert result["rows"] == [["田中", 2], ["鈴木", 2], [NONE_LABEL, 1]]
+
+    def test_matrix(self) -> None:
+        """2つの軸の組み合わせを並行して数え、表にすることを確認するテスト"""
+        result = self.service.aggregate(1, group_by=["status", "assignee"])
+
+        assert result["columns"] == ["status", "田中", "鈴木", NONE_LABEL, "total"]
+        assert result["rows"] == [
+            ["未対応", 2, 0, 1, 3],
+            ["処理中", 0, 1, 0, 1],
+            ["完了", 0, 1, 0, 1],
+        ]
+        assert result["total"] == 5
+        # 総数1 + 行4 + 列3 + 組み合わせ12
+        assert result["api_calls"] == 20
+
+    def test_multi_valued_dimension_has_no_none_row(self) -> None:
+        """複数の値を持てる軸では課題を値ごとに数え、"(none)" の行・列を作らないことを確認するテスト"""
+        issues = [
+            {"category_id": [20, 21], "assignee_id": 10},
+            {"category_id": [20], "assignee_id": 10},
+            {"category_id": [], "assignee_id": None},
+        ]
+        self.client.count_issues.side_effect = lambda **filters: fake_count_issues(issues, **filters)
+        self.client.get_categories.return_value = [{"id": 20, "name": "A"}, {"id": 21, "name": "B"}]
+
+        single = self.service.aggregate(1, group_by=["category"])
+        matrix = self.service.aggregate(1, group_by=["assignee", "category"])
+
+        assert single["rows"] == [["A", 2], ["B", 1]]
+        assert single["total"] == 3
+        assert single["overlapping"] == ["category"]
+        # 担当者の軸は値を1つだけ持つため、"(none)" の行は総数から求められる
+        assert matrix["columns"] == ["assignee", "A", "B", "total"]
+        assert matrix["rows"] == [["田中", 2, 1, 2], [NONE_LABEL, 0, 0, 1]]
+
+    def test_filters_are_pushed_down(self) -> None:
+        """絞り込み条件をすべての課題数APIの呼び出しに渡すことを確認するテスト"""
+        result = self.service.aggregate(1, group_by=["assignee"], filters={"status_id": [1]})
+
+        assert result["rows"] == [["田中", 2], [NONE_LABEL, 1]]
+        for call in self.client.count_issues.call_args_list:
+            assert call.kwargs["status_id"] == [1]
+            assert call.kwargs["project_id"] == [1]
+
+    def test_filter_on_same_dimension_limits_values(self) -> None:
+        """集計の軸と同じ項目の絞り込みでは、条件の値だけを数えることを確認するテスト"""
+        result = self.service.aggregate(1, group_by=["status"], filters={"status_id": [1, 2]})
+
+        assert result["rows"] == [["未対応", 3], ["処理中", 1]]
+        assert result["api_calls"] == 3
+
+    @pytest.mark.parametrize(
+        "group_by",
+        [["unknown"], ["status", "assignee", "priority"], ["status", "status"]],
+    )
+    def test_invalid_group_by(self, group_by: List[str]) -> None:
+        """不正な軸の指定は ValueError になることを確認するテスト"""
+        with pytest.raises(ValueError):
+            self.service.aggregate(1, group_by=group_by)
+        self.client.count_issues.assert_not_called()
+
+    def test_call_limit(self) -> None:
+        """課題数APIの呼び出し回数が上限を超える場合は呼び出さないことを確認するテスト"""
+        service = AggregationService(self.client, max_calls=10)
+
+        with pytest.raises(ValueError):
+            service.aggregate(1, group_by=["status", "assignee"])
+        self.client.count_issues.assert_not_called()
+
+    def test_count_error_is_raised(self) -> None:
+        """課題数を取得できなかった場合は例外を送出することを確認するテスト"""
+        self.client.count_issues.side_effect = Exception("API Error")
+
+        with pytest.raises(Exception, match="Failed to count issues"):
+            self.service.aggregate(1, group_by=["status"])
+
+    def test_value_list_error_is_raised(self) -> None:
+        """軸の値の一覧を取得できなかった場合は、空や既定の一覧で集計せずに例外を送出することを確認するテスト"""
+        self.client.get_statuses.side_effect = Exception("API Error")
+
+        with pytest.raises(Exception, match="API Error"):
+            self.service.aggregate(1, group_by=["status"])
+        self.client.get_statuses.assert_called_once_with(1, raise_errors=True)
+        self.client.count_issues.assert_not_called()
+
+
+class TestCountIssues:
+    """課題数の取得のテストクラス"""
+
+    def test_returns_count(self) -> None:
+        """件数・並び順を送信せずに課題数を取得することを確認するテスト"""
+        client = BacklogClientWrapper(api_key="dummy_api_key", space="dummy_space")
+        client.issue_api.rs.send_get_request = Mock(
+            return_value=Mock(ok=True, status_code=200, text=json.dumps({"count": 42}))
+        )
+
+        assert client.count_issues(project_id=[1], status_id=[1, 2]) == 42
+        params = client.issue_api.rs.send_get_request.call_args.kwargs["url_param"]
+        assert params["projectId[]"] == [1]
+        assert params["statusId[]"] == [1, 2]
+        assert "count" not in params
+        assert "order" not in params
+
+    def test_error_response(self) -> None:
+        """エラー応答の場合は BacklogApiError を送出することを確認するテスト"""
+        client = BacklogClientWrapper(api_key="dummy_api_key", space="dummy_space")
+        client.issue_api.rs.send_get_request = Mock(
+            return_value=Mock(
+                ok=False,
+                status_code=400,
+                text=json.dumps({"errors": [{"message": "No project"}]}),
+            )
+        )
+
+        with pytest.raises(Exception, match="Error counting issues"):
+            client.count_issues(project_id=[999])
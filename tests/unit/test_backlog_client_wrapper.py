@@ -0,0 +1,401 @@
+"""
+Backlog APIクライアントラッパーのユニットテスト
+"""
+
+from typing import Any, Dict, List, Optional
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.infrastructure.backlog.backlog_client_wrapper import BacklogClientWrapper
+from app.infrastructure.backlog.circuit_breaker import CircuitOpenError
+from app.infrastructure.backlog.comment_cache import comment_cache
+from app.infrastructure.backlog.issue_cache import issue_cache
+from app.infrastructure.backlog.metadata_cache import metadata_cache
+from app.infrastructure.backlog.negative_cache import negative_cache
+from tests.mock_data import make_response
+
+
+class FakeCommentApi:
+    """minId/maxId/count/orderを解釈するコメント一覧APIの代わり"""
+
+    def __init__(self, comment_ids: List[int]) -> None:
+        self.comment_ids = comment_ids
+        self.requests: List[Dict[str, Any]] = []
+
+    def __call__(self, path: str, url_param: Optional[dict] = None) -> Mock:
+        params = url_param or {}
+        self.requests.append(params)
+        ids = sorted(self.comment_ids, reverse=params.get("order", "desc") == "desc")
+        # Backlog APIのminId/maxIdは境界を含む
+        ids = [
+            i
+            for i in ids
+            if i >= params.get("minId", 0) and i <= params.get("maxId", 10**9)
+        ]
+        return make_response(
+            [{"id": i, "content": f"comment {i}"} for i in ids[: params.get("count", 20)]]
+        )
+
+
+@pytest.fixture
+def client() -> BacklogClientWrapper:
+    """テスト用のBacklogクライアント"""
+    comment_cache.clear()
+    issue_cache.clear()
+    negative_cache.clear()
+    metadata_cache.clear()
+    return BacklogClientWrapper(api_key="dummy_api_key", space="dummy_space")
+
+
+class TestIssueComments:
+    """コメント取得のテストクラス"""
+
+    @pytest.fixture(autouse=True)
+    def stub_issue(self, client: BacklogClientWrapper) -> None:
+        """課題キーを課題IDに解決できるようにする"""
+        client.issue_api.get_issue = Mock(
+            return_value=make_response({"id": 1, "issueKey": "TEST-1"})
+        )
+
+    def test_iter_issue_comments_pages_with_min_id(
+        self, client: BacklogClientWrapper
+    ) -> None:
+        """件数の上限を超えるコメントをminIdでページングしながら取得することを確認するテスト"""
+        api = FakeCommentApi(list(range(1, 251)))
+        client.request_sender.send_get_request = api
+
+        comments = list(client.iter_issue_comments("TEST-1", page_size=100))
+
+        assert [c["id"] for c in comments] == list(range(1, 251))
+        assert [r.get("minId") for r in api.requests] == [None, 100, 199]
+
+    def test_iter_issue_comments_descending_uses_max_id(
+        self, client: BacklogClientWrapper
+    ) -> None:
+        """降順の場合はmaxIdでページングすることを確認するテスト"""
+        api = FakeCommentApi(list(range(1, 151)))
+        client.request_sender.send_get_request = api
+
+        comments = list(client.iter_issue_comments("TEST-1", order="desc"))
+
+        assert [c["id"] for c in comments] == list(range(150, 0, -1))
+        assert api.requests[1]["maxId"] == 51
+
+    def test_get_issue_comments_since_fetches_only_new_comments(
+        self, client: BacklogClientWrapper
+    ) -> None:
+        """2回目以降は最後に取得したコメントより新しいコメントだけを取得することを確認するテスト"""
+        api = FakeCommentApi([1, 2, 3])
+        client.request_sender.send_get_request = api
+
+        first = client.get_issue_comments_since("TEST-1", since_comment_id=0)
+        api.comment_ids.append(4)
+        second = client.get_issue_comments_since("TEST-1", since_comment_id=2)
+
+        assert [c["id"] for c in first] == [1, 2, 3]
+        assert [c["id"] for c in second] == [3, 4]
+        assert api.requests[-1]["minId"] == 3
+
+    def test_get_issue_comments_since_limits_count(
+        self, client: BacklogClientWrapper
+    ) -> None:
+        """countで返す件数を制限できることを確認するテスト"""
+        client.request_sender.send_get_request = FakeCommentApi([10, 20, 30])
+
+        comments = client.get_issue_comments_since(
+            "TEST-1", since_comment_id=10, count=1
+        )
+
+        assert [c["id"] for c in comments] == [20]
+
+    def test_get_issue_comments_since_stops_paging_at_count(
+        self, client: BacklogClientWrapper
+    ) -> None:
+        """countを指定した場合は件数が揃った時点で取得をやめ、続きは次の呼び出しで取得することを確認するテスト"""
+        api = FakeCommentApi(list(range(1, 5001)))
+        client.request_sender.send_get_request = api
+
+        first = client.get_issue_comments_since("TEST-1", count=20)
+        cached = client.get_issue_comments_since("TEST-1", since_comment_id=5, count=10)
+        second = client.get_issue_comments_since("TEST-1", since_comment_id=20, count=150)
+
+        assert [c["id"] for c in first] == list(range(1, 21))
+        assert [c["id"] for c in cached] == list(range(6, 16))
+        assert [c["id"] for c in second] == list(range(21, 171))
+        # 1回目は1ページ、2回目はキャッシュから、3回目はキャッシュ済みの範囲の続きから2ページ
+        assert [r.get("minId") for r in api.requests] == [None, 20, 119]
+
+    def test_get_issue_comments_since_shares_cache_between_id_and_key(
+        self, client: BacklogClientWrapper
+    ) -> None:
+        """課題キーで取得したコメントを課題IDで参照・破棄できることを確認するテスト"""
+        api = FakeCommentApi([1, 2, 3])
+        client.request_sender.send_get_request = api
+
+        client.get_issue_comments_since("TEST-1")
+        cached = client.get_issue_comments_since("1", since_comment_id=1)
+        requests_before = len(api.requests)
+        comment_cache.invalidate(("dummy_space", 1))
+        client.get_issue_comments_since("TEST-1")
+
+        assert [c["id"] for c in cached] == [2, 3]
+        assert requests_before == 2
+        assert len(api.requests) == requests_before + 1
+
+
+class TestRaiseErrors:
+    """取得できなかった場合に例外を送出するオプションのテストクラス"""
+
+    def test_metadata_errors(self, client: BacklogClientWrapper) -> None:
+        """raise_errors を指定した場合だけ、一覧を取得できなかったことを例外で返すことを確認するテスト"""
+        client.category_api.get_category_list = Mock(
+            return_value=make_response({"errors": [{"message": "No project."}]}, 404)
+        )
+
+        assert client.get_categories("TEST") == []
+        with pytest.raises(Exception, match="No project"):
+            client.get_categories("TEST", raise_errors=True)
+
+    def test_issue_list_errors(self, client: BacklogClientWrapper) -> None:
+        """raise_errors を指定した場合は、課題一覧のエラーレスポンスを例外にすることを確認するテスト"""
+        client.issue_api.get_issue_list = Mock(
+            return_value=make_response({"errors": [{"message": "Bad request."}]}, 400)
+        )
+
+        with pytest.raises(Exception, match="Bad request"):
+            client.get_issues(parent_issue_id=[1], raise_errors=True)
+
+
+class TestIssueCache:
+    """課題キャッシュのテストクラス"""
+
+    def test_get_issue_is_served_from_cache_by_id_and_key(
+        self, client: BacklogClientWrapper
+    ) -> None:
+        """取得した課題が課題IDと課題キーのどちらでもキャッシュから返ることを確認するテスト"""
+        client.issue_api.get_issue = Mock(
+            return_value=make_response({"id": 1, "issueKey": "TEST-1"})
+        )
+
+        client.get_issue("TEST-1")
+        by_key = client.get_issue("TEST-1")
+        by_id = client.get_issue("1")
+
+        assert client.issue_api.get_issue.call_count == 1
+        assert by_key == by_id == {"id": 1, "issueKey": "TEST-1"}
+
+    def test_get_issues_and_update_issue_populate_cache(
+        self, client: BacklogClientWrapper
+    ) -> None:
+        """課題一覧の取得と課題の更新で課題キャッシュが更新されることを確認するテスト"""
+        client.issue_api.get_issue_list = Mock(
+            return_value=make_response(
+                [{"id": 1, "issueKey": "TEST-1", "summary": "old"}]
+            )
+        )
+        client.issue_api.update_issue = Mock(
+            return_value=make_response(
+                {"id": 1, "issueKey": "TEST-1", "projectId": 1, "summary": "new"}
+            )
+        )
+        client.issue_api.get_issue = Mock()
+
+        client.get_issues(project_id=1)
+        client.update_issue("TEST-1", summary="new")
+
+        assert client.get_issue("1")["summary"] == "new"
+        client.issue_api.get_issue.assert_not_called()
+
+    def test_get_issues_pushes_down_filters(self, client: BacklogClientWrapper) -> None:
+        """絞り込み・並び替えの条件をBacklog APIのパラメータとして送信することを確認するテスト"""
+        client.issue_api.rs.send_get_request = Mock(return_value=make_response([]))
+
+        client.get_issues(
+            project_id=1,
+            issue_type_id=[2],
+            milestone_id=[3, 4],
+            priority_id=[],
+            parent_child=2,
+            due_date_until="2024-01-31",
+            sort="dueDate",
+            order="asc",
+            offset=40,
+        )
+
+        params = client.issue_api.rs.send_get_request.call_args.kwargs["url_param"]
+        assert params["projectId[]"] == [1]
+        assert params["issueTypeId[]"] == [2]
+        assert params["milestoneId[]"] == [3, 4]
+        assert "priorityId[]" not in params
+        assert params["parentChild"] == 2
+        assert params["dueDateUntil"] == "2024-01-31"
+        assert (params["sort"], params["order"], params["offset"]) == ("dueDate", "asc", 40)
+
+    def test_delete_issue_invalidates_cache(self, client: BacklogClientWrapper) -> None:
+        """課題の削除で課題キャッシュが破棄されることを確認するテスト"""
+        client.issue_api.get_issue = Mock(
+            return_value=make_response({"id": 1, "issueKey": "TEST-1"})
+        )
+        client.issue_api.delete_issue = Mock(return_value=Mock(ok=True))
+
+        client.get_issue("TEST-1")
+        client.delete_issue("TEST-1")
+        client.get_issue("1")
+
+        assert client.issue_api.get_issue.call_count == 2
+
+
+class TestNegativeCache:
+    """ネガティブキャッシュのテストクラス"""
+
+    def test_missing_issue_is_not_requested_again(
+        self, client: BacklogClientWrapper
+    ) -> None:
+        """存在しない課題を繰り返し取得してもBacklogへは1回だけ問い合わせることを確認するテスト"""
+        client.issue_api.get_issue = Mock(
+            return_value=make_response({"errors": [{"code": 6}]}, status_code=404)
+        )
+
+        assert client.get_issue("TEST-404") is None
+        assert client.get_issue("TEST-404") is None
+        assert client.issue_api.get_issue.call_count == 1
+
+    def test_server_error_is_not_cached(self, client: BacklogClientWrapper) -> None:
+        """存在しない以外のエラーは記録しないことを確認するテスト"""
+        client.project_api.get_project = Mock(
+            return_value=make_response({"errors": []}, status_code=500)
+        )
+
+        assert client.get_project("TEST") is None
+        assert client.get_project("TEST") is None
+        assert client.project_api.get_project.call_count == 2
+
+    def test_missing_name_is_not_resolved_again(
+        self, client: BacklogClientWrapper
+    ) -> None:
+        """存在しない名前を繰り返し検索しても一覧は1回だけ取得することを確認するテスト"""
+        client.category_api.get_category_list = Mock(
+            return_value=make_response([{"id": 1, "name": "フロントエンド"}])
+        )
+
+        assert client.get_category_id_by_name("TEST", "バックエンド") is None
+        metadata_cache.clear()
+        assert client.get_category_id_by_name("TEST", "バックエンド") is None
+        assert client.category_api.get_category_list.call_count == 1
+        assert client.get_category_id_by_name("TEST", "フロントエンド") == 1
+        assert client.category_api.get_category_list.call_count == 2
+
+    def test_created_issue_clears_missing_record(
+        self, client: BacklogClientWrapper
+    ) -> None:
+        """課題を作成すると存在しないという記録が破棄されることを確認するテスト"""
+        client.issue_api.get_issue = Mock(
+            return_value=make_response({"errors": []}, status_code=404)
+        )
+        client.issue_api.add_issue = Mock(
+            return_value=make_response({"id": 1, "issueKey": "TEST-1"})
+        )
+
+        assert client.get_issue("TEST-1") is None
+        client.create_issue(project_id=1, summary="new")
+
+        assert client.get_issue("TEST-1") == {"id": 1, "issueKey": "TEST-1"}
+
+
+class TestMetadataCache:
+    """メタデータキャッシュのテストクラス"""
+
+    def test_metadata_is_shared_between_clients(self, client: BacklogClientWrapper) -> None:
+        """メタデータがクライアントのインスタンス間で共有されることを確認するテスト"""
+        client.user_api.get_user_list = Mock(
+            return_value=make_response([{"id": 1, "name": "山田"}])
+        )
+        other = BacklogClientWrapper(api_key="dummy_api_key", space="dummy_space")
+        other.user_api.get_user_list = Mock()
+
+        assert client.get_user_id_by_name("山田") == 1
+        assert other.get_user_id_by_name("山田") == 1
+        other.user_api.get_user_list.assert_not_called()
+
+    def test_project_key_and_id_share_metadata(self, client: BacklogClientWrapper) -> None:
+        """プロジェクト取得後はプロジェクトキーとIDでメタデータを共有することを確認するテスト"""
+        client.project_api.get_project = Mock(
+            return_value=make_response({"id": 10, "projectKey": "TEST"})
+        )
+        client.category_api.get_category_list = Mock(
+            return_value=make_response([{"id": 1, "name": "フロントエンド"}])
+        )
+
+        assert client.get_project("TEST") == {"id": 10, "projectKey": "TEST"}
+        assert client.get_project("TEST") == {"id": 10, "projectKey": "TEST"}
+        client.project_api.get_project.assert_called_once()
+
+        client.get_categories("TEST")
+        assert client.get_category_id_by_name("10", "フロントエンド") == 1
+        client.category_api.get_category_list.assert_called_once()
+
+    def test_error_response_is_not_cached(self, client: BacklogClientWrapper) -> None:
+        """エラーレスポンスはキャッシュしないことを確認するテスト"""
+        client.priority_api.get_priority_list = Mock(
+            side_effect=[
+                make_response({"errors": []}, status_code=500),
+                make_response([{"id": 3, "name": "中"}]),
+            ]
+        )
+
+        assert client.get_priorities() == []
+        assert client.get_priorities() == [{"id": 3, "name": "中"}]
+
+
+class TestCircuitOpen:
+    """サーキットブレーカーが開いている場合のテストクラス"""
+
+    def test_serves_expired_issue(self, client: BacklogClientWrapper) -> None:
+        """有効期間を過ぎた課題を返すことを確認するテスト"""
+        issue_cache.put("dummy_space", {"id": 1, "issueKey": "TEST-1"})
+        client.issue_api.get_issue = Mock(side_effect=CircuitOpenError(10))
+
+        with patch.object(issue_cache, "ttl", -1):
+            assert client.get_issue("TEST-1") == {"id": 1, "issueKey": "TEST-1"}
+            assert client.get_issue("TEST-2") is None
+        assert client.issue_api.get_issue.call_count == 2
+
+    def test_update_issue_raises_instead_of_returning_none(
+        self, client: BacklogClientWrapper
+    ) -> None:
+        """課題の更新がNoneを返さずに接続断を送出することを確認するテスト"""
+        issue_cache.put("dummy_space", {"id": 1, "issueKey": "TEST-1", "projectId": 1})
+        client.issue_api.update_issue = Mock(side_effect=CircuitOpenError(10))
+
+        with pytest.raises(CircuitOpenError):
+            client.update_issue("TEST-1", summary="件名")
+
+    def test_create_issue_raises_instead_of_returning_none(
+        self, client: BacklogClientWrapper
+    ) -> None:
+        """課題の作成がNoneを返さずに接続断を送出することを確認するテスト"""
+        client.issue_api.add_issue = Mock(side_effect=CircuitOpenError(10))
+
+        with pytest.raises(CircuitOpenError):
+            client.create_issue(project_id=1, summary="件名", issue_type_id=1, priority_id=3)
+
+    def test_add_comment_raises_instead_of_returning_none(
+        self, client: BacklogClientWrapper
+    ) -> None:
+        """コメントの追加がNoneを返さずに接続断を送出することを確認するテスト"""
+        client.issue_comment_api = Mock()
+        client.issue_comment_api.add_issue_comment.side_effect = CircuitOpenError(10)
+
+        with pytest.raises(CircuitOpenError):
+            client.add_comment("TEST-1", "コメント")
+
+    def test_serves_metadata_beyond_max_staleness(self, client: BacklogClientWrapper) -> None:
+        """最大許容期間を過ぎたメタデータを返すことを確認するテスト"""
+        metadata_cache.set(("users", "dummy_space", None), [{"id": 1, "name": "山田"}])
+        client.user_api.get_user_list = Mock(side_effect=CircuitOpenError(10))
+
+        with patch.object(metadata_cache, "max_staleness", -1), patch.object(
+            metadata_cache, "ttl", -1
+        ):
+            assert client.get_users() == [{"id": 1, "name": "山田"}]
@@ -7,6 +7,10 @@ from unittest.mock import Mock, patch
 import pytest
 
 from app.application.services.bulk_operations_service import BulkOperationsService
+from app.core.deadline import DeadlineExceededError, deadline_scope
+from app.infrastructure.backlog.backlog_client_wrapper import BacklogClientWrapper
+from app.infrastructure.backlog.circuit_breaker import CircuitOpenError
+from tests.mock_data import make_response
 
 
 class TestBulkOperationsService:
@@ -231,3 +235,263 @@ class TestBulkOperationsService:
         assert len(result["failed_issues"]) == 2
         assert "TEST-2" in result["failed_issues"]
         assert "TEST-3" in result["failed_issues"]
+
+    def test_bulk_create_issues_resolves_names_once(
+        self, mock_backlog_client: Mock
+    ) -> None:
+        """課題の一括作成で名前解決がバッチ全体で1回だけ行われ、課題キーが入力順に返ることを確認するテスト"""
+        # モックの戻り値を設定
+        mock_backlog_client.get_issue_types.return_value = [{"id": 10, "name": "バグ"}]
+        mock_backlog_client.get_priorities.return_value = [{"id": 2, "name": "高"}]
+        mock_backlog_client.create_issue.side_effect = lambda **params: {
+            "issueKey": f"TEST-{params['summary']}"
+        }
+
+        # テスト対象のサービスをインスタンス化
+        bulk_service = BulkOperationsService(
+            backlog_client=mock_backlog_client, max_workers=4
+        )
+
+        # 課題を一括作成
+        result = bulk_service.bulk_create_issues(
+            project_key="TEST1",
+            issues=[
+                {"summary": str(i), "issue_type_name": "バグ", "priority_name": "高"}
+                for i in range(6)
+            ],
+        )
+
+        # 名前解決はバッチ全体で1回だけ
+        mock_backlog_client.get_project.assert_called_once_with("TEST1")
+        mock_backlog_client.get_issue_types.assert_called_once_with("1")
+        mock_backlog_client.get_priorities.assert_called_once()
+        mock_backlog_client.get_users.assert_not_called()
+        mock_backlog_client.create_issue.assert_any_call(
+            project_id=1, summary="0", issue_type_id=10, priority_id=2
+        )
+
+        # 結果の検証
+        assert result["total"] == 6
+        assert result["success"] == 6
+        assert result["failed"] == 0
+        assert result["issue_keys"] == [f"TEST-{i}" for i in range(6)]
+
+    def test_bulk_create_issues_validates_before_creating(
+        self, mock_backlog_client: Mock
+    ) -> None:
+        """検証エラーがある場合は課題を1件も作成しないことを確認するテスト"""
+        # モックの戻り値を設定
+        mock_backlog_client.get_users.return_value = [{"id": 5, "name": "山田"}]
+
+        # テスト対象のサービスをインスタンス化
+        bulk_service = BulkOperationsService(backlog_client=mock_backlog_client)
+
+        # 課題を一括作成
+        result = bulk_service.bulk_create_issues(
+            project_id=1,
+            issues=[
+                {"summary": "OK", "assignee_name": "山田"},
+                {"summary": "NG", "assignee_name": "田中"},
+                {"assignee_name": "山田"},
+            ],
+        )
+
+        # 課題は作成されない
+        mock_backlog_client.create_issue.assert_not_called()
+
+        # 結果の検証
+        assert result["success"] == 0
+        assert result["failed"] == 3
+        assert result["issue_keys"] == [None, None, None]
+        assert [e["index"] for e in result["validation_errors"]] == [1, 2]
+
+    def test_bulk_create_issues_reports_unknown_project(
+        self, mock_backlog_client: Mock
+    ) -> None:
+        """プロジェクトが見つからない場合は行ごとの検証エラーとして返ることを確認するテスト"""
+        # モックの戻り値を設定
+        mock_backlog_client.get_project.return_value = None
+
+        # テスト対象のサービスをインスタンス化
+        bulk_service = BulkOperationsService(backlog_client=mock_backlog_client)
+
+        # 課題を一括作成
+        result = bulk_service.bulk_create_issues(
+            project_key="NOPE",
+            issues=[{"summary": "A", "category_name": ["UI"]}, {"summary": "B"}],
+        )
+
+        # 名前解決も課題の作成も行わない
+        mock_backlog_client.get_categories.assert_not_called()
+        mock_backlog_client.create_issue.assert_not_called()
+
+        # 結果の検証
+        assert result["failed"] == 2
+        assert result["validation_errors"] == [
+            {"index": 0, "errors": ["Project not found: NOPE"]},
+            {"index": 1, "errors": ["Project not found: NOPE"]},
+        ]
+
+    def test_bulk_create_issues_reports_failed_rows(
+        self, mock_backlog_client: Mock
+    ) -> None:
+        """作成に失敗した行のインデックスが返ることを確認するテスト"""
+        # モックの戻り値を設定
+        def create_issue(**params):
+            if params["summary"] == "NG":
+                raise Exception("API Error")
+            return {"issueKey": "TEST-1"}
+
+        mock_backlog_client.create_issue.side_effect = create_issue
+
+        # テスト対象のサービスをインスタンス化
+        bulk_service = BulkOperationsService(backlog_client=mock_backlog_client)
+
+        # 課題を一括作成
+        result = bulk_service.bulk_create_issues(
+            project_id=1, issues=[{"summary": "NG"}, {"summary": "OK"}]
+        )
+
+        # 結果の検証
+        assert result["total"] == 2
+        assert result["success"] == 1
+        assert result["failed_issues"] == [0]
+        assert result["issue_keys"] == [None, "TEST-1"]
+
+    def test_bulk_add_comment_renders_template_per_issue(
+        self, mock_backlog_client: Mock
+    ) -> None:
+        """コメントの一括追加で課題ごとにテンプレートが展開されることを確認するテスト"""
+        # モックの戻り値を設定
+        def add_comment(issue_id_or_key, content):
+            if issue_id_or_key == "TEST-3":
+                raise Exception("API Error")
+            return {"id": 1, "content": content}
+
+        mock_backlog_client.add_comment.side_effect = add_comment
+
+        # テスト対象のサービスをインスタンス化
+        bulk_service = BulkOperationsService(backlog_client=mock_backlog_client)
+
+        # コメントを一括追加
+        result = bulk_service.bulk_add_comment(
+            issue_ids=["TEST-1", "TEST-2", "TEST-3"],
+            content="${issue_id_or_key}: v${version} をリリースしました ${unknown}",
+            variables={"TEST-1": {"version": "1.0"}},
+        )
+
+        # モックが正しいパラメータで呼ばれたことを確認
+        assert mock_backlog_client.add_comment.call_count == 3
+        mock_backlog_client.add_comment.assert_any_call(
+            issue_id_or_key="TEST-1", content="TEST-1: v1.0 をリリースしました ${unknown}"
+        )
+        mock_backlog_client.add_comment.assert_any_call(
+            issue_id_or_key="TEST-2",
+            content="TEST-2: v${version} をリリースしました ${unknown}",
+        )
+
+        # 結果の検証
+        assert result["total"] == 3
+        assert result["success"] == 2
+        assert result["failed"] == 1
+        assert result["failed_issues"] == ["TEST-3"]
+
+    def test_bulk_add_comment_reports_error_responses(self) -> None:
+        """エラーの本文を返した課題を失敗として数えることを確認するテスト"""
+        backlog_client = BacklogClientWrapper(api_key="dummy_api_key", space="dummy_space")
+        backlog_client.issue_comment_api = Mock()
+        backlog_client.issue_comment_api.add_issue_comment.side_effect = (
+            lambda issue_id_or_key, content: make_response(
+                {"errors": [{"message": "No issue.", "code": 6}]}, 404
+            )
+            if issue_id_or_key == "TEST-2"
+            else make_response({"id": 1, "content": content})
+        )
+        bulk_service = BulkOperationsService(backlog_client=backlog_client)
+
+        result = bulk_service.bulk_add_comment(issue_ids=["TEST-1", "TEST-2"], content="コメント")
+
+        assert result == {"total": 2, "success": 1, "failed": 1, "failed_issues": ["TEST-2"]}
+
+
+class TestBulkOperationsDeadline:
+    """一括操作の処理期限のテストクラス"""
+
+    def test_sequential_update_stops_at_deadline(self, mock_backlog_client: Mock) -> None:
+        """処理期限が近づいた後の課題は更新せず、部分的な結果を返すことを確認するテスト"""
+        mock_backlog_client.update_issue.return_value = {"id": 1}
+        bulk_service = BulkOperationsService(backlog_client=mock_backlog_client)
+
+        with patch(
+            "app.application.services.bulk_operations_service.deadline_exceeded",
+            side_effect=[False, True, True],
+        ):
+            result = bulk_service.bulk_update_status(
+                issue_ids=["TEST-1", "TEST-2", "TEST-3"], status_id=2
+            )
+
+        assert mock_backlog_client.update_issue.call_count == 1
+        assert result["success"] == 1
+        assert result["failed"] == 2
+        assert result["failed_issues"] == ["TEST-2", "TEST-3"]
+        assert result["deadline_exceeded"] is True
+        assert result["skipped_issues"] == ["TEST-2", "TEST-3"]
+
+    def test_concurrent_workers_see_request_deadline(self, mock_backlog_client: Mock) -> None:
+        """並行実行するスレッドにも処理期限が引き継がれることを確認するテスト"""
+        bulk_service = BulkOperationsService(backlog_client=mock_backlog_client, max_workers=2)
+
+        with deadline_scope(0):
+            result = bulk_service.bulk_add_comment(
+                issue_ids=["TEST-1", "TEST-2", "TEST-3"], content="コメント"
+            )
+
+        mock_backlog_client.add_comment.assert_not_called()
+        assert result["skipped_issues"] == ["TEST-1", "TEST-2", "TEST-3"]
+
+    def test_errors_raised_by_client_are_skipped(self, mock_backlog_client: Mock) -> None:
+        """クライアントが送出した処理期限切れと接続断の課題を未処理として数えることを確認するテスト"""
+        mock_backlog_client.update_issue.side_effect = [
+            {"id": 1},
+            DeadlineExceededError(),
+            CircuitOpenError(10),
+        ]
+        bulk_service = BulkOperationsService(backlog_client=mock_backlog_client)
+
+        result = bulk_service.bulk_update_status(
+            issue_ids=["TEST-1", "TEST-2", "TEST-3"], status_id=2
+        )
+
+        assert result["failed_issues"] == ["TEST-2", "TEST-3"]
+        assert result["skipped_issues"] == ["TEST-2", "TEST-3"]
+        assert result["deadline_exceeded"] is True
+        assert result["circuit_open"] is True
+
+    def test_comment_errors_raised_by_client_are_skipped(self) -> None:
+        """コメントの追加で送出された処理期限切れと接続断の課題を未処理として数えることを確認するテスト"""
+        backlog_client = BacklogClientWrapper(api_key="dummy_api_key", space="dummy_space")
+        backlog_client.issue_comment_api = Mock()
+        backlog_client.issue_comment_api.add_issue_comment.side_effect = [
+            make_response({"id": 1, "content": "コメント"}),
+            DeadlineExceededError(),
+            CircuitOpenError(10),
+        ]
+        bulk_service = BulkOperationsService(backlog_client=backlog_client, max_workers=1)
+
+        result = bulk_service.bulk_add_comment(
+            issue_ids=["TEST-1", "TEST-2", "TEST-3"], content="コメント"
+        )
+
+        assert result["failed_issues"] == ["TEST-2", "TEST-3"]
+        assert result["skipped_issues"] == ["TEST-2", "TEST-3"]
+        assert result["deadline_exceeded"] is True
+        assert result["circuit_open"] is True
+
+    def test_no_deadline_fields_when_completed(self, mock_backlog_client: Mock) -> None:
+        """すべて処理した場合は処理期限の項目を含めないことを確認するテスト"""
+        mock_backlog_client.delete_issue.return_value = True
+        bulk_service = BulkOperationsService(backlog_client=mock_backlog_client)
+
+        result = bulk_service.bulk_delete_issues(issue_ids=["TEST-1"])
+
+        assert result == {"total": 1, "success": 1, "failed": 0, "failed_issues": []}
@@ -0,0 +1,75 @@
+"""
+キャッシュの事前取得サービスのユニットテスト
+"""
+
+from unittest.mock import Mock, patch
+
+from app.application.services.cache_warmup_service import (
+    CacheWarmupService,
+    get_warmup_project_keys,
+)
+
+
+class TestCacheWarmupService:
+    """キャッシュの事前取得サービスのテストクラス"""
+
+    def test_warm_up_fetches_metadata_of_projects(self, mock_backlog_client: Mock) -> None:
+        """見つかったプロジェクトのメタデータを取得し、結果を報告することを確認するテスト"""
+        mock_backlog_client.get_project.side_effect = lambda key: (
+            {"id": 1, "projectKey": key} if key == "TEST" else None
+        )
+        for name in (
+            "get_users",
+            "get_priorities",
+            "get_statuses",
+            "get_issue_types",
+            "get_categories",
+            "get_milestones",
+            "get_versions",
+        ):
+            getattr(mock_backlog_client, name).return_value = []
+
+        report = CacheWarmupService(mock_backlog_client, max_workers=4).warm_up(
+            ["TEST", "MISSING"]
+        )
+
+        assert report["projects"] == ["TEST"]
+        assert report["failed"] == ["MISSING:project"]
+        assert report["elapsed_seconds"] >= 0
+        assert [task["name"] for task in report["tasks"]] == [
+            "TEST:project",
+            "MISSING:project",
+            "users",
+            "priorities",
+            "TEST:statuses",
+            "TEST:issue_types",
+            "TEST:categories",
+            "TEST:milestones",
+            "TEST:versions",
+        ]
+        mock_backlog_client.get_statuses.assert_called_once_with("TEST")
+        mock_backlog_client.get_versions.assert_called_once_with("TEST")
+
+    def test_warm_up_reports_failed_tasks(self, mock_backlog_client: Mock) -> None:
+        """取得に失敗した処理があっても残りの処理を続けることを確認するテスト"""
+        mock_backlog_client.get_project.return_value = {"id": 1}
+        mock_backlog_client.get_users.side_effect = Exception("API Error")
+
+        report = CacheWarmupService(mock_backlog_client).warm_up(["TEST"])
+
+        assert report["failed"] == ["users"]
+        mock_backlog_client.get_categories.assert_called_once_with("TEST")
+
+    def test_get_warmup_project_keys_falls_back_to_backlog_project(self) -> None:
+        """対象のプロジェクトを指定しない場合はBACKLOG_PROJECTを使うことを確認するテスト"""
+        with patch(
+            "app.application.services.cache_warmup_service.settings.CACHE_WARMUP_PROJECTS",
+            None,
+        ), patch.dict("os.environ", {"BACKLOG_PROJECT": "TEST"}):
+            assert get_warmup_project_keys() == ["TEST"]
+
+        with patch(
+            "app.application.services.cache_warmup_service.settings.CACHE_WARMUP_PROJECTS",
+            "TEST, DEV ,",
+        ):
+            assert get_warmup_project_keys() == ["TEST", "DEV"]
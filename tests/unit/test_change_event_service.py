@@ -0,0 +1,202 @@
+"""
+更新通知の反映サービスのテスト
+"""
+
+from typing import Generator
+from unittest.mock import Mock
+
+import pytest
+
+from app.application.services.change_event_service import (
+    ISSUE_COMMENTED,
+    ISSUE_DELETED,
+    ISSUE_MULTI_UPDATED,
+    ISSUE_UPDATED,
+    MILESTONE_UPDATED,
+    PROJECT_USER_ADDED,
+    ChangeEventService,
+)
+from app.infrastructure.backlog.comment_cache import CommentCacheEntry, comment_cache
+from app.infrastructure.backlog.issue_cache import issue_cache
+from app.infrastructure.backlog.metadata_cache import metadata_cache
+from app.infrastructure.backlog.negative_cache import negative_cache
+from app.infrastructure.mirror.issue_mirror import IssueMirror
+from tests.mock_data import make_issue
+
+SPACE = "space"
+PROJECT = {"id": 1, "projectKey": "TEST"}
+
+
+class TestChangeEventService:
+    """更新通知の反映サービスのテストクラス"""
+
+    @pytest.fixture(autouse=True)
+    def clear_caches(self) -> Generator[None, None, None]:
+        issue_cache.clear()
+        metadata_cache.clear()
+        negative_cache.clear()
+        yield
+        issue_cache.clear()
+        metadata_cache.clear()
+        negative_cache.clear()
+
+    def setup_method(self) -> None:
+        self.client = Mock()
+        self.client.space = SPACE
+        self.mirror = IssueMirror()
+        self.service = ChangeEventService(self.client, mirror=self.mirror)
+
+    def test_issue_updated_refreshes_cache_and_mirror(self) -> None:
+        """課題の更新で課題キャッシュを破棄し、ミラーの課題を取得し直すことを確認するテスト"""
+        issue_cache.put(SPACE, make_issue(5, "古い件名"))
+        self.mirror.upsert_issues(SPACE, [make_issue(5, "古い件名")])
+        self.client.get_issue.return_value = make_issue(5, "新しい件名", "2024-01-02T00:00:00Z")
+
+        result = self.service.apply(
+            {"id": 100, "type": ISSUE_UPDATED, "project": PROJECT, "content": {"id": 5, "key_id": 5}}
+        )
+
+        assert issue_cache.get(SPACE, "TEST-5") is None
+        self.client.get_issue.assert_called_once_with("5")
+        assert self.mirror.get_issue(SPACE, 5)["summary"] == "新しい件名"
+        assert result["actions"] == ["issue_cache:invalidate:TEST-5", "mirror:refresh_issue:5"]
+
+    def test_comment_refetched_into_mirror(self) -> None:
+        """コメントの追加で、通知の内容ではなくBacklogから取得したコメントを保存することを確認するテスト"""
+        self.client.get_issue.return_value = make_issue(5, "件名")
+        self.client.iter_issue_comments.return_value = iter([{"id": 300, "content": "再現しました"}])
+
+        result = self.service.apply(
+            {
+                "type": ISSUE_COMMENTED,
+                "project": PROJECT,
+                "content": {"id": 5, "key_id": 5, "comment": {"id": 300, "content": "偽の内容"}},
+            }
+        )
+
+        self.client.iter_issue_comments.assert_called_once_with("5", min_id=None)
+        assert "mirror:refresh_comments:5" in result["actions"]
+        assert self.mirror.get_last_comment_id(SPACE, 5) == 300
+        assert len(self.mirror.search_issues(SPACE, "再現")) == 1
+        assert self.mirror.search_issues(SPACE, "偽の内容") == []
+
+    def test_comment_event_invalidates_comment_cache(self) -> None:
+        """コメントの追加で課題のコメントキャッシュを破棄することを確認するテスト"""
+        for value in (5, 6):
+            comment_cache.put((SPACE, value), CommentCacheEntry(0, [{"id": 1}]))
+        self.client.get_issue.return_value = make_issue(5, "件名")
+
+        self.service.apply(
+            {
+                "type": ISSUE_COMMENTED,
+                "project": PROJECT,
+                "content": {"id": 5, "key_id": 5, "comment": {"id": 300, "content": "編集しました"}},
+            }
+        )
+
+        assert comment_cache.get((SPACE, 5)) is None
+        assert comment_cache.get((SPACE, 6)) is not None
+        comment_cache.clear()
+
+    def test_refresh_failure_marks_project_stale(self) -> None:
+        """課題を取得できない場合はプロジェクトを次回同期する状態にすることを確認するテスト"""
+        self.mirror.set_sync_state(SPACE, 1, "2024-01-01T00:00:00Z", 1000.0)
+        self.client.get_issue.side_effect = Exception("API Error")
+
+        result = self.service.apply(
+            {"type": ISSUE_UPDATED, "project": PROJECT, "content": {"id": 5, "key_id": 5}}
+        )
+
+        assert "mirror:mark_stale:1" in result["actions"]
+        assert self.mirror.get_sync_state(SPACE, 1) == {
+            "last_updated": "2024-01-01T00:00:00Z",
+            "synced_at": None,
+        }
+
+    def test_issue_deleted(self) -> None:
+        """Backlogで課題が見つからないことを確認してから、キャッシュとミラーから削除することを確認するテスト"""
+        issue_cache.put(SPACE, make_issue(5, "件名"))
+        self.mirror.upsert_issues(SPACE, [make_issue(5, "件名")])
+        self.client.get_issue.return_value = None
+
+        result = self.service.apply(
+            {"type": ISSUE_DELETED, "project": PROJECT, "content": {"id": 5, "key_id": 5}}
+        )
+
+        assert issue_cache.get(SPACE, 5) is None
+        assert self.mirror.get_issue(SPACE, 5) is None
+        assert "mirror:delete_issue:5" in result["actions"]
+        self.client.get_issue.assert_called_once_with("5", use_cache=False, raise_errors=True)
+
+    def test_issue_deleted_ignored_when_issue_exists(self) -> None:
+        """削除の通知でもBacklogに課題が存在する場合は削除せず、取得し直すことを確認するテスト"""
+        self.mirror.upsert_issues(SPACE, [make_issue(5, "古い件名")])
+        self.client.get_issue.return_value = make_issue(5, "新しい件名", "2024-01-02T00:00:00Z")
+
+        result = self.service.apply(
+            {"type": ISSUE_DELETED, "project": PROJECT, "content": {"id": 5, "key_id": 5}}
+        )
+
+        assert self.mirror.get_issue(SPACE, 5)["summary"] == "新しい件名"
+        assert "mirror:refresh_issue:5" in result["actions"]
+
+    def test_issue_deleted_ignored_when_confirmation_fails(self) -> None:
+        """削除を確認できないエラーの場合は、課題を削除しないことを確認するテスト"""
+        self.mirror.upsert_issues(SPACE, [make_issue(5, "件名")])
+        self.client.get_issue.side_effect = Exception("API Error")
+
+        result = self.service.apply(
+            {"type": ISSUE_DELETED, "project": PROJECT, "content": {"id": 5, "key_id": 5}}
+        )
+
+        assert self.mirror.get_issue(SPACE, 5) is not None
+        assert "mirror:delete_issue:5" not in result["actions"]
+
+    def test_multi_update_marks_project_stale(self) -> None:
+        """一括更新は課題ごとに取得せず、プロジェクトを次回同期する状態にすることを確認するテスト"""
+        issue_cache.put(SPACE, make_issue(5, "件名"))
+        self.mirror.set_sync_state(SPACE, 1, "2024-01-01T00:00:00Z", 1000.0)
+
+        self.service.apply(
+            {
+                "type": ISSUE_MULTI_UPDATED,
+                "project": PROJECT,
+                "content": {"link": [{"id": 5, "key_id": 5}, {"id": 6, "key_id": 6}]},
+            }
+        )
+
+        assert issue_cache.get(SPACE, 5) is None
+        assert self.mirror.get_sync_state(SPACE, 1)["synced_at"] is None
+        self.client.get_issue.assert_not_called()
+
+    def test_milestone_updated_invalidates_versions(self) -> None:
+        """マイルストーンの更新でプロジェクトのマイルストーン・発生バージョンを破棄することを確認するテスト"""
+        metadata_cache.set(("milestones", SPACE, "1"), [{"id": 1}])
+        metadata_cache.set(("versions", SPACE, "TEST"), [{"id": 1}])
+        metadata_cache.set(("versions", SPACE, "2"), [{"id": 2}])
+        metadata_cache.set(("statuses", SPACE, "1"), [{"id": 3}])
+
+        result = self.service.apply(
+            {"type": MILESTONE_UPDATED, "project": PROJECT, "content": {"id": 1}}
+        )
+
+        assert result["actions"] == ["metadata_cache:invalidate:versions:2"]
+        assert metadata_cache.get(("milestones", SPACE, "1")) is None
+        assert metadata_cache.get(("versions", SPACE, "TEST")) is None
+        assert metadata_cache.get(("versions", SPACE, "2")) is not None
+        assert metadata_cache.get(("statuses", SPACE, "1")) is not None
+
+    def test_project_user_added_invalidates_users(self) -> None:
+        """プロジェクトへのユーザー追加でユーザー一覧を破棄することを確認するテスト"""
+        metadata_cache.set(("users", SPACE, None), [{"id": 1}])
+        metadata_cache.set(("users", "other", None), [{"id": 1}])
+
+        self.service.apply({"type": PROJECT_USER_ADDED, "project": PROJECT, "content": {}})
+
+        assert metadata_cache.get(("users", SPACE, None)) is None
+        assert metadata_cache.get(("users", "other", None)) is not None
+
+    def test_ignores_other_types(self) -> None:
+        """対象外の種類は何もしないことを確認するテスト"""
+        result = self.service.apply({"id": 1, "type": 5, "project": PROJECT, "content": {}})
+        assert result == {"id": 1, "type": 5, "actions": []}
@@ -0,0 +1,92 @@
+"""
+サーキットブレーカーのユニットテスト
+"""
+
+import pytest
+
+from app.infrastructure.backlog.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from tests.mock_data import FakeClock
+
+
+def make_breaker(clock: FakeClock, **kwargs: float) -> CircuitBreaker:
+    params = dict(
+        failure_rate_threshold=0.5,
+        slow_call_seconds=5.0,
+        slow_call_rate_threshold=0.5,
+        minimum_calls=4,
+        window_size=4,
+        open_seconds=30.0,
+    )
+    params.update(kwargs)
+    return CircuitBreaker(clock=clock, **params)
+
+
+class TestCircuitBreaker:
+    """サーキットブレーカーのテストクラス"""
+
+    def test_opens_when_failure_rate_exceeds_threshold(self) -> None:
+        """失敗率がしきい値以上になると開き、呼び出しをすぐに失敗させることを確認するテスト"""
+        breaker = make_breaker(FakeClock())
+        for success in (True, False, True):
+            breaker.record(success, 0.1)
+        assert breaker.state == CLOSED
+
+        breaker.record(False, 0.1)
+        assert breaker.state == OPEN
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_call()
+        assert exc_info.value.retry_after == 30.0
+        assert breaker.snapshot()["rejected_calls"] == 1
+
+    def test_opens_when_calls_are_slow(self) -> None:
+        """遅い呼び出しの割合がしきい値以上になると開くことを確認するテスト"""
+        breaker = make_breaker(FakeClock())
+        for elapsed in (0.1, 0.1, 6.0, 6.0):
+            breaker.record(True, elapsed)
+        assert breaker.state == OPEN
+
+    def test_half_open_closes_after_successful_trial(self) -> None:
+        """半開での試験的な呼び出しが成功すると閉じることを確認するテスト"""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        for _ in range(4):
+            breaker.record(False, 0.1)
+
+        clock.now = 30
+        assert breaker.state == HALF_OPEN
+        breaker.before_call()
+        # 試験的な呼び出しの結果が出るまでは他の呼び出しを許可しない
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record(True, 0.1)
+        assert breaker.state == CLOSED
+        breaker.before_call()
+
+    def test_half_open_reopens_after_failed_trial(self) -> None:
+        """半開での試験的な呼び出しが失敗すると再び開くことを確認するテスト"""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        for _ in range(4):
+            breaker.record(False, 0.1)
+
+        clock.now = 30
+        breaker.before_call()
+        breaker.record(False, 0.1)
+        assert breaker.state == OPEN
+        assert breaker.snapshot()["opened_count"] == 2
+
+    def test_disabled_breaker_never_opens(self) -> None:
+        """無効なサーキットブレーカーは開かないことを確認するテスト"""
+        breaker = make_breaker(FakeClock(), enabled=False)
+        for _ in range(4):
+            breaker.record(False, 0.1)
+        breaker.before_call()
+        assert breaker.state == CLOSED
+
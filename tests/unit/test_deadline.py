@@ -0,0 +1,33 @@
+"""
+リクエスト単位の処理期限のユニットテスト
+"""
+
+from app.core.deadline import deadline_exceeded, deadline_scope, remaining
+
+
+class TestDeadline:
+    """処理期限のテストクラス"""
+
+    def test_no_deadline_by_default(self) -> None:
+        """期限を設定しない場合は期限切れにならないことを確認するテスト"""
+        assert remaining() is None
+        assert deadline_exceeded() is False
+
+    def test_nested_scope_keeps_earlier_deadline(self) -> None:
+        """入れ子で設定した場合は早い方の期限を使い、終了後に元に戻すことを確認するテスト"""
+        with deadline_scope(10):
+            with deadline_scope(100):
+                left = remaining()
+                assert left is not None and left <= 10
+            with deadline_scope(2):
+                left = remaining()
+                assert left is not None and left <= 2
+            left = remaining()
+            assert left is not None and left > 2
+        assert remaining() is None
+
+    def test_deadline_exceeded_uses_margin(self) -> None:
+        """残り時間が余裕時間以下になると期限切れとみなすことを確認するテスト"""
+        with deadline_scope(5):
+            assert deadline_exceeded(margin=1) is False
+            assert deadline_exceeded(margin=10) is True
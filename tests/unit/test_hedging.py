@@ -0,0 +1,106 @@
+"""
+読み取りリクエストのヘッジのユニットテスト
+"""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from app.core.deadline import deadline_scope, remaining
+from app.infrastructure.backlog.hedging import Hedger
+
+
+def make_hedger(**kwargs: float) -> Hedger:
+    params = dict(budget_ratio=1.0, min_delay=0.01, min_samples=3)
+    params.update(kwargs)
+    hedger = Hedger(**params)
+    # 応答時間を記録しておく
+    for _ in range(3):
+        hedger.call("get_issue", lambda: None)
+    return hedger
+
+
+class TestHedger:
+    """ヘッジのテストクラス"""
+
+    def test_does_not_hedge_without_enough_samples(self) -> None:
+        """応答時間の記録が足りない場合はヘッジしないことを確認するテスト"""
+        hedger = Hedger(min_samples=3)
+        assert hedger.delay("get_issue") is None
+        assert hedger.call("get_issue", lambda: "issue") == "issue"
+        assert hedger.snapshot()["hedged_calls"] == 0
+
+    def test_slow_call_is_hedged(self) -> None:
+        """待ち時間を過ぎても応答がない場合、重ねて送った呼び出しの結果を返すことを確認するテスト"""
+        hedger = make_hedger()
+        release = threading.Event()
+        calls = []
+
+        def func() -> str:
+            calls.append(1)
+            if len(calls) == 1:
+                # 最初の呼び出しだけ応答が遅い
+                release.wait(5)
+                return "slow"
+            return "fast"
+
+        try:
+            assert hedger.call("get_issue", func) == "fast"
+        finally:
+            release.set()
+        stats = hedger.snapshot()
+        assert stats["hedged_calls"] == 1
+        assert stats["hedge_wins"] == 1
+
+    def test_budget_limits_hedging(self) -> None:
+        """予算がない場合はヘッジしないことを確認するテスト"""
+        hedger = make_hedger(budget_ratio=0.0)
+        release = threading.Event()
+        calls = []
+
+        def func() -> str:
+            calls.append(1)
+            release.wait(0.1)
+            return "slow"
+
+        assert hedger.call("get_issue", func) == "slow"
+        assert len(calls) == 1
+
+    def test_error_response_does_not_win(self) -> None:
+        """エラーのレスポンスは先に返っても採用せず、応答時間も記録しないことを確認するテスト"""
+        hedger = make_hedger()
+        ok, error = Mock(ok=True), Mock(ok=False)
+        calls = []
+
+        def func() -> Mock:
+            calls.append(1)
+            if len(calls) == 1:
+                threading.Event().wait(0.1)
+                return ok
+            return error
+
+        assert hedger.call("get_issue", func) is ok
+        stats = hedger.snapshot()
+        assert stats["hedged_calls"] == 1
+        assert stats["hedge_wins"] == 0
+        # エラーのレスポンスの応答時間は記録しない
+        assert len(hedger._latencies["get_issue"]) == 4
+
+    def test_failed_call_raises_when_both_fail(self) -> None:
+        """重ねて送った呼び出しも失敗した場合は例外を送出することを確認するテスト"""
+        hedger = make_hedger()
+
+        def func() -> str:
+            threading.Event().wait(0.05)
+            raise ValueError("API Error")
+
+        with pytest.raises(ValueError):
+            hedger.call("get_issue", func)
+
+    def test_call_runs_in_caller_context(self) -> None:
+        """処理期限が呼び出しを実行するスレッドに引き継がれることを確認するテスト"""
+        hedger = make_hedger()
+        with deadline_scope(10):
+            left = hedger.call("get_issue", remaining)
+        assert left is not None and left <= 10
@@ -0,0 +1,48 @@
+"""
+課題キャッシュのユニットテスト
+"""
+
+from app.infrastructure.backlog.issue_cache import IssueCache
+from tests.mock_data import FakeClock
+
+
+class TestIssueCache:
+    """課題キャッシュのテストクラス"""
+
+    def test_expires_after_ttl(self) -> None:
+        """有効期間を過ぎた課題は返さないことを確認するテスト"""
+        clock = FakeClock()
+        cache = IssueCache(ttl=10, clock=clock)
+        cache.put("space", {"id": 1, "issueKey": "TEST-1"})
+
+        clock.now = 10
+        assert cache.get("space", "TEST-1") is not None
+        clock.now = 10.1
+        assert cache.get("space", "TEST-1") is None
+
+    def test_does_not_overwrite_with_older_updated(self) -> None:
+        """保存済みの課題より古い課題では上書きしないことを確認するテスト"""
+        cache = IssueCache()
+        cache.put("space", {"id": 1, "summary": "new", "updated": "2024-01-02T00:00:00Z"})
+        cache.put("space", {"id": 1, "summary": "old", "updated": "2024-01-01T00:00:00Z"})
+
+        assert cache.get("space", 1)["summary"] == "new"
+
+    def test_evicts_least_recently_used(self) -> None:
+        """上限を超えた場合は最も長く使われていない課題から破棄することを確認するテスト"""
+        cache = IssueCache(max_entries=2)
+        cache.put("space", {"id": 1, "issueKey": "TEST-1"})
+        cache.put("space", {"id": 2, "issueKey": "TEST-2"})
+        cache.get("space", "TEST-1")
+        cache.put("space", {"id": 3, "issueKey": "TEST-3"})
+
+        assert cache.get("space", "TEST-1") is not None
+        assert cache.get("space", "TEST-2") is None
+        assert cache.get("space", 2) is None
+
+    def test_is_isolated_per_space(self) -> None:
+        """スペースごとに分離されていることを確認するテスト"""
+        cache = IssueCache()
+        cache.put("space1", {"id": 1, "issueKey": "TEST-1"})
+
+        assert cache.get("space2", "TEST-1") is None
@@ -0,0 +1,217 @@
+"""
+課題のローカルミラーのユニットテスト
+"""
+
+from typing import Any, Dict, List
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.application.services.issue_service import IssueService
+from app.core.deadline import DeadlineExceededError
+from app.infrastructure.mirror.issue_mirror import IssueMirror
+from app.infrastructure.mirror.mirror_sync import PAGE_SIZE, IssueMirrorSync
+from tests import mock_data
+
+
+def make_issue(issue_id: int, updated: str, status_id: int = 1, assignee_id: int = 10) -> Dict[str, Any]:
+    return mock_data.make_issue(
+        issue_id, updated=updated, status={"id": status_id}, assignee={"id": assignee_id}
+    )
+
+
+class TestIssueMirror:
+    """課題のローカルミラーのテストクラス"""
+
+    def test_upsert_and_query(self) -> None:
+        """保存した課題を絞り込み、更新日時の降順で取得できることを確認するテスト"""
+        mirror = IssueMirror()
+        mirror.upsert_issues(
+            "space",
+            [
+                make_issue(1, "2024-01-01T00:00:00Z", status_id=1),
+                make_issue(2, "2024-01-03T00:00:00Z", status_id=2),
+                make_issue(3, "2024-01-02T00:00:00Z", status_id=1, assignee_id=20),
+            ],
+        )
+
+        assert [i["id"] for i in mirror.query_issues("space", project_id=1)] == [2, 3, 1]
+        assert [i["id"] for i in mirror.query_issues("space", status_id=[1])] == [3, 1]
+        assert [i["id"] for i in mirror.query_issues("space", assignee_id=20)] == [3]
+        assert mirror.query_issues("other", project_id=1) == []
+        assert mirror.get_issue("space", "TEST-2")["id"] == 2
+        assert mirror.get_issue("space", 3)["issueKey"] == "TEST-3"
+
+    def test_does_not_overwrite_with_older_issue(self) -> None:
+        """保存済みの課題より古い課題では上書きしないことを確認するテスト"""
+        mirror = IssueMirror()
+        mirror.upsert_issues("space", [make_issue(1, "2024-01-02T00:00:00Z", status_id=2)])
+        mirror.upsert_issues("space", [make_issue(1, "2024-01-01T00:00:00Z", status_id=1)])
+
+        assert mirror.get_issue("space", 1)["status"] == {"id": 2}
+
+    def test_delete_issue(self) -> None:
+        """課題キーで課題を削除できることを確認するテスト"""
+        mirror = IssueMirror()
+        mirror.upsert_issues("space", [make_issue(1, "2024-01-01T00:00:00Z")])
+
+        assert mirror.delete_issue("space", "TEST-1") is True
+        assert mirror.get_issue("space", 1) is None
+        assert mirror.delete_issue("space", "TEST-1") is False
+
+
+class TestIssueMirrorSync:
+    """課題のローカルミラーの同期のテストクラス"""
+
+    def setup_method(self) -> None:
+        self.mirror = IssueMirror()
+        self.clock = mock_data.FakeClock(1000.0)
+        self.client = Mock()
+        self.client.space = "space"
+        self.sync = IssueMirrorSync(self.client, self.mirror, clock=self.clock)
+
+    def test_initial_load_pages_through_all_issues(self) -> None:
+        """初回は全課題をページ単位で取得することを確認するテスト"""
+        first_page = [make_issue(i, f"2024-01-01T00:00:{i % 60:02d}Z") for i in range(1, PAGE_SIZE + 1)]
+        second_page = [make_issue(PAGE_SIZE + 1, "2024-01-02T00:00:00Z")]
+        self.client.get_issues_page.side_effect = [first_page, second_page]
+
+        result = self.sync.sync_project(1)
+
+        assert result["synced"] is True
+        assert result["fetched"] == PAGE_SIZE + 1
+        assert self.client.get_issues_page.call_args_list[0].kwargs == {
+            "updated_since": None,
+            "offset": 0,
+            "count": PAGE_SIZE,
+        }
+        assert self.client.get_issues_page.call_args_list[1].kwargs["offset"] == PAGE_SIZE
+        assert self.mirror.get_sync_state("space", 1) == {
+            "last_updated": "2024-01-02T00:00:00Z",
+            "synced_at": 1000.0,
+        }
+
+    def test_incremental_sync_uses_updated_since(self) -> None:
+        """2回目以降は前回の最新の更新日以降の課題だけを取得することを確認するテスト"""
+        self.client.get_issues_page.return_value = [make_issue(1, "2024-01-02T10:00:00Z")]
+        self.sync.sync_project(1)
+
+        self.clock.now = 2000.0
+        self.client.get_issues_page.return_value = [make_issue(1, "2024-01-03T10:00:00Z", status_id=3)]
+        self.sync.sync_project(1)
+
+        assert self.client.get_issues_page.call_args.kwargs["updated_since"] == "2024-01-02"
+        assert self.mirror.get_issue("space", 1)["status"] == {"id": 3}
+
+    def test_refetches_issues_skipped_by_updates_during_sync(self) -> None:
+        """同期中に更新された課題でページの境界がずれた場合、読み飛ばした課題を取得し直すことを確認するテスト"""
+        issues = [
+            make_issue(i, f"2024-01-{1 + i // PAGE_SIZE:02d}T00:{i // 60 % 60:02d}:{i % 60:02d}Z")
+            for i in range(1, 2 * PAGE_SIZE + 2)
+        ]
+
+        def get_issues_page(project_id, updated_since, offset, count):
+            if offset == PAGE_SIZE and issues[4]["id"] == 5:
+                # 2ページ目を取得する前に、取得済みの課題5が更新されて末尾へ移動する
+                issues.append({**issues.pop(4), "updated": "2024-01-05T00:00:00Z"})
+            matched = [i for i in issues if not updated_since or i["updated"][:10] >= updated_since]
+            return matched[offset : offset + count]
+
+        self.client.get_issues_page.side_effect = get_issues_page
+
+        self.sync.sync_project(1)
+
+        # 課題101は1回目の巡回では読み飛ばされるが、1ページ目の最後の課題の更新日から取得し直す
+        assert self.mirror.get_issue("space", PAGE_SIZE + 1) is not None
+        assert self.client.get_issues_page.call_args_list[3].kwargs == {
+            "updated_since": "2024-01-02",
+            "offset": 0,
+            "count": PAGE_SIZE,
+        }
+        assert self.client.get_issues_page.call_count == 5
+        assert self.mirror.get_sync_state("space", 1)["last_updated"] == "2024-01-05T00:00:00Z"
+
+    def test_skips_sync_within_max_staleness(self) -> None:
+        """最後の同期から max_staleness 秒以内であれば同期しないことを確認するテスト"""
+        self.client.get_issues_page.return_value = []
+        self.sync.sync_project(1)
+
+        self.clock.now = 1030.0
+        result = self.sync.sync_project(1, max_staleness=60)
+        assert result["synced"] is False
+        assert result["age_seconds"] == 30.0
+        assert self.client.get_issues_page.call_count == 1
+
+        self.clock.now = 1100.0
+        assert self.sync.sync_project(1, max_staleness=60)["synced"] is True
+
+    def test_stops_at_deadline(self) -> None:
+        """処理期限が近い場合は同期を中断し、同期完了として記録しないことを確認するテスト"""
+        with patch(
+            "app.infrastructure.mirror.mirror_sync.deadline_exceeded", return_value=True
+        ):
+            with pytest.raises(DeadlineExceededError):
+                self.sync.sync_project(1)
+        assert self.sync.age(1) is None
+
+
+class TestIssueServiceMirror:
+    """課題管理サービスのローカルミラー利用のテストクラス"""
+
+    def test_get_issues_reads_from_mirror(self, mock_backlog_client: Mock) -> None:
+        """max_staleness を指定した場合はミラーから取得することを確認するテスト"""
+        mock_backlog_client.space = "dummy_space"
+        mock_backlog_client.get_issues_page.return_value = [
+            make_issue(1, "2024-01-01T00:00:00Z", status_id=1),
+            make_issue(2, "2024-01-02T00:00:00Z", status_id=2),
+        ]
+        issue_service = IssueService(backlog_client=mock_backlog_client, mirror=IssueMirror())
+
+        issues = issue_service.get_issues(project_id=1, status_id=[2], max_staleness=60)
+        assert [issue["id"] for issue in issues] == [2]
+        issue_service.get_issues(project_id=1, max_staleness=60)
+
+        mock_backlog_client.get_issues_page.assert_called_once()
+        mock_backlog_client.get_issues.assert_not_called()
+
+    def test_get_issues_pages_from_mirror(self, mock_backlog_client: Mock) -> None:
+        """offset を指定した次のページもミラーから取得することを確認するテスト"""
+        mock_backlog_client.space = "dummy_space"
+        mock_backlog_client.get_issues_page.return_value = [
+            make_issue(i, f"2024-01-{i:02d}T00:00:00Z") for i in range(1, 6)
+        ]
+        issue_service = IssueService(backlog_client=mock_backlog_client, mirror=IssueMirror())
+
+        first = issue_service.get_issues(project_id=1, count=2, max_staleness=60)
+        second = issue_service.get_issues(project_id=1, count=2, offset=2, max_staleness=60)
+
+        assert [issue["id"] for issue in first + second] == [5, 4, 3, 2]
+        mock_backlog_client.get_issues.assert_not_called()
+
+    def test_get_issues_with_filters_skips_mirror(self, mock_backlog_client: Mock) -> None:
+        """ミラーで扱えない絞り込み条件がある場合はBacklogに渡すことを確認するテスト"""
+        mock_backlog_client.get_issues.return_value = [{"id": 1}]
+        issue_service = IssueService(backlog_client=mock_backlog_client, mirror=IssueMirror())
+
+        issue_service.get_issues(
+            project_id=1, max_staleness=60, milestone_id=[3], category_id=[], sort=None
+        )
+
+        mock_backlog_client.get_issues_page.assert_not_called()
+        mock_backlog_client.get_issues.assert_called_once_with(
+            project_id=1,
+            status_id=None,
+            assignee_id=None,
+            keyword=None,
+            count=20,
+            milestone_id=[3],
+        )
+
+    def test_get_issues_falls_back_when_sync_fails(self, mock_backlog_client: Mock) -> None:
+        """同期に失敗した場合はBacklogから直接取得することを確認するテスト"""
+        mock_backlog_client.space = "dummy_space"
+        mock_backlog_client.get_issues_page.side_effect = Exception("API Error")
+        mock_backlog_client.get_issues.return_value = [{"id": 1}]
+        issue_service = IssueService(backlog_client=mock_backlog_client, mirror=IssueMirror())
+
+        assert issue_service.get_issues(project_id=1, max_staleness=60) == [{"id": 1}]
@@ -0,0 +1,212 @@
+"""
+課題の検索クエリサービスのテスト
+"""
+
+from datetime import date
+from typing import Any, Dict, List
+from unittest.mock import Mock
+
+import pytest
+
+from app.application.services.issue_query_service import (
+    PAGE_SIZE,
+    IssueQueryService,
+    parse_query,
+)
+from tests.mock_data import make_issue
+
+
+class TestParseQuery:
+    """クエリの解析のテストクラス"""
+
+    def test_fields_values_and_keywords(self) -> None:
+        """項目・否定・カンマ区切りの値・引用符・キーワードを解析することを確認するテスト"""
+        terms = parse_query('type:バグ,タスク -status:完了 milestone:"v 2.0" due<today 障害')
+
+        assert terms == [
+            {"field": "type", "op": ":", "values": ["バグ", "タスク"], "negate": False},
+            {"field": "status", "op": ":", "values": ["完了"], "negate": True},
+            {"field": "milestone", "op": ":", "values": ["v 2.0"], "negate": False},
+            {"field": "due", "op": "<", "values": ["today"], "negate": False},
+            {"field": "keyword", "op": ":", "values": ["障害"], "negate": False},
+        ]
+
+    def test_negated_keyword_is_rejected(self) -> None:
+        """項目のない語の否定は ValueError になることを確認するテスト"""
+        with pytest.raises(ValueError):
+            parse_query("-障害")
+
+
+class TestIssueQueryService:
+    """課題の検索クエリサービスのテストクラス"""
+
+    def setup_method(self) -> None:
+        self.client = Mock()
+        self.client.get_project.return_value = {"id": 1, "projectKey": "TEST"}
+        self.client.get_statuses.return_value = [
+            {"id": 1, "name": "未対応"},
+            {"id": 2, "name": "処理中"},
+            {"id": 3, "name": "処理済み"},
+            {"id": 4, "name": "完了"},
+        ]
+        self.client.get_issue_types.return_value = [
+            {"id": 10, "name": "バグ"},
+            {"id": 11, "name": "タスク"},
+        ]
+        self.client.get_priorities.return_value = [
+            {"id": 2, "name": "高"},
+            {"id": 3, "name": "中"},
+        ]
+        self.client.get_milestones.return_value = [{"id": 20, "name": "2.0"}]
+        self.client.get_project_users.return_value = [
+            {"id": 100, "userId": "tanaka", "name": "田中"},
+            {"id": 101, "userId": "suzuki", "name": "鈴木"},
+        ]
+        self.client.get_issues.return_value = []
+        self.service = IssueQueryService(
+            self.client, today=lambda: date(2024, 3, 15), max_pages=3
+        )
+
+    def test_pushes_down_resolved_filters(self) -> None:
+        """名前をIDへ解決し、すべての条件を課題一覧APIに渡すことを確認するテスト"""
+        result = self.service.query(
+            "project:TEST type:バグ priority:高 milestone:2.0 assignee:Tanaka is:overdue sort:due order:asc"
+        )
+
+        plan = result["plan"]
+        assert plan["project_id"] == 1
+        assert plan["pushdown"] == {
+            "issue_type_id": [10],
+            "priority_id": [2],
+            "milestone_id": [20],
+            "assignee_id": [100],
+            "status_id": [1, 2, 3],
+            "due_date_until": "2024-03-14",
+            "sort": "dueDate",
+            "order": "asc",
+        }
+        assert plan["local"] == []
+        assert plan["resolved"]["assignee"] == {"Tanaka": 100}
+        # プロジェクト1 + 名前解決用の一覧5 + 課題一覧1
+        assert plan["lookups"] == 6
+        assert plan["api_calls"] == 7
+        assert plan["pages"] == 1
+        self.client.get_issues.assert_called_once_with(
+            project_id=1, count=20, offset=None, raise_errors=True, **plan["pushdown"]
+        )
+
+    def test_negation_and_date_ranges(self) -> None:
+        """否定を補集合に、日付の比較を範囲に変換することを確認するテスト"""
+        plan = self.service.plan(
+            "-status:完了,処理済み created>=2024-01-01 created<today-7 updated:today", project_id=1
+        )
+
+        assert plan["pushdown"] == {
+            "status_id": [1, 2],
+            "created_since": "2024-01-01",
+            "created_until": "2024-03-07",
+            "updated_since": "2024-03-15",
+            "updated_until": "2024-03-15",
+        }
+
+    def test_negation_of_optional_field_is_applied_locally(self) -> None:
+        """値を持たない課題や一覧にない値を落とさないよう、担当者・マイルストーンなどの否定は取得後に適用することを確認するテスト"""
+        self.client.get_issues.return_value = [
+            make_issue(1, assignee={"id": 100}),
+            make_issue(2, assignee=None),
+            make_issue(3, assignee={"id": 999}),
+            make_issue(4, assignee={"id": 101}),
+        ]
+
+        result = self.service.query("-assignee:tanaka -milestone:2.0", project_id=1)
+
+        plan = result["plan"]
+        assert "assignee_id" not in plan["pushdown"]
+        assert "milestone_id" not in plan["pushdown"]
+        assert plan["local"][0] == {
+            "field": "assignee",
+            "attribute": "assignee",
+            "ids": [100],
+            "include_none": False,
+            "negate": True,
+        }
+        assert [issue["id"] for issue in result["issues"]] == [2, 3, 4]
+
+    def test_api_errors_are_raised(self) -> None:
+        """課題一覧や名前解決用の一覧を取得できない場合は、一致なしとせずに例外を送出することを確認するテスト"""
+        self.client.get_issues.side_effect = Exception("API Error")
+        with pytest.raises(Exception, match="API Error"):
+            self.service.query("type:バグ", project_id=1)
+
+        self.client.get_project_users.side_effect = Exception("API Error")
+        with pytest.raises(Exception, match="Failed to load users"):
+            self.service.plan("assignee:tanaka", project_id=1)
+        self.client.get_project_users.assert_called_once_with(1, raise_errors=True)
+
+    def test_contradiction_skips_api(self) -> None:
+        """条件が矛盾する場合はAPIを呼び出さないことを確認するテスト"""
+        result = self.service.query("status:完了 is:open", project_id=1)
+
+        assert result["plan"]["empty"] is True
+        assert result["issues"] == []
+        self.client.get_issues.assert_not_called()
+
+    def test_local_filters_page_until_limit(self) -> None:
+        """APIで絞り込めない条件は取得後に適用し、件数に達するまでページングすることを確認するテスト"""
+        pages: List[List[Dict[str, Any]]] = [
+            [make_issue(i, assignee={"id": 100}) for i in range(PAGE_SIZE)],
+            [make_issue(PAGE_SIZE + i) for i in range(PAGE_SIZE)],
+        ]
+        self.client.get_issues.side_effect = pages
+
+        result = self.service.query("assignee:none,suzuki limit:30", project_id=1)
+
+        assert [issue["id"] for issue in result["issues"]] == list(range(PAGE_SIZE, PAGE_SIZE + 30))
+        assert result["plan"]["pages"] == 2
+        assert result["plan"]["scanned"] == 2 * PAGE_SIZE
+        assert "assignee_id" not in result["plan"]["pushdown"]
+        assert self.client.get_issues.call_args_list[1].kwargs["offset"] == PAGE_SIZE
+        assert result["plan"]["next_offset"] == PAGE_SIZE + 30
+
+    def test_continues_from_next_offset(self) -> None:
+        """next_offset から続きを検索し、最後まで取得した場合は next_offset が None になることを確認するテスト"""
+        issues = [make_issue(i, assignee=None if i % 2 else {"id": 100}) for i in range(150)]
+        self.client.get_issues.side_effect = lambda count, offset, **kwargs: issues[
+            offset or 0 : (offset or 0) + count
+        ]
+
+        first = self.service.query("assignee:none limit:40", project_id=1)
+        second = self.service.query(
+            "assignee:none limit:40", project_id=1, offset=first["plan"]["next_offset"]
+        )
+
+        assert first["plan"]["next_offset"] == 80
+        assert [issue["id"] for issue in first["issues"] + second["issues"]] == list(
+            range(1, 150, 2)
+        )
+        assert second["plan"]["next_offset"] is None
+
+    def test_local_filters_stop_at_max_pages(self) -> None:
+        """取得後の絞り込みは最大ページ数で打ち切り、truncated を返すことを確認するテスト"""
+        self.client.get_issues.return_value = [make_issue(i) for i in range(PAGE_SIZE)]
+
+        result = self.service.query('summary:"見つからない"', project_id=1)
+
+        assert result["issues"] == []
+        assert result["plan"]["pages"] == 3
+        assert result["plan"]["truncated"] is True
+
+    @pytest.mark.parametrize(
+        "query",
+        ["type:不明", "priority:none", "due<2024/01/01", "unknown:1", "-is:open", "sort:bogus"],
+    )
+    def test_invalid_queries(self, query: str) -> None:
+        """不正なクエリは ValueError になることを確認するテスト"""
+        with pytest.raises(ValueError):
+            self.service.query(query, project_id=1)
+        self.client.get_issues.assert_not_called()
+
+    def test_project_is_required(self) -> None:
+        """プロジェクトを指定しない場合は ValueError になることを確認するテスト"""
+        with pytest.raises(ValueError):
+            self.service.query("type:バグ")
@@ -0,0 +1,155 @@
+"""
+課題の全文検索のテスト
+"""
+
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from app.application.services.issue_service import IssueService
+from app.infrastructure.mirror.issue_mirror import IssueMirror
+from app.infrastructure.mirror.mirror_sync import IssueMirrorSync
+from app.infrastructure.mirror.ngram import make_snippet, to_index_text, to_match_query
+from tests.mock_data import make_issue
+
+
+class TestNgram:
+    """bi-gram分割のテストクラス"""
+
+    def test_to_index_text(self) -> None:
+        """文字・数字の連続を2文字ずつ区切り、記号で区切ることを確認するテスト"""
+        assert to_index_text("ログイン障害") == "ログ グイ イン ン障 障害"
+        assert to_index_text("ＡＰＩ-v2") == "ap pi v2"
+        assert to_index_text(None) == ""
+
+    def test_to_match_query(self) -> None:
+        """検索語をフレーズのAND条件に変換することを確認するテスト"""
+        assert to_match_query("障害 ログイン") == '"障害" AND "ログ グイ イン"'
+        assert to_match_query("表") == '"表" *'
+        assert to_match_query("！？") is None
+
+    def test_make_snippet(self) -> None:
+        """検索語の前後を抜き出して強調することを確認するテスト"""
+        text = "あ" * 50 + "障害が発生" + "い" * 50
+        snippet = make_snippet(text, "障害", width=5)
+        assert snippet == "…あああああ**障害**が発生いい…"
+        assert make_snippet("関係ない文章", "障害") is None
+
+
+class TestIssueMirrorSearch:
+    """ローカルミラーの全文検索のテストクラス"""
+
+    def setup_method(self) -> None:
+        self.mirror = IssueMirror()
+        self.mirror.upsert_issues(
+            "space",
+            [
+                make_issue(1, "ログイン画面で障害が発生", description="エラーが表示される"),
+                make_issue(2, "検索機能の改善", description="ログイン後の画面で検索が遅い"),
+                make_issue(3, "帳票の出力", description="障害とは関係ない", project_id=2),
+            ],
+        )
+
+    def test_ranks_summary_matches_higher(self) -> None:
+        """件名に一致した課題を詳細に一致した課題より上位にすることを確認するテスト"""
+        results = self.mirror.search_issues("space", "ログイン")
+        assert [result["issue"]["id"] for result in results] == [1, 2]
+        assert results[0]["score"] > results[1]["score"]
+        assert results[0]["matched_field"] == "summary"
+        assert results[0]["snippet"] == "**ログイン**画面で障害が発生"
+        assert results[1]["matched_field"] == "description"
+
+    def test_matches_two_character_terms(self) -> None:
+        """2文字の単語で検索できることを確認するテスト"""
+        results = self.mirror.search_issues("space", "障害")
+        assert {result["issue"]["id"] for result in results} == {1, 3}
+
+    def test_requires_all_terms(self) -> None:
+        """空白で区切った検索語をすべて含む課題だけを返すことを確認するテスト"""
+        results = self.mirror.search_issues("space", "ログイン 検索")
+        assert [result["issue"]["id"] for result in results] == [2]
+
+    def test_does_not_match_across_separators(self) -> None:
+        """連続していない文字列には一致しないことを確認するテスト"""
+        assert self.mirror.search_issues("space", "イン画面障害") == []
+
+    def test_filters_by_project_and_space(self) -> None:
+        """プロジェクトとスペースで絞り込むことを確認するテスト"""
+        results = self.mirror.search_issues("space", "障害", project_id=2)
+        assert [result["issue"]["id"] for result in results] == [3]
+        assert self.mirror.search_issues("other", "障害") == []
+
+    def test_reindexes_updated_issue(self) -> None:
+        """課題を更新すると索引も更新されることを確認するテスト"""
+        self.mirror.upsert_issues(
+            "space", [make_issue(1, "ログアウトできない", updated="2024-01-02T00:00:00Z")]
+        )
+        results = self.mirror.search_issues("space", "障害")
+        assert [result["issue"]["id"] for result in results] == [3]
+
+    def test_searches_comments(self) -> None:
+        """コメントも検索対象にすることを確認するテスト"""
+        self.mirror.upsert_comments("space", 2, [{"id": 100, "content": "再現手順を追記しました"}])
+        results = self.mirror.search_issues("space", "再現手順")
+        assert [result["issue"]["id"] for result in results] == [2]
+        assert results[0]["matched_field"] == "comments"
+        assert self.mirror.get_last_comment_id("space", 2) == 100
+
+    def test_delete_issue_removes_from_index(self) -> None:
+        """課題を削除すると検索結果に含まれないことを確認するテスト"""
+        self.mirror.delete_issue("space", "TEST-1")
+        results = self.mirror.search_issues("space", "ログイン")
+        assert [result["issue"]["id"] for result in results] == [2]
+
+    def test_indexes_existing_database(self, tmp_path: Any) -> None:
+        """索引のないデータベースを開くと既存の課題を索引に登録することを確認するテスト"""
+        path = str(tmp_path / "mirror.sqlite3")
+        mirror = IssueMirror(path)
+        mirror.upsert_issues("space", [make_issue(1, "ログイン障害")])
+        mirror._conn.execute("DELETE FROM issue_fts")
+        mirror._conn.commit()
+
+        reopened = IssueMirror(path)
+        assert len(reopened.search_issues("space", "障害")) == 1
+
+
+class TestMirrorSyncComments:
+    """ミラーの同期でのコメント取得のテストクラス"""
+
+    def test_fetches_new_comments(self) -> None:
+        """保存済みのコメントより新しいコメントだけを取得することを確認するテスト"""
+        mirror = IssueMirror()
+        mirror.upsert_comments("space", 1, [{"id": 10, "content": "最初のコメント"}])
+        client = Mock()
+        client.space = "space"
+        client.get_issues_page.return_value = [make_issue(1, "課題")]
+        client.iter_issue_comments.return_value = iter([{"id": 11, "content": "追加のコメント"}])
+
+        IssueMirrorSync(client, mirror, index_comments=True).sync_project(1)
+
+        client.iter_issue_comments.assert_called_once_with("1", min_id=10)
+        assert mirror.get_last_comment_id("space", 1) == 11
+        assert len(mirror.search_issues("space", "追加")) == 1
+
+
+class TestIssueServiceSearch:
+    """課題管理サービスの全文検索のテストクラス"""
+
+    def test_search_issues_syncs_project(self, mock_backlog_client: Mock) -> None:
+        """プロジェクトと max_staleness を指定した場合は同期してから検索することを確認するテスト"""
+        mock_backlog_client.space = "dummy_space"
+        mock_backlog_client.get_issues_page.return_value = [make_issue(1, "ログイン障害")]
+        issue_service = IssueService(backlog_client=mock_backlog_client, mirror=IssueMirror())
+
+        results = issue_service.search_issues("障害", project_id=1, max_staleness=60)
+
+        assert [result["issue"]["id"] for result in results] == [1]
+        mock_backlog_client.get_issues_page.assert_called_once()
+
+    def test_search_issues_requires_mirror(self, mock_backlog_client: Mock) -> None:
+        """ミラーが無効な場合はエラーになることを確認するテスト"""
+        issue_service = IssueService(backlog_client=mock_backlog_client)
+        issue_service.mirror = None
+        with pytest.raises(ValueError):
+            issue_service.search_issues("障害")
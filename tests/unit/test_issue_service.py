@@ -2,11 +2,13 @@
 課題管理サービスのユニットテスト
 """
 
+from typing import Any, Dict, List, Optional
 from unittest.mock import Mock, patch
 
 import pytest
 
 from app.application.services.issue_service import IssueService
+from app.core.config import settings
 
 
 class TestIssueService:
@@ -561,3 +563,208 @@ class TestIssueService:
 
         # エラーメッセージを確認
         assert "Failed to get comments" in str(excinfo.value)
+
+    def test_get_issue_comments_since_comment_id(self, mock_backlog_client: Mock) -> None:
+        """since_comment_idを指定した場合は差分取得を使うことを確認するテスト"""
+        # モックの戻り値を設定
+        mock_backlog_client.get_issue_comments_since.return_value = [
+            {"id": 3, "content": "コメント3"}
+        ]
+
+        # テスト対象のサービスをインスタンス化
+        issue_service = IssueService(backlog_client=mock_backlog_client)
+
+        # コメント一覧を取得
+        comments = issue_service.get_issue_comments("TEST-1", count=10, since_comment_id=2)
+
+        # モックが正しいパラメータで呼ばれたことを確認
+        mock_backlog_client.get_issue_comments_since.assert_called_once_with(
+            issue_id_or_key="TEST-1", since_comment_id=2, count=10
+        )
+        mock_backlog_client.get_issue_comments.assert_not_called()
+        assert comments[0]["id"] == 3
+
+    def test_get_issue_comments_before_comment_id(self, mock_backlog_client: Mock) -> None:
+        """before_comment_idを指定した場合はそれより古いコメントを新しい順で取得することを確認するテスト"""
+        mock_backlog_client.get_issue_comments.return_value = [
+            {"id": 9, "content": "コメント9"},
+            {"id": 8, "content": "コメント8"},
+        ]
+        issue_service = IssueService(backlog_client=mock_backlog_client)
+
+        comments = issue_service.get_issue_comments("TEST-1", count=2, before_comment_id=10)
+
+        mock_backlog_client.get_issue_comments.assert_called_once_with(
+            issue_id_or_key="TEST-1", count=2, max_id=9, order="desc"
+        )
+        assert [comment["id"] for comment in comments] == [9, 8]
+
+
+class TestIssuesAcrossProjects:
+    """複数プロジェクトの課題取得のテストクラス"""
+
+    @staticmethod
+    def fake_get_issues(issues_by_project: Dict[int, List[Dict[str, Any]]]) -> Any:
+        """projectId[]・count・offsetを解釈し、更新日時の降順で返す課題一覧APIの代わり"""
+
+        def get_issues(
+            project_id: List[int], count: int, offset: Optional[int], **kwargs: Any
+        ) -> List[Dict[str, Any]]:
+            issues = sorted(
+                (issue for pid in project_id for issue in issues_by_project.get(pid, [])),
+                key=lambda issue: issue["updated"],
+                reverse=True,
+            )
+            return issues[offset or 0 : (offset or 0) + count]
+
+        return get_issues
+
+    def test_merges_chunks_in_sort_order(self, mock_backlog_client: Mock) -> None:
+        """プロジェクトをまとめて並行して取得し、並び順を保って併合することを確認するテスト"""
+        issues_by_project = {
+            pid: [
+                {"id": pid * 100 + i, "updated": f"2024-01-{day:02d}T00:00:00Z"}
+                for i, day in enumerate(range(pid, 29, 5))
+            ]
+            for pid in range(1, 6)
+        }
+        mock_backlog_client.get_issues.side_effect = self.fake_get_issues(issues_by_project)
+        mock_backlog_client.get_project.return_value = {"id": 5}
+        issue_service = IssueService(backlog_client=mock_backlog_client)
+
+        with patch.object(settings, "MULTI_PROJECT_CHUNK_SIZE", 2):
+            result = issue_service.get_issues_across_projects([1, "2", 3, 4, "PROJ5"], limit=7)
+
+        expected = sorted(
+            (issue for issues in issues_by_project.values() for issue in issues),
+            key=lambda issue: issue["updated"],
+            reverse=True,
+        )[:7]
+        assert result["issues"] == expected
+        assert result["project_ids"] == [1, 2, 3, 4, 5]
+        assert result["api_calls"] == 3
+        chunks = sorted(
+            call.kwargs["project_id"] for call in mock_backlog_client.get_issues.call_args_list
+        )
+        assert chunks == [[1, 2], [3, 4], [5]]
+
+    def test_fetches_further_pages_only_when_needed(self, mock_backlog_client: Mock) -> None:
+        """併合に必要になった場合だけ次のページを取得することを確認するテスト"""
+        issues_by_project = {
+            1: [{"id": i, "updated": f"2024-02-{i:02d}T00:00:00Z"} for i in range(1, 11)],
+            2: [{"id": 100 + i, "updated": f"2024-01-{i:02d}T00:00:00Z"} for i in range(1, 11)],
+        }
+        mock_backlog_client.get_issues.side_effect = self.fake_get_issues(issues_by_project)
+        issue_service = IssueService(backlog_client=mock_backlog_client)
+
+        with patch.object(settings, "MULTI_PROJECT_CHUNK_SIZE", 1):
+            result = issue_service.get_issues_across_projects([1, 2], limit=3)
+
+        assert [issue["id"] for issue in result["issues"]] == [10, 9, 8]
+        # limit件に達したため、2ページ目は取得しない
+        assert result["api_calls"] == 2
+
+    def test_continues_from_offsets(self, mock_backlog_client: Mock) -> None:
+        """返した offsets から続きを取得すると、1回で取得した場合と同じ並びになることを確認するテスト"""
+        issues_by_project = {
+            1: [{"id": i, "updated": f"2024-02-{i:02d}T00:00:00Z"} for i in range(1, 11)],
+            2: [{"id": 100 + i, "updated": f"2024-02-{i:02d}T12:00:00Z"} for i in range(1, 11)],
+        }
+        mock_backlog_client.get_issues.side_effect = self.fake_get_issues(issues_by_project)
+        issue_service = IssueService(backlog_client=mock_backlog_client)
+
+        with patch.object(settings, "MULTI_PROJECT_CHUNK_SIZE", 1):
+            whole = issue_service.get_issues_across_projects([1, 2], limit=12)
+            first = issue_service.get_issues_across_projects([1, 2], limit=5)
+            second = issue_service.get_issues_across_projects(
+                [1, 2], limit=7, offsets=first["offsets"]
+            )
+
+        assert first["offsets"] == [2, 3]
+        assert first["issues"] + second["issues"] == whole["issues"]
+
+    @pytest.mark.parametrize("failing_offset", [None, 100])
+    def test_raises_when_a_page_fails(
+        self, mock_backlog_client: Mock, failing_offset: Optional[int]
+    ) -> None:
+        """1ページ目でも2ページ目以降でも、取得できなかった場合は欠けた結果を返さずに例外を送出することを確認するテスト"""
+        issues_by_project = {
+            pid: [
+                {"id": pid * 1000 + i, "updated": f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}Z"}
+                for i in range(150)
+            ]
+            for pid in (1, 2)
+        }
+        get_issues = self.fake_get_issues(issues_by_project)
+
+        def failing_get_issues(
+            project_id: List[int], count: int, offset: Optional[int], **kwargs: Any
+        ) -> List[Dict[str, Any]]:
+            assert kwargs["raise_errors"] is True
+            if project_id == [2] and offset == failing_offset:
+                raise Exception("API Error")
+            return get_issues(project_id, count, offset, **kwargs)
+
+        mock_backlog_client.get_issues.side_effect = failing_get_issues
+        issue_service = IssueService(backlog_client=mock_backlog_client)
+
+        with patch.object(settings, "MULTI_PROJECT_CHUNK_SIZE", 1):
+            with pytest.raises(Exception, match=r"Failed to get issues of projects \[2\]"):
+                issue_service.get_issues_across_projects([1, 2], limit=250)
+
+    def test_rejects_unmergeable_sort(self, mock_backlog_client: Mock) -> None:
+        """併合できない並び替えの項目は ValueError になることを確認するテスト"""
+        issue_service = IssueService(backlog_client=mock_backlog_client)
+
+        with pytest.raises(ValueError):
+            issue_service.get_issues_across_projects([1], sort="priority")
+        mock_backlog_client.get_issues.assert_not_called()
+
+
+class TestExpandedIssue:
+    """関連情報を含む課題取得のテストクラス"""
+
+    def test_expands_relations(self, mock_backlog_client: Mock) -> None:
+        """コメント・子課題・親課題を取得して課題情報に含めることを確認するテスト"""
+        issues = {
+            "TEST-2": {"id": 2, "issueKey": "TEST-2", "parentIssueId": 1},
+            "1": {"id": 1, "issueKey": "TEST-1", "parentIssueId": None},
+        }
+        mock_backlog_client.get_issue.side_effect = lambda key: issues.get(key)
+        mock_backlog_client.get_issue_comments.return_value = [{"id": 10}]
+        mock_backlog_client.get_issues.return_value = [{"id": 3}]
+        issue_service = IssueService(backlog_client=mock_backlog_client)
+
+        issue = issue_service.get_issue("TEST-2", expand=["comments", "children", "parent"])
+
+        assert issue is not None
+        assert issue["comments"] == [{"id": 10}]
+        assert issue["children"] == [{"id": 3}]
+        assert issue["parent"]["issueKey"] == "TEST-1"
+        assert "expand_errors" not in issue
+        assert mock_backlog_client.get_issues.call_args.kwargs["parent_issue_id"] == [2]
+        assert mock_backlog_client.get_issues.call_args.kwargs["raise_errors"] is True
+        # 取得した課題情報そのものは変更しない
+        assert "comments" not in issues["TEST-2"]
+
+    def test_relation_errors_are_reported(self, mock_backlog_client: Mock) -> None:
+        """関連情報を取得できなかった場合は expand_errors に含めることを確認するテスト"""
+        mock_backlog_client.get_issue.return_value = {"id": 2, "issueKey": "TEST-2"}
+        mock_backlog_client.get_issue_comments.side_effect = Exception("API Error")
+        issue_service = IssueService(backlog_client=mock_backlog_client)
+
+        issue = issue_service.get_issue("2", expand=["comments", "parent"])
+
+        assert issue is not None
+        assert issue["comments"] is None
+        assert issue["parent"] is None
+        assert "API Error" in issue["expand_errors"]["comments"]
+
+    def test_missing_issue_and_unknown_expand(self, mock_backlog_client: Mock) -> None:
+        """課題が存在しない場合はNone、不明な関連情報は ValueError になることを確認するテスト"""
+        mock_backlog_client.get_issue.return_value = None
+        issue_service = IssueService(backlog_client=mock_backlog_client)
+
+        assert issue_service.get_issue("TEST-9", expand=["comments"]) is None
+        with pytest.raises(ValueError):
+            issue_service.get_issue("TEST-9", expand=["watchers"])
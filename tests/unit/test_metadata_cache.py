@@ -0,0 +1,81 @@
+"""
+メタデータキャッシュのユニットテスト
+"""
+
+from typing import Callable, List
+
+import pytest
+
+from app.infrastructure.backlog.metadata_cache import MetadataCache
+from tests.mock_data import FakeClock
+
+
+class TestMetadataCache:
+    """メタデータキャッシュのテストクラス"""
+
+    def setup_method(self) -> None:
+        self.clock = FakeClock()
+        self.background: List[Callable[[], None]] = []
+        self.cache = MetadataCache(
+            ttl=10,
+            max_staleness=100,
+            clock=self.clock,
+            run_in_background=self.background.append,
+        )
+        self.calls = 0
+
+    def load(self) -> int:
+        self.calls += 1
+        return self.calls
+
+    def test_fresh_value_is_not_reloaded(self) -> None:
+        """有効期間内の値は再取得しないことを確認するテスト"""
+        assert self.cache.get_or_load("key", self.load) == 1
+        self.clock.now = 10
+        assert self.cache.get_or_load("key", self.load) == 1
+        assert self.calls == 1
+        assert self.background == []
+
+    def test_stale_value_is_served_while_refreshing(self) -> None:
+        """有効期間を過ぎた値はすぐに返し、裏で1回だけ再取得することを確認するテスト"""
+        self.cache.get_or_load("key", self.load)
+        self.clock.now = 50
+
+        assert self.cache.get_or_load("key", self.load) == 1
+        assert self.cache.get_or_load("key", self.load) == 1
+        assert self.calls == 1
+        assert len(self.background) == 1
+
+        self.background.pop()()
+        assert self.cache.get_or_load("key", self.load) == 2
+
+    def test_value_beyond_max_staleness_is_reloaded(self) -> None:
+        """最大許容期間を過ぎた値は取得が終わるまで待つことを確認するテスト"""
+        self.cache.get_or_load("key", self.load)
+        self.clock.now = 101
+
+        assert self.cache.get_or_load("key", self.load) == 2
+        assert self.background == []
+
+    def test_failed_refresh_keeps_stale_value(self) -> None:
+        """裏での再取得に失敗しても古い値を使い続けることを確認するテスト"""
+        self.cache.get_or_load("key", self.load)
+        self.clock.now = 50
+
+        def fail() -> int:
+            raise Exception("API Error")
+
+        assert self.cache.get_or_load("key", fail) == 1
+        self.background.pop()()
+        assert self.cache.get_or_load("key", self.load) == 1
+        assert len(self.background) == 1
+
+    def test_failed_load_is_not_cached(self) -> None:
+        """取得に失敗した場合は値を保存しないことを確認するテスト"""
+
+        def fail() -> int:
+            raise Exception("API Error")
+
+        with pytest.raises(Exception):
+            self.cache.get_or_load("key", fail)
+        assert self.cache.get_or_load("key", self.load) == 1
@@ -115,3 +115,73 @@ class TestProjectService:
 
         # エラーメッセージを確認
         assert "Failed to get projects" in str(excinfo.value)
+
+
+class TestProjectContext:
+    """プロジェクトのコンテキスト取得のテストクラス"""
+
+    def setup_method(self) -> None:
+        self.client = Mock()
+        self.client.get_project.return_value = {
+            "id": 1,
+            "projectKey": "TEST",
+            "name": "テスト",
+            "chartEnabled": True,
+        }
+        self.client.get_statuses.return_value = [{"id": 1, "name": "未対応", "color": "#ed8077"}]
+        self.client.get_issue_types.return_value = [{"id": 10, "name": "バグ", "projectId": 1}]
+        self.client.get_categories.return_value = []
+        self.client.get_milestones.return_value = [
+            {"id": 20, "name": "1.0", "releaseDueDate": None, "archived": True},
+            {"id": 21, "name": "2.0", "releaseDueDate": "2024-06-30T00:00:00Z", "archived": False},
+        ]
+        self.client.get_versions.return_value = []
+        self.client.get_project_users.return_value = [
+            {"id": 100, "userId": "tanaka", "name": "田中", "mailAddress": "t@example.com"}
+        ]
+        self.client.get_priorities.return_value = [{"id": 2, "name": "高"}]
+        self.service = ProjectService(backlog_client=self.client)
+
+    def test_returns_compact_context(self) -> None:
+        """すべての項目を取得し、必要な属性だけに絞ることを確認するテスト"""
+        context = self.service.get_project_context("TEST")
+
+        assert context == {
+            "project": {"id": 1, "projectKey": "TEST", "name": "テスト"},
+            "statuses": [{"id": 1, "name": "未対応"}],
+            "issue_types": [{"id": 10, "name": "バグ"}],
+            "categories": [],
+            "milestones": [
+                {
+                    "id": 21,
+                    "name": "2.0",
+                    "releaseDueDate": "2024-06-30T00:00:00Z",
+                    "archived": False,
+                }
+            ],
+            "versions": [],
+            "users": [{"id": 100, "userId": "tanaka", "name": "田中"}],
+            "priorities": [{"id": 2, "name": "高"}],
+        }
+
+    def test_selected_sections_and_errors(self) -> None:
+        """指定した項目だけを取得し、失敗した項目は errors に含めることを確認するテスト"""
+        self.client.get_project_users.side_effect = Exception("API Error")
+
+        context = self.service.get_project_context("TEST", sections=["statuses", "users"])
+
+        assert context is not None
+        assert set(context) == {"project", "statuses", "users", "errors"}
+        assert context["users"] is None
+        assert "API Error" in context["errors"]["users"]
+        self.client.get_milestones.assert_not_called()
+        # 取得できなかった項目を空の一覧と区別するため、例外を送出させて取得する
+        self.client.get_project_users.assert_called_once_with("TEST", raise_errors=True)
+
+    def test_missing_project_and_unknown_section(self) -> None:
+        """プロジェクトが存在しない場合はNone、不明な項目は ValueError になることを確認するテスト"""
+        self.client.get_project.return_value = None
+        assert self.service.get_project_context("NONE") is None
+
+        with pytest.raises(ValueError):
+            self.service.get_project_context("TEST", sections=["wiki"])
@@ -0,0 +1,37 @@
+"""
+レート制限のユニットテスト
+"""
+
+from app.infrastructure.backlog.rate_limiter import RateLimiter
+from tests.mock_data import FakeClock
+
+
+class TestRateLimiter:
+    """レート制限のテストクラス"""
+
+    def test_allows_burst_then_waits(self) -> None:
+        """burstまでは待機せず、それ以降はrateに従って待機することを確認するテスト"""
+        clock = FakeClock()
+        limiter = RateLimiter(rate=2, burst=2, clock=clock, sleep=clock.sleep)
+
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == 0
+        assert limiter.acquire() == 0.5
+        assert limiter.acquire() == 0.5
+        assert clock.now == 1.0
+
+    def test_refills_tokens_over_time(self) -> None:
+        """時間の経過でトークンが補充されることを確認するテスト"""
+        clock = FakeClock()
+        limiter = RateLimiter(rate=1, burst=1, clock=clock, sleep=clock.sleep)
+
+        assert limiter.acquire() == 0
+        clock.now += 1.0
+        assert limiter.acquire() == 0
+
+    def test_disabled_when_rate_is_zero(self) -> None:
+        """rateが0以下の場合は制限しないことを確認するテスト"""
+        limiter = RateLimiter(rate=0)
+
+        for _ in range(100):
+            assert limiter.acquire() == 0
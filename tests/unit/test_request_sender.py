@@ -0,0 +1,94 @@
+"""
+リクエスト送信処理のユニットテスト
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from pybacklogpy.BacklogConfigure import BacklogComConfigure
+
+from app.core.deadline import DeadlineExceededError, deadline_scope
+from app.infrastructure.backlog.circuit_breaker import (
+    CLOSED,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from app.infrastructure.backlog.rate_limiter import RateLimiter
+from app.infrastructure.backlog.request_sender import ManagedRequestSender
+
+
+def make_sender(circuit_breaker: CircuitBreaker) -> ManagedRequestSender:
+    sender = ManagedRequestSender(
+        BacklogComConfigure(space_key="dummy_space", api_key="dummy_api_key"),
+        rate_limiter=RateLimiter(rate=0),
+        circuit_breaker=circuit_breaker,
+    )
+    sender.connect_timeout = 3.0
+    sender.read_timeout = 10.0
+    sender.write_timeout = 30.0
+    return sender
+
+
+class TestManagedRequestSender:
+    """リクエスト送信処理のテストクラス"""
+
+    def test_records_server_errors_as_failures(self) -> None:
+        """5xxは失敗、4xxは成功として記録し、開いた後は送信しないことを確認するテスト"""
+        breaker = CircuitBreaker(minimum_calls=2, window_size=2)
+        sender = make_sender(breaker)
+
+        with patch("requests.get") as mock_get:
+            mock_get.return_value = Mock(status_code=404)
+            sender.send_get_request("issues/TEST-1")
+            sender.send_get_request("issues/TEST-1")
+            assert breaker.state == CLOSED
+
+            mock_get.return_value = Mock(status_code=503)
+            sender.send_get_request("issues/TEST-1")
+            assert breaker.state == OPEN
+
+            with pytest.raises(CircuitOpenError):
+                sender.send_get_request("issues/TEST-1")
+            assert mock_get.call_count == 3
+
+    def test_uses_timeouts_per_operation(self) -> None:
+        """読み取り系と更新系でそれぞれのタイムアウトを指定することを確認するテスト"""
+        sender = make_sender(CircuitBreaker())
+
+        with patch("requests.get") as mock_get, patch("requests.post") as mock_post:
+            mock_get.return_value = Mock(status_code=200)
+            mock_post.return_value = Mock(status_code=201)
+            sender.send_get_request("issues", {"count": 1, "archived": False})
+            sender.send_post_request("issues", {"summary": "テスト"})
+
+        assert mock_get.call_args.kwargs["timeout"] == (3.0, 10.0)
+        assert mock_get.call_args.kwargs["params"] == {
+            "apiKey": "dummy_api_key",
+            "count": 1,
+            "archived": "false",
+        }
+        assert mock_post.call_args.kwargs["timeout"] == (3.0, 30.0)
+
+    def test_timeout_is_bounded_by_deadline(self) -> None:
+        """処理期限までの残り時間でタイムアウトを短くすることを確認するテスト"""
+        sender = make_sender(CircuitBreaker())
+
+        with patch("requests.get") as mock_get, deadline_scope(5.0):
+            mock_get.return_value = Mock(status_code=200)
+            sender.send_get_request("issues")
+
+        connect_timeout, read_timeout = mock_get.call_args.kwargs["timeout"]
+        assert connect_timeout == 3.0
+        assert 4.0 < read_timeout <= 5.0
+
+    def test_does_not_send_after_deadline(self) -> None:
+        """処理期限が近い場合は送信せず、サーキットブレーカーにも記録しないことを確認するテスト"""
+        breaker = CircuitBreaker(minimum_calls=1, window_size=1)
+        sender = make_sender(breaker)
+
+        with patch("requests.get") as mock_get, deadline_scope(0.5):
+            with pytest.raises(DeadlineExceededError):
+                sender.send_get_request("issues")
+        mock_get.assert_not_called()
+        assert breaker.snapshot()["calls_in_window"] == 0
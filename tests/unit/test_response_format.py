@@ -0,0 +1,411 @@
+"""
+レスポンスの整形のテスト
+"""
+
+import base64
+import csv
+import io
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from app.infrastructure.backlog.result_cache import result_cache
+from app.presentation.response_format import (
+    ISSUE_COLUMNS,
+    SEARCH_COLUMNS,
+    budget_bytes,
+    budget_comments,
+    budget_issue,
+    continue_result,
+    format_table,
+    is_continuation_cursor,
+    normalize_entities,
+    page_cursor,
+    parse_columns,
+    read_page_cursor,
+    with_next_cursor,
+)
+
+USERS = [
+    {
+        "id": 100 + i,
+        "userId": f"user{i}",
+        "name": f"ユーザー{i}",
+        "roleType": 2,
+        "lang": "ja",
+        "mailAddress": f"user{i}@example.com",
+        "nulabAccount": {
+            "nulabId": f"nulab{i}",
+            "name": f"ユーザー{i}",
+            "uniqueId": f"unique{i}",
+        },
+        "keyword": f"ユーザー{i} USER{i}",
+        "lastLoginTime": "2024-03-01T09:00:00Z",
+    }
+    for i in range(5)
+]
+STATUSES = [
+    {"id": i, "projectId": 1, "name": name, "color": "#ed8077", "displayOrder": i * 1000}
+    for i, name in enumerate(["未対応", "処理中", "処理済み", "完了"], start=1)
+]
+PRIORITIES = [{"id": 2, "name": "高"}, {"id": 3, "name": "中"}, {"id": 4, "name": "低"}]
+ISSUE_TYPES = [
+    {
+        "id": 10 + i,
+        "projectId": 1,
+        "name": name,
+        "color": "#7ea800",
+        "displayOrder": i,
+        "templateSummary": None,
+        "templateDescription": None,
+    }
+    for i, name in enumerate(["バグ", "タスク", "要望"])
+]
+MILESTONE = {
+    "id": 30,
+    "projectId": 1,
+    "name": "2.0",
+    "description": "",
+    "startDate": "2024-01-01T00:00:00Z",
+    "releaseDueDate": "2024-06-30T00:00:00Z",
+    "archived": False,
+    "displayOrder": 0,
+}
+
+
+def make_backlog_issue(i: int) -> Dict[str, Any]:
+    """Backlog APIの課題一覧の1件と同じ形の課題"""
+    return {
+        "id": 1000 + i,
+        "projectId": 1,
+        "issueKey": f"TEST-{i}",
+        "keyId": i,
+        "issueType": ISSUE_TYPES[i % 3],
+        "summary": f"ログイン画面でエラーが発生する {i}",
+        "description": "再現手順:\n1. ログイン画面を開く\n2. ログインする",
+        "resolution": None,
+        "priority": PRIORITIES[i % 3],
+        "status": STATUSES[i % 4],
+        "assignee": USERS[i % 5] if i % 7 else None,
+        "category": [],
+        "versions": [],
+        "milestone": [MILESTONE],
+        "startDate": None,
+        "dueDate": "2024-04-01T00:00:00Z",
+        "estimatedHours": None,
+        "actualHours": None,
+        "parentIssueId": None,
+        "createdUser": USERS[(i + 1) % 5],
+        "created": "2024-03-01T09:00:00Z",
+        "updatedUser": USERS[(i + 2) % 5],
+        "updated": "2024-03-02T09:00:00Z",
+        "customFields": [],
+        "attachments": [],
+        "sharedFiles": [],
+        "stars": [],
+    }
+
+
+class TestNormalizeEntities:
+    """コンパクト形式への変換のテストクラス"""
+
+    def test_references_entities_by_id(self) -> None:
+        """参照される項目を entities にまとめ、行ではIDで参照することを確認するテスト"""
+        issues = [make_backlog_issue(1), make_backlog_issue(2)]
+
+        result = normalize_entities(issues)
+
+        row = result["items"][0]
+        assert row["assignee"] == 101
+        assert row["status"] == 2
+        assert row["milestone"] == [30]
+        assert "category" not in row
+        assert "resolution" not in row
+        assert result["entities"]["users"]["101"]["name"] == "ユーザー1"
+        assert result["entities"]["milestones"]["30"]["name"] == "2.0"
+        assert set(result["entities"]["statuses"]) == {"2", "3"}
+
+    def test_comment_users(self) -> None:
+        """コメントの投稿者も entities にまとめることを確認するテスト"""
+        comments: List[Dict[str, Any]] = [
+            {"id": i, "content": f"コメント{i}", "createdUser": USERS[i % 2], "stars": []}
+            for i in range(4)
+        ]
+
+        result = normalize_entities(comments)
+
+        assert [row["createdUser"] for row in result["items"]] == [100, 101, 100, 101]
+        assert len(result["entities"]["users"]) == 2
+
+    def test_reduces_realistic_payload(self) -> None:
+        """実際の課題一覧と同じ形の100件でサイズが半分以下になることを確認するテスト"""
+        issues = [make_backlog_issue(i) for i in range(100)]
+
+        full = len(json.dumps(issues, ensure_ascii=False).encode())
+        compact = len(json.dumps(normalize_entities(issues), ensure_ascii=False).encode())
+
+        assert compact < full * 0.5
+
+
+class TestFormatTable:
+    """表形式への変換のテストクラス"""
+
+    def test_csv_with_default_columns(self) -> None:
+        """既定の列で入れ子の項目を名前にして CSV に変換することを確認するテスト"""
+        issues = [make_backlog_issue(1), make_backlog_issue(7)]
+
+        rows = list(csv.reader(io.StringIO(format_table(issues, ISSUE_COLUMNS, "csv"))))
+
+        assert rows[0] == ISSUE_COLUMNS
+        assert rows[1] == [
+            "TEST-1",
+            "ログイン画面でエラーが発生する 1",
+            "処理中",
+            "中",
+            "ユーザー1",
+            "2024-04-01T00:00:00Z",
+            "2024-03-02T09:00:00Z",
+        ]
+        assert rows[2][4] == ""
+
+    def test_search_results(self) -> None:
+        """検索結果の既定の列は課題の属性と関連度・抜粋になることを確認するテスト"""
+        results = [{"issue": make_backlog_issue(1), "score": 1.5, "snippet": "[ログイン]画面"}]
+
+        rows = list(csv.reader(io.StringIO(format_table(results, SEARCH_COLUMNS, "csv"))))
+
+        assert rows[1] == [
+            "TEST-1",
+            "ログイン画面でエラーが発生する 1",
+            "処理中",
+            "ユーザー1",
+            "1.5",
+            "[ログイン]画面",
+        ]
+
+    def test_tsv_keeps_multiline_values(self) -> None:
+        """改行を含む値も TSV の1つのセルとして読み戻せることを確認するテスト"""
+        table = format_table([make_backlog_issue(1)], ["issueKey", "description"], "tsv")
+
+        rows = list(csv.reader(io.StringIO(table), delimiter="\t"))
+
+        assert rows == [
+            ["issueKey", "description"],
+            ["TEST-1", make_backlog_issue(1)["description"]],
+        ]
+
+    def test_markdown_escapes_cells(self) -> None:
+        """Markdown の表では区切り文字と改行をエスケープし、リストはカンマ区切りにすることを確認するテスト"""
+        issue = make_backlog_issue(1)
+        issue["summary"] = "A | B"
+        issue["category"] = [{"id": 1, "name": "画面"}, {"id": 2, "name": "API"}]
+
+        columns = parse_columns(["issueKey,summary", "description", "category.name"])
+
+        table = format_table([issue], columns, "markdown")
+
+        assert table.splitlines() == [
+            "| issueKey | summary | description | category.name |",
+            "|---|---|---|---|",
+            "| TEST-1 | A \\| B | 再現手順:<br>1. ログイン画面を開く<br>2. ログインする | 画面, API |",
+        ]
+
+    def test_smaller_than_json(self) -> None:
+        """実際の課題一覧と同じ形の100件で JSON の1割以下になることを確認するテスト"""
+        issues = [make_backlog_issue(i) for i in range(100)]
+
+        full = len(json.dumps(issues, ensure_ascii=False).encode())
+        table = len(format_table(issues, ISSUE_COLUMNS, "csv").encode())
+
+        assert table < full * 0.1
+
+    @pytest.mark.parametrize("table_format,columns", [("xml", ISSUE_COLUMNS), ("csv", [])])
+    def test_invalid_arguments(self, table_format: str, columns: List[str]) -> None:
+        """不正な形式や列の指定がない場合は ValueError になることを確認するテスト"""
+        with pytest.raises(ValueError):
+            format_table([make_backlog_issue(1)], columns, table_format)
+
+
+def json_size(value: Any) -> int:
+    return len(json.dumps(value, ensure_ascii=False).encode())
+
+
+class TestBudget:
+    """予算に合わせたレスポンスの区切りのテストクラス"""
+
+    def setup_method(self) -> None:
+        result_cache.clear()
+
+    def read_all(self, kind: str, page: Dict[str, Any]) -> List[Dict[str, Any]]:
+        pages = [page]
+        while "continuation" in pages[-1]:
+            pages.append(continue_result(kind, pages[-1]["continuation"]["cursor"])[0])
+        return pages
+
+    def test_small_issue_is_unchanged(self) -> None:
+        """予算に収まる課題はそのまま返し、キャッシュしないことを確認するテスト"""
+        issue = make_backlog_issue(1)
+
+        assert budget_issue(issue, 10000) == issue
+
+    def test_issue_pages_reassemble(self) -> None:
+        """区切った課題の各ページが予算に収まり、つなげると元の詳細・コメント・子課題になることを確認するテスト"""
+        issue = make_backlog_issue(1)
+        issue["description"] = "障害の詳細。" * 500
+        issue["comments"] = [
+            {"id": i, "content": "調査結果" * (40 * i + 1), "createdUser": USERS[i % 5]}
+            for i in range(8)
+        ]
+        issue["children"] = [make_backlog_issue(i) for i in range(2, 5)]
+
+        first = budget_issue(issue, 3000)
+        pages = self.read_all("issue", first)
+
+        assert all(json_size(page) <= 3000 for page in pages)
+        assert first["issueKey"] == "TEST-1" and first["status"] == issue["status"]
+        assert first["continuation"]["truncated"] == ["description", "comments", "children"]
+        assert "".join(page.get("description", "") for page in pages) == issue["description"]
+        contents: Dict[int, str] = {}
+        for page in pages:
+            for comment in page.get("comments", []):
+                contents[comment["id"]] = contents.get(comment["id"], "") + comment["content"]
+        assert contents == {comment["id"]: comment["content"] for comment in issue["comments"]}
+        children = [child for page in pages for child in page.get("children", [])]
+        assert [child["issueKey"] for child in children] == ["TEST-2", "TEST-3", "TEST-4"]
+
+    def test_same_budget_gives_same_pages(self) -> None:
+        """同じ予算では同じ位置で区切ることを確認するテスト"""
+        issue = make_backlog_issue(1)
+        issue["description"] = "あ" * 5000
+
+        first = budget_issue(issue, 1000)
+        second = budget_issue(issue, 1000)
+
+        assert first["description"] == second["description"]
+        assert first["continuation"]["truncated"] == second["continuation"]["truncated"]
+
+    def test_comment_pages_keep_options(self) -> None:
+        """コメント一覧は件数の境界で区切り、続きのページにも形式の指定を引き継ぐことを確認するテスト"""
+        comments = [{"id": i, "content": "コメント" * 20, "createdUser": USERS[0]} for i in range(30)]
+
+        first = budget_comments(comments, 2000, {"compact": True})
+        pages = self.read_all("comments", first)
+
+        assert [c["id"] for page in pages for c in page["comments"]] == list(range(30))
+        assert continue_result("comments", first["continuation"]["cursor"])[1] == {"compact": True}
+
+    def test_invalid_cursors(self) -> None:
+        """不正なカーソルや保持期間を過ぎたカーソル、種類の異なるカーソルは ValueError になることを確認するテスト"""
+        issue = make_backlog_issue(1)
+        issue["description"] = "あ" * 5000
+        cursor = budget_issue(issue, 1000)["continuation"]["cursor"]
+
+        with pytest.raises(ValueError):
+            continue_result("comments", cursor)
+        with pytest.raises(ValueError):
+            continue_result("issue", "not-a-cursor")
+        result_cache.clear()
+        with pytest.raises(ValueError):
+            continue_result("issue", cursor)
+
+    def test_budget_bytes(self) -> None:
+        """トークン数をバイト数に換算し、小さい方を予算にすることを確認するテスト"""
+        assert budget_bytes() is None
+        assert budget_bytes(max_tokens=1000) == 3000
+        assert budget_bytes(max_bytes=2000, max_tokens=1000) == 2000
+        with pytest.raises(ValueError):
+            budget_bytes(max_bytes=100)
+
+
+ACROSS_PROJECTS_STATE = {
+    "projects": [],
+    "limit": 100,
+    "sort": "updated",
+    "order": "desc",
+    "filters": {},
+    "offsets": [0],
+}
+
+
+class TestPageCursor:
+    """一覧の次のページのカーソルのテストクラス"""
+
+    def test_round_trip(self) -> None:
+        """カーソルに含めた条件を取り出せることを確認するテスト"""
+        cursor = page_cursor(
+            "issues", project_id=1, count=20, milestone_id=[3], sort="created", offset=20
+        )
+
+        assert read_page_cursor("issues", cursor) == {
+            "project_id": 1,
+            "count": 20,
+            "milestone_id": [3],
+            "sort": "created",
+            "offset": 20,
+        }
+        assert not is_continuation_cursor(cursor)
+
+    def test_rejects_other_kinds(self) -> None:
+        """種類の異なる一覧のカーソルや不正なカーソルは ValueError になることを確認するテスト"""
+        with pytest.raises(ValueError):
+            read_page_cursor("comments", page_cursor("issues", offset=20))
+        with pytest.raises(ValueError):
+            read_page_cursor("issues", "!!!")
+
+    def test_rejects_tampered_cursors(self) -> None:
+        """署名と一致しない（書き換えた・署名のない）カーソルは ValueError になることを確認するテスト"""
+        cursor = page_cursor("comments", issue="TEST-1", count=20, max_id=10)
+        payload, _, signature = cursor.partition(".")
+        forged = base64.urlsafe_b64encode(
+            json.dumps({"kind": "comments", "issue": "TEST-2", "count": 20, "max_id": 10}).encode()
+        ).decode()
+
+        with pytest.raises(ValueError):
+            read_page_cursor("comments", f"{forged}.{signature}")
+        with pytest.raises(ValueError):
+            read_page_cursor("comments", payload)
+
+    @pytest.mark.parametrize(
+        "kind, state",
+        [
+            ("issues", {"count": 100000, "offset": 20}),
+            ("issues", {"count": 20, "sort": "nope", "offset": 20}),
+            ("issues", {"count": 20, "offset": -1}),
+            ("issues", {"count": 20, "status_id": ["1"], "offset": 20}),
+            ("issues", {"count": 20, "updated_since": "yesterday", "offset": 20}),
+            ("issues", {"count": 20, "offset": 20, "apiKey": "x"}),
+            ("search", {"query": "", "count": 20, "offset": 20}),
+            ("across_projects", {**ACROSS_PROJECTS_STATE, "limit": 5000}),
+            ("across_projects", {**ACROSS_PROJECTS_STATE, "filters": {"count": 100}}),
+            ("query", {"q": "is:open", "project_id": None, "limit": 20, "offset": True}),
+            ("comments", {"count": 20, "max_id": 10}),
+            ("comments", {"issue": "TEST-1", "count": "20"}),
+        ],
+    )
+    def test_rejects_invalid_fields(self, kind: str, state: Dict[str, Any]) -> None:
+        """制約を満たさない条件・必須の条件がない・余分な属性を含むカーソルは ValueError になることを確認するテスト"""
+        with pytest.raises(ValueError):
+            read_page_cursor(kind, page_cursor(kind, **state))
+
+    def test_rejects_other_issue(self) -> None:
+        """コメント一覧のカーソルは指定した課題のものでないと ValueError になることを確認するテスト"""
+        cursor = page_cursor("comments", issue="TEST-1", count=20, max_id=10)
+
+        assert read_page_cursor("comments", cursor, issue="TEST-1") == {
+            "issue": "TEST-1",
+            "count": 20,
+            "max_id": 10,
+        }
+        with pytest.raises(ValueError):
+            read_page_cursor("comments", cursor, issue="TEST-2")
+
+    def test_with_next_cursor(self) -> None:
+        """辞書には next_cursor を追加し、リストは指定した場合だけ items にまとめることを確認するテスト"""
+        assert with_next_cursor([1], "c") == [1]
+        assert with_next_cursor([1], "c", wrap=True) == {"items": [1], "next_cursor": "c"}
+        assert with_next_cursor({"items": [1], "entities": {}}, None) == {
+            "items": [1],
+            "entities": {},
+            "next_cursor": None,
+        }
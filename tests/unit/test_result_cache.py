@@ -0,0 +1,39 @@
+"""
+結果のキャッシュのユニットテスト
+"""
+
+from app.infrastructure.backlog.result_cache import ResultCache
+from tests.mock_data import FakeClock
+
+
+class TestResultCache:
+    """結果のキャッシュのテストクラス"""
+
+    def test_expires_after_ttl(self) -> None:
+        """保持期間を過ぎた結果は返さないことを確認するテスト"""
+        clock = FakeClock()
+        cache = ResultCache(ttl=10, clock=clock)
+        key = cache.put({"value": 1})
+
+        clock.now = 9.9
+        assert cache.get(key) == {"value": 1}
+        clock.now = 10
+        assert cache.get(key) is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        """上限を超えた場合は最も長く使われていない結果から破棄することを確認するテスト"""
+        cache = ResultCache(max_entries=2)
+        first = cache.put(1)
+        second = cache.put(2)
+        cache.get(first)
+        third = cache.put(3)
+
+        assert cache.get(first) == 1
+        assert cache.get(second) is None
+        assert cache.get(third) == 3
+
+    def test_disabled(self) -> None:
+        """保持期間が0以下の場合は保持しないことを確認するテスト"""
+        cache = ResultCache(ttl=0)
+
+        assert cache.get(cache.put(1)) is None